@@ -0,0 +1,118 @@
+"""
+Minimal client for the OpenAI Files and Batch APIs.
+
+The pinned OpenAI SDK predates the Batch API, so the few endpoints the
+offline extraction pipeline needs are called over HTTP directly. The base
+URL can point at the local fake (fake_batch_api.py) for offline runs.
+"""
+
+import httpx
+from typing import Any, Dict, Optional
+
+# Batch statuses after which the batch will not change any more
+BATCH_FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+class BatchAPIClient:
+    """Uploads JSONL request files, creates batches and reads their output."""
+    
+    def __init__(self, api_key: str, base_url: str, transport: Optional[httpx.AsyncBaseTransport] = None):
+        """
+        Initialize the client.
+        
+        Args:
+            api_key: OpenAI API key
+            base_url: API root, e.g. https://api.openai.com/v1
+            transport: Optional httpx transport (tests route it to the fake app)
+        """
+        self.base_url = base_url.rstrip("/")
+        self._http = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=60.0,
+            transport=transport
+        )
+    
+    # PUBLIC_INTERFACE
+    async def upload_jsonl(self, content: str, filename: str) -> str:
+        """
+        Upload a JSONL file of batch requests.
+        
+        Args:
+            content: One request per line
+            filename: File name shown in the OpenAI dashboard
+        
+        Returns:
+            File ID
+        """
+        response = await self._http.post(
+            "/files",
+            data={"purpose": "batch"},
+            files={"file": (filename, content.encode("utf-8"), "application/jsonl")}
+        )
+        response.raise_for_status()
+        return response.json()["id"]
+    
+    # PUBLIC_INTERFACE
+    async def create_batch(
+        self,
+        input_file_id: str,
+        endpoint: str,
+        completion_window: str,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Start a batch over an uploaded request file.
+        
+        Args:
+            input_file_id: ID returned by upload_jsonl
+            endpoint: API endpoint every request targets
+            completion_window: Processing window, e.g. "24h"
+            metadata: Optional labels stored with the batch
+        
+        Returns:
+            Batch object
+        """
+        response = await self._http.post("/batches", json={
+            "input_file_id": input_file_id,
+            "endpoint": endpoint,
+            "completion_window": completion_window,
+            "metadata": metadata or {}
+        })
+        response.raise_for_status()
+        return response.json()
+    
+    # PUBLIC_INTERFACE
+    async def get_batch(self, batch_id: str) -> Dict[str, Any]:
+        """
+        Get the current state of a batch.
+        
+        Args:
+            batch_id: Batch ID
+        
+        Returns:
+            Batch object with status and output/error file IDs
+        """
+        response = await self._http.get(f"/batches/{batch_id}")
+        response.raise_for_status()
+        return response.json()
+    
+    # PUBLIC_INTERFACE
+    async def get_file_content(self, file_id: str) -> str:
+        """
+        Download a file, such as a batch output file.
+        
+        Args:
+            file_id: File ID
+        
+        Returns:
+            File content as text
+        """
+        response = await self._http.get(f"/files/{file_id}/content")
+        response.raise_for_status()
+        return response.text
+    
+    # PUBLIC_INTERFACE
+    async def close(self) -> None:
+        """Close the HTTP connection pool."""
+        await self._http.aclose()
@@ -0,0 +1,71 @@
+"""
+Run offline check-in extraction through the OpenAI Batch API.
+
+Usage:
+    python batch_extract.py [--limit N] [--reprocess] [--poll-interval SECONDS] [--fake]
+
+With --fake, requests go to the local stand-in in fake_batch_api.py,
+served in-process, instead of OpenAI.
+"""
+
+import argparse
+import asyncio
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from services.batch_extraction_service import BatchExtractionService
+from batch_api import BatchAPIClient
+from constants import BATCH_EXTRACTION_LIMIT, BATCH_POLL_INTERVAL_SECONDS
+from database import close_database
+
+
+async def run_batch_extraction(limit: int, reprocess: bool, poll_interval: float, fake: bool):
+    """Submit pending check-in calls and apply the batch results."""
+    client = None
+    if fake:
+        import fake_batch_api
+        client = BatchAPIClient(
+            api_key="fake",
+            base_url=fake_batch_api.FAKE_BATCH_BASE_URL,
+            transport=httpx.ASGITransport(app=fake_batch_api.app)
+        )
+    service = BatchExtractionService(client=client)
+    try:
+        summary = await service.run(limit=limit, reprocess=reprocess, poll_interval=poll_interval)
+    finally:
+        await service.client.close()
+        await close_database()
+    
+    if summary["batch_id"] is None:
+        print("No check-in calls pending extraction")
+        return
+    print(f"Batch {summary['batch_id']}: {summary['status']}")
+    print(f"   Applied: {summary['applied']}")
+    print(f"   Invalid: {summary['invalid']}")
+    print(f"   Failed:  {summary['failed']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--limit", type=int, default=BATCH_EXTRACTION_LIMIT, help="Maximum calls per batch")
+    parser.add_argument(
+        "--reprocess",
+        action="store_true",
+        help="Also re-extract calls that already have structured data"
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=BATCH_POLL_INTERVAL_SECONDS,
+        help="Seconds between batch status checks"
+    )
+    parser.add_argument(
+        "--fake",
+        action="store_true",
+        help="Use the local rule-based stand-in for the Batch API"
+    )
+    args = parser.parse_args()
+    
+    asyncio.run(run_batch_extraction(args.limit, args.reprocess, args.poll_interval, args.fake))
@@ -0,0 +1,147 @@
+"""
+Compare check-in extraction throughput of the local and OpenAI backends.
+
+Usage:
+    python benchmark_extractors.py [--seconds S] [--openai N] [--concurrency C]
+
+The local backend is measured single-threaded, so transcripts per CPU
+second is also transcripts/sec/core. The OpenAI path is only measured
+with --openai N (it sends N real requests); its figures are wall-clock
+throughput at the given concurrency and transcripts per CPU second spent
+in this process.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from local_extractor import LocalCheckinExtractor
+
+SAMPLE_TRANSCRIPTS = [
+    (
+        "Agent: Hi Mike, this is Dispatch with a check call on load 7891. Can you give me an update?\n"
+        "Driver: Yeah, I'm driving on I-10 near Indio, CA right now.\n"
+        "Agent: Great. What's your ETA?\n"
+        "Driver: Should be there around 8 AM tomorrow.\n"
+        "Agent: Any delays?\n"
+        "Driver: No, traffic's fine.\n"
+        "Agent: Please remember to send the POD once you deliver.\n"
+        "Driver: Will do."
+    ),
+    (
+        "Agent: Hi Sara, checking in on load 5521. How's it going?\n"
+        "Driver: I'm running late, stuck in heavy traffic on I-40 outside Flagstaff.\n"
+        "Agent: Sorry to hear that. When do you think you'll arrive?\n"
+        "Driver: Probably 3 PM today.\n"
+        "Agent: Okay, and don't forget the POD.\n"
+        "Driver: Got it."
+    ),
+    (
+        "Agent: Hi Dan, where are you with load 3320?\n"
+        "Driver: I arrived about an hour ago, I'm in door 42 getting unloaded.\n"
+        "Agent: Perfect. Please send over the POD when you're done.\n"
+        "Driver: Sure thing."
+    ),
+    (
+        "Agent: Hi Lee, any update on load 1187?\n"
+        "Driver: Um, I was on the road earlier, but I just got here.\n"
+        "Driver: Waiting for the lumper now.\n"
+        "Agent: Thanks, please send the POD after.\n"
+        "Driver: Okay."
+    )
+]
+
+
+def sample_transcripts(count: int) -> List[str]:
+    """Get distinct transcripts so caches cannot serve repeats."""
+    return [
+        f"{SAMPLE_TRANSCRIPTS[index % len(SAMPLE_TRANSCRIPTS)]}\nAgent: Thanks, reference {index}."
+        for index in range(count)
+    ]
+
+
+def benchmark_local(seconds: float) -> Dict[str, Any]:
+    """
+    Run the local backend for a fixed time.
+    
+    Args:
+        seconds: Wall-clock duration
+    
+    Returns:
+        Transcript count, CPU seconds and transcripts/sec/core
+    """
+    extractor = LocalCheckinExtractor()
+    transcripts = sample_transcripts(1000)
+    count = 0
+    deadline = time.perf_counter() + seconds
+    cpu_started = time.process_time()
+    while time.perf_counter() < deadline:
+        extractor.extract(transcripts[count % len(transcripts)])
+        count += 1
+    cpu_seconds = time.process_time() - cpu_started
+    return {
+        "transcripts": count,
+        "cpu_seconds": cpu_seconds,
+        "per_second_per_core": count / cpu_seconds if cpu_seconds else 0.0,
+        "p50_ms": extractor.latency.percentile(50) * 1000
+    }
+
+
+async def benchmark_openai(count: int, concurrency: int) -> Dict[str, Any]:
+    """
+    Send check-in extractions to OpenAI with the fast path disabled.
+    
+    Args:
+        count: Transcripts to extract
+        concurrency: Extractions in flight at once
+    
+    Returns:
+        Transcript count, wall and CPU seconds, and throughput
+    """
+    from openai_client import openai_extractor
+    
+    openai_extractor.fast_path_threshold = 2.0
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def extract(transcript: str) -> None:
+        async with semaphore:
+            await openai_extractor.extract_checkin_data(transcript)
+    
+    wall_started = time.perf_counter()
+    cpu_started = time.process_time()
+    await asyncio.gather(*(extract(transcript) for transcript in sample_transcripts(count)))
+    wall_seconds = time.perf_counter() - wall_started
+    cpu_seconds = time.process_time() - cpu_started
+    return {
+        "transcripts": count,
+        "wall_seconds": wall_seconds,
+        "cpu_seconds": cpu_seconds,
+        "per_second": count / wall_seconds,
+        "per_cpu_second": count / cpu_seconds if cpu_seconds else 0.0
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=5.0, help="Duration of the local run")
+    parser.add_argument("--openai", type=int, default=0, help="Real OpenAI extractions to time (default: skip)")
+    parser.add_argument("--concurrency", type=int, default=8, help="OpenAI extractions in flight at once")
+    args = parser.parse_args()
+    
+    local = benchmark_local(args.seconds)
+    print("Local backend (1 core)")
+    print(f"   Transcripts:       {local['transcripts']}")
+    print(f"   Transcripts/s/core: {local['per_second_per_core']:.1f}")
+    print(f"   p50 latency:       {local['p50_ms']:.2f} ms")
+    
+    if args.openai:
+        remote = asyncio.run(benchmark_openai(args.openai, args.concurrency))
+        print(f"OpenAI backend (concurrency {args.concurrency})")
+        print(f"   Transcripts:       {remote['transcripts']}")
+        print(f"   Transcripts/s:     {remote['per_second']:.2f}")
+        print(f"   Transcripts/CPU s: {remote['per_cpu_second']:.1f}")
+        print(f"   Speedup (local/core vs OpenAI wall): {local['per_second_per_core'] / remote['per_second']:.0f}x")
@@ -0,0 +1,101 @@
+"""
+In-process caching utilities for the Logistics Voice Agent system.
+"""
+
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Dictionary cache whose entries expire after a fixed time-to-live."""
+    
+    def __init__(self, ttl_seconds: float, max_size: Optional[int] = None):
+        """
+        Initialize the cache.
+        
+        Args:
+            ttl_seconds: Seconds an entry stays valid after it is stored
+            max_size: Optional entry limit; the oldest entries are evicted
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+    
+    # PUBLIC_INTERFACE
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self.hits += 1
+            return entry[1]
+        
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        return None
+    
+    # PUBLIC_INTERFACE
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value for the configured TTL.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        self._entries.pop(key, None)
+        if self.max_size is not None and len(self._entries) >= self.max_size:
+            self._evict()
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+    
+    # PUBLIC_INTERFACE
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Drop one entry, or every entry when no key is given.
+        
+        Args:
+            key: Cache key to drop (default: all keys)
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+        self.invalidations += 1
+    
+    def _evict(self) -> None:
+        """Drop expired entries, then the oldest ones until below max_size."""
+        now = time.monotonic()
+        for key in [key for key, (expires, _) in self._entries.items() if expires <= now]:
+            del self._entries[key]
+        
+        while len(self._entries) >= self.max_size:
+            del self._entries[next(iter(self._entries))]
+    
+    # PUBLIC_INTERFACE
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters.
+        
+        Returns:
+            Dictionary with size, hits, misses, hit rate and invalidations
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations
+        }
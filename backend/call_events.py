@@ -0,0 +1,93 @@
+"""
+In-process publish/subscribe for live call updates.
+
+Subscribers (server-sent event streams) get their own bounded queue per
+call. Publishing never blocks: if a slow subscriber's queue is full, its
+oldest event is dropped.
+"""
+
+import asyncio
+from typing import Any, Dict, Set
+from constants import CALL_EVENTS_QUEUE_SIZE
+
+
+class CallEventBroker:
+    """Fans call events out to subscribers of that call."""
+    
+    def __init__(self, queue_size: int = CALL_EVENTS_QUEUE_SIZE):
+        """
+        Initialize the broker.
+        
+        Args:
+            queue_size: Events buffered per subscriber
+        """
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self.published = 0
+        self.dropped = 0
+    
+    # PUBLIC_INTERFACE
+    def subscribe(self, call_id: str) -> asyncio.Queue:
+        """
+        Start receiving events for a call.
+        
+        Args:
+            call_id: Call log ID
+        
+        Returns:
+            Queue the events are put on; pass it to unsubscribe when done
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(call_id, set()).add(queue)
+        return queue
+    
+    # PUBLIC_INTERFACE
+    def unsubscribe(self, call_id: str, queue: asyncio.Queue) -> None:
+        """
+        Stop receiving events for a call.
+        
+        Args:
+            call_id: Call log ID
+            queue: Queue returned by subscribe
+        """
+        queues = self._subscribers.get(call_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[call_id]
+    
+    # PUBLIC_INTERFACE
+    def publish(self, call_id: str, event: Dict[str, Any]) -> None:
+        """
+        Send an event to every subscriber of a call.
+        
+        Args:
+            call_id: Call log ID
+            event: JSON-serializable event
+        """
+        for queue in self._subscribers.get(call_id, ()):
+            if queue.full():
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(event)
+        self.published += 1
+    
+    # PUBLIC_INTERFACE
+    def stats(self) -> Dict[str, int]:
+        """
+        Get broker counters.
+        
+        Returns:
+            Dictionary with subscribed calls, subscribers and event totals
+        """
+        return {
+            "calls": len(self._subscribers),
+            "subscribers": sum(len(queues) for queues in self._subscribers.values()),
+            "published": self.published,
+            "dropped": self.dropped
+        }
+
+
+# Singleton instance
+call_events = CallEventBroker()
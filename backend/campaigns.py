@@ -0,0 +1,168 @@
+"""
+In-process progress tracking for batch call campaigns.
+
+A campaign is one POST /api/calls/batch: its call logs are written in one
+insert and then dialed in the background. The tracker holds each row's
+dialing state so clients can poll progress while calls go out. Finished
+campaigns are kept for a bounded history; older ones are still visible
+through their call logs, which carry the campaign ID.
+"""
+
+import asyncio
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from constants import (
+    CAMPAIGN_HISTORY_SIZE,
+    CAMPAIGN_ROW_QUEUED,
+    CAMPAIGN_ROW_DIALING,
+    CAMPAIGN_ROW_INITIATED,
+    CAMPAIGN_ROW_FAILED
+)
+
+
+# PUBLIC_INTERFACE
+def campaign_progress(campaign_id: str, rows: List[Dict[str, Any]], created_at: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Summarize a campaign's rows.
+    
+    Args:
+        campaign_id: Campaign ID
+        rows: Per-row progress, each with a "status"
+        created_at: When the campaign was submitted
+    
+    Returns:
+        Dictionary with the campaign ID, row counts per status, whether
+        dialing has finished, and the rows
+    """
+    counts = {status: 0 for status in (
+        CAMPAIGN_ROW_QUEUED, CAMPAIGN_ROW_DIALING, CAMPAIGN_ROW_INITIATED, CAMPAIGN_ROW_FAILED
+    )}
+    for row in rows:
+        counts[row["status"]] = counts.get(row["status"], 0) + 1
+    return {
+        "campaign_id": campaign_id,
+        "created_at": created_at,
+        "total": len(rows),
+        "counts": counts,
+        "done": counts[CAMPAIGN_ROW_QUEUED] == counts[CAMPAIGN_ROW_DIALING] == 0,
+        "rows": [dict(row) for row in rows]
+    }
+
+
+class CampaignTracker:
+    """Per-row dialing progress of recent campaigns."""
+    
+    def __init__(self, history_size: int = CAMPAIGN_HISTORY_SIZE):
+        """
+        Initialize the tracker.
+        
+        Args:
+            history_size: Campaigns kept in memory; the oldest is dropped
+        """
+        self.history_size = history_size
+        self._campaigns: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self.counts = {"campaigns": 0, "calls": 0, "initiated": 0, "failed": 0}
+    
+    # PUBLIC_INTERFACE
+    def create(self, campaign_id: str, rows: List[Dict[str, Any]]) -> None:
+        """
+        Register a campaign.
+        
+        Args:
+            campaign_id: Campaign ID
+            rows: Initial row progress, in request order, each with
+                index, call_id, driver_name, load_number, scenario_type,
+                status, retell_call_id and error
+        """
+        self._campaigns[campaign_id] = {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "rows": rows
+        }
+        self.counts["campaigns"] += 1
+        self.counts["calls"] += len(rows)
+        self.counts["failed"] += sum(1 for row in rows if row["status"] == CAMPAIGN_ROW_FAILED)
+        # Drop the oldest finished campaigns; ones still dialing are kept
+        while len(self._campaigns) > self.history_size:
+            oldest = next(
+                (cid for cid in self._campaigns if cid != campaign_id and cid not in self._tasks),
+                None
+            )
+            if oldest is None:
+                break
+            self._campaigns.pop(oldest)
+    
+    # PUBLIC_INTERFACE
+    def update_row(self, campaign_id: str, index: int, **fields: Any) -> None:
+        """
+        Update one row's progress.
+        
+        Args:
+            campaign_id: Campaign ID
+            index: Row position in the request
+            **fields: Fields to set (status, retell_call_id, error)
+        """
+        campaign = self._campaigns.get(campaign_id)
+        if campaign is None:
+            return
+        campaign["rows"][index].update(fields)
+        if fields.get("status") == CAMPAIGN_ROW_INITIATED:
+            self.counts["initiated"] += 1
+        elif fields.get("status") == CAMPAIGN_ROW_FAILED:
+            self.counts["failed"] += 1
+    
+    # PUBLIC_INTERFACE
+    def track(self, campaign_id: str, task: asyncio.Task) -> None:
+        """
+        Keep a reference to a campaign's dialing task.
+        
+        Args:
+            campaign_id: Campaign ID
+            task: Background task dialing the campaign
+        """
+        self._tasks[campaign_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(campaign_id, None))
+    
+    # PUBLIC_INTERFACE
+    async def wait(self, campaign_id: str) -> None:
+        """
+        Wait until a campaign's dialing task has finished.
+        
+        Args:
+            campaign_id: Campaign ID
+        """
+        task = self._tasks.get(campaign_id)
+        if task is not None:
+            await asyncio.shield(task)
+    
+    # PUBLIC_INTERFACE
+    def get(self, campaign_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a campaign's progress.
+        
+        Args:
+            campaign_id: Campaign ID
+        
+        Returns:
+            Progress from campaign_progress, or None if not tracked
+        """
+        campaign = self._campaigns.get(campaign_id)
+        if campaign is None:
+            return None
+        return campaign_progress(campaign_id, campaign["rows"], campaign["created_at"])
+    
+    # PUBLIC_INTERFACE
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get campaign counters.
+        
+        Returns:
+            Dictionary with campaigns and calls submitted, calls initiated
+            and failed, and campaigns still dialing
+        """
+        return {**self.counts, "dialing_campaigns": len(self._tasks)}
+
+
+# Singleton instance
+call_campaigns = CampaignTracker()
@@ -13,6 +13,32 @@ CALL_STATUS_IN_PROGRESS = "in_progress"
 CALL_STATUS_COMPLETED = "completed"
 CALL_STATUS_FAILED = "failed"
 
+# Check-in extraction schema
+CHECKIN_FIELDS = [
+    "call_outcome",
+    "driver_status",
+    "current_location",
+    "eta",
+    "delay_reason",
+    "unloading_status",
+    "pod_reminder_acknowledged"
+]
+EMERGENCY_FIELDS = [
+    "call_outcome",
+    "emergency_type",
+    "safety_status",
+    "injury_status",
+    "emergency_location",
+    "load_secure",
+    "escalation_status"
+]
+CHECKIN_OUTCOME_IN_TRANSIT = "In-Transit Update"
+CHECKIN_OUTCOME_ARRIVAL = "Arrival Confirmation"
+DRIVER_STATUS_DRIVING = "Driving"
+DRIVER_STATUS_DELAYED = "Delayed"
+DRIVER_STATUS_ARRIVED = "Arrived"
+DRIVER_STATUS_UNLOADING = "Unloading"
+
 # Special markers
 WEB_CALL_PHONE_MARKER = "web-call"
 
@@ -20,10 +46,174 @@ WEB_CALL_PHONE_MARKER = "web-call"
 TABLE_AGENT_CONFIGURATIONS = "agent_configurations"
 TABLE_CALL_LOGS = "call_logs"
 
+# Call log projections for the fields= query parameter
+CALL_LOG_FIELDS = [
+    "id",
+    "retell_call_id",
+    "driver_name",
+    "driver_phone",
+    "load_number",
+    "scenario_type",
+    "call_status",
+    "raw_transcript",
+    "structured_data",
+    "campaign_id",
+    "created_at"
+]
+CALL_LOG_SUMMARY_FIELDS = [
+    "id",
+    "retell_call_id",
+    "driver_name",
+    "load_number",
+    "scenario_type",
+    "call_status",
+    "created_at"
+]
+FIELDS_SUMMARY = "summary"
+FIELDS_ALL = "all"
+
+# Pagination settings
+CALL_LOGS_PAGE_SIZE = 50
+CALL_LOGS_MAX_PAGE_SIZE = 200
+
+# Longest a call initiation waits for its agent to finish provisioning
+AGENT_READY_WAIT_SECONDS = 10
+
+# Outbound from-number pool (RETELL_FROM_NUMBERS)
+FROM_NUMBER_MAX_CONCURRENT_CALLS = 5
+FROM_NUMBER_SELECTION_LEAST_LOADED = "least_loaded"
+FROM_NUMBER_SELECTION_ROUND_ROBIN = "round_robin"
+FROM_NUMBER_SELECTIONS = [FROM_NUMBER_SELECTION_LEAST_LOADED, FROM_NUMBER_SELECTION_ROUND_ROBIN]
+FROM_NUMBER_FAILURE_THRESHOLD = 3
+FROM_NUMBER_COOLDOWN_SECONDS = 300
+FROM_NUMBER_CALL_TIMEOUT_SECONDS = 3600
+FROM_NUMBER_ACQUIRE_WAIT_SECONDS = 5
+# Retell disconnection reasons that count against the from-number
+FROM_NUMBER_FAILURE_REASONS = ["dial_failed"]
+# Retell API error text marking a rejection of the from-number itself
+# (e.g. flagged by the carrier) rather than of the request
+FROM_NUMBER_REJECTION_MARKERS = ["from_number", "from number", "carrier"]
+
+# Batch call campaigns (POST /api/calls/batch)
+CAMPAIGN_MAX_CALLS = 1000
+CAMPAIGN_DIAL_CONCURRENCY = 10
+CAMPAIGN_HISTORY_SIZE = 100
+CAMPAIGN_ROW_QUEUED = "queued"
+CAMPAIGN_ROW_DIALING = "dialing"
+CAMPAIGN_ROW_INITIATED = CALL_STATUS_INITIATED
+CAMPAIGN_ROW_FAILED = CALL_STATUS_FAILED
+
+# Shared HTTP transport (per upstream host)
+HTTP_MAX_CONNECTIONS_PER_HOST = 20
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 10
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 60
+HTTP_CONNECT_TIMEOUT_SECONDS = 5
+HTTP_PREWARM_CONNECTIONS = 2
+OPENAI_API_BASE_URL = "https://api.openai.com/v1"
+RETELL_API_BASE_URL = "https://api.retellai.com"
+
+# Live call events (server-sent events)
+CALL_EVENTS_QUEUE_SIZE = 100
+CALL_EVENTS_KEEPALIVE_SECONDS = 15
+
+# Cache settings
+CONFIG_CACHE_TTL_SECONDS = 300
+
+# Extraction worker pool and durable job queue settings
+JOB_PROCESS_TRANSCRIPT = "process_transcript"
+EXTRACTION_WORKER_CONCURRENCY = 4
+EXTRACTION_DRAIN_TIMEOUT_SECONDS = 30
+EXTRACTION_QUEUE_PATH = "extraction_jobs.db"
+EXTRACTION_MAX_ATTEMPTS = 5
+EXTRACTION_VISIBILITY_TIMEOUT_SECONDS = 300
+EXTRACTION_RETRY_BASE_SECONDS = 5
+EXTRACTION_RETRY_MAX_SECONDS = 600
+EXTRACTION_POLL_INTERVAL_SECONDS = 1.0
+EXTRACTION_DEDUP_TTL_SECONDS = 3600
+EXTRACTION_DEDUP_MAX_CALLS = 10000
+
+# Live extraction from Retell transcript_updated events during the call
+LIVE_EXTRACTION_DEBOUNCE_SECONDS = 1.5
+
+# Offline check-in extraction through the OpenAI Batch API
+OPENAI_BATCH_BASE_URL = "https://api.openai.com/v1"
+OPENAI_BATCH_ENDPOINT = "/v1/chat/completions"
+OPENAI_BATCH_COMPLETION_WINDOW = "24h"
+BATCH_EXTRACTION_LIMIT = 1000
+BATCH_POLL_INTERVAL_SECONDS = 60
+BATCH_APPLY_CONCURRENCY = 10
+
 # OpenAI settings
 OPENAI_MODEL = "gpt-4o"
 OPENAI_TEMPERATURE = 0
 
+# Tiered routing: short check-ins try the fast model first
+OPENAI_FAST_MODEL = "gpt-4o-mini"
+ROUTING_LONG_TRANSCRIPT_TOKENS = 1500
+# Fast-model check-in answers are re-asked on the strong model when a key
+# field contradicts the rule-based guess, when a field the rules found is
+# answered with a placeholder, or when the outcome contradicts the status
+ROUTING_KEY_FIELDS = ["call_outcome", "driver_status"]
+ROUTING_PLACEHOLDER_VALUES = {"", "n/a", "unknown", "none"}
+CHECKIN_OUTCOME_BY_STATUS = {
+    DRIVER_STATUS_DRIVING: CHECKIN_OUTCOME_IN_TRANSIT,
+    DRIVER_STATUS_DELAYED: CHECKIN_OUTCOME_IN_TRANSIT,
+    DRIVER_STATUS_ARRIVED: CHECKIN_OUTCOME_ARRIVAL,
+    DRIVER_STATUS_UNLOADING: CHECKIN_OUTCOME_ARRIVAL
+}
+
+# USD per million (input, output) tokens, used for cost metrics
+OPENAI_MODEL_PRICING = {
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60)
+}
+EXTRACTION_CACHE_MAX_SIZE = 1000
+EXTRACTION_REASK_ATTEMPTS = 2
+
+# Check-in extraction micro-batching: pending short transcripts on the
+# fast model share one request
+EXTRACTION_BATCH_MAX_ITEMS = 8
+EXTRACTION_BATCH_MAX_WAIT_MS = 50
+EXTRACTION_BATCH_MAX_TOKENS = 500
+
+# Extraction backend per scenario; "local" runs on CPU without network (check-in only)
+EXTRACTION_BACKEND_OPENAI = "openai"
+EXTRACTION_BACKEND_LOCAL = "local"
+EXTRACTION_BACKENDS = {
+    SCENARIO_CHECKIN: EXTRACTION_BACKEND_OPENAI,
+    SCENARIO_EMERGENCY: EXTRACTION_BACKEND_OPENAI
+}
+
+# Emergency extraction hedging: resend requests slower than the percentile
+EMERGENCY_HEDGE_PERCENTILE = 90
+EMERGENCY_HEDGE_MAX_RATE = 0.1
+EMERGENCY_HEDGE_MIN_SAMPLES = 20
+
+# OpenAI rate governor (defaults match gpt-4o usage tier 1)
+OPENAI_REQUESTS_PER_MINUTE = 500
+OPENAI_TOKENS_PER_MINUTE = 30000
+OPENAI_COMPLETION_TOKEN_ESTIMATE = 300
+OPENAI_MAX_RETRIES = 5
+OPENAI_RETRY_BASE_SECONDS = 1.0
+OPENAI_RETRY_MAX_SECONDS = 60.0
+
+# Rule-based fast path: fields at or above this confidence skip the LLM
+FAST_PATH_CONFIDENCE_THRESHOLD = 0.8
+
+# Transcript compaction before extraction
+TRANSCRIPT_TOKEN_BUDGET = 3000
+
+# Map-reduce extraction: longer compacted transcripts are split into chunks
+CHUNKED_EXTRACTION_THRESHOLD_TOKENS = 3000
+CHUNKED_EXTRACTION_CHUNK_TOKENS = 1200
+CHUNKED_EXTRACTION_MAX_CHUNKS = 8
+TRANSCRIPT_TOKENIZER_ENCODING = "o200k_base"
+TRANSCRIPT_DISFLUENCIES = {"um", "umm", "uh", "uhh", "uhm", "erm", "er", "ah", "hmm", "hm", "mm"}
+TRANSCRIPT_BACKCHANNELS = {
+    "yeah", "yep", "yup", "ok", "okay", "alright", "right", "sure",
+    "mm-hmm", "mhm", "uh-huh", "gotcha", "cool"
+}
+
 # Retell settings
 RETELL_VOICE_ID = "11labs-Adrian"
 RETELL_MODEL = "gpt-4o"
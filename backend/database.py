@@ -1,4 +1,5 @@
-from supabase import create_client, Client
+from postgrest import AsyncPostgrestClient
+from http_transport import http_clients
 import os
 from dotenv import load_dotenv
 
@@ -11,4 +12,35 @@ supabase_key = os.getenv("SUPABASE_KEY")
 if not supabase_url or not supabase_key:
     raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in .env file")
 
-supabase: Client = create_client(supabase_url, supabase_key)
+
+class PooledPostgrestClient(AsyncPostgrestClient):
+    """PostgREST client whose session is the shared, tuned Supabase pool."""
+    
+    def create_session(self, base_url, headers, timeout):
+        """Build the session on the shared HTTP transport."""
+        return http_clients.client(
+            "supabase",
+            warm_url=f"{supabase_url}/rest/v1/",
+            timeout=timeout,
+            base_url=base_url,
+            headers=headers
+        )
+
+
+# Async PostgREST client for the Supabase REST API. It owns one pooled
+# HTTP connection set, so queries are awaited instead of blocking the loop.
+supabase: AsyncPostgrestClient = PooledPostgrestClient(
+    f"{supabase_url}/rest/v1",
+    headers={
+        "apiKey": supabase_key,
+        "Authorization": f"Bearer {supabase_key}",
+        "Accept": "application/json",
+        "Content-Type": "application/json"
+    },
+    timeout=30.0
+)
+
+
+async def close_database() -> None:
+    """Close pooled Supabase HTTP connections."""
+    await supabase.aclose()
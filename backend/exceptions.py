@@ -14,6 +14,17 @@ class AgentConfigurationError(HTTPException):
         super().__init__(status_code=400, detail=detail)
 
 
+class AgentNotReadyError(HTTPException):
+    """Raised when a scenario's agent is still being provisioned."""
+    
+    def __init__(self, scenario_type: str):
+        super().__init__(
+            status_code=503,
+            detail=f"Agent for {scenario_type} scenario is still being provisioned",
+            headers={"Retry-After": "5"}
+        )
+
+
 class CallLogCreationError(HTTPException):
     """Raised when call log creation fails."""
     
@@ -29,6 +40,13 @@ class CallNotFoundError(HTTPException):
         super().__init__(status_code=404, detail=f"Call {call_id} not found")
 
 
+class CampaignNotFoundError(HTTPException):
+    """Raised when a call campaign cannot be found."""
+    
+    def __init__(self, campaign_id: str):
+        super().__init__(status_code=404, detail=f"Campaign {campaign_id} not found")
+
+
 class ConfigurationNotFoundError(HTTPException):
     """Raised when configuration cannot be found."""
     
@@ -49,6 +67,31 @@ class EnvironmentVariableError(HTTPException):
         )
 
 
+class FromNumberUnavailableError(HTTPException):
+    """Raised when every from-number is at its call limit or cooling down."""
+    
+    def __init__(self):
+        super().__init__(
+            status_code=503,
+            detail="No outbound phone number is available; all are busy or cooling down",
+            headers={"Retry-After": "10"}
+        )
+
+
+class InvalidCursorError(HTTPException):
+    """Raised when a pagination cursor cannot be decoded."""
+    
+    def __init__(self, cursor: str):
+        super().__init__(status_code=400, detail=f"Invalid cursor: {cursor}")
+
+
+class InvalidFieldsError(HTTPException):
+    """Raised when a fields projection names unknown columns."""
+    
+    def __init__(self, fields: str):
+        super().__init__(status_code=400, detail=f"Invalid fields: {fields}")
+
+
 class InvalidPhoneNumberError(HTTPException):
     """Raised when phone number validation fails."""
     
@@ -0,0 +1,136 @@
+"""
+Micro-batching of small requests into one upstream call.
+
+Callers submit items and await their own result. Items are held for a
+short window, or until a batch fills up, then handed to a flush handler
+together; the handler returns one result per item, in order.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Set, Tuple
+from latency import LatencyWindow
+
+# Flush handler: (group, items) -> one result per item
+BatchHandler = Callable[[Hashable, List[Any]], Awaitable[List[Any]]]
+
+
+class MicroBatcher:
+    """Collects items per group and flushes them by size or age."""
+    
+    def __init__(self, handler: BatchHandler, max_items: int, max_wait_seconds: float):
+        """
+        Initialize the batcher.
+        
+        Args:
+            handler: Coroutine function sending one batch
+            max_items: Items that trigger an immediate flush
+            max_wait_seconds: Longest an item waits for the batch to fill
+        """
+        self.handler = handler
+        self.max_items = max_items
+        self.max_wait_seconds = max_wait_seconds
+        self._pending: Dict[Hashable, List[Tuple[Any, asyncio.Future, float]]] = {}
+        self._timers: Dict[Hashable, asyncio.TimerHandle] = {}
+        self._flushing: Set[asyncio.Task] = set()
+        self.wait_latency = LatencyWindow()
+        self.batches = 0
+        self.items = 0
+        self.full_flushes = 0
+        self.failed_batches = 0
+    
+    # PUBLIC_INTERFACE
+    async def submit(self, group: Hashable, item: Any) -> Any:
+        """
+        Add an item to its group's next batch and wait for its result.
+        
+        Args:
+            group: Items are only batched with items of the same group
+            item: Request passed to the handler
+        
+        Returns:
+            The handler's result for this item
+        
+        Raises:
+            Exception: Whatever the handler raised for the batch
+        """
+        future = asyncio.get_running_loop().create_future()
+        pending = self._pending.setdefault(group, [])
+        pending.append((item, future, time.perf_counter()))
+        
+        if len(pending) >= self.max_items:
+            self.full_flushes += 1
+            self._flush(group)
+        elif group not in self._timers:
+            self._timers[group] = asyncio.get_running_loop().call_later(
+                self.max_wait_seconds, self._flush, group
+            )
+        
+        # Shield so one cancelled caller does not fail the whole batch
+        return await asyncio.shield(future)
+    
+    # PUBLIC_INTERFACE
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get batching counters.
+        
+        Returns:
+            Dictionary with batch and item totals, mean batch size, the
+            number of batches flushed because they were full, and the time
+            items waited for their batch
+        """
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "mean_batch_size": self.items / self.batches if self.batches else 0.0,
+            "full_flushes": self.full_flushes,
+            "failed_batches": self.failed_batches,
+            "pending": sum(len(pending) for pending in self._pending.values()),
+            "wait": self.wait_latency.stats()
+        }
+    
+    def _flush(self, group: Hashable) -> None:
+        """
+        Send a group's pending items as one batch.
+        
+        Args:
+            group: Group to flush
+        """
+        timer = self._timers.pop(group, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(group, [])
+        if not batch:
+            return
+        
+        now = time.perf_counter()
+        for _, _, submitted in batch:
+            self.wait_latency.record(now - submitted)
+        self.batches += 1
+        self.items += len(batch)
+        task = asyncio.ensure_future(self._run(group, [(item, future) for item, future, _ in batch]))
+        self._flushing.add(task)
+        task.add_done_callback(self._flushing.discard)
+    
+    async def _run(self, group: Hashable, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """
+        Call the handler and resolve each caller's future.
+        
+        Args:
+            group: Batch group
+            batch: (item, future) pairs
+        """
+        try:
+            results = await self.handler(group, [item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"Batch handler returned {len(results)} results for {len(batch)} items")
+        except Exception as e:
+            self.failed_batches += 1
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,193 @@
+"""
+Content-addressed cache for transcript extraction results.
+
+Results are keyed on everything that determines the model output:
+scenario, prompt version, model and transcript hash. A bounded in-memory
+LRU tier answers repeats in microseconds; an optional SQLite tier keeps
+results across restarts.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+def extraction_cache_key(
+    scenario_type: str,
+    prompt_version: str,
+    model: str,
+    transcript_digest: str
+) -> str:
+    """
+    Build a cache key for one extraction.
+    
+    Args:
+        scenario_type: Scenario type (checkin, emergency)
+        prompt_version: Hash of the prompt template
+        model: Model name
+        transcript_digest: Hash of the transcript
+    
+    Returns:
+        Hex SHA-256 cache key
+    """
+    raw = "|".join([scenario_type, prompt_version, model, transcript_digest])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ExtractionCache:
+    """Two-tier (memory LRU, optional SQLite) extraction result cache."""
+    
+    def __init__(self, max_size: int, disk_path: Optional[str] = None):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_size: Maximum number of results kept in memory
+            disk_path: Optional SQLite file for the persistent tier
+        """
+        self.max_size = max_size
+        self.disk_path = disk_path
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    # PUBLIC_INTERFACE
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result, promoting disk hits into memory.
+        
+        Args:
+            key: Cache key from extraction_cache_key
+        
+        Returns:
+            Copy of the cached result, or None on a miss
+        """
+        value = self._memory.get(key)
+        if value is not None:
+            self._memory.move_to_end(key)
+            self.memory_hits += 1
+            return copy.deepcopy(value)
+        
+        if self.disk_path:
+            value = await asyncio.to_thread(self._disk_get, key)
+            if value is not None:
+                self.disk_hits += 1
+                self._remember(key, value)
+                return copy.deepcopy(value)
+        
+        self.misses += 1
+        return None
+    
+    # PUBLIC_INTERFACE
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a result in memory and, if enabled, on disk.
+        
+        Args:
+            key: Cache key from extraction_cache_key
+            value: Extraction result
+        """
+        self._remember(key, copy.deepcopy(value))
+        if self.disk_path:
+            await asyncio.to_thread(self._disk_set, key, value)
+    
+    # PUBLIC_INTERFACE
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters.
+        
+        Returns:
+            Dictionary with size, hits per tier, misses and hit rate
+        """
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+        return {
+            "size": len(self._memory),
+            "max_size": self.max_size,
+            "disk_enabled": bool(self.disk_path),
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "evictions": self.evictions
+        }
+    
+    def _remember(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Insert into the memory tier, evicting the least recently used entry.
+        
+        Args:
+            key: Cache key
+            value: Extraction result
+        """
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+    
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Open the disk tier and create its table if needed.
+        
+        Returns:
+            SQLite connection
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(self.disk_path, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS extraction_results "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+    
+    def _disk_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a result from the disk tier.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Stored result or None
+        """
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT value FROM extraction_results WHERE key = ?",
+                (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def _disk_set(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Write a result to the disk tier.
+        
+        Args:
+            key: Cache key
+            value: Extraction result
+        """
+        with self._lock:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO extraction_results (key, value, created_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time())
+            )
+    
+    # PUBLIC_INTERFACE
+    def close(self) -> None:
+        """Close the disk tier connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
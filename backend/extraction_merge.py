@@ -0,0 +1,155 @@
+"""
+Deterministic merge of extraction results from transcript chunks.
+
+Each chunk of a long transcript is extracted on its own, so fields the
+chunk does not discuss come back as placeholders or guesses. Merge rules
+are per field: most facts take the latest informative value, while safety
+facts take the most serious one seen anywhere in the call.
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+from constants import SCENARIO_CHECKIN, SCENARIO_EMERGENCY
+
+LATEST = "latest"
+ANY_TRUE = "any_true"
+ANY_FALSE = "any_false"
+INJURY = "injury"
+
+# Values a chunk returns when it has nothing to say about a field
+_PLACEHOLDERS = {
+    "", "n/a", "na", "none", "unknown", "other", "not mentioned", "not discussed",
+    "not provided", "not specified", "not stated", "no information"
+}
+
+_INJURY_PATTERN = re.compile(
+    r"\b(?:injur\w*|hurt|bleed\w*|broken|fractur\w*|unconscious|ambulance|pain|wound\w*|cuts?|bruis\w*)\b",
+    re.IGNORECASE
+)
+_NO_INJURY_PATTERN = re.compile(
+    r"\b(?:no|not|none|without|nobody|no one)\b[^.;,]*?\b(?:injur\w*|hurt)\b|\b(?:uninjured|unhurt|unharmed)\b",
+    re.IGNORECASE
+)
+
+# Merge rule per field; call_outcome follows the chunk whose driver_status won
+MERGE_RULES = {
+    SCENARIO_CHECKIN: {
+        "call_outcome": "driver_status",
+        "driver_status": LATEST,
+        "current_location": LATEST,
+        "eta": LATEST,
+        "delay_reason": LATEST,
+        "unloading_status": LATEST,
+        "pod_reminder_acknowledged": ANY_TRUE
+    },
+    SCENARIO_EMERGENCY: {
+        "call_outcome": LATEST,
+        "emergency_type": LATEST,
+        "safety_status": LATEST,
+        "injury_status": INJURY,
+        "emergency_location": LATEST,
+        "load_secure": ANY_FALSE,
+        "escalation_status": LATEST
+    }
+}
+
+
+def _informative(value: Any) -> bool:
+    """
+    Check whether a value says something beyond "not discussed".
+    
+    Args:
+        value: Extracted field value
+    
+    Returns:
+        False for None and placeholder strings
+    """
+    if value is None:
+        return False
+    if isinstance(value, str):
+        return value.strip().lower().rstrip(".") not in _PLACEHOLDERS
+    return True
+
+
+def _reports_injury(value: Any) -> bool:
+    """
+    Check whether an injury_status value reports an injury.
+    
+    Args:
+        value: injury_status value
+    
+    Returns:
+        True if an injury is mentioned outside a negation such as "no injuries"
+    """
+    if not isinstance(value, str):
+        return False
+    return bool(_INJURY_PATTERN.search(_NO_INJURY_PATTERN.sub("", value)))
+
+
+def _winner(rule: str, values: List[Any]) -> Optional[int]:
+    """
+    Pick the chunk whose value a field takes.
+    
+    Args:
+        rule: Merge rule
+        values: The field's value from each chunk, in call order
+    
+    Returns:
+        Index of the winning chunk, or None if no chunk has the field
+    """
+    present = [index for index, value in enumerate(values) if value is not None]
+    if not present:
+        return None
+    
+    if rule == ANY_TRUE:
+        matches = [index for index in present if values[index] is True]
+    elif rule == ANY_FALSE:
+        matches = [index for index in present if values[index] is False]
+    elif rule == INJURY:
+        matches = [index for index in present if _reports_injury(values[index])]
+    else:
+        matches = []
+    if not matches:
+        matches = [index for index in present if _informative(values[index])] or present
+    return matches[-1]
+
+
+# PUBLIC_INTERFACE
+def merge_chunk_results(scenario_type: str, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge per-chunk extraction results into one result.
+    
+    - latest: the last informative value wins (later turns correct earlier ones)
+    - any_true / any_false: one chunk with that value decides
+    - injury: the last value reporting an injury wins over "no injuries"
+    - a field name: take the value from the chunk that field was taken from
+    
+    Args:
+        scenario_type: Scenario type
+        results: Extraction result per chunk, in call order
+    
+    Returns:
+        Merged result with every field present in any chunk
+    """
+    rules = MERGE_RULES[scenario_type]
+    fields = [field for field in rules if any(field in result for result in results)]
+    
+    winners: Dict[str, Optional[int]] = {}
+    for field in fields:
+        rule = rules[field]
+        if rule in rules:
+            continue
+        winners[field] = _winner(rule, [result.get(field) for result in results])
+    for field in fields:
+        rule = rules[field]
+        if rule in rules:
+            # Follow another field's chunk, or fall back to the latest value
+            winners[field] = winners.get(rule)
+            if winners[field] is None or field not in results[winners[field]]:
+                winners[field] = _winner(LATEST, [result.get(field) for result in results])
+    
+    return {
+        field: results[winners[field]][field]
+        for field in fields
+        if winners[field] is not None
+    }
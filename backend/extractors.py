@@ -0,0 +1,108 @@
+"""
+Per-scenario selection of the extraction backend.
+
+Each scenario uses the backend named in EXTRACTION_BACKENDS, overridable
+with EXTRACTION_BACKEND_<SCENARIO> (e.g. EXTRACTION_BACKEND_CHECKIN=local).
+The OpenAI backend serves every scenario; the local CPU backend only has
+a check-in schema.
+"""
+
+import os
+from typing import Any, Dict, Optional
+from constants import (
+    SCENARIO_CHECKIN,
+    SCENARIO_EMERGENCY,
+    VALID_SCENARIOS,
+    EXTRACTION_BACKENDS,
+    EXTRACTION_BACKEND_OPENAI,
+    EXTRACTION_BACKEND_LOCAL
+)
+from local_extractor import local_checkin_extractor
+from openai_client import openai_extractor, FieldCallback
+
+# Method each scenario's backend must provide
+_SCENARIO_METHODS = {
+    SCENARIO_CHECKIN: "extract_checkin_data",
+    SCENARIO_EMERGENCY: "extract_emergency_data"
+}
+
+
+class ScenarioExtractor:
+    """Routes each scenario's extraction to its configured backend."""
+    
+    def __init__(self, backends: Dict[str, Any], selection: Dict[str, str]):
+        """
+        Initialize the router.
+        
+        Args:
+            backends: Backend instances keyed by backend name
+            selection: Backend name per scenario
+        
+        Raises:
+            ValueError: If a scenario names an unknown backend or one that
+                cannot extract that scenario
+        """
+        self.selection = selection
+        self._backends: Dict[str, Any] = {}
+        for scenario in VALID_SCENARIOS:
+            name = selection[scenario]
+            if name not in backends:
+                raise ValueError(f"Unknown extraction backend for {scenario}: {name}")
+            if not hasattr(backends[name], _SCENARIO_METHODS[scenario]):
+                raise ValueError(f"Extraction backend {name} does not support the {scenario} scenario")
+            self._backends[scenario] = backends[name]
+    
+    # PUBLIC_INTERFACE
+    async def extract_checkin_data(self, transcript: str) -> Dict[str, Any]:
+        """
+        Extract structured data from check-in call transcript.
+        
+        Args:
+            transcript: Raw call transcript text
+        
+        Returns:
+            Dictionary with extracted check-in data fields
+        """
+        return await self._backends[SCENARIO_CHECKIN].extract_checkin_data(transcript)
+    
+    # PUBLIC_INTERFACE
+    async def extract_emergency_data(
+        self,
+        transcript: str,
+        on_field: Optional[FieldCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Extract structured data from emergency call transcript.
+        
+        Args:
+            transcript: Raw call transcript text
+            on_field: Optional per-field callback, used by backends that stream
+        
+        Returns:
+            Dictionary with extracted emergency data fields
+        """
+        return await self._backends[SCENARIO_EMERGENCY].extract_emergency_data(transcript, on_field=on_field)
+
+
+# PUBLIC_INTERFACE
+def configured_backends() -> Dict[str, str]:
+    """
+    Get the backend name configured for each scenario.
+    
+    Returns:
+        Backend name per scenario, with environment overrides applied
+    """
+    return {
+        scenario: os.getenv(f"EXTRACTION_BACKEND_{scenario.upper()}", EXTRACTION_BACKENDS[scenario]).lower()
+        for scenario in VALID_SCENARIOS
+    }
+
+
+# Singleton instance
+scenario_extractor = ScenarioExtractor(
+    backends={
+        EXTRACTION_BACKEND_OPENAI: openai_extractor,
+        EXTRACTION_BACKEND_LOCAL: local_checkin_extractor
+    },
+    selection=configured_backends()
+)
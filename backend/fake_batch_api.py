@@ -0,0 +1,253 @@
+"""
+Local stand-in for the OpenAI Files and Batch APIs.
+
+A separate app, never part of the backend API, so the batch extraction
+pipeline can run offline: `python batch_extract.py --fake` serves it
+in-process. Requests are answered by the rule-based check-in extractor;
+fields it cannot fill get a schema default ("N/A", false, or the first
+enum value).
+"""
+
+from email.parser import BytesParser
+from email.policy import default as default_policy
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+from typing import Any, Dict, List
+from rule_extractor import RuleBasedCheckinExtractor
+import json
+import time
+import uuid
+
+# Base URL for BatchAPIClient when the app is served in-process
+FAKE_BATCH_BASE_URL = "http://fake-openai/v1"
+
+app = FastAPI(title="Fake OpenAI Batch API")
+
+_files: Dict[str, Dict[str, Any]] = {}
+_batches: Dict[str, Dict[str, Any]] = {}
+_rule_extractor = RuleBasedCheckinExtractor()
+
+
+def _parse_multipart(content_type: str, body: bytes) -> Dict[str, Any]:
+    """
+    Parse a multipart/form-data body without a form-parsing dependency.
+    
+    Args:
+        content_type: Request Content-Type header, including the boundary
+        body: Raw request body
+    
+    Returns:
+        Mapping of form field name to (filename, bytes) for files or str
+    """
+    message = BytesParser(policy=default_policy).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode("utf-8") + body
+    )
+    fields: Dict[str, Any] = {}
+    for part in message.iter_parts():
+        name = part.get_param("name", header="content-disposition")
+        payload = part.get_payload(decode=True) or b""
+        filename = part.get_filename()
+        fields[name] = (filename, payload) if filename else payload.decode("utf-8")
+    return fields
+
+
+def _default_value(schema: Dict[str, Any]) -> Any:
+    """
+    Get a placeholder value for a JSON schema property.
+    
+    Args:
+        schema: Property schema
+    
+    Returns:
+        First enum value, false for booleans, otherwise "N/A"
+    """
+    if schema.get("enum"):
+        return schema["enum"][0]
+    if schema.get("type") == "boolean":
+        return False
+    return "N/A"
+
+
+def _complete(body: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Answer one chat completion request with rule-based extraction.
+    
+    Args:
+        body: Chat completion request body
+    
+    Returns:
+        Chat completion response body
+    """
+    prompt = body["messages"][-1]["content"]
+    transcript = prompt.rsplit("Transcript:\n", 1)[-1]
+    schema = body["response_format"]["json_schema"]["schema"]
+    guesses = _rule_extractor.extract(transcript)
+    
+    result = {}
+    for name, property_schema in schema["properties"].items():
+        guess = guesses.get(name)
+        result[name] = guess.value if guess is not None and guess.value is not None else _default_value(property_schema)
+    
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model"),
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": json.dumps(result)},
+            "finish_reason": "stop"
+        }],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+    }
+
+
+def _run_batch(requests: List[Dict[str, Any]]) -> str:
+    """
+    Produce a batch output file for a list of requests.
+    
+    Args:
+        requests: Parsed JSONL request lines
+    
+    Returns:
+        Output JSONL text
+    """
+    lines = []
+    for request in requests:
+        lines.append(json.dumps({
+            "id": f"batch_req_{uuid.uuid4().hex[:12]}",
+            "custom_id": request["custom_id"],
+            "response": {
+                "status_code": 200,
+                "request_id": uuid.uuid4().hex,
+                "body": _complete(request["body"])
+            },
+            "error": None
+        }))
+    return "\n".join(lines) + "\n"
+
+
+def _public(batch: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Strip internal keys from a stored batch.
+    
+    Args:
+        batch: Stored batch
+    
+    Returns:
+        Batch object as the API returns it
+    """
+    return {key: value for key, value in batch.items() if not key.startswith("_")}
+
+
+# PUBLIC_INTERFACE
+@app.post("/v1/files")
+async def upload_file(request: Request):
+    """
+    Store an uploaded file.
+    
+    Args:
+        request: multipart/form-data request with "file" and "purpose"
+    
+    Returns:
+        File object
+    """
+    form = _parse_multipart(request.headers.get("content-type", ""), await request.body())
+    if not isinstance(form.get("file"), tuple):
+        raise HTTPException(status_code=400, detail="file is required")
+    
+    filename, content = form["file"]
+    file_id = f"file-{uuid.uuid4().hex[:24]}"
+    _files[file_id] = {"filename": filename, "content": content.decode("utf-8")}
+    return {
+        "id": file_id,
+        "object": "file",
+        "bytes": len(content),
+        "created_at": int(time.time()),
+        "filename": filename,
+        "purpose": form.get("purpose", "batch")
+    }
+
+
+# PUBLIC_INTERFACE
+@app.get("/v1/files/{file_id}/content", response_class=PlainTextResponse)
+async def get_file_content(file_id: str):
+    """
+    Download a stored file.
+    
+    Args:
+        file_id: File ID
+    
+    Returns:
+        File content
+    """
+    if file_id not in _files:
+        raise HTTPException(status_code=404, detail=f"No such file: {file_id}")
+    return _files[file_id]["content"]
+
+
+# PUBLIC_INTERFACE
+@app.post("/v1/batches")
+async def create_batch(request: Request):
+    """
+    Create a batch and process it right away.
+    
+    The batch reports in_progress until it is first fetched, like a real
+    batch that completes between polls.
+    
+    Args:
+        request: JSON body with input_file_id, endpoint, completion_window
+    
+    Returns:
+        Batch object
+    """
+    payload = await request.json()
+    input_file = _files.get(payload.get("input_file_id"))
+    if input_file is None:
+        raise HTTPException(status_code=400, detail="input_file_id not found")
+    
+    requests = [json.loads(line) for line in input_file["content"].splitlines() if line.strip()]
+    output_file_id = f"file-{uuid.uuid4().hex[:24]}"
+    _files[output_file_id] = {"filename": "output.jsonl", "content": _run_batch(requests)}
+    
+    batch_id = f"batch_{uuid.uuid4().hex[:24]}"
+    _batches[batch_id] = {
+        "id": batch_id,
+        "object": "batch",
+        "endpoint": payload.get("endpoint"),
+        "input_file_id": payload["input_file_id"],
+        "completion_window": payload.get("completion_window"),
+        "status": "in_progress",
+        "output_file_id": None,
+        "error_file_id": None,
+        "created_at": int(time.time()),
+        "request_counts": {"total": len(requests), "completed": 0, "failed": 0},
+        "metadata": payload.get("metadata") or {},
+        "_output_file_id": output_file_id
+    }
+    return _public(_batches[batch_id])
+
+
+# PUBLIC_INTERFACE
+@app.get("/v1/batches/{batch_id}")
+async def get_batch(batch_id: str):
+    """
+    Get a batch, completing it on first fetch.
+    
+    Args:
+        batch_id: Batch ID
+    
+    Returns:
+        Batch object
+    """
+    batch = _batches.get(batch_id)
+    if batch is None:
+        raise HTTPException(status_code=404, detail=f"No such batch: {batch_id}")
+    
+    if batch["status"] == "in_progress":
+        batch["status"] = "completed"
+        batch["output_file_id"] = batch["_output_file_id"]
+        batch["request_counts"]["completed"] = batch["request_counts"]["total"]
+        batch["completed_at"] = int(time.time())
+    return _public(batch)
+
@@ -0,0 +1,216 @@
+"""
+Shared, tuned HTTP clients for the Retell, OpenAI and Supabase SDKs.
+
+Every upstream host gets one pooled httpx client that all code talking
+to that host shares. Pools have explicit connection limits, keep idle
+connections much longer than httpx's 5 second default, use HTTP/2 when
+the h2 package is installed, and can be pre-warmed at startup so the first
+real request does not pay for DNS, TCP and TLS.
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Dict, Optional
+import httpx
+from constants import (
+    HTTP_MAX_CONNECTIONS_PER_HOST,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    HTTP_CONNECT_TIMEOUT_SECONDS,
+    HTTP_PREWARM_CONNECTIONS
+)
+from latency import LatencyWindow
+from logger import service_logger
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """Wraps a transport to count requests and report pool usage."""
+    
+    def __init__(self, inner: httpx.AsyncBaseTransport, max_connections: int):
+        """
+        Initialize the transport.
+        
+        Args:
+            inner: Transport that sends the requests
+            max_connections: Pool size, used for utilization
+        """
+        self.inner = inner
+        self.max_connections = max_connections
+        self.latency = LatencyWindow()
+        self.first_request_seconds: Optional[float] = None
+        self.counts = {"requests": 0, "errors": 0, "in_flight": 0, "peak_in_flight": 0}
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Send a request, timing it until the response headers arrive.
+        
+        Args:
+            request: Outgoing request
+        
+        Returns:
+            Response from the inner transport
+        """
+        self.counts["requests"] += 1
+        self.counts["in_flight"] += 1
+        self.counts["peak_in_flight"] = max(self.counts["peak_in_flight"], self.counts["in_flight"])
+        started = time.perf_counter()
+        try:
+            return await self.inner.handle_async_request(request)
+        except Exception:
+            self.counts["errors"] += 1
+            raise
+        finally:
+            self.counts["in_flight"] -= 1
+            seconds = time.perf_counter() - started
+            self.latency.record(seconds)
+            if self.first_request_seconds is None:
+                self.first_request_seconds = seconds
+    
+    async def aclose(self) -> None:
+        """Close the inner transport."""
+        await self.inner.aclose()
+    
+    # PUBLIC_INTERFACE
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get request counters and connection pool utilization.
+        
+        Returns:
+            Dictionary with request counts, open/active/idle connections,
+            utilization of the pool limit, and latency to response headers
+        """
+        pool = getattr(self.inner, "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        idle = sum(1 for connection in connections if connection.is_idle())
+        active = len(connections) - idle
+        return {
+            **self.counts,
+            "connections": len(connections),
+            "active_connections": active,
+            "idle_connections": idle,
+            "max_connections": self.max_connections,
+            "utilization": active / self.max_connections if self.max_connections else 0.0,
+            "first_request_seconds": self.first_request_seconds,
+            "latency": self.latency.stats()
+        }
+
+
+class SharedHTTPClients:
+    """One tuned httpx client per upstream host."""
+    
+    def __init__(self):
+        """Initialize the registry with pool settings from the environment."""
+        self.max_connections = int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", HTTP_MAX_CONNECTIONS_PER_HOST))
+        self.limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=min(self.max_connections, HTTP_MAX_KEEPALIVE_CONNECTIONS),
+            keepalive_expiry=float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", HTTP_KEEPALIVE_EXPIRY_SECONDS))
+        )
+        self.http2 = HTTP2_AVAILABLE and os.getenv("HTTP2_ENABLED", "true").lower() == "true"
+        self.prewarm_connections = int(os.getenv("HTTP_PREWARM_CONNECTIONS", HTTP_PREWARM_CONNECTIONS))
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._transports: Dict[str, InstrumentedTransport] = {}
+        self._warm_urls: Dict[str, str] = {}
+        self.warm_up_seconds: Dict[str, Optional[float]] = {}
+    
+    # PUBLIC_INTERFACE
+    def client(
+        self,
+        name: str,
+        warm_url: Optional[str] = None,
+        timeout: float = 60.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        **kwargs: Any
+    ) -> httpx.AsyncClient:
+        """
+        Get the shared client for an upstream host, creating it on first use.
+        
+        Args:
+            name: Host label used in metrics (e.g. "openai")
+            warm_url: URL requested by warm_up to open connections early
+            timeout: Default request timeout in seconds
+            transport: Optional inner transport (tests); defaults to a
+                pooled HTTP transport with the shared limits
+            **kwargs: Extra httpx.AsyncClient arguments (base_url, headers)
+        
+        Returns:
+            Pooled httpx client
+        """
+        if name in self._clients:
+            return self._clients[name]
+        
+        inner = transport or httpx.AsyncHTTPTransport(limits=self.limits, http2=self.http2)
+        instrumented = InstrumentedTransport(inner, self.max_connections)
+        self._transports[name] = instrumented
+        if warm_url:
+            self._warm_urls[name] = warm_url
+        self._clients[name] = httpx.AsyncClient(
+            transport=instrumented,
+            timeout=httpx.Timeout(timeout, connect=HTTP_CONNECT_TIMEOUT_SECONDS),
+            **kwargs
+        )
+        return self._clients[name]
+    
+    # PUBLIC_INTERFACE
+    async def warm_up(self) -> Dict[str, Optional[float]]:
+        """
+        Open connections to every registered host before real traffic.
+        
+        Any HTTP response (even 401 or 404) counts: the point is an
+        established, kept-alive TLS connection. Failures are logged, not
+        raised, since the first real request will simply connect itself.
+        
+        Returns:
+            Warm-up time per host in seconds, None where it failed
+        """
+        async def warm(name: str, url: str) -> None:
+            started = time.perf_counter()
+            # One request per connection; HTTP/2 multiplexes them onto one
+            results = await asyncio.gather(
+                *(self._clients[name].head(url) for _ in range(max(1, self.prewarm_connections))),
+                return_exceptions=True
+            )
+            errors = [result for result in results if isinstance(result, Exception)]
+            if len(errors) == len(results):
+                service_logger.warning(f"Could not pre-warm {name} connections: {errors[0]}")
+                self.warm_up_seconds[name] = None
+                return
+            self.warm_up_seconds[name] = round(time.perf_counter() - started, 3)
+        
+        await asyncio.gather(*(warm(name, url) for name, url in self._warm_urls.items()))
+        service_logger.info(f"Pre-warmed HTTP connections: {self.warm_up_seconds}")
+        return dict(self.warm_up_seconds)
+    
+    # PUBLIC_INTERFACE
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get pool utilization per host.
+        
+        Returns:
+            Dictionary with HTTP/2 and keep-alive settings and, per host,
+            request counts, connection usage and warm-up time
+        """
+        return {
+            "http2": self.http2,
+            "keepalive_expiry_seconds": self.limits.keepalive_expiry,
+            "hosts": {
+                name: {**transport.stats(), "warm_up_seconds": self.warm_up_seconds.get(name)}
+                for name, transport in self._transports.items()
+            }
+        }
+    
+    # PUBLIC_INTERFACE
+    async def close(self) -> None:
+        """Close every shared client and its connections."""
+        await asyncio.gather(*(client.aclose() for client in self._clients.values()))
+
+
+# Singleton instance
+http_clients = SharedHTTPClients()
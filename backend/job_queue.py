@@ -0,0 +1,287 @@
+"""
+Durable SQLite-backed job queue for background work.
+
+Jobs survive restarts. A claimed job is hidden from other workers for a
+visibility timeout; if the worker dies before completing it, the job
+becomes claimable again. Failed jobs are retried with exponential backoff
+and moved to the dead-letter state after the final attempt.
+"""
+
+import json
+import random
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+JOB_STATUS_PENDING = "pending"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_DEAD = "dead"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_type TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    available_at REAL NOT NULL,
+    last_error TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs(status, available_at);
+"""
+
+
+class SQLiteJobQueue:
+    """Job queue stored in a local SQLite file."""
+    
+    def __init__(
+        self,
+        path: str,
+        max_attempts: int,
+        visibility_timeout: float,
+        retry_base_seconds: float,
+        retry_max_seconds: float
+    ):
+        """
+        Initialize the queue. The database is opened on first use.
+        
+        Args:
+            path: SQLite file path (":memory:" for a non-durable queue)
+            max_attempts: Attempts before a job is dead-lettered
+            visibility_timeout: Seconds a claimed job stays hidden
+            retry_base_seconds: Delay before the first retry
+            retry_max_seconds: Upper bound on the retry delay
+        """
+        self.path = path
+        self.max_attempts = max_attempts
+        self.visibility_timeout = visibility_timeout
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+    
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Open the database and create the schema if needed.
+        
+        Returns:
+            SQLite connection in autocommit mode
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+    
+    # PUBLIC_INTERFACE
+    def enqueue(self, job_type: str, payload: Dict[str, Any], delay: float = 0) -> int:
+        """
+        Add a job to the queue.
+        
+        Args:
+            job_type: Name of the handler that processes the job
+            payload: JSON-serializable job arguments
+            delay: Seconds before the job becomes claimable
+        
+        Returns:
+            Job ID
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._connection().execute(
+                "INSERT INTO jobs (job_type, payload, status, max_attempts, available_at, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_type, json.dumps(payload), JOB_STATUS_PENDING, self.max_attempts, now + delay, now)
+            )
+            return cursor.lastrowid
+    
+    # PUBLIC_INTERFACE
+    def claim(self) -> Optional[Dict[str, Any]]:
+        """
+        Claim the next available job and hide it for the visibility timeout.
+        
+        Pending jobs and running jobs whose visibility timeout has expired
+        are both claimable. Each claim counts as one attempt; an expired
+        job that has used all its attempts (its worker crashed or hung on
+        the final one) is dead-lettered instead of being claimed again.
+        
+        Returns:
+            Job dictionary, or None if nothing is available
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, last_error = ? "
+                    "WHERE status = ? AND available_at <= ? AND attempts >= max_attempts",
+                    (JOB_STATUS_DEAD, "Visibility timeout expired on the final attempt", JOB_STATUS_RUNNING, now)
+                )
+                row = conn.execute(
+                    "SELECT * FROM jobs WHERE status IN (?, ?) AND available_at <= ? "
+                    "ORDER BY available_at, id LIMIT 1",
+                    (JOB_STATUS_PENDING, JOB_STATUS_RUNNING, now)
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+                
+                conn.execute(
+                    "UPDATE jobs SET status = ?, attempts = attempts + 1, available_at = ? WHERE id = ?",
+                    (JOB_STATUS_RUNNING, now + self.visibility_timeout, row["id"])
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        job["attempts"] += 1
+        return job
+    
+    # PUBLIC_INTERFACE
+    def extend(self, job_id: int) -> bool:
+        """
+        Renew a running job's visibility timeout while it is still worked on.
+        
+        Args:
+            job_id: Job ID
+        
+        Returns:
+            True if the job is still running and its lease was renewed
+        """
+        with self._lock:
+            cursor = self._connection().execute(
+                "UPDATE jobs SET available_at = ? WHERE id = ? AND status = ?",
+                (time.time() + self.visibility_timeout, job_id, JOB_STATUS_RUNNING)
+            )
+            return cursor.rowcount > 0
+    
+    # PUBLIC_INTERFACE
+    def complete(self, job_id: int) -> None:
+        """
+        Remove a successfully processed job.
+        
+        Args:
+            job_id: Job ID
+        """
+        with self._lock:
+            self._connection().execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+    
+    # PUBLIC_INTERFACE
+    def fail(self, job_id: int, error: str) -> bool:
+        """
+        Record a failed attempt and schedule a retry or dead-letter the job.
+        
+        Args:
+            job_id: Job ID
+            error: Error message to keep with the job
+        
+        Returns:
+            True if the job will be retried, False if it was dead-lettered
+        """
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT attempts, max_attempts FROM jobs WHERE id = ?",
+                (job_id,)
+            ).fetchone()
+            if row is None:
+                return False
+            
+            if row["attempts"] >= row["max_attempts"]:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, last_error = ? WHERE id = ?",
+                    (JOB_STATUS_DEAD, error, job_id)
+                )
+                return False
+            
+            conn.execute(
+                "UPDATE jobs SET status = ?, available_at = ?, last_error = ? WHERE id = ?",
+                (JOB_STATUS_PENDING, time.time() + self.retry_delay(row["attempts"]), error, job_id)
+            )
+            return True
+    
+    # PUBLIC_INTERFACE
+    def retry_delay(self, attempts: int) -> float:
+        """
+        Get the backoff delay after a number of failed attempts.
+        
+        Args:
+            attempts: Attempts made so far
+        
+        Returns:
+            Delay in seconds, doubled per attempt with jitter and capped
+        """
+        delay = min(self.retry_max_seconds, self.retry_base_seconds * 2 ** (attempts - 1))
+        return delay * random.uniform(0.5, 1.0)
+    
+    # PUBLIC_INTERFACE
+    def dead_letters(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        List dead-lettered jobs, oldest first.
+        
+        Args:
+            limit: Maximum number of jobs to return
+        
+        Returns:
+            List of job dictionaries
+        """
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT * FROM jobs WHERE status = ? ORDER BY id LIMIT ?",
+                (JOB_STATUS_DEAD, limit)
+            ).fetchall()
+        
+        jobs = [dict(row) for row in rows]
+        for job in jobs:
+            job["payload"] = json.loads(job["payload"])
+        return jobs
+    
+    # PUBLIC_INTERFACE
+    def requeue_dead(self) -> int:
+        """
+        Move every dead-lettered job back to pending with fresh attempts.
+        
+        Returns:
+            Number of jobs requeued
+        """
+        with self._lock:
+            cursor = self._connection().execute(
+                "UPDATE jobs SET status = ?, attempts = 0, available_at = ? WHERE status = ?",
+                (JOB_STATUS_PENDING, time.time(), JOB_STATUS_DEAD)
+            )
+            return cursor.rowcount
+    
+    # PUBLIC_INTERFACE
+    def counts(self) -> Dict[str, int]:
+        """
+        Count jobs by status.
+        
+        Returns:
+            Dictionary with pending, running and dead counts
+        """
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT status, COUNT(*) AS total FROM jobs GROUP BY status"
+            ).fetchall()
+        
+        counts = {JOB_STATUS_PENDING: 0, JOB_STATUS_RUNNING: 0, JOB_STATUS_DEAD: 0}
+        counts.update({row["status"]: row["total"] for row in rows})
+        return counts
+    
+    # PUBLIC_INTERFACE
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
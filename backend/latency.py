@@ -0,0 +1,64 @@
+"""
+Rolling latency percentiles for in-process metrics.
+"""
+
+import math
+from collections import deque
+from typing import Deque, Dict
+
+
+class LatencyWindow:
+    """Keeps the most recent latency samples and reports percentiles."""
+    
+    def __init__(self, max_samples: int = 1000):
+        """
+        Initialize the window.
+        
+        Args:
+            max_samples: Number of recent samples kept
+        """
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+        self.count = 0
+    
+    # PUBLIC_INTERFACE
+    def record(self, seconds: float) -> None:
+        """
+        Add a latency sample.
+        
+        Args:
+            seconds: Observed latency in seconds
+        """
+        self._samples.append(seconds)
+        self.count += 1
+    
+    # PUBLIC_INTERFACE
+    def percentile(self, percent: float) -> float:
+        """
+        Get a latency percentile over the window (nearest-rank).
+        
+        Args:
+            percent: Percentile between 0 and 100
+        
+        Returns:
+            Latency in seconds, or 0.0 if there are no samples
+        """
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        rank = max(1, math.ceil(percent / 100 * len(ordered)))
+        return ordered[rank - 1]
+    
+    # PUBLIC_INTERFACE
+    def stats(self) -> Dict[str, float]:
+        """
+        Get summary percentiles.
+        
+        Returns:
+            Dictionary with sample count and p50/p90/p99 in seconds
+        """
+        return {
+            "count": self.count,
+            "p50_seconds": self.percentile(50),
+            "p90_seconds": self.percentile(90),
+            "p99_seconds": self.percentile(99)
+        }
@@ -3,10 +3,16 @@ Main FastAPI application entry point.
 """
 
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
-from routers import configurations, webhooks, calls
-from startup import initialize_agents
+from routers import configurations, webhooks, calls, metrics
+from startup import start_agent_initialization
+from readiness import readiness
+from database import close_database
+from http_transport import http_clients
+from services.extraction_worker import extraction_pool
+from openai_client import openai_extractor
 from logger import app_logger
 import asyncio
 
@@ -31,6 +37,9 @@ app.add_middleware(
 app.include_router(configurations.router)
 app.include_router(webhooks.router)
 app.include_router(calls.router)
+app.include_router(metrics.router)
+
+_warm_up_task = None
 
 
 @app.on_event("startup")
@@ -38,8 +47,26 @@ async def startup_event():
     """Run initialization on startup."""
     app_logger.info("Starting Logistics Voice Agent API")
     
-    # Run agent initialization in background
-    asyncio.create_task(initialize_agents())
+    # Start background transcript extraction workers
+    extraction_pool.start()
+    
+    # Open Retell, OpenAI and Supabase connections before the first request
+    global _warm_up_task
+    _warm_up_task = asyncio.create_task(http_clients.warm_up())
+    
+    # Provision agents in background; call initiation waits on the readiness gate
+    start_agent_initialization()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled connections on shutdown."""
+    app_logger.info("Shutting down Logistics Voice Agent API")
+    await extraction_pool.stop()
+    extraction_pool.job_queue.close()
+    openai_extractor.cache.close()
+    await close_database()
+    await http_clients.close()
 
 
 # PUBLIC_INTERFACE
@@ -64,3 +91,17 @@ def health_check():
         Health status
     """
     return {"status": "healthy"}
+
+
+# PUBLIC_INTERFACE
+@app.get("/ready", tags=["health"])
+def readiness_check():
+    """
+    Readiness endpoint.
+    
+    Returns:
+        Per-scenario agent provisioning state and timing; 503 until every
+        scenario's agent is ready
+    """
+    status = readiness.status()
+    return JSONResponse(status_code=200 if status["ready"] else 503, content=status)
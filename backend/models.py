@@ -1,5 +1,6 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, BeforeValidator, Field, create_model
+from typing import Annotated, Any, Dict, List, Literal, Optional, Tuple, Type
+from functools import lru_cache
 
 class RetellSettings(BaseModel):
     enable_backchannel: bool = True
@@ -25,6 +26,7 @@ class ConfigurationResponse(BaseModel):
     llm_id: Optional[str] = None
     agent_id: Optional[str] = None
     created_at: str
+    retell_sync: Optional[dict] = None
 
 class WebCallInitiateRequest(BaseModel):
     driver_name: str = Field(..., min_length=1)
@@ -36,3 +38,127 @@ class WebCallInitiateResponse(BaseModel):
     retell_call_id: str
     access_token: str
     status: str
+
+
+def _canonical_choice(choices: Tuple[str, ...]):
+    """
+    Build a validator that fixes the case of enum values ("driving" -> "Driving").
+    
+    Args:
+        choices: Allowed values
+    
+    Returns:
+        BeforeValidator that maps case-insensitive matches onto the allowed value
+    """
+    by_key = {choice.lower(): choice for choice in choices}
+    
+    def match(value: Any) -> Any:
+        if isinstance(value, str):
+            return by_key.get(value.strip().lower(), value)
+        return value
+    
+    return BeforeValidator(match)
+
+
+def _choice(*choices: str):
+    """Enum string type that tolerates case differences."""
+    return Annotated[Literal[choices], _canonical_choice(choices)]
+
+
+class CheckinExtraction(BaseModel):
+    call_outcome: _choice("In-Transit Update", "Arrival Confirmation")
+    driver_status: _choice("Driving", "Delayed", "Arrived", "Unloading")
+    current_location: str
+    eta: str
+    delay_reason: str
+    unloading_status: str
+    pod_reminder_acknowledged: bool
+
+class EmergencyExtraction(BaseModel):
+    call_outcome: _choice("Emergency Escalation")
+    emergency_type: _choice("Accident", "Breakdown", "Medical", "Other")
+    safety_status: str
+    injury_status: str
+    emergency_location: str
+    load_secure: bool
+    escalation_status: str
+
+
+# PUBLIC_INTERFACE
+@lru_cache(maxsize=None)
+def extraction_subset_model(model: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """
+    Get a model containing only some fields of an extraction model.
+    
+    Used to validate and request the fields that are re-asked.
+    
+    Args:
+        model: CheckinExtraction or EmergencyExtraction
+        fields: Field names to keep, in order
+    
+    Returns:
+        Pydantic model with the same types and validators for those fields
+    """
+    return create_model(
+        f"{model.__name__}Subset",
+        **{name: (model.model_fields[name].annotation, model.model_fields[name]) for name in fields}
+    )
+
+
+# PUBLIC_INTERFACE
+def strict_json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Build a JSON schema accepted by OpenAI strict structured outputs.
+    
+    Every property is required, extra properties are rejected, and
+    single-value enums are written as enum rather than const.
+    
+    Args:
+        model: Pydantic model
+    
+    Returns:
+        JSON schema dictionary
+    """
+    properties: Dict[str, Any] = {}
+    for name, schema in model.model_json_schema()["properties"].items():
+        schema = {key: value for key, value in schema.items() if key != "title"}
+        if "const" in schema:
+            schema = {"type": "string", "enum": [schema["const"]]}
+        properties[name] = schema
+    
+    required: List[str] = list(properties)
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": required,
+        "additionalProperties": False
+    }
+
+
+# PUBLIC_INTERFACE
+def strict_json_batch_schema(model: Type[BaseModel], key: str) -> Dict[str, Any]:
+    """
+    Build a strict JSON schema for several results returned in one response.
+    
+    The response is an object with a "results" array; each item carries the
+    key identifying its input followed by the model's fields.
+    
+    Args:
+        model: Pydantic model of one result
+        key: Name of the string property identifying each input
+    
+    Returns:
+        JSON schema dictionary
+    """
+    item = strict_json_schema(model)
+    item = {
+        **item,
+        "properties": {key: {"type": "string"}, **item["properties"]},
+        "required": [key, *item["required"]]
+    }
+    return {
+        "type": "object",
+        "properties": {"results": {"type": "array", "items": item}},
+        "required": ["results"],
+        "additionalProperties": False
+    }
@@ -0,0 +1,319 @@
+"""
+Managed pool of outbound from-numbers.
+
+Outbound calls are spread over every number in RETELL_FROM_NUMBERS
+(comma-separated; a lone RETELL_FROM_NUMBER is a pool of one). A number
+carries at most FROM_NUMBER_MAX_CONCURRENT_CALLS calls from the moment it
+is picked until Retell reports the call ended. A number that fails
+FROM_NUMBER_FAILURE_THRESHOLD times in a row is skipped for a cool-down,
+so a number the carrier has started rejecting stops taking traffic.
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from constants import (
+    FROM_NUMBER_MAX_CONCURRENT_CALLS,
+    FROM_NUMBER_SELECTION_LEAST_LOADED,
+    FROM_NUMBER_SELECTION_ROUND_ROBIN,
+    FROM_NUMBER_SELECTIONS,
+    FROM_NUMBER_FAILURE_THRESHOLD,
+    FROM_NUMBER_COOLDOWN_SECONDS,
+    FROM_NUMBER_CALL_TIMEOUT_SECONDS,
+    FROM_NUMBER_FAILURE_REASONS
+)
+from exceptions import FromNumberUnavailableError
+from logger import service_logger
+
+
+class FromNumberPool:
+    """Per-number call limits, selection and cool-down for outbound calls."""
+    
+    def __init__(
+        self,
+        max_concurrent: Optional[int] = None,
+        selection: Optional[str] = None,
+        failure_threshold: Optional[int] = None,
+        cooldown_seconds: Optional[float] = None,
+        call_timeout_seconds: float = FROM_NUMBER_CALL_TIMEOUT_SECONDS
+    ):
+        """
+        Initialize the pool; unset settings are read from the environment.
+        
+        Args:
+            max_concurrent: Calls each number carries at once
+            selection: "least_loaded" or "round_robin"
+            failure_threshold: Consecutive failures that start a cool-down
+            cooldown_seconds: How long a failing number is skipped
+            call_timeout_seconds: Calls with no end event after this long
+                stop counting against their number
+        
+        Raises:
+            ValueError: If the selection strategy is unknown
+        """
+        self.max_concurrent = max_concurrent or int(
+            os.getenv("FROM_NUMBER_MAX_CONCURRENT_CALLS", FROM_NUMBER_MAX_CONCURRENT_CALLS)
+        )
+        self.selection = selection or os.getenv("FROM_NUMBER_SELECTION", FROM_NUMBER_SELECTION_LEAST_LOADED)
+        if self.selection not in FROM_NUMBER_SELECTIONS:
+            raise ValueError(
+                f"Unknown from-number selection {self.selection!r}; "
+                f"expected one of {', '.join(FROM_NUMBER_SELECTIONS)}"
+            )
+        self.failure_threshold = failure_threshold or int(
+            os.getenv("FROM_NUMBER_FAILURE_THRESHOLD", FROM_NUMBER_FAILURE_THRESHOLD)
+        )
+        self.cooldown_seconds = cooldown_seconds if cooldown_seconds is not None else float(
+            os.getenv("FROM_NUMBER_COOLDOWN_SECONDS", FROM_NUMBER_COOLDOWN_SECONDS)
+        )
+        self.call_timeout_seconds = call_timeout_seconds
+        self._state: Dict[str, Dict[str, Any]] = {}
+        self._calls: Dict[str, Tuple[str, float]] = {}
+        self._waiters: List[asyncio.Future] = []
+        self._next = 0
+    
+    # PUBLIC_INTERFACE
+    def numbers(self) -> List[str]:
+        """
+        Get the configured from-numbers.
+        
+        Read on every call so configuration changes apply without a restart.
+        
+        Returns:
+            Numbers from RETELL_FROM_NUMBERS, else RETELL_FROM_NUMBER
+        """
+        configured = os.getenv("RETELL_FROM_NUMBERS") or os.getenv("RETELL_FROM_NUMBER") or ""
+        return [number.strip() for number in configured.split(",") if number.strip()]
+    
+    # PUBLIC_INTERFACE
+    async def acquire(self, timeout: Optional[float]) -> str:
+        """
+        Reserve a call slot on a from-number.
+        
+        The slot is held until release() or, once the call is placed,
+        until call_ended() for its Retell call ID.
+        
+        Args:
+            timeout: Longest wait for a free number in seconds (None waits
+                until one is free)
+        
+        Returns:
+            From-number to dial from
+        
+        Raises:
+            FromNumberUnavailableError: If no number is configured, or none
+                became free within the timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            numbers = self.numbers()
+            if not numbers:
+                raise FromNumberUnavailableError()
+            number = self._pick(numbers)
+            if number is not None:
+                return number
+            
+            # Wake on a release, when the next cool-down ends, or when the
+            # oldest call without an end event expires
+            now = time.monotonic()
+            waits = [
+                self._state[number]["cooling_until"] - now
+                for number in numbers
+                if self._state[number]["cooling_until"] > now
+            ]
+            if self._calls:
+                oldest = min(started for _, started in self._calls.values())
+                waits.append(max(0.0, oldest + self.call_timeout_seconds - now))
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise FromNumberUnavailableError()
+                waits.append(remaining)
+            await self._wait(min(waits) if waits else None)
+    
+    # PUBLIC_INTERFACE
+    def attach(self, number: str, retell_call_id: str) -> None:
+        """
+        Tie a reserved slot to the call placed with it.
+        
+        Args:
+            number: From-number returned by acquire
+            retell_call_id: Retell call ID of the placed call
+        """
+        self._calls[retell_call_id] = (number, time.monotonic())
+        self._number(number)["consecutive_failures"] = 0
+    
+    # PUBLIC_INTERFACE
+    def release(self, number: str, failed: bool = False) -> None:
+        """
+        Free a reserved slot.
+        
+        Args:
+            number: From-number returned by acquire
+            failed: Whether the call failed because of the number (counts
+                towards its cool-down)
+        """
+        state = self._number(number)
+        state["active"] = max(0, state["active"] - 1)
+        if failed:
+            state["failures"] += 1
+            state["consecutive_failures"] += 1
+            if state["consecutive_failures"] >= self.failure_threshold:
+                state["consecutive_failures"] = 0
+                state["cooling_until"] = time.monotonic() + self.cooldown_seconds
+                state["cooldowns"] += 1
+                service_logger.warning(
+                    f"From-number {number} failed {self.failure_threshold} times in a row; "
+                    f"cooling down for {self.cooldown_seconds:.0f}s"
+                )
+        self._notify()
+    
+    # PUBLIC_INTERFACE
+    def call_ended(self, retell_call_id: str, disconnection_reason: Optional[str] = None) -> bool:
+        """
+        Free the slot of a call Retell reported as ended.
+        
+        Args:
+            retell_call_id: Retell call ID
+            disconnection_reason: Retell disconnection reason; dial failures
+                count against the number
+        
+        Returns:
+            True if the call held a slot in this pool
+        """
+        entry = self._calls.pop(retell_call_id, None)
+        if entry is None:
+            return False
+        self.release(entry[0], failed=disconnection_reason in FROM_NUMBER_FAILURE_REASONS)
+        return True
+    
+    def _number(self, number: str) -> Dict[str, Any]:
+        """
+        Get a number's state, creating it on first use.
+        
+        Args:
+            number: From-number
+        
+        Returns:
+            Mutable state dictionary
+        """
+        if number not in self._state:
+            self._state[number] = {
+                "active": 0,
+                "peak_active": 0,
+                "calls": 0,
+                "failures": 0,
+                "consecutive_failures": 0,
+                "cooldowns": 0,
+                "cooling_until": 0.0,
+                "last_picked": 0.0
+            }
+        return self._state[number]
+    
+    def _pick(self, numbers: List[str]) -> Optional[str]:
+        """
+        Reserve a slot on the best available number.
+        
+        Args:
+            numbers: Configured from-numbers
+        
+        Returns:
+            Chosen number, or None if all are full or cooling down
+        """
+        self._expire_stale()
+        now = time.monotonic()
+        available = [
+            number for number in numbers
+            if self._number(number)["active"] < self.max_concurrent
+            and self._number(number)["cooling_until"] <= now
+        ]
+        if not available:
+            return None
+        
+        if self.selection == FROM_NUMBER_SELECTION_ROUND_ROBIN:
+            start = self._next % len(numbers)
+            rotation = numbers[start:] + numbers[:start]
+            number = next(candidate for candidate in rotation if candidate in available)
+            self._next = numbers.index(number) + 1
+        else:
+            # Fewest active calls; ties go to the number idle the longest
+            number = min(
+                available,
+                key=lambda candidate: (self._state[candidate]["active"], self._state[candidate]["last_picked"])
+            )
+        
+        state = self._state[number]
+        state["active"] += 1
+        state["calls"] += 1
+        state["peak_active"] = max(state["peak_active"], state["active"])
+        state["last_picked"] = now
+        return number
+    
+    def _expire_stale(self) -> None:
+        """Free slots of calls whose end event never arrived."""
+        cutoff = time.monotonic() - self.call_timeout_seconds
+        stale = [call_id for call_id, (_, started) in self._calls.items() if started < cutoff]
+        for call_id in stale:
+            number, _ = self._calls.pop(call_id)
+            service_logger.warning(f"No end event for call {call_id} on {number}; freeing its slot")
+            self.release(number)
+    
+    async def _wait(self, timeout: Optional[float]) -> None:
+        """
+        Wait for a slot to be released.
+        
+        Args:
+            timeout: Longest wait in seconds (None waits indefinitely)
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._waiters.remove(waiter)
+    
+    def _notify(self) -> None:
+        """Wake every acquire waiting for a slot."""
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+    
+    # PUBLIC_INTERFACE
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get per-number utilization.
+        
+        Returns:
+            Dictionary with the selection strategy, per-number call limit,
+            callers waiting for a slot and, per number, active and peak
+            calls, utilization, calls placed, failures and cool-down state
+        """
+        now = time.monotonic()
+        numbers = {}
+        for number in self.numbers():
+            state = self._number(number)
+            cooldown_remaining = max(0.0, state["cooling_until"] - now)
+            numbers[number] = {
+                "active_calls": state["active"],
+                "peak_active_calls": state["peak_active"],
+                "utilization": state["active"] / self.max_concurrent,
+                "calls": state["calls"],
+                "failures": state["failures"],
+                "cooldowns": state["cooldowns"],
+                "cooling_down": cooldown_remaining > 0,
+                "cooldown_remaining_seconds": round(cooldown_remaining, 1)
+            }
+        return {
+            "selection": self.selection,
+            "max_concurrent_calls": self.max_concurrent,
+            "waiting": len(self._waiters),
+            "numbers": numbers
+        }
+
+
+# Singleton instance
+from_number_pool = FromNumberPool()
@@ -4,10 +4,109 @@ OpenAI client for transcript data extraction.
 
 import os
 from openai import AsyncOpenAI
-from typing import Dict, Any
-from constants import OPENAI_MODEL, OPENAI_TEMPERATURE
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Set, Tuple
+from pydantic import ValidationError
+from constants import (
+    OPENAI_MODEL,
+    OPENAI_FAST_MODEL,
+    OPENAI_MODEL_PRICING,
+    ROUTING_LONG_TRANSCRIPT_TOKENS,
+    OPENAI_TEMPERATURE,
+    SCENARIO_CHECKIN,
+    SCENARIO_EMERGENCY,
+    CHECKIN_FIELDS,
+    EXTRACTION_CACHE_MAX_SIZE,
+    OPENAI_REQUESTS_PER_MINUTE,
+    OPENAI_TOKENS_PER_MINUTE,
+    OPENAI_COMPLETION_TOKEN_ESTIMATE,
+    OPENAI_MAX_RETRIES,
+    OPENAI_RETRY_BASE_SECONDS,
+    OPENAI_RETRY_MAX_SECONDS,
+    FAST_PATH_CONFIDENCE_THRESHOLD,
+    ROUTING_KEY_FIELDS,
+    ROUTING_PLACEHOLDER_VALUES,
+    CHECKIN_OUTCOME_BY_STATUS,
+    TRANSCRIPT_TOKEN_BUDGET,
+    EXTRACTION_REASK_ATTEMPTS,
+    CHUNKED_EXTRACTION_THRESHOLD_TOKENS,
+    CHUNKED_EXTRACTION_CHUNK_TOKENS,
+    CHUNKED_EXTRACTION_MAX_CHUNKS,
+    EXTRACTION_BATCH_MAX_ITEMS,
+    EXTRACTION_BATCH_MAX_WAIT_MS,
+    EXTRACTION_BATCH_MAX_TOKENS,
+    EMERGENCY_HEDGE_PERCENTILE,
+    EMERGENCY_HEDGE_MAX_RATE,
+    EMERGENCY_HEDGE_MIN_SAMPLES,
+    OPENAI_API_BASE_URL
+)
+from extraction_batcher import MicroBatcher
+from extraction_cache import ExtractionCache, extraction_cache_key
+from extraction_merge import merge_chunk_results
+from http_transport import http_clients
+from latency import LatencyWindow
+from models import (
+    CheckinExtraction,
+    EmergencyExtraction,
+    extraction_subset_model,
+    strict_json_batch_schema,
+    strict_json_schema
+)
+from rate_limiter import RateGovernor
+from request_hedging import RequestHedger
+from rule_extractor import RuleBasedCheckinExtractor
+from streaming_json import IncrementalObjectParser
+from transcripts import chunk_transcript, compact_transcript, count_tokens, transcript_hash
 from logger import service_logger
+from functools import partial
+import asyncio
+import hashlib
 import json
+import time
+
+# Called with (field, value) as each extracted field becomes available
+FieldCallback = Callable[[str, Any], Awaitable[None]]
+
+EXTRACTION_SYSTEM_PROMPT = "You are a data extraction assistant. Return only valid JSON."
+
+# JSON schema lines shown to the model, one per extracted field
+CHECKIN_FIELD_SPECS = {
+    "call_outcome": '"In-Transit Update" OR "Arrival Confirmation"',
+    "driver_status": '"Driving" OR "Delayed" OR "Arrived" OR "Unloading"',
+    "current_location": "\"string (e.g., 'I-10 near Indio, CA')\"",
+    "eta": "\"string (e.g., 'Tomorrow, 8:00 AM') or 'N/A'\"",
+    "delay_reason": "\"string (e.g., 'Heavy Traffic', 'Weather', 'None')\"",
+    "unloading_status": "\"string (e.g., 'In Door 42', 'Waiting for Lumper', 'N/A')\"",
+    "pod_reminder_acknowledged": "true or false"
+}
+EMERGENCY_FIELD_SPECS = {
+    "call_outcome": '"Emergency Escalation"',
+    "emergency_type": '"Accident" OR "Breakdown" OR "Medical" OR "Other"',
+    "safety_status": "\"string (e.g., 'Driver confirmed everyone is safe')\"",
+    "injury_status": "\"string (e.g., 'No injuries reported')\"",
+    "emergency_location": "\"string (e.g., 'I-15 North, Mile Marker 123')\"",
+    "load_secure": "true or false",
+    "escalation_status": '"Connected to Human Dispatcher"'
+}
+
+
+class ExtractionValidationError(ValueError):
+    """Raised when the model keeps returning fields that fail validation."""
+
+
+def _render_fields(specs: Dict[str, str], fields: Optional[List[str]]) -> str:
+    """
+    Render the JSON field block of an extraction prompt.
+    
+    Args:
+        specs: Field name to value description
+        fields: Fields to include, or None for all
+    
+    Returns:
+        Field lines inside braces
+    """
+    names = fields if fields is not None else list(specs)
+    lines = ",\n".join(f'  "{name}": {specs[name]}' for name in names)
+    return "{\n" + lines + "\n}"
 
 
 class OpenAIExtractor:
@@ -19,98 +118,875 @@ class OpenAIExtractor:
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY must be set")
         
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        # Retries are owned by the rate governor so they respect the shared buckets
+        self.client = AsyncOpenAI(
+            api_key=self.api_key,
+            max_retries=0,
+            http_client=http_clients.client("openai", warm_url=OPENAI_API_BASE_URL, timeout=600.0)
+        )
+        self.rate_governor = RateGovernor(
+            requests_per_minute=float(os.getenv("OPENAI_REQUESTS_PER_MINUTE", OPENAI_REQUESTS_PER_MINUTE)),
+            tokens_per_minute=float(os.getenv("OPENAI_TOKENS_PER_MINUTE", OPENAI_TOKENS_PER_MINUTE)),
+            max_retries=int(os.getenv("OPENAI_MAX_RETRIES", OPENAI_MAX_RETRIES)),
+            retry_base_seconds=OPENAI_RETRY_BASE_SECONDS,
+            retry_max_seconds=OPENAI_RETRY_MAX_SECONDS
+        )
+        self.cache = ExtractionCache(
+            max_size=int(os.getenv("EXTRACTION_CACHE_MAX_SIZE", EXTRACTION_CACHE_MAX_SIZE)),
+            disk_path=os.getenv("EXTRACTION_CACHE_PATH") or None
+        )
+        self.token_budget = int(os.getenv("TRANSCRIPT_TOKEN_BUDGET", TRANSCRIPT_TOKEN_BUDGET))
+        self.compaction_stats = {"transcripts": 0, "raw_tokens": 0, "compacted_tokens": 0}
+        self.chunk_threshold_tokens = int(
+            os.getenv("CHUNKED_EXTRACTION_THRESHOLD_TOKENS", CHUNKED_EXTRACTION_THRESHOLD_TOKENS)
+        )
+        self.chunk_tokens = int(os.getenv("CHUNKED_EXTRACTION_CHUNK_TOKENS", CHUNKED_EXTRACTION_CHUNK_TOKENS))
+        self.max_chunks = int(os.getenv("CHUNKED_EXTRACTION_MAX_CHUNKS", CHUNKED_EXTRACTION_MAX_CHUNKS))
+        self.chunking_counts = {"transcripts": 0, "chunks": 0, "dropped_chunks": 0}
+        self.fast_path = RuleBasedCheckinExtractor()
+        self.fast_path_threshold = float(
+            os.getenv("FAST_PATH_CONFIDENCE_THRESHOLD", FAST_PATH_CONFIDENCE_THRESHOLD)
+        )
+        self.fast_path_counts = {
+            "calls": 0,
+            "resolved_locally": 0,
+            "partial_llm": 0,
+            "full_llm": 0,
+            "fields_resolved_locally": 0
+        }
+        self.checkin_latency = {
+            "local": LatencyWindow(),
+            "llm": LatencyWindow()
+        }
+        self._labels = {
+            SCENARIO_CHECKIN: "check-in",
+            SCENARIO_EMERGENCY: "emergency"
+        }
+        self._result_models = {
+            SCENARIO_CHECKIN: CheckinExtraction,
+            SCENARIO_EMERGENCY: EmergencyExtraction
+        }
+        self.reask_attempts = EXTRACTION_REASK_ATTEMPTS
+        self.strong_model = OPENAI_MODEL
+        self.fast_model = os.getenv("OPENAI_FAST_MODEL", OPENAI_FAST_MODEL) or None
+        self.long_transcript_tokens = int(
+            os.getenv("ROUTING_LONG_TRANSCRIPT_TOKENS", ROUTING_LONG_TRANSCRIPT_TOKENS)
+        )
+        self.routing_counts = {"fast_first": 0, "strong_first": 0, "escalated": 0, "disputed": 0}
+        self.tier_usage: Dict[str, Dict[str, Any]] = {}
+        self.tier_latency: Dict[str, LatencyWindow] = {}
+        self.streaming_counts = {"streams": 0, "interrupted": 0, "early_fields": 0}
+        self.first_field_latency = LatencyWindow()
+        self.validation_stats = {"responses": 0, "invalid_responses": 0, "reasked_fields": 0, "failed": 0}
+        self.batcher = MicroBatcher(
+            self._request_batch,
+            max_items=int(os.getenv("EXTRACTION_BATCH_MAX_ITEMS", EXTRACTION_BATCH_MAX_ITEMS)),
+            max_wait_seconds=float(os.getenv("EXTRACTION_BATCH_MAX_WAIT_MS", EXTRACTION_BATCH_MAX_WAIT_MS)) / 1000
+        )
+        self.batch_max_tokens = int(os.getenv("EXTRACTION_BATCH_MAX_TOKENS", EXTRACTION_BATCH_MAX_TOKENS))
+        self.emergency_hedger = RequestHedger(
+            percentile=EMERGENCY_HEDGE_PERCENTILE,
+            max_rate=float(os.getenv("EMERGENCY_HEDGE_MAX_RATE", EMERGENCY_HEDGE_MAX_RATE)),
+            min_samples=EMERGENCY_HEDGE_MIN_SAMPLES
+        )
+        self._prompt_builders = {
+            SCENARIO_CHECKIN: self._build_checkin_prompt,
+            SCENARIO_EMERGENCY: self._build_emergency_prompt
+        }
     
     # PUBLIC_INTERFACE
     async def extract_checkin_data(self, transcript: str) -> Dict[str, Any]:
         """
         Extract structured data from check-in call transcript.
         
+        The rule-based fast path runs first. Only fields it cannot fill with
+        enough confidence are sent to the model, and calls whose driver
+        status is unclear are sent to the model whole. Its low-confidence
+        guesses are used to check the fast model's answer.
+        
         Args:
             transcript: Raw call transcript text
-            
+        
         Returns:
             Dictionary with extracted check-in data fields
         """
-        prompt = self._build_checkin_prompt(transcript)
+        started = time.perf_counter()
+        chunks = self._prepare(transcript)
+        guesses = self.fast_path.extract(chunks[0] if len(chunks) == 1 else transcript)
+        resolved = {
+            field: guess.value
+            for field, guess in guesses.items()
+            if guess.confidence >= self.fast_path_threshold
+        }
+        hints = {
+            field: guess.value
+            for field, guess in guesses.items()
+            if guess.confidence > 0 and str(guess.value).lower() not in ROUTING_PLACEHOLDER_VALUES
+        }
+        self.fast_path_counts["calls"] += 1
         
-        try:
-            response = await self.client.chat.completions.create(
-                model=OPENAI_MODEL,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a data extraction assistant. Return only valid JSON."
-                    },
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=OPENAI_TEMPERATURE,
-                response_format={"type": "json_object"}
-            )
-            
-            result = json.loads(response.choices[0].message.content)
-            service_logger.debug(f"Successfully extracted check-in data")
+        if "driver_status" not in resolved:
+            self.fast_path_counts["full_llm"] += 1
+            result = await self._extract_chunks(SCENARIO_CHECKIN, chunks, hints=hints)
+            self.checkin_latency["llm"].record(time.perf_counter() - started)
             return result
-        except Exception as e:
-            service_logger.error(f"Error extracting check-in data: {e}")
-            raise
+        
+        self.fast_path_counts["fields_resolved_locally"] += len(resolved)
+        missing = [field for field in CHECKIN_FIELDS if field not in resolved]
+        if not missing:
+            self.fast_path_counts["resolved_locally"] += 1
+            self.checkin_latency["local"].record(time.perf_counter() - started)
+            service_logger.debug("Check-in extraction resolved by fast path")
+            return {field: resolved[field] for field in CHECKIN_FIELDS}
+        
+        self.fast_path_counts["partial_llm"] += 1
+        result = await self._extract_chunks(SCENARIO_CHECKIN, chunks, fields=missing, hints=hints)
+        self.checkin_latency["llm"].record(time.perf_counter() - started)
+        return {
+            field: resolved[field] if field in resolved else result.get(field)
+            for field in CHECKIN_FIELDS
+        }
     
     # PUBLIC_INTERFACE
-    async def extract_emergency_data(self, transcript: str) -> Dict[str, Any]:
+    async def extract_emergency_data(
+        self,
+        transcript: str,
+        on_field: Optional[FieldCallback] = None
+    ) -> Dict[str, Any]:
         """
         Extract structured data from emergency call transcript.
         
         Args:
             transcript: Raw call transcript text
-            
+            on_field: Optional coroutine called with (field, value) as soon
+                as each field is received and validated; enables streaming
+        
         Returns:
             Dictionary with extracted emergency data fields
         """
-        prompt = self._build_emergency_prompt(transcript)
+        return await self._extract_chunks(SCENARIO_EMERGENCY, self._prepare(transcript), on_field=on_field)
+    
+    # PUBLIC_INTERFACE
+    def build_request(self, scenario_type: str, transcript: str) -> Dict[str, Any]:
+        """
+        Build the chat completion body for a full extraction on the strong model.
+        
+        Used by the offline batch pipeline, which sends requests itself.
+        
+        Args:
+            scenario_type: Scenario type
+            transcript: Raw call transcript text
+        
+        Returns:
+            Chat completion request body
+        """
+        fields = list(self._result_models[scenario_type].model_fields)
+        params, _ = self._request_params(scenario_type, self._compact(transcript), fields, self.strong_model)
+        return params
+    
+    # PUBLIC_INTERFACE
+    def parse_result(self, scenario_type: str, content: str) -> Dict[str, Any]:
+        """
+        Decode and validate a completion produced from build_request.
+        
+        Args:
+            scenario_type: Scenario type
+            content: Message content of the completion
+        
+        Returns:
+            Validated structured data
+        
+        Raises:
+            ExtractionValidationError: If the content is not valid JSON or
+                any field fails validation
+        """
+        try:
+            data = json.loads(content)
+        except (TypeError, ValueError) as e:
+            raise ExtractionValidationError(f"Invalid JSON in completion: {e}")
+        
+        fields = list(self._result_models[scenario_type].model_fields)
+        valid, failing = self._validate(scenario_type, data, fields)
+        if failing:
+            raise ExtractionValidationError(f"Invalid fields: {', '.join(failing)}")
+        return valid
+    
+    # PUBLIC_INTERFACE
+    def fast_path_stats(self) -> Dict[str, Any]:
+        """
+        Get fast-path counters and check-in extraction latency.
+        
+        Returns:
+            Dictionary with call counts, the share of calls resolved without
+            the model, and latency percentiles for local and model paths
+        """
+        calls = self.fast_path_counts["calls"]
+        return {
+            **self.fast_path_counts,
+            "threshold": self.fast_path_threshold,
+            "local_share": self.fast_path_counts["resolved_locally"] / calls if calls else 0.0,
+            "latency": {path: window.stats() for path, window in self.checkin_latency.items()}
+        }
+    
+    # PUBLIC_INTERFACE
+    def routing_stats(self) -> Dict[str, Any]:
+        """
+        Get tiered routing counters.
+        
+        Returns:
+            Dictionary with first-tier counts, the escalation rate of
+            fast-first extractions, and per-model latency, tokens and cost
+        """
+        fast_first = self.routing_counts["fast_first"]
+        return {
+            **self.routing_counts,
+            "fast_model": self.fast_model,
+            "strong_model": self.strong_model,
+            "escalation_rate": self.routing_counts["escalated"] / fast_first if fast_first else 0.0,
+            "tiers": {
+                model_name: {
+                    **usage,
+                    "cost_usd": round(usage["cost_usd"], 6),
+                    "latency": self.tier_latency[model_name].stats()
+                }
+                for model_name, usage in self.tier_usage.items()
+            }
+        }
+    
+    # PUBLIC_INTERFACE
+    def streaming_stats(self) -> Dict[str, Any]:
+        """
+        Get streaming extraction counters.
+        
+        Returns:
+            Dictionary with stream and early field counts and the time from
+            request start to the first published field
+        """
+        return {
+            **self.streaming_counts,
+            "time_to_first_field": self.first_field_latency.stats()
+        }
+    
+    # PUBLIC_INTERFACE
+    def hedging_stats(self) -> Dict[str, Any]:
+        """
+        Get emergency request hedging counters.
+        
+        Returns:
+            Dictionary with hedge counts and win rates, the current trigger
+            delay, and the emergency request latency callers observed
+        """
+        return self.emergency_hedger.stats()
+    
+    # PUBLIC_INTERFACE
+    def chunking_stats(self) -> Dict[str, Any]:
+        """
+        Get chunked extraction counters.
+        
+        Returns:
+            Dictionary with chunked transcript and chunk counts and the
+            configured thresholds
+        """
+        return {
+            **self.chunking_counts,
+            "threshold_tokens": self.chunk_threshold_tokens,
+            "chunk_tokens": self.chunk_tokens
+        }
+    
+    # PUBLIC_INTERFACE
+    def prompt_version(self, scenario_type: str) -> str:
+        """
+        Get a version hash of the prompt template for a scenario.
+        
+        Editing a prompt or result model changes its version, so cached
+        results produced by the old prompt are no longer served.
+        
+        Args:
+            scenario_type: Scenario type
+        
+        Returns:
+            Short hex digest of the prompt templates and response schema
+        """
+        template = (
+            EXTRACTION_SYSTEM_PROMPT
+            + self._prompt_builders[scenario_type]("")
+            + json.dumps(strict_json_schema(self._result_models[scenario_type]), sort_keys=True)
+        )
+        return hashlib.sha256(template.encode("utf-8")).hexdigest()[:16]
+    
+    async def _extract_chunks(
+        self,
+        scenario_type: str,
+        chunks: List[str],
+        fields: Optional[List[str]] = None,
+        on_field: Optional[FieldCallback] = None,
+        hints: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Extract a transcript given as one or more chunks.
+        
+        Chunks are extracted concurrently and merged field by field, so
+        latency follows the chunk size rather than the call length.
+        
+        Args:
+            scenario_type: Scenario type
+            chunks: Compacted transcript chunks from _prepare
+            fields: Subset of schema fields to ask for, or None for all
+            on_field: Optional coroutine called with (field, value) once per
+                field; chunked results are published after the merge
+            hints: Rule-based guesses for the whole transcript; not used for
+                chunks, which may rightly disagree with them
+        
+        Returns:
+            Extracted (and merged) structured data
+        """
+        if len(chunks) == 1:
+            return await self._extract(scenario_type, chunks[0], fields=fields, on_field=on_field, hints=hints)
+        
+        results = await asyncio.gather(*(
+            self._extract(scenario_type, chunk, fields=fields, batch=False) for chunk in chunks
+        ))
+        merged = merge_chunk_results(scenario_type, list(results))
+        if on_field is not None:
+            for name, value in merged.items():
+                await on_field(name, value)
+        return merged
+    
+    async def _extract(
+        self,
+        scenario_type: str,
+        transcript: str,
+        fields: Optional[List[str]] = None,
+        on_field: Optional[FieldCallback] = None,
+        batch: bool = True,
+        hints: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Extract structured data, serving repeat transcripts from the cache.
+        
+        The first attempt uses the routed model tier; fields that fail
+        validation, or that a fast-model answer gets wrong by the checks in
+        _disputed, are re-asked on the strong model. With on_field, the
+        first attempt is streamed and each valid field is handed over as
+        soon as its JSON value is complete.
+        
+        Args:
+            scenario_type: Scenario type
+            transcript: Compacted call transcript
+            fields: Subset of schema fields to ask for, or None for all
+            on_field: Optional coroutine called with (field, value) once per field
+            batch: Whether a short check-in on the fast model may share a
+                request with others (False for chunks of a long transcript)
+            hints: Rule-based guesses to check a fast-model answer against
+        
+        Returns:
+            Dictionary with extracted data fields
+        """
+        label = self._labels[scenario_type]
+        requested = fields if fields is not None else list(self._result_models[scenario_type].model_fields)
+        first_model = self._route(scenario_type, transcript)
+        cache_scope = scenario_type if fields is None else f"{scenario_type}:{','.join(fields)}"
+        cache_key = extraction_cache_key(
+            cache_scope,
+            self.prompt_version(scenario_type),
+            first_model,
+            transcript_hash(transcript)
+        )
+        
+        published: Set[str] = set()
+        started = time.perf_counter()
+        
+        async def publish(valid: Dict[str, Any]) -> None:
+            for name, value in valid.items():
+                if on_field is None or name in published:
+                    continue
+                if not published:
+                    self.first_field_latency.record(time.perf_counter() - started)
+                published.add(name)
+                await on_field(name, value)
+        
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            service_logger.debug(f"Served {label} extraction from cache")
+            await publish(cached)
+            return cached
+        
+        tier = "fast_first" if first_model != self.strong_model else "strong_first"
+        self.routing_counts[tier] += 1
+        batch = batch and self._batchable(scenario_type, transcript, first_model)
+        
+        async def publish_streamed(name: str, value: Any) -> None:
+            valid, _ = self._validate(scenario_type, {name: value}, [name])
+            if valid:
+                self.streaming_counts["early_fields"] += 1
+                await publish(valid)
+        
+        try:
+            result: Dict[str, Any] = {}
+            pending = requested
+            model = first_model
+            for attempt in range(self.reask_attempts + 1):
+                if on_field is not None and attempt == 0:
+                    request = partial(
+                        self._request_stream, scenario_type, transcript, pending, model, publish_streamed
+                    )
+                elif batch and attempt == 0:
+                    # Short check-ins share a request; re-asks go out on their own
+                    request = partial(self.batcher.submit, model, (transcript, pending))
+                else:
+                    request = partial(self._request, scenario_type, transcript, pending, model)
+                if scenario_type == SCENARIO_EMERGENCY:
+                    # A hedged stream publishes from whichever copy is ahead; publish() dedupes
+                    data = await self.emergency_hedger.run(request)
+                else:
+                    data = await request()
+                valid, failing = self._validate(scenario_type, data, pending)
+                disputed = [] if model == self.strong_model else self._disputed(scenario_type, valid, hints or {})
+                for field in disputed:
+                    del valid[field]
+                result.update(valid)
+                await publish(valid)
+                self.validation_stats["responses"] += 1
+                if not failing and not disputed:
+                    break
+                
+                if failing:
+                    self.validation_stats["invalid_responses"] += 1
+                    self.validation_stats["reasked_fields"] += len(failing)
+                    service_logger.warning(f"Invalid {label} fields from {model}, re-asking: {failing}")
+                if disputed:
+                    self.routing_counts["disputed"] += 1
+                    service_logger.info(f"Doubtful {label} fields from {model}, re-asking: {disputed}")
+                if model != self.strong_model:
+                    self.routing_counts["escalated"] += 1
+                    model = self.strong_model
+                pending = failing + disputed
+            else:
+                self.validation_stats["failed"] += 1
+                raise ExtractionValidationError(f"{label} fields still invalid after re-ask: {pending}")
+            
+            service_logger.debug(f"Successfully extracted {label} data")
+        except Exception as e:
+            service_logger.error(f"Error extracting {label} data: {e}")
+            raise
+        
+        result = {field: result[field] for field in requested}
+        await self.cache.set(cache_key, result)
+        return result
+    
+    def _route(self, scenario_type: str, transcript: str) -> str:
+        """
+        Pick the model for the first extraction attempt.
+        
+        Emergencies and long transcripts go straight to the strong model;
+        everything else tries the fast model first.
+        
+        Args:
+            scenario_type: Scenario type
+            transcript: Compacted call transcript
+        
+        Returns:
+            Model name
+        """
+        if (
+            not self.fast_model
+            or scenario_type == SCENARIO_EMERGENCY
+            or count_tokens(transcript) > self.long_transcript_tokens
+        ):
+            return self.strong_model
+        return self.fast_model
+    
+    def _disputed(self, scenario_type: str, valid: Dict[str, Any], hints: Dict[str, Any]) -> List[str]:
+        """
+        Find fast-model check-in fields that are likely wrong despite being valid.
+        
+        A key field is doubted when it contradicts the rule-based guess, any
+        field when it is a placeholder although the rules found a value, and
+        call_outcome and driver_status when they contradict each other.
+        
+        Args:
+            scenario_type: Scenario type
+            valid: Validated fields from the fast model
+            hints: Rule-based guesses with some confidence
+        
+        Returns:
+            Names of the fields to re-ask on the strong model
+        """
+        if scenario_type != SCENARIO_CHECKIN:
+            return []
+        
+        disputed = set()
+        for field, value in valid.items():
+            if field not in hints:
+                continue
+            if field in ROUTING_KEY_FIELDS and value != hints[field]:
+                disputed.add(field)
+            elif isinstance(value, str) and value.strip().lower() in ROUTING_PLACEHOLDER_VALUES:
+                disputed.add(field)
+        
+        if (
+            "call_outcome" in valid and "driver_status" in valid
+            and valid["call_outcome"] != CHECKIN_OUTCOME_BY_STATUS[valid["driver_status"]]
+        ):
+            disputed.update({"call_outcome", "driver_status"})
+        return [field for field in valid if field in disputed]
+    
+    def _batchable(self, scenario_type: str, transcript: str, model_name: str) -> bool:
+        """
+        Decide whether a first extraction attempt may go through the batcher.
+        
+        Only short check-ins on the fast model are batched: a batch answers
+        in the time of its longest item, so long or strong-model
+        transcripts would slow down every other item in it.
+        
+        Args:
+            scenario_type: Scenario type
+            transcript: Compacted call transcript
+            model_name: Model picked for the first attempt
+        
+        Returns:
+            True if the request may be batched
+        """
+        return (
+            scenario_type == SCENARIO_CHECKIN
+            and self.batcher.max_items > 1
+            and model_name != self.strong_model
+            and count_tokens(transcript) <= self.batch_max_tokens
+        )
+    
+    def _request_params(
+        self,
+        scenario_type: str,
+        transcript: str,
+        fields: List[str],
+        model_name: str
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Build chat completion arguments for a strict JSON-schema request.
+        
+        Args:
+            scenario_type: Scenario type
+            transcript: Compacted call transcript
+            fields: Fields to ask for
+            model_name: OpenAI model to use
+        
+        Returns:
+            Tuple of (create() keyword arguments, estimated token cost)
+        """
+        all_fields = list(self._result_models[scenario_type].model_fields)
+        subset = None if fields == all_fields else fields
+        prompt = self._prompt_builders[scenario_type](transcript, subset)
+        model = extraction_subset_model(self._result_models[scenario_type], tuple(fields))
+        
+        estimated_tokens = (
+            count_tokens(EXTRACTION_SYSTEM_PROMPT)
+            + count_tokens(prompt)
+            + OPENAI_COMPLETION_TOKEN_ESTIMATE
+        )
+        params = {
+            "model": model_name,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": EXTRACTION_SYSTEM_PROMPT
+                },
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": OPENAI_TEMPERATURE,
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": f"{scenario_type}_extraction",
+                    "strict": True,
+                    "schema": strict_json_schema(model)
+                }
+            }
+        }
+        return params, estimated_tokens
+    
+    async def _request(
+        self,
+        scenario_type: str,
+        transcript: str,
+        fields: List[str],
+        model_name: str
+    ) -> Any:
+        """
+        Ask the model for some fields using a strict JSON-schema response format.
+        
+        Args:
+            scenario_type: Scenario type
+            transcript: Compacted call transcript
+            fields: Fields to ask for
+            model_name: OpenAI model to use
+        
+        Returns:
+            Decoded JSON response
+        """
+        params, estimated_tokens = self._request_params(scenario_type, transcript, fields, model_name)
+        started = time.perf_counter()
+        response = await self.rate_governor.call(
+            lambda: self.client.chat.completions.create(**params),
+            estimated_tokens
+        )
+        self._record_tier(model_name, time.perf_counter() - started, response)
+        return json.loads(response.choices[0].message.content)
+    
+    async def _request_stream(
+        self,
+        scenario_type: str,
+        transcript: str,
+        fields: List[str],
+        model_name: str,
+        on_field: FieldCallback
+    ) -> Dict[str, Any]:
+        """
+        Stream a request and hand over each field as its value completes.
+        
+        Only opening the stream goes through the rate governor; an error
+        while reading it is not retried here. The fields completed before
+        the error are returned, and the missing ones fail validation and are
+        re-asked like any other invalid field.
+        
+        Args:
+            scenario_type: Scenario type
+            transcript: Compacted call transcript
+            fields: Fields to ask for
+            model_name: OpenAI model to use
+            on_field: Coroutine called with (field, value) per completed field
+        
+        Returns:
+            Fields parsed from the stream; an interrupted stream returns the
+            fields completed so far
+        """
+        params, estimated_tokens = self._request_params(scenario_type, transcript, fields, model_name)
+        started = time.perf_counter()
+        stream = await self.rate_governor.call(
+            lambda: self.client.chat.completions.create(
+                **params, stream=True, stream_options={"include_usage": True}
+            ),
+            estimated_tokens
+        )
+        self.streaming_counts["streams"] += 1
         
+        parser = IncrementalObjectParser()
+        # The last chunk carries the usage of the whole stream
+        usage_chunk = None
         try:
-            response = await self.client.chat.completions.create(
-                model=OPENAI_MODEL,
+            async for chunk in stream:
+                if getattr(chunk, "usage", None) is not None:
+                    usage_chunk = chunk
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content
+                if not content:
+                    continue
+                for name, value in parser.feed(content):
+                    await on_field(name, value)
+        except Exception as e:
+            self.streaming_counts["interrupted"] += 1
+            service_logger.warning(
+                f"Stream from {model_name} failed after {len(parser.result)} fields: {e}"
+            )
+        
+        self.rate_governor.settle(estimated_tokens, usage_chunk)
+        self._record_tier(model_name, time.perf_counter() - started, usage_chunk)
+        return parser.result
+    
+    async def _request_batch(
+        self,
+        model_name: str,
+        items: List[Tuple[str, List[str]]]
+    ) -> List[Any]:
+        """
+        Ask the model for several check-in transcripts in one request.
+        
+        Every transcript is asked for the union of the fields its callers
+        need; each caller validates its own subset of the returned item.
+        
+        Args:
+            model_name: OpenAI model to use
+            items: (compacted transcript, fields) per caller
+        
+        Returns:
+            Decoded result per item, in order; {} for items missing from
+            the response, so their fields are re-asked
+        """
+        if len(items) == 1:
+            transcript, fields = items[0]
+            return [await self._request(SCENARIO_CHECKIN, transcript, fields, model_name)]
+        
+        fields = [field for field in CHECKIN_FIELDS if any(field in wanted for _, wanted in items)]
+        keys = [f"t{index}" for index in range(1, len(items) + 1)]
+        prompt = self._build_checkin_batch_prompt(
+            [(key, transcript) for key, (transcript, _) in zip(keys, items)],
+            None if fields == CHECKIN_FIELDS else fields
+        )
+        model = extraction_subset_model(CheckinExtraction, tuple(fields))
+        estimated_tokens = (
+            count_tokens(EXTRACTION_SYSTEM_PROMPT)
+            + count_tokens(prompt)
+            + OPENAI_COMPLETION_TOKEN_ESTIMATE * len(items)
+        )
+        
+        started = time.perf_counter()
+        response = await self.rate_governor.call(
+            lambda: self.client.chat.completions.create(
+                model=model_name,
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are a data extraction assistant. Return only valid JSON."
+                        "content": EXTRACTION_SYSTEM_PROMPT
                     },
                     {"role": "user", "content": prompt}
                 ],
                 temperature=OPENAI_TEMPERATURE,
-                response_format={"type": "json_object"}
-            )
-            
-            result = json.loads(response.choices[0].message.content)
-            service_logger.debug(f"Successfully extracted emergency data")
-            return result
-        except Exception as e:
-            service_logger.error(f"Error extracting emergency data: {e}")
-            raise
+                response_format={
+                    "type": "json_schema",
+                    "json_schema": {
+                        "name": f"{SCENARIO_CHECKIN}_batch_extraction",
+                        "strict": True,
+                        "schema": strict_json_batch_schema(model, "transcript_id")
+                    }
+                }
+            ),
+            estimated_tokens
+        )
+        self._record_tier(model_name, time.perf_counter() - started, response)
+        
+        data = json.loads(response.choices[0].message.content)
+        results = data.get("results", []) if isinstance(data, dict) else []
+        by_key = {
+            result.get("transcript_id"): result
+            for result in results
+            if isinstance(result, dict)
+        }
+        return [by_key.get(key, {}) for key in keys]
+    
+    def _record_tier(self, model_name: str, seconds: float, response: Any) -> None:
+        """
+        Record latency, token usage and cost for one model request.
+        
+        Args:
+            model_name: Model that served the request
+            seconds: Request latency including rate-limit waits and retries
+            response: API response, possibly carrying usage
+        """
+        usage = self.tier_usage.setdefault(
+            model_name,
+            {"requests": 0, "prompt_tokens": 0, "completion_tokens": 0, "cost_usd": 0.0}
+        )
+        self.tier_latency.setdefault(model_name, LatencyWindow()).record(seconds)
+        usage["requests"] += 1
+        
+        prompt_tokens = getattr(getattr(response, "usage", None), "prompt_tokens", None)
+        completion_tokens = getattr(getattr(response, "usage", None), "completion_tokens", None)
+        if not isinstance(prompt_tokens, int) or not isinstance(completion_tokens, int):
+            return
+        
+        input_price, output_price = OPENAI_MODEL_PRICING.get(model_name, (0.0, 0.0))
+        usage["prompt_tokens"] += prompt_tokens
+        usage["completion_tokens"] += completion_tokens
+        usage["cost_usd"] += (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+    
+    def _validate(
+        self,
+        scenario_type: str,
+        data: Any,
+        fields: List[str]
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Validate requested fields against the scenario's result model.
+        
+        Args:
+            scenario_type: Scenario type
+            data: Decoded model response
+            fields: Fields that were requested
+        
+        Returns:
+            Tuple of (valid field values, names of missing or invalid fields)
+        """
+        if not isinstance(data, dict):
+            return {}, list(fields)
+        
+        result_model = self._result_models[scenario_type]
+        candidate = {field: data[field] for field in fields if field in data}
+        try:
+            validated = extraction_subset_model(result_model, tuple(fields)).model_validate(candidate)
+            return validated.model_dump(), []
+        except ValidationError as e:
+            invalid = {error["loc"][0] for error in e.errors() if error["loc"]}
+        
+        failing = [field for field in fields if field in invalid]
+        passing = [field for field in fields if field not in invalid]
+        if not passing:
+            return {}, failing
+        validated = extraction_subset_model(result_model, tuple(passing)).model_validate(candidate)
+        return validated.model_dump(), failing
+    
+    def _compact(self, transcript: str) -> str:
+        """
+        Compact a transcript to the token budget and record the savings.
+        
+        Args:
+            transcript: Raw call transcript
+        
+        Returns:
+            Compacted transcript
+        """
+        compacted = compact_transcript(transcript, self.token_budget)
+        self.compaction_stats["transcripts"] += 1
+        self.compaction_stats["raw_tokens"] += count_tokens(transcript)
+        self.compaction_stats["compacted_tokens"] += count_tokens(compacted)
+        return compacted
+    
+    def _prepare(self, transcript: str) -> List[str]:
+        """
+        Compact a transcript, splitting it into chunks if it is long.
+        
+        Transcripts whose compacted size is within the chunking threshold
+        are cut to the token budget as before. Longer ones are split on turn
+        boundaries instead of losing their middle; past the chunk limit the
+        first chunk and the most recent ones are kept.
+        
+        Args:
+            transcript: Raw call transcript
+        
+        Returns:
+            One compacted transcript, or several chunks
+        """
+        full = compact_transcript(transcript, None)
+        if self.chunk_threshold_tokens <= 0 or count_tokens(full) <= self.chunk_threshold_tokens:
+            return [self._compact(transcript)]
+        
+        chunks = chunk_transcript(full, self.chunk_tokens)
+        if len(chunks) > self.max_chunks:
+            self.chunking_counts["dropped_chunks"] += len(chunks) - self.max_chunks
+            chunks = chunks[:1] + chunks[len(chunks) - self.max_chunks + 1:]
+        
+        self.chunking_counts["transcripts"] += 1
+        self.chunking_counts["chunks"] += len(chunks)
+        self.compaction_stats["transcripts"] += 1
+        self.compaction_stats["raw_tokens"] += count_tokens(transcript)
+        self.compaction_stats["compacted_tokens"] += sum(count_tokens(chunk) for chunk in chunks)
+        service_logger.debug(f"Split transcript into {len(chunks)} chunks for extraction")
+        return chunks
     
-    def _build_checkin_prompt(self, transcript: str) -> str:
+    def _build_checkin_prompt(self, transcript: str, fields: Optional[List[str]] = None) -> str:
         """
         Build prompt for check-in data extraction.
         
         Args:
             transcript: Call transcript
-            
+            fields: Subset of fields to ask for, or None for all
+        
         Returns:
             Formatted prompt string
         """
         return f"""Analyze this driver check-in call transcript and extract the following information.
 Return ONLY valid JSON with these exact fields:
 
-{{
-  "call_outcome": "In-Transit Update" OR "Arrival Confirmation",
-  "driver_status": "Driving" OR "Delayed" OR "Arrived" OR "Unloading",
-  "current_location": "string (e.g., 'I-10 near Indio, CA')",
-  "eta": "string (e.g., 'Tomorrow, 8:00 AM') or 'N/A'",
-  "delay_reason": "string (e.g., 'Heavy Traffic', 'Weather', 'None')",
-  "unloading_status": "string (e.g., 'In Door 42', 'Waiting for Lumper', 'N/A')",
-  "pod_reminder_acknowledged": true or false
-}}
+{_render_fields(CHECKIN_FIELD_SPECS, fields)}
 
 Rules:
 - If information is not mentioned, use "N/A" for strings and false for booleans
@@ -120,29 +996,54 @@ Rules:
 Transcript:
 {transcript}
 """
-    
-    def _build_emergency_prompt(self, transcript: str) -> str:
+
+    def _build_checkin_batch_prompt(
+        self,
+        transcripts: List[Tuple[str, str]],
+        fields: Optional[List[str]] = None
+    ) -> str:
+        """
+        Build prompt for extracting several check-in transcripts at once.
+        
+        Args:
+            transcripts: (transcript ID, transcript) pairs
+            fields: Subset of fields to ask for, or None for all
+        
+        Returns:
+            Formatted prompt string
+        """
+        sections = "\n\n".join(
+            f"Transcript {key}:\n{transcript}" for key, transcript in transcripts
+        )
+        return f"""Analyze each of these driver check-in call transcripts separately and extract the following information from each.
+Return ONLY valid JSON: {{"results": [...]}} with one object per transcript, each with "transcript_id" and these exact fields:
+
+{_render_fields(CHECKIN_FIELD_SPECS, fields)}
+
+Rules:
+- If information is not mentioned, use "N/A" for strings and false for booleans
+- Choose the most appropriate value from the options given
+- Extract exactly what the driver said
+- Never mix information between transcripts
+
+{sections}
+"""
+
+    def _build_emergency_prompt(self, transcript: str, fields: Optional[List[str]] = None) -> str:
         """
         Build prompt for emergency data extraction.
         
         Args:
             transcript: Call transcript
-            
+            fields: Subset of fields to ask for, or None for all
+        
         Returns:
             Formatted prompt string
         """
         return f"""Analyze this emergency call transcript and extract the following information.
 Return ONLY valid JSON with these exact fields:
 
-{{
-  "call_outcome": "Emergency Escalation",
-  "emergency_type": "Accident" OR "Breakdown" OR "Medical" OR "Other",
-  "safety_status": "string (e.g., 'Driver confirmed everyone is safe')",
-  "injury_status": "string (e.g., 'No injuries reported')",
-  "emergency_location": "string (e.g., 'I-15 North, Mile Marker 123')",
-  "load_secure": true or false,
-  "escalation_status": "Connected to Human Dispatcher"
-}}
+{_render_fields(EMERGENCY_FIELD_SPECS, fields)}
 
 Rules:
 - If information is not mentioned, use "Unknown" for strings and false for booleans
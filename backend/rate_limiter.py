@@ -0,0 +1,282 @@
+"""
+Client-side rate governor for OpenAI requests.
+
+Requests wait in FIFO order for both a requests-per-minute and a
+tokens-per-minute bucket before they are sent. Throttled (429) and
+transient failures are retried with jittered backoff that honours the
+server's Retry-After header, and a 429 pauses every caller, not just the
+one that hit it.
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+from openai import APIConnectionError, APIStatusError
+from latency import LatencyWindow
+from logger import service_logger
+
+_RETRYABLE_STATUS_CODES = {408, 409, 429}
+
+
+class TokenBucket:
+    """Bucket refilled continuously at a per-minute rate."""
+    
+    def __init__(self, per_minute: float):
+        """
+        Initialize a full bucket.
+        
+        Args:
+            per_minute: Capacity, refilled over one minute
+        """
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.available = per_minute
+        self._updated = time.monotonic()
+    
+    def _refill(self, now: float) -> None:
+        """
+        Add the tokens earned since the last update.
+        
+        Args:
+            now: Current monotonic time
+        """
+        self.available = min(self.capacity, self.available + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    # PUBLIC_INTERFACE
+    def time_until(self, amount: float, now: float) -> float:
+        """
+        Get the wait before an amount can be taken.
+        
+        Args:
+            amount: Tokens needed (capped at capacity)
+            now: Current monotonic time
+        
+        Returns:
+            Seconds to wait, 0 if available now
+        """
+        self._refill(now)
+        missing = min(amount, self.capacity) - self.available
+        return missing / self.rate if missing > 0 else 0.0
+    
+    # PUBLIC_INTERFACE
+    def consume(self, amount: float) -> None:
+        """
+        Take tokens. The balance may go negative when correcting estimates.
+        
+        Args:
+            amount: Tokens to take; negative values give tokens back
+        """
+        self._refill(time.monotonic())
+        self.available = min(self.capacity, self.available - amount)
+
+
+class RateGovernor:
+    """Shared RPM/TPM limiter and retry policy around API calls."""
+    
+    def __init__(
+        self,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        max_retries: int,
+        retry_base_seconds: float,
+        retry_max_seconds: float
+    ):
+        """
+        Initialize the governor.
+        
+        Args:
+            requests_per_minute: Request budget per minute
+            tokens_per_minute: Token budget per minute
+            max_retries: Retries after the first attempt
+            retry_base_seconds: Backoff for the first retry
+            retry_max_seconds: Upper bound on any single backoff
+        """
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.max_retries = max_retries
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self._lock = asyncio.Lock()
+        self._paused_until = 0.0
+        self.wait_latency = LatencyWindow()
+        self.waiting = 0
+        self.sent = 0
+        self.throttled = 0
+        self.retried = 0
+        self.failed = 0
+    
+    # PUBLIC_INTERFACE
+    async def acquire(self, estimated_tokens: int) -> None:
+        """
+        Wait in line until both buckets allow one request of this size.
+        
+        Args:
+            estimated_tokens: Estimated prompt plus completion tokens
+        """
+        started = time.monotonic()
+        self.waiting += 1
+        try:
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    delay = max(
+                        self._paused_until - now,
+                        self.requests.time_until(1, now),
+                        self.tokens.time_until(estimated_tokens, now)
+                    )
+                    if delay <= 0:
+                        break
+                    await asyncio.sleep(delay)
+                
+                self.requests.consume(1)
+                self.tokens.consume(estimated_tokens)
+        finally:
+            self.waiting -= 1
+        self.wait_latency.record(time.monotonic() - started)
+    
+    # PUBLIC_INTERFACE
+    async def call(
+        self,
+        request: Callable[[], Awaitable[Any]],
+        estimated_tokens: int
+    ) -> Any:
+        """
+        Send a request through the limiter, retrying throttled and transient errors.
+        
+        Args:
+            request: Zero-argument coroutine function that sends the request
+            estimated_tokens: Estimated prompt plus completion tokens
+        
+        Returns:
+            The request's response
+        
+        Raises:
+            APIStatusError: Non-retryable status, or retries exhausted
+            APIConnectionError: Connection still failing after retries
+        """
+        attempt = 0
+        while True:
+            await self.acquire(estimated_tokens)
+            self.sent += 1
+            try:
+                response = await request()
+            except (APIStatusError, APIConnectionError) as e:
+                status = getattr(e, "status_code", None)
+                if not self._is_retryable(e) or attempt >= self.max_retries:
+                    self.failed += 1
+                    raise
+                
+                delay = self._retry_delay(e, attempt)
+                self.retried += 1
+                attempt += 1
+                service_logger.warning(
+                    f"OpenAI request failed (status {status}), "
+                    f"retry {attempt}/{self.max_retries} in {delay:.1f}s"
+                )
+                if status == 429:
+                    # Throttling is account-wide: hold every caller in acquire()
+                    self.throttled += 1
+                    self._paused_until = max(self._paused_until, time.monotonic() + delay)
+                else:
+                    await asyncio.sleep(delay)
+                continue
+            
+            self.settle(estimated_tokens, response)
+            return response
+    
+    # PUBLIC_INTERFACE
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get limiter counters.
+        
+        Returns:
+            Dictionary with queue depth, wait percentiles, bucket levels,
+            and sent/throttled/retried/failed totals
+        """
+        return {
+            "queue_depth": self.waiting,
+            "wait": self.wait_latency.stats(),
+            "available_requests": round(self.requests.available, 2),
+            "available_tokens": round(self.tokens.available, 2),
+            "paused_seconds": max(0.0, self._paused_until - time.monotonic()),
+            "sent": self.sent,
+            "throttled": self.throttled,
+            "retried": self.retried,
+            "failed": self.failed
+        }
+    
+    # PUBLIC_INTERFACE
+    def settle(self, estimated_tokens: int, response: Any) -> None:
+        """
+        Correct the token bucket with the usage the API reported.
+        
+        call() settles every response itself; a streamed response only
+        reports usage in its last chunk, so its reader settles that chunk.
+        
+        Args:
+            estimated_tokens: Tokens taken before sending
+            response: API response, possibly carrying usage.total_tokens
+        """
+        actual = getattr(getattr(response, "usage", None), "total_tokens", None)
+        if isinstance(actual, int):
+            self.tokens.consume(actual - estimated_tokens)
+    
+    def _is_retryable(self, error: Exception) -> bool:
+        """
+        Decide whether an API error is worth retrying.
+        
+        Args:
+            error: Error raised by the request
+        
+        Returns:
+            True for connection errors, throttling and server errors
+        """
+        if isinstance(error, APIConnectionError):
+            return True
+        status = getattr(error, "status_code", None)
+        return status in _RETRYABLE_STATUS_CODES or (status is not None and status >= 500)
+    
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """
+        Get the backoff before the next attempt.
+        
+        Args:
+            error: Error raised by the request
+            attempt: Retries made so far
+        
+        Returns:
+            Seconds to wait: Retry-After plus jitter when the server sent
+            one, otherwise full-jitter exponential backoff
+        """
+        retry_after = _retry_after_seconds(error)
+        if retry_after is not None:
+            delay = retry_after + random.uniform(0, self.retry_base_seconds)
+        else:
+            delay = random.uniform(0, self.retry_base_seconds * 2 ** attempt)
+        return min(delay, self.retry_max_seconds)
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    Read the Retry-After hint from an API error response.
+    
+    Args:
+        error: Error raised by the request
+    
+    Returns:
+        Seconds to wait, or None if the response has no usable hint
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    
+    try:
+        if headers.get("retry-after-ms") is not None:
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after") is not None:
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        return None
+    return None
@@ -0,0 +1,107 @@
+"""
+Readiness gate for agent provisioning.
+
+Agents are provisioned in the background after startup. Call initiation
+waits briefly on the gate for its scenario instead of failing while the
+agent is still being created, and /ready reports per-scenario state.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+from constants import VALID_SCENARIOS
+
+PENDING = "pending"
+PROVISIONING = "provisioning"
+READY = "ready"
+FAILED = "failed"
+
+
+class ReadinessGate:
+    """Tracks provisioning of each scenario's agent."""
+    
+    def __init__(self):
+        """Initialize every scenario as pending."""
+        self._events: Dict[str, asyncio.Event] = {}
+        self._state: Dict[str, Dict[str, Any]] = {
+            scenario: {"status": PENDING, "agent_id": None, "duration_seconds": None, "error": None}
+            for scenario in VALID_SCENARIOS
+        }
+        self._started: Dict[str, float] = {}
+    
+    # PUBLIC_INTERFACE
+    def start(self, scenario_type: str) -> None:
+        """
+        Mark a scenario as being provisioned; callers will wait for it.
+        
+        Args:
+            scenario_type: Scenario type
+        """
+        self._events[scenario_type] = asyncio.Event()
+        self._started[scenario_type] = time.perf_counter()
+        self._state[scenario_type] = {
+            "status": PROVISIONING,
+            "agent_id": None,
+            "duration_seconds": None,
+            "error": None
+        }
+    
+    # PUBLIC_INTERFACE
+    def finish(self, scenario_type: str, agent_id: Optional[str], error: Optional[str] = None) -> None:
+        """
+        Record the outcome of provisioning and release waiting callers.
+        
+        Args:
+            scenario_type: Scenario type
+            agent_id: Provisioned agent ID, or None on failure
+            error: Failure description
+        """
+        started = self._started.get(scenario_type, time.perf_counter())
+        self._state[scenario_type] = {
+            "status": READY if agent_id else FAILED,
+            "agent_id": agent_id,
+            "duration_seconds": round(time.perf_counter() - started, 3),
+            "error": None if agent_id else error or "Agent provisioning failed"
+        }
+        event = self._events.get(scenario_type)
+        if event is not None:
+            event.set()
+    
+    # PUBLIC_INTERFACE
+    async def wait(self, scenario_type: str, timeout: float) -> bool:
+        """
+        Wait for a scenario that is still being provisioned.
+        
+        Args:
+            scenario_type: Scenario type
+            timeout: Longest wait in seconds
+        
+        Returns:
+            False if provisioning is still running after the timeout,
+            True otherwise (including when it was never started)
+        """
+        if self._state.get(scenario_type, {}).get("status") != PROVISIONING:
+            return True
+        try:
+            await asyncio.wait_for(self._events[scenario_type].wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+    
+    # PUBLIC_INTERFACE
+    def status(self) -> Dict[str, Any]:
+        """
+        Get provisioning state.
+        
+        Returns:
+            Dictionary with overall readiness and, per scenario, the
+            status, agent ID, provisioning time and error
+        """
+        return {
+            "ready": all(state["status"] == READY for state in self._state.values()),
+            "scenarios": {scenario: dict(state) for scenario, state in self._state.items()}
+        }
+
+
+# Singleton instance
+readiness = ReadinessGate()
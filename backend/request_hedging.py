@@ -0,0 +1,162 @@
+"""
+Hedged requests for latency-critical calls.
+
+A request that has not returned by the observed tail latency (p90 by
+default) is sent a second time; whichever copy finishes first is used and
+the other is cancelled. Hedges draw on a budget that grows by max_rate per
+request, so at most that fraction of requests is ever sent twice.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+from latency import LatencyWindow
+from logger import service_logger
+
+
+class RequestHedger:
+    """Sends a backup copy of slow requests and keeps the faster one."""
+    
+    def __init__(self, percentile: float, max_rate: float, min_samples: int):
+        """
+        Initialize the hedger.
+        
+        Args:
+            percentile: Request latency percentile after which a hedge is sent
+            max_rate: Largest fraction of requests that may be hedged; 0 disables hedging
+            min_samples: Latency samples needed before the trigger is trusted
+        """
+        self.percentile = percentile
+        self.max_rate = max_rate
+        self.min_samples = min_samples
+        # Service time of single requests, used for the trigger
+        self.request_latency = LatencyWindow()
+        # What callers saw, hedged or not
+        self.latency = LatencyWindow()
+        self._budget = 0.0
+        self.counts = {
+            "requests": 0,
+            "hedged": 0,
+            "hedge_wins": 0,
+            "primary_wins": 0,
+            "skipped_budget": 0
+        }
+    
+    # PUBLIC_INTERFACE
+    def trigger_seconds(self) -> Optional[float]:
+        """
+        Get the delay after which a request is hedged.
+        
+        Returns:
+            Seconds, or None while hedging is disabled or still warming up
+        """
+        if self.max_rate <= 0 or self.request_latency.count < self.min_samples:
+            return None
+        return self.request_latency.percentile(self.percentile)
+    
+    # PUBLIC_INTERFACE
+    async def run(self, request: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a request, hedging it if it is slower than the trigger.
+        
+        Args:
+            request: Coroutine function sending one copy of the request;
+                it is called a second time for the hedge
+        
+        Returns:
+            Result of the first copy to succeed
+        
+        Raises:
+            Exception: The error of the last copy to fail if none succeeded
+        """
+        self.counts["requests"] += 1
+        self._budget = min(1.0, self._budget + self.max_rate)
+        started = time.perf_counter()
+        trigger = self.trigger_seconds()
+        
+        primary = asyncio.ensure_future(self._timed(request))
+        try:
+            if trigger is not None:
+                await asyncio.wait({primary}, timeout=trigger)
+            if primary.done() or trigger is None:
+                result = await primary
+            elif self._budget < 1.0:
+                self.counts["skipped_budget"] += 1
+                result = await primary
+            else:
+                self._budget -= 1.0
+                self.counts["hedged"] += 1
+                result = await self._race(primary, asyncio.ensure_future(self._timed(request)))
+        finally:
+            primary.cancel()
+        
+        self.latency.record(time.perf_counter() - started)
+        return result
+    
+    # PUBLIC_INTERFACE
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get hedging counters.
+        
+        Returns:
+            Dictionary with request, hedge and win counts, the hedge rate,
+            the share of hedges that beat the original, the current trigger,
+            and caller-observed latency percentiles
+        """
+        hedged = self.counts["hedged"]
+        return {
+            **self.counts,
+            "hedge_rate": hedged / self.counts["requests"] if self.counts["requests"] else 0.0,
+            "hedge_win_rate": self.counts["hedge_wins"] / hedged if hedged else 0.0,
+            "max_rate": self.max_rate,
+            "trigger_seconds": self.trigger_seconds(),
+            "latency": self.latency.stats()
+        }
+    
+    async def _timed(self, request: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run one copy of a request and record its service time.
+        
+        A copy cancelled because the other won is recorded with the time it
+        had run so far; leaving it out would drop exactly the slow requests
+        and pull the trigger down.
+        
+        Args:
+            request: Coroutine function sending the request
+        
+        Returns:
+            Request result
+        """
+        started = time.perf_counter()
+        try:
+            return await request()
+        finally:
+            self.request_latency.record(time.perf_counter() - started)
+    
+    async def _race(self, primary: asyncio.Future, hedge: asyncio.Future) -> Any:
+        """
+        Wait for the first copy to succeed and cancel the other.
+        
+        Args:
+            primary: Original request
+            hedge: Backup request
+        
+        Returns:
+            Result of the first successful copy
+        """
+        pending = {primary, hedge}
+        try:
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Prefer the original if both finished in the same tick
+                for winner in (primary, hedge):
+                    if winner in done and winner.exception() is None:
+                        self.counts["hedge_wins" if winner is hedge else "primary_wins"] += 1
+                        return winner.result()
+                failed = next(iter(done))
+                if not pending:
+                    return failed.result()
+                service_logger.warning(f"Hedged request copy failed, waiting for the other: {failed.exception()}")
+        finally:
+            for task in pending:
+                task.cancel()
@@ -5,7 +5,8 @@ Retell AI client for managing LLMs, agents, and calls.
 import os
 from retell import AsyncRetell
 from typing import Dict, Any, Optional, List
-from constants import RETELL_VOICE_ID, RETELL_MODEL
+from constants import RETELL_VOICE_ID, RETELL_MODEL, RETELL_API_BASE_URL
+from http_transport import http_clients
 from logger import service_logger
 
 
@@ -18,7 +19,10 @@ class RetellClient:
         if not self.api_key:
             raise ValueError("RETELL_API_KEY must be set")
         
-        self.client = AsyncRetell(api_key=self.api_key)
+        self.client = AsyncRetell(
+            api_key=self.api_key,
+            http_client=http_clients.client("retell", warm_url=RETELL_API_BASE_URL, timeout=30.0)
+        )
     
     # PUBLIC_INTERFACE
     async def create_llm(
@@ -58,7 +62,8 @@ class RetellClient:
         self,
         llm_id: str,
         general_prompt: Optional[str] = None,
-        general_tools: Optional[List[Dict[str, Any]]] = None
+        general_tools: Optional[List[Dict[str, Any]]] = None,
+        model: Optional[str] = None
     ) -> None:
         """
         Update an existing LLM.
@@ -67,6 +72,7 @@ class RetellClient:
             llm_id: ID of the LLM to update
             general_prompt: Optional new system prompt
             general_tools: Optional new list of tools
+            model: Optional new model
         """
         update_data = {}
         
@@ -76,6 +82,9 @@ class RetellClient:
         if general_tools is not None:
             update_data["general_tools"] = general_tools
         
+        if model is not None:
+            update_data["model"] = model
+        
         if update_data:
             try:
                 await self.client.llm.update(llm_id, **update_data)
@@ -115,6 +124,22 @@ class RetellClient:
             service_logger.error(f"Error creating agent: {e}")
             raise
     
+    # PUBLIC_INTERFACE
+    async def update_agent(self, agent_id: str, **settings: Any) -> None:
+        """
+        Update an existing agent.
+        
+        Args:
+            agent_id: ID of the agent to update
+            **settings: Agent fields to set (agent_name, voice_id, response_engine, ...)
+        """
+        try:
+            await self.client.agent.update(agent_id, **settings)
+            service_logger.debug(f"Updated agent: {agent_id}")
+        except Exception as e:
+            service_logger.error(f"Error updating agent: {e}")
+            raise
+    
     # PUBLIC_INTERFACE
     async def create_web_call(
         self,
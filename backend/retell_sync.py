@@ -0,0 +1,141 @@
+"""
+Hash-diffed provisioning of Retell LLMs and agents.
+
+Each configuration stores a content hash per part of what was last pushed
+to Retell (prompt, tools, model, agent settings) in retell_hashes, next to
+llm_id and agent_id. A sync only calls Retell for the parts whose hash
+differs, so boots and unchanged saves make no Retell API calls.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List
+from constants import END_CALL_TOOL, RETELL_MODEL, RETELL_VOICE_ID
+from logger import service_logger
+
+
+# PUBLIC_INTERFACE
+def content_hash(value: Any) -> str:
+    """
+    Hash a JSON-serializable value independent of key order.
+    
+    Args:
+        value: Value to hash
+    
+    Returns:
+        Hex SHA-256 digest
+    """
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# PUBLIC_INTERFACE
+def llm_spec(system_prompt: str) -> Dict[str, Any]:
+    """
+    Get the Retell LLM fields a configuration should have.
+    
+    Args:
+        system_prompt: Agent system prompt
+    
+    Returns:
+        update_llm keyword arguments
+    """
+    return {
+        "general_prompt": system_prompt,
+        "general_tools": [END_CALL_TOOL],
+        "model": RETELL_MODEL
+    }
+
+
+# PUBLIC_INTERFACE
+def agent_spec(scenario_type: str, llm_id: str) -> Dict[str, Any]:
+    """
+    Get the Retell agent settings a configuration should have.
+    
+    Args:
+        scenario_type: Scenario type
+        llm_id: LLM the agent answers with
+    
+    Returns:
+        update_agent keyword arguments
+    """
+    return {
+        "agent_name": f"Dispatch {scenario_type.title()} Agent",
+        "voice_id": RETELL_VOICE_ID,
+        "response_engine": {"type": "retell-llm", "llm_id": llm_id},
+        "enable_backchannel": True
+    }
+
+
+# PUBLIC_INTERFACE
+async def sync_retell_agent(
+    scenario_type: str,
+    system_prompt: str,
+    config: Dict[str, Any],
+    retell: Any,
+    db: Any
+) -> Dict[str, Any]:
+    """
+    Create or update the Retell LLM and agent for a configuration.
+    
+    Missing resources are created; existing ones are only updated with
+    the parts whose content hash changed since the last sync.
+    
+    Args:
+        scenario_type: Scenario type
+        system_prompt: System prompt to provision
+        config: Stored configuration with llm_id, agent_id, retell_hashes
+        retell: Retell client
+        db: Database service used to store IDs and hashes
+    
+    Returns:
+        Report with llm_id, agent_id, the action taken for the LLM and
+        the agent ("created", "updated" or "unchanged") and which parts
+        changed
+    """
+    stored: Dict[str, str] = config.get("retell_hashes") or {}
+    llm_id = config.get("llm_id")
+    agent_id = config.get("agent_id")
+    report: Dict[str, Any] = {"llm": "unchanged", "agent": "unchanged", "changed": []}
+    
+    llm = llm_spec(system_prompt)
+    hashes = {name: content_hash(value) for name, value in llm.items()}
+    changed: List[str] = [name for name in llm if stored.get(name) != hashes[name]]
+    if not llm_id:
+        llm_id = await retell.create_llm(
+            general_prompt=llm["general_prompt"],
+            general_tools=llm["general_tools"]
+        )
+        await db.save_configuration(scenario_type, {"llm_id": llm_id})
+        report["llm"] = "created"
+    elif changed:
+        await retell.update_llm(llm_id=llm_id, **{name: llm[name] for name in changed})
+        report["llm"] = "updated"
+    report["changed"].extend(changed)
+    
+    agent = agent_spec(scenario_type, llm_id)
+    hashes["agent"] = content_hash(agent)
+    updates: Dict[str, Any] = {}
+    if not agent_id:
+        agent_id = (await retell.create_agent(agent["agent_name"], llm_id))["agent_id"]
+        updates["agent_id"] = agent_id
+        report["agent"] = "created"
+    elif stored.get("agent") != hashes["agent"]:
+        await retell.update_agent(agent_id, **agent)
+        report["agent"] = "updated"
+    if stored.get("agent") != hashes["agent"]:
+        report["changed"].append("agent")
+    
+    if hashes != stored:
+        updates["retell_hashes"] = hashes
+    if updates:
+        await db.save_configuration(scenario_type, updates)
+    
+    if report["llm"] == report["agent"] == "unchanged":
+        service_logger.info(f"Retell {scenario_type} agent up to date, no API calls")
+    else:
+        service_logger.info(
+            f"Retell {scenario_type} sync: LLM {report['llm']}, agent {report['agent']}, "
+            f"changed: {', '.join(report['changed']) or 'none'}"
+        )
+    return {"llm_id": llm_id, "agent_id": agent_id, **report}
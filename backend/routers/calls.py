@@ -3,19 +3,39 @@ FastAPI router for call-related endpoints.
 """
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
+from typing import Any, AsyncIterator, Dict, List, Optional
 from services.call_service import call_service
 from services.database_service import db_service
+from call_events import call_events
 from models import WebCallInitiateRequest, WebCallInitiateResponse
+from constants import (
+    CALL_LOGS_PAGE_SIZE,
+    CALL_LOGS_MAX_PAGE_SIZE,
+    FIELDS_SUMMARY,
+    FIELDS_ALL,
+    CALL_STATUS_COMPLETED,
+    CALL_EVENTS_KEEPALIVE_SECONDS,
+    CAMPAIGN_MAX_CALLS
+)
 from logger import router_logger
 from exceptions import (
     AgentConfigurationError,
+    AgentNotReadyError,
     CallLogCreationError,
+    CampaignNotFoundError,
     EnvironmentVariableError,
+    FromNumberUnavailableError,
     InvalidPhoneNumberError,
+    InvalidCursorError,
+    InvalidFieldsError,
     CallNotFoundError
 )
 
+import asyncio
+import json
+
 router = APIRouter(prefix="/api/calls", tags=["calls"])
 
 
@@ -42,6 +62,16 @@ class CallInitiateResponse(BaseModel):
     status: str
 
 
+class CampaignRequest(BaseModel):
+    """Request model for a batch call campaign."""
+    calls: List[CallInitiateRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=CAMPAIGN_MAX_CALLS,
+        description="Calls to place, one per driver/load/scenario row"
+    )
+
+
 # PUBLIC_INTERFACE
 @router.post("/initiate-web", response_model=WebCallInitiateResponse)
 async def initiate_web_call(request: WebCallInitiateRequest):
@@ -64,7 +94,7 @@ async def initiate_web_call(request: WebCallInitiateRequest):
             scenario_type=request.scenario_type
         )
         return result
-    except (AgentConfigurationError, CallLogCreationError) as e:
+    except (AgentConfigurationError, AgentNotReadyError, CallLogCreationError) as e:
         router_logger.error(f"Web call initiation failed: {e.detail}")
         raise
     except Exception as e:
@@ -99,7 +129,9 @@ async def initiate_call(request: CallInitiateRequest):
         EnvironmentVariableError,
         InvalidPhoneNumberError,
         AgentConfigurationError,
-        CallLogCreationError
+        AgentNotReadyError,
+        CallLogCreationError,
+        FromNumberUnavailableError
     ) as e:
         router_logger.error(f"Phone call initiation failed: {e.detail}")
         raise
@@ -109,27 +141,112 @@ async def initiate_call(request: CallInitiateRequest):
 
 
 # PUBLIC_INTERFACE
-@router.get("", summary="List all calls")
+@router.post("/batch", status_code=202, summary="Start a call campaign")
+async def start_campaign(request: CampaignRequest):
+    """
+    Place many phone calls from one request.
+    
+    All call logs are written in one insert and the calls are dialed in
+    the background with bounded concurrency. Poll
+    GET /api/calls/batch/{campaign_id} for per-row progress.
+    
+    Args:
+        request: Campaign request with the calls to place
+    
+    Returns:
+        Campaign ID with per-row progress
+    
+    Raises:
+        HTTPException: If the campaign cannot be started
+    """
+    try:
+        return await call_service.start_campaign(
+            [call.model_dump() for call in request.calls]
+        )
+    except (
+        EnvironmentVariableError,
+        AgentConfigurationError,
+        AgentNotReadyError,
+        CallLogCreationError
+    ) as e:
+        router_logger.error(f"Campaign start failed: {e.detail}")
+        raise
+    except Exception as e:
+        router_logger.error(f"Unexpected error starting campaign: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# PUBLIC_INTERFACE
+@router.get("/batch/{campaign_id}", summary="Get call campaign progress")
+async def get_campaign(campaign_id: str):
+    """
+    Get the per-row progress of a call campaign.
+    
+    Args:
+        campaign_id: Campaign ID returned by POST /api/calls/batch
+    
+    Returns:
+        Row counts per status, whether dialing has finished, and each row's
+        status, call IDs and error
+    
+    Raises:
+        HTTPException: If campaign not found or error occurs
+    """
+    try:
+        return await call_service.get_campaign(campaign_id)
+    except CampaignNotFoundError:
+        router_logger.warning(f"Campaign not found: {campaign_id}")
+        raise
+    except Exception as e:
+        router_logger.error(f"Error fetching campaign {campaign_id}: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# PUBLIC_INTERFACE
+@router.get("", summary="List calls")
 async def list_calls(
-    order_by: str = Query(default="created_at", description="Field to order by"),
-    ascending: bool = Query(default=False, description="Sort order (true=ascending, false=descending)")
+    limit: int = Query(
+        default=CALL_LOGS_PAGE_SIZE,
+        ge=1,
+        le=CALL_LOGS_MAX_PAGE_SIZE,
+        description="Maximum number of calls to return"
+    ),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+    ascending: bool = Query(default=False, description="Sort order (true=ascending, false=descending)"),
+    fields: str = Query(
+        default=FIELDS_SUMMARY,
+        description="Projection: summary, all, or comma-separated column names"
+    )
 ):
     """
-    List all call logs with optional ordering.
+    List call logs one page at a time, ordered by creation time.
     
     Args:
-        order_by: Field to order by (default: created_at)
+        limit: Maximum number of calls to return
+        cursor: Cursor from the previous page (omit for the first page)
         ascending: Sort order direction (default: False for descending)
+        fields: Columns to return (default: summary, without transcript
+            and structured data)
         
     Returns:
-        List of call logs
+        Page of call logs with the cursor for the next page
         
     Raises:
-        HTTPException: If listing fails
+        HTTPException: If the cursor or fields are invalid or listing fails
     """
     try:
-        calls = db_service.list_call_logs(order_by=order_by, ascending=ascending)
-        return calls
+        return await db_service.list_call_logs(
+            limit=limit,
+            cursor=cursor,
+            ascending=ascending,
+            fields=fields
+        )
+    except InvalidCursorError as e:
+        router_logger.warning(f"Invalid cursor: {cursor}")
+        raise
+    except InvalidFieldsError as e:
+        router_logger.warning(f"Invalid fields: {fields}")
+        raise
     except Exception as e:
         router_logger.error(f"Error listing calls: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -137,24 +254,120 @@ async def list_calls(
 
 # PUBLIC_INTERFACE
 @router.get("/{call_id}")
-async def get_call(call_id: str):
+async def get_call(
+    call_id: str,
+    fields: str = Query(
+        default=FIELDS_ALL,
+        description="Projection: all, summary, or comma-separated column names"
+    )
+):
     """
     Get call details by ID.
     
     Args:
         call_id: UUID of the call
+        fields: Columns to return (default: all)
         
     Returns:
         Call log details
         
     Raises:
-        HTTPException: If call not found or error occurs
+        HTTPException: If call not found, fields are invalid, or error occurs
     """
     try:
-        return db_service.get_call_log(call_id)
+        return await db_service.get_call_log(call_id, fields=fields)
     except CallNotFoundError as e:
         router_logger.warning(f"Call not found: {call_id}")
         raise
+    except InvalidFieldsError as e:
+        router_logger.warning(f"Invalid fields: {fields}")
+        raise
     except Exception as e:
         router_logger.error(f"Error fetching call {call_id}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
+
+
+def _sse(event: Dict[str, Any]) -> str:
+    """
+    Format an event as a server-sent event message.
+    
+    Args:
+        event: JSON-serializable event
+    
+    Returns:
+        SSE "data:" message
+    """
+    return f"data: {json.dumps(event)}\n\n"
+
+
+async def _event_stream(call_id: str, queue: asyncio.Queue, call: Dict[str, Any]) -> AsyncIterator[str]:
+    """
+    Relay a call's events until it completes.
+    
+    Args:
+        call_id: Call log ID
+        queue: Queue from call_events.subscribe
+        call: Call status and structured data read after subscribing
+    
+    Yields:
+        SSE messages, with keep-alive comments while idle
+    """
+    try:
+        if call.get("call_status") == CALL_STATUS_COMPLETED:
+            yield _sse({
+                "type": "completed",
+                "call_status": CALL_STATUS_COMPLETED,
+                "structured_data": call.get("structured_data")
+            })
+            return
+        
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=CALL_EVENTS_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            yield _sse(event)
+            if event.get("type") == "completed":
+                return
+    finally:
+        call_events.unsubscribe(call_id, queue)
+
+
+# PUBLIC_INTERFACE
+@router.get("/{call_id}/events", summary="Stream call updates")
+async def stream_call_events(call_id: str):
+    """
+    Stream extracted fields and completion of a call as server-sent events.
+    
+    Emergency fields are sent as {"type": "field", "field", "value"} while
+    extraction streams; a final {"type": "completed"} event carries the full
+    structured data and ends the stream.
+    
+    Args:
+        call_id: UUID of the call
+    
+    Returns:
+        text/event-stream response
+    
+    Raises:
+        HTTPException: If call not found or error occurs
+    """
+    # Subscribe first so no event is missed between the read and the stream
+    queue = call_events.subscribe(call_id)
+    try:
+        call = await db_service.get_call_log(call_id, fields="call_status,structured_data")
+    except CallNotFoundError:
+        call_events.unsubscribe(call_id, queue)
+        router_logger.warning(f"Call not found: {call_id}")
+        raise
+    except Exception as e:
+        call_events.unsubscribe(call_id, queue)
+        router_logger.error(f"Error opening event stream for call {call_id}: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    return StreamingResponse(
+        _event_stream(call_id, queue, call),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -21,7 +21,7 @@ async def create_configuration(config: ConfigurationCreate):
         config: Configuration data
         
     Returns:
-        Created/updated configuration with agent IDs
+        Created/updated configuration with agent IDs and the Retell sync report
         
     Raises:
         HTTPException: If configuration save fails
@@ -40,7 +40,7 @@ async def create_configuration(config: ConfigurationCreate):
 
 # PUBLIC_INTERFACE
 @router.get("/{scenario_type}", response_model=ConfigurationResponse)
-def get_configuration(scenario_type: str):
+async def get_configuration(scenario_type: str):
     """
     Get configuration for a specific scenario.
     
@@ -54,7 +54,7 @@ def get_configuration(scenario_type: str):
         HTTPException: If configuration not found or invalid
     """
     try:
-        return config_service.get_configuration(scenario_type)
+        return await config_service.get_configuration(scenario_type)
     except ValueError as e:
         router_logger.warning(f"Invalid scenario type: {scenario_type}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -68,7 +68,7 @@ def get_configuration(scenario_type: str):
 
 # PUBLIC_INTERFACE
 @router.get("", response_model=list[ConfigurationResponse])
-def list_configurations():
+async def list_configurations():
     """
     Get all configurations.
     
@@ -79,7 +79,7 @@ def list_configurations():
         HTTPException: If listing fails
     """
     try:
-        return config_service.list_configurations()
+        return await config_service.list_configurations()
     except Exception as e:
         router_logger.error(f"Error listing configurations: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
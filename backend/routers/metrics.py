@@ -0,0 +1,50 @@
+"""
+FastAPI router for runtime metrics endpoints.
+"""
+
+from fastapi import APIRouter
+from services.database_service import db_service
+from services.extraction_worker import extraction_pool
+from services.webhook_service import webhook_service
+from openai_client import openai_extractor
+from extractors import scenario_extractor
+from local_extractor import local_checkin_extractor
+from call_events import call_events
+from campaigns import call_campaigns
+from number_pool import from_number_pool
+from http_transport import http_clients
+
+router = APIRouter(prefix="/api/metrics", tags=["metrics"])
+
+
+# PUBLIC_INTERFACE
+@router.get("")
+async def get_metrics():
+    """
+    Get in-process runtime metrics.
+    
+    Returns:
+        Dictionary of metric groups keyed by component
+    """
+    return {
+        "config_cache": db_service.config_cache.stats(),
+        "extraction_pool": await extraction_pool.stats(),
+        "extraction_dedup": webhook_service.dedup_stats,
+        "live_extraction": webhook_service.live_stats,
+        "extraction_backends": scenario_extractor.selection,
+        "local_extraction": local_checkin_extractor.stats(),
+        "extraction_cache": openai_extractor.cache.stats(),
+        "transcript_compaction": openai_extractor.compaction_stats,
+        "extraction_chunking": openai_extractor.chunking_stats(),
+        "extraction_fast_path": openai_extractor.fast_path_stats(),
+        "openai_rate_governor": openai_extractor.rate_governor.stats(),
+        "extraction_validation": openai_extractor.validation_stats,
+        "extraction_routing": openai_extractor.routing_stats(),
+        "extraction_batching": openai_extractor.batcher.stats(),
+        "extraction_streaming": openai_extractor.streaming_stats(),
+        "extraction_hedging": openai_extractor.hedging_stats(),
+        "call_events": call_events.stats(),
+        "call_campaigns": call_campaigns.stats(),
+        "from_numbers": from_number_pool.stats(),
+        "http_pools": http_clients.stats()
+    }
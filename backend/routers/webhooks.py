@@ -4,6 +4,7 @@ FastAPI router for webhook endpoints.
 
 from fastapi import APIRouter, Request, HTTPException
 from services.webhook_service import webhook_service
+from number_pool import from_number_pool
 from logger import router_logger
 import json
 
@@ -18,8 +19,13 @@ async def handle_retell_webhook(request: Request):
     
     Processes different webhook events:
     - call_started: Mark call as in progress
-    - call_ended: Process transcript if available
-    - call_analyzed: Process transcript data
+    - call_ended: Free the from-number slot; store transcript and queue
+      extraction if available
+    - call_analyzed: Store transcript and queue extraction
+    - transcript_updated: Extract the partial transcript while the call runs
+    
+    Extraction runs in the background worker pool, so the webhook is
+    acknowledged as soon as the transcript is persisted.
     
     Args:
         request: FastAPI request object with webhook payload
@@ -44,11 +50,16 @@ async def handle_retell_webhook(request: Request):
         if event == "call_started":
             await webhook_service.handle_call_started(call_id)
         elif event == "call_ended":
+            # Free the from-number slot before the slower transcript work
+            from_number_pool.call_ended(call_id, call_data.get("disconnection_reason"))
             transcript = call_data.get("transcript", "")
             await webhook_service.handle_call_ended(call_id, transcript)
         elif event == "call_analyzed":
             transcript = call_data.get("transcript", "")
             await webhook_service.handle_call_analyzed(call_id, transcript)
+        elif event == "transcript_updated":
+            transcript = call_data.get("transcript", "")
+            await webhook_service.handle_transcript_updated(call_id, transcript)
         else:
             router_logger.warning(f"Unknown webhook event: {event}")
         
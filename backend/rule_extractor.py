@@ -0,0 +1,269 @@
+"""
+Rule-based check-in extraction that runs before the LLM.
+
+Drivers state most check-in facts in predictable forms ("I-10 near Indio",
+"ETA 8 AM tomorrow", "door 42"). Each field gets a value and a confidence
+score; fields below the threshold are left for the LLM.
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from transcripts import parse_turns
+from constants import (
+    CHECKIN_OUTCOME_IN_TRANSIT,
+    CHECKIN_OUTCOME_ARRIVAL,
+    DRIVER_STATUS_DRIVING,
+    DRIVER_STATUS_DELAYED,
+    DRIVER_STATUS_ARRIVED,
+    DRIVER_STATUS_UNLOADING
+)
+
+
+class FieldGuess(NamedTuple):
+    """A locally extracted field value with its confidence (0-1)."""
+    value: object
+    confidence: float
+
+
+UNRESOLVED = FieldGuess(None, 0.0)
+
+_STATUS_PATTERNS = [
+    (DRIVER_STATUS_UNLOADING, re.compile(
+        r"\b(?:unloading|getting unloaded|(?:in|at) door\s*#?\s*\d+|lumper)\b"
+    )),
+    (DRIVER_STATUS_ARRIVED, re.compile(
+        r"\b(?:arrived|just got here|pulled in|checked in at|"
+        r"i'?m (?:here|at the (?:receiver|consignee|facility|dock|warehouse)))\b"
+    )),
+    (DRIVER_STATUS_DELAYED, re.compile(
+        r"\b(?:delayed|running (?:late|behind)|behind schedule|stuck in|held up|"
+        r"(?:gonna|going to) be late)\b"
+    )),
+    (DRIVER_STATUS_DRIVING, re.compile(
+        r"\b(?:driving|on the road|rolling|en route|on my way|heading (?:to|towards)|"
+        r"still moving|moving along)\b"
+    ))
+]
+_NEGATION_PATTERN = re.compile(r"(?:\bnot|\bno|\bnever|n't)\s+(?:\w+\s+)?$")
+
+_LOCATION_PATTERN = re.compile(
+    r"\b(?:I-\d{1,3}|(?:US|SR|Hwy|Highway|Interstate|Route)[- ]?\d{1,3})"
+    r"(?:\s+(?:North|South|East|West)(?:bound)?)?"
+    r"(?:,?\s+(?:at\s+)?mile\s+marker\s+\d+)?"
+    r"(?P<place>,?\s+(?:near|by|outside(?: of)?|past|just (?:past|outside))\s+"
+    r"[A-Z][a-z]+(?:\s[A-Z][a-z]+)?(?:,\s*[A-Z]{2}\b)?)?"
+)
+_TIME_PATTERN = re.compile(
+    r"\b(?P<hour>1[0-2]|0?[1-9])(?::(?P<minute>[0-5]\d))?\s*(?P<meridiem>[ap])\.?\s*m\b\.?",
+    re.IGNORECASE
+)
+_DAY_PATTERN = re.compile(r"\b(today|tonight|tomorrow)\b", re.IGNORECASE)
+_DOOR_PATTERN = re.compile(r"\bdoor\s*(?:number\s*|#\s*)?(\d+)\b", re.IGNORECASE)
+_POD_PATTERN = re.compile(r"\b(?:pod|proof of delivery|signed bol|bill of lading)\b", re.IGNORECASE)
+_AFFIRMATIVE_PATTERN = re.compile(
+    r"^\W*(?:yes|yeah|yep|yup|sure|ok(?:ay)?|will do|got it|of course|absolutely|"
+    r"no problem|sounds good|definitely|i will|i'll|for sure)\b",
+    re.IGNORECASE
+)
+_NEGATIVE_PATTERN = re.compile(r"^\W*(?:no|nope|not|i can't|i won't)\b", re.IGNORECASE)
+
+_DELAY_REASONS = [
+    ("Heavy Traffic", re.compile(r"\btraffic\b|\bcongestion\b|\bbacked up\b", re.IGNORECASE)),
+    ("Weather", re.compile(r"\bweather\b|\bsnow\b|\bice\b|\bstorm\b|\brain\b|\bfog\b|\bwind\b", re.IGNORECASE)),
+    ("Construction", re.compile(r"\bconstruction\b|\broad ?work\b", re.IGNORECASE)),
+    ("Mechanical Issue", re.compile(r"\bmechanical\b|\bflat tire\b|\bengine\b|\bbreak ?down\b", re.IGNORECASE)),
+    ("Accident Ahead", re.compile(r"\baccident\b|\bcrash\b|\bwreck\b", re.IGNORECASE))
+]
+
+_ARRIVAL_STATUSES = {DRIVER_STATUS_ARRIVED, DRIVER_STATUS_UNLOADING}
+_IN_TRANSIT_STATUSES = {DRIVER_STATUS_DRIVING, DRIVER_STATUS_DELAYED}
+
+
+class RuleBasedCheckinExtractor:
+    """Fills check-in fields from regular phrasing, each with a confidence."""
+    
+    # PUBLIC_INTERFACE
+    def extract(self, transcript: str) -> Dict[str, FieldGuess]:
+        """
+        Extract check-in fields from a transcript.
+        
+        Args:
+            transcript: Call transcript in "Speaker: text" lines
+        
+        Returns:
+            Mapping of every check-in field to a FieldGuess; unresolved
+            fields have confidence 0
+        """
+        turns = parse_turns(transcript)
+        driver_text = " ".join(text for speaker, text in turns if speaker == "Driver")
+        
+        status = self._driver_status(driver_text)
+        return {
+            "call_outcome": self._call_outcome(status),
+            "driver_status": status,
+            "current_location": self._current_location(driver_text),
+            "eta": self._eta(driver_text, status),
+            "delay_reason": self._delay_reason(driver_text, status),
+            "unloading_status": self._unloading_status(driver_text, status),
+            "pod_reminder_acknowledged": self._pod_acknowledged(turns)
+        }
+    
+    def _driver_status(self, driver_text: str) -> FieldGuess:
+        """
+        Classify the driver status; conflicting cues leave it unresolved.
+        
+        Args:
+            driver_text: Everything the driver said
+        
+        Returns:
+            FieldGuess for driver_status
+        """
+        lowered = driver_text.lower()
+        found = set()
+        for status, pattern in _STATUS_PATTERNS:
+            for match in pattern.finditer(lowered):
+                if not _NEGATION_PATTERN.search(lowered[:match.start()]):
+                    found.add(status)
+                    break
+        
+        if found & _ARRIVAL_STATUSES and found & _IN_TRANSIT_STATUSES:
+            return UNRESOLVED
+        for status, _ in _STATUS_PATTERNS:
+            if status in found:
+                return FieldGuess(status, 0.9)
+        return UNRESOLVED
+    
+    def _call_outcome(self, status: FieldGuess) -> FieldGuess:
+        """
+        Derive the call outcome from the driver status.
+        
+        Args:
+            status: driver_status guess
+        
+        Returns:
+            FieldGuess for call_outcome
+        """
+        if status.value in _ARRIVAL_STATUSES:
+            return FieldGuess(CHECKIN_OUTCOME_ARRIVAL, status.confidence)
+        if status.value in _IN_TRANSIT_STATUSES:
+            return FieldGuess(CHECKIN_OUTCOME_IN_TRANSIT, status.confidence)
+        return UNRESOLVED
+    
+    def _current_location(self, driver_text: str) -> FieldGuess:
+        """
+        Find a highway location such as "I-10 near Indio".
+        
+        Args:
+            driver_text: Everything the driver said
+        
+        Returns:
+            FieldGuess for current_location
+        """
+        matches = list(_LOCATION_PATTERN.finditer(driver_text))
+        if not matches:
+            return UNRESOLVED
+        
+        last = matches[-1]
+        value = last.group(0).strip(" ,")
+        if len({match.group(0).strip(" ,") for match in matches}) > 1:
+            return FieldGuess(value, 0.6)
+        return FieldGuess(value, 0.9 if last.group("place") else 0.7)
+    
+    def _eta(self, driver_text: str, status: FieldGuess) -> FieldGuess:
+        """
+        Find a single stated arrival time, e.g. "8 AM tomorrow".
+        
+        Args:
+            driver_text: Everything the driver said
+            status: driver_status guess
+        
+        Returns:
+            FieldGuess for eta
+        """
+        if status.value in _ARRIVAL_STATUSES:
+            return FieldGuess("N/A", status.confidence)
+        
+        times: List[Tuple[str, Optional[str]]] = []
+        for match in _TIME_PATTERN.finditer(driver_text):
+            hour = int(match.group("hour"))
+            minute = match.group("minute") or "00"
+            time = f"{hour}:{minute} {match.group('meridiem').upper()}M"
+            window = driver_text[max(0, match.start() - 25):match.end() + 25]
+            day = _DAY_PATTERN.search(window)
+            times.append((time, day.group(1).capitalize() if day else None))
+        
+        if not times:
+            return UNRESOLVED
+        
+        time, day = times[-1]
+        value = f"{day}, {time}" if day else time
+        return FieldGuess(value, 0.85 if len(set(times)) == 1 else 0.5)
+    
+    def _delay_reason(self, driver_text: str, status: FieldGuess) -> FieldGuess:
+        """
+        Name the delay reason for delayed drivers.
+        
+        Args:
+            driver_text: Everything the driver said
+            status: driver_status guess
+        
+        Returns:
+            FieldGuess for delay_reason
+        """
+        if status.value is None:
+            return UNRESOLVED
+        if status.value != DRIVER_STATUS_DELAYED:
+            return FieldGuess("None", 0.85)
+        
+        reasons = [reason for reason, pattern in _DELAY_REASONS if pattern.search(driver_text)]
+        if len(reasons) == 1:
+            return FieldGuess(reasons[0], 0.85)
+        return UNRESOLVED
+    
+    def _unloading_status(self, driver_text: str, status: FieldGuess) -> FieldGuess:
+        """
+        Find the dock door or lumper wait for arrived drivers.
+        
+        Args:
+            driver_text: Everything the driver said
+            status: driver_status guess
+        
+        Returns:
+            FieldGuess for unloading_status
+        """
+        if status.value in _IN_TRANSIT_STATUSES:
+            return FieldGuess("N/A", status.confidence)
+        
+        doors = {match.group(1) for match in _DOOR_PATTERN.finditer(driver_text)}
+        if len(doors) == 1:
+            return FieldGuess(f"In Door {doors.pop()}", 0.9)
+        if not doors and "lumper" in driver_text.lower():
+            return FieldGuess("Waiting for Lumper", 0.85)
+        return UNRESOLVED
+    
+    def _pod_acknowledged(self, turns: List[Tuple[str, str]]) -> FieldGuess:
+        """
+        Check whether the driver acknowledged the POD reminder.
+        
+        Args:
+            turns: Parsed (speaker, text) turns
+        
+        Returns:
+            FieldGuess for pod_reminder_acknowledged
+        """
+        reminder_index = None
+        for index, (speaker, text) in enumerate(turns):
+            if speaker == "Agent" and _POD_PATTERN.search(text):
+                reminder_index = index
+        
+        if reminder_index is None:
+            return FieldGuess(False, 0.9)
+        
+        replies = [text for speaker, text in turns[reminder_index + 1:] if speaker == "Driver"]
+        if not replies:
+            return UNRESOLVED
+        if _AFFIRMATIVE_PATTERN.search(replies[0]):
+            return FieldGuess(True, 0.9)
+        if _NEGATIVE_PATTERN.search(replies[0]):
+            return FieldGuess(False, 0.8)
+        return UNRESOLVED
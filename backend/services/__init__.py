@@ -3,8 +3,15 @@ Services package for business logic layer.
 """
 
 from services.database_service import db_service
+from services.extraction_worker import extraction_pool
 from services.call_service import call_service
 from services.configuration_service import config_service
 from services.webhook_service import webhook_service
 
-__all__ = ["db_service", "call_service", "config_service", "webhook_service"]
+__all__ = [
+    "db_service",
+    "extraction_pool",
+    "call_service",
+    "config_service",
+    "webhook_service"
+]
@@ -0,0 +1,220 @@
+"""
+Service layer for offline check-in extraction through the OpenAI Batch API.
+
+For results that are not needed in real time (overnight runs, reprocessing
+after a prompt change), pending calls are written as JSONL requests,
+submitted as one batch at the Batch API's lower price and separate rate
+limits, and the results are applied to call_logs when the batch completes.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from services.database_service import db_service
+from openai_client import openai_extractor, ExtractionValidationError
+from batch_api import BatchAPIClient, BATCH_FINAL_STATUSES
+from constants import (
+    SCENARIO_CHECKIN,
+    OPENAI_BATCH_BASE_URL,
+    OPENAI_BATCH_ENDPOINT,
+    OPENAI_BATCH_COMPLETION_WINDOW,
+    BATCH_EXTRACTION_LIMIT,
+    BATCH_POLL_INTERVAL_SECONDS,
+    BATCH_APPLY_CONCURRENCY
+)
+from logger import service_logger
+import asyncio
+import json
+import os
+import time
+
+
+class BatchExtractionService:
+    """Service class for Batch API extraction runs."""
+    
+    def __init__(self, client: Optional[BatchAPIClient] = None):
+        """
+        Initialize the service.
+        
+        Args:
+            client: Batch API client (default: one built from OPENAI_API_KEY
+                and OPENAI_BATCH_BASE_URL)
+        """
+        self.db_service = db_service
+        self.extractor = openai_extractor
+        self.client = client or BatchAPIClient(
+            api_key=os.getenv("OPENAI_API_KEY", ""),
+            base_url=os.getenv("OPENAI_BATCH_BASE_URL", OPENAI_BATCH_BASE_URL)
+        )
+    
+    # PUBLIC_INTERFACE
+    async def submit_pending(
+        self,
+        limit: int = BATCH_EXTRACTION_LIMIT,
+        reprocess: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Write pending check-in calls as batch requests and submit them.
+        
+        Args:
+            limit: Maximum number of calls in the batch
+            reprocess: Include calls that already have structured data
+        
+        Returns:
+            Created batch object, or None if no call needs extraction
+        """
+        calls = await self.db_service.list_calls_for_extraction(
+            SCENARIO_CHECKIN,
+            limit,
+            include_extracted=reprocess
+        )
+        if not calls:
+            service_logger.info("No check-in calls pending batch extraction")
+            return None
+        
+        jsonl = self.build_requests(calls)
+        file_id = await self.client.upload_jsonl(jsonl, f"checkin-extraction-{int(time.time())}.jsonl")
+        batch = await self.client.create_batch(
+            file_id,
+            OPENAI_BATCH_ENDPOINT,
+            OPENAI_BATCH_COMPLETION_WINDOW,
+            metadata={
+                "scenario_type": SCENARIO_CHECKIN,
+                "prompt_version": self.extractor.prompt_version(SCENARIO_CHECKIN)
+            }
+        )
+        service_logger.info(f"Submitted batch {batch['id']} with {len(calls)} check-in calls")
+        return batch
+    
+    # PUBLIC_INTERFACE
+    def build_requests(self, calls: List[Dict[str, Any]]) -> str:
+        """
+        Render calls as Batch API JSONL, one chat completion per call.
+        
+        Args:
+            calls: Call logs with id and raw_transcript
+        
+        Returns:
+            JSONL text; each custom_id is the call log ID
+        """
+        lines = []
+        for call in calls:
+            body = self.extractor.build_request(SCENARIO_CHECKIN, call["raw_transcript"])
+            lines.append(json.dumps({
+                "custom_id": call["id"],
+                "method": "POST",
+                "url": OPENAI_BATCH_ENDPOINT,
+                "body": body
+            }))
+        return "\n".join(lines) + "\n"
+    
+    # PUBLIC_INTERFACE
+    async def wait(
+        self,
+        batch_id: str,
+        poll_interval: float = BATCH_POLL_INTERVAL_SECONDS,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Poll a batch until it reaches a final status.
+        
+        Args:
+            batch_id: Batch ID
+            poll_interval: Seconds between polls
+            timeout: Optional limit on the total wait
+        
+        Returns:
+            Final batch object
+        
+        Raises:
+            TimeoutError: If the timeout passes first
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            batch = await self.client.get_batch(batch_id)
+            if batch["status"] in BATCH_FINAL_STATUSES:
+                return batch
+            if deadline is not None and time.monotonic() + poll_interval > deadline:
+                raise TimeoutError(f"Batch {batch_id} still {batch['status']} after {timeout}s")
+            await asyncio.sleep(poll_interval)
+    
+    # PUBLIC_INTERFACE
+    async def apply_results(self, batch: Dict[str, Any]) -> Dict[str, int]:
+        """
+        Store the structured data from a finished batch.
+        
+        Calls whose result failed or did not validate are left untouched,
+        so the next run picks them up again.
+        
+        Args:
+            batch: Final batch object
+        
+        Returns:
+            Counts of applied, invalid and failed requests
+        """
+        counts = {"applied": 0, "invalid": 0, "failed": 0}
+        if batch.get("error_file_id"):
+            errors = await self.client.get_file_content(batch["error_file_id"])
+            counts["failed"] += sum(1 for line in errors.splitlines() if line.strip())
+        if not batch.get("output_file_id"):
+            return counts
+        
+        output = await self.client.get_file_content(batch["output_file_id"])
+        updates: List[Tuple[str, Dict[str, Any]]] = []
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                counts["failed"] += 1
+                continue
+            try:
+                content = response["body"]["choices"][0]["message"]["content"]
+                updates.append((record["custom_id"], self.extractor.parse_result(SCENARIO_CHECKIN, content)))
+            except (KeyError, IndexError, ExtractionValidationError) as e:
+                service_logger.warning(f"Discarding batch result for call {record.get('custom_id')}: {e}")
+                counts["invalid"] += 1
+        
+        semaphore = asyncio.Semaphore(BATCH_APPLY_CONCURRENCY)
+        
+        async def apply(call_id: str, structured_data: Dict[str, Any]) -> bool:
+            async with semaphore:
+                try:
+                    return await self.db_service.update_call_log(
+                        call_id,
+                        {"structured_data": structured_data, "extraction_complete": True}
+                    )
+                except Exception as e:
+                    service_logger.error(f"Failed to store batch result for call {call_id}: {e}")
+                    return False
+        
+        stored = await asyncio.gather(*(apply(call_id, data) for call_id, data in updates))
+        counts["applied"] = sum(1 for ok in stored if ok)
+        counts["failed"] += len(stored) - counts["applied"]
+        return counts
+    
+    # PUBLIC_INTERFACE
+    async def run(
+        self,
+        limit: int = BATCH_EXTRACTION_LIMIT,
+        reprocess: bool = False,
+        poll_interval: float = BATCH_POLL_INTERVAL_SECONDS
+    ) -> Dict[str, Any]:
+        """
+        Submit pending calls, wait for the batch, and apply its results.
+        
+        Args:
+            limit: Maximum number of calls in the batch
+            reprocess: Include calls that already have structured data
+            poll_interval: Seconds between status polls
+        
+        Returns:
+            Summary with the batch ID, final status and result counts
+        """
+        batch = await self.submit_pending(limit, reprocess)
+        if batch is None:
+            return {"batch_id": None, "status": None, "applied": 0, "invalid": 0, "failed": 0}
+        
+        batch = await self.wait(batch["id"], poll_interval)
+        counts = await self.apply_results(batch)
+        service_logger.info(f"Batch {batch['id']} {batch['status']}: {counts}")
+        return {"batch_id": batch["id"], "status": batch["status"], **counts}
@@ -2,22 +2,43 @@
 Service layer for call-related business logic.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List
 from services.database_service import db_service
 from retell_client import retell_client
+from campaigns import call_campaigns, campaign_progress
+from number_pool import from_number_pool
 from constants import (
     CALL_STATUS_INITIATED,
+    CALL_STATUS_FAILED,
     WEB_CALL_PHONE_MARKER,
-    VALID_SCENARIOS
+    VALID_SCENARIOS,
+    AGENT_READY_WAIT_SECONDS,
+    FROM_NUMBER_ACQUIRE_WAIT_SECONDS,
+    FROM_NUMBER_REJECTION_MARKERS,
+    CAMPAIGN_DIAL_CONCURRENCY,
+    CAMPAIGN_ROW_QUEUED,
+    CAMPAIGN_ROW_DIALING,
+    CAMPAIGN_ROW_INITIATED,
+    CAMPAIGN_ROW_FAILED
 )
 from exceptions import (
     AgentConfigurationError,
+    AgentNotReadyError,
     CallLogCreationError,
+    CampaignNotFoundError,
     EnvironmentVariableError,
     InvalidPhoneNumberError
 )
+from readiness import readiness
 from logger import service_logger
+import asyncio
 import os
+import uuid
+
+SAME_NUMBER_DETAIL = (
+    "Cannot call one of the from_numbers. "
+    "Use a different driver phone number."
+)
 
 
 class CallService:
@@ -26,6 +47,7 @@ class CallService:
     def __init__(self):
         self.db_service = db_service
         self.retell_client = retell_client
+        self.from_numbers = from_number_pool
     
     # PUBLIC_INTERFACE
     async def initiate_web_call(
@@ -46,14 +68,15 @@ class CallService:
             Dictionary with call_id, retell_call_id, access_token, and status
             
         Raises:
+            AgentNotReadyError: If the agent is still being provisioned
             AgentConfigurationError: If agent not configured
             CallLogCreationError: If call log creation fails
         """
         # Validate and get agent ID
-        agent_id = self._get_agent_id(scenario_type)
+        agent_id = await self._get_agent_id(scenario_type)
         
         # Create call log
-        call_record = self._create_call_log(
+        call_record = await self._create_call_log(
             driver_name=driver_name,
             driver_phone=WEB_CALL_PHONE_MARKER,
             load_number=load_number,
@@ -71,7 +94,7 @@ class CallService:
             )
             
             # Update call log with Retell call ID
-            self.db_service.update_call_log(
+            await self.db_service.update_call_log(
                 call_record["id"],
                 {"retell_call_id": retell_call["call_id"]}
             )
@@ -101,6 +124,9 @@ class CallService:
         """
         Initiate a phone call.
         
+        The call is placed from the pool's least-loaded (or next
+        round-robin) from-number, waiting briefly if all are busy.
+        
         Args:
             driver_name: Driver's name
             driver_phone: Driver's phone number
@@ -111,35 +137,278 @@ class CallService:
             Dictionary with call_id, retell_call_id, and status
             
         Raises:
-            EnvironmentVariableError: If RETELL_FROM_NUMBER not set
+            EnvironmentVariableError: If no from-number is configured
             InvalidPhoneNumberError: If phone numbers are invalid
+            AgentNotReadyError: If the agent is still being provisioned
             AgentConfigurationError: If agent not configured
+            FromNumberUnavailableError: If every from-number stays busy
+                or cooling down
         """
-        # Get and validate from_number
-        from_number = os.getenv("RETELL_FROM_NUMBER")
-        if not from_number:
+        # Get and validate from-numbers
+        from_numbers = self.from_numbers.numbers()
+        if not from_numbers:
             raise EnvironmentVariableError("RETELL_FROM_NUMBER")
         
         # Validate phone numbers
-        if from_number == driver_phone:
-            raise InvalidPhoneNumberError(
-                "Cannot call the same number as the from_number. "
-                "Use a different driver phone number."
-            )
+        if driver_phone in from_numbers:
+            raise InvalidPhoneNumberError(SAME_NUMBER_DETAIL)
         
         # Validate and get agent ID
-        agent_id = self._get_agent_id(scenario_type)
+        agent_id = await self._get_agent_id(scenario_type)
+        
+        # Reserve a call slot on a from-number
+        from_number = await self.from_numbers.acquire(
+            float(os.getenv("FROM_NUMBER_ACQUIRE_WAIT_SECONDS", FROM_NUMBER_ACQUIRE_WAIT_SECONDS))
+        )
         
         # Create call log
-        call_record = self._create_call_log(
-            driver_name=driver_name,
-            driver_phone=driver_phone,
-            load_number=load_number,
-            scenario_type=scenario_type
+        try:
+            call_record = await self._create_call_log(
+                driver_name=driver_name,
+                driver_phone=driver_phone,
+                load_number=load_number,
+                scenario_type=scenario_type
+            )
+        except CallLogCreationError:
+            self.from_numbers.release(from_number)
+            raise
+        
+        try:
+            retell_call_id = await self._dial(
+                agent_id=agent_id,
+                from_number=from_number,
+                call_id=call_record["id"],
+                driver_name=driver_name,
+                driver_phone=driver_phone,
+                load_number=load_number
+            )
+            
+            return {
+                "call_id": call_record["id"],
+                "retell_call_id": retell_call_id,
+                "status": CALL_STATUS_INITIATED
+            }
+        except Exception as e:
+            service_logger.error(f"Error initiating phone call: {e}")
+            raise
+    
+    # PUBLIC_INTERFACE
+    async def start_campaign(self, calls: List[Dict[str, str]]) -> Dict[str, Any]:
+        """
+        Start a batch call campaign.
+        
+        Agents are looked up once per scenario and every call log is
+        written in a single insert; the calls are then dialed in the
+        background with a bounded number in flight, each waiting for a free
+        from-number. Rows whose driver phone is one of the from-numbers
+        are reported as failed without a call log.
+        
+        Args:
+            calls: Rows with driver_name, driver_phone, load_number and
+                scenario_type
+        
+        Returns:
+            Campaign progress (see campaigns.campaign_progress) with every
+            dialable row queued
+        
+        Raises:
+            EnvironmentVariableError: If no from-number is configured
+            AgentNotReadyError: If an agent is still being provisioned
+            AgentConfigurationError: If an agent is not configured
+            CallLogCreationError: If the call logs cannot be written
+        """
+        from_numbers = self.from_numbers.numbers()
+        if not from_numbers:
+            raise EnvironmentVariableError("RETELL_FROM_NUMBER")
+        
+        scenarios = sorted({call["scenario_type"] for call in calls})
+        agent_ids = dict(zip(
+            scenarios,
+            await asyncio.gather(*(self._get_agent_id(scenario) for scenario in scenarios))
+        ))
+        
+        campaign_id = str(uuid.uuid4())
+        rows = [
+            {
+                "index": index,
+                "call_id": None,
+                "driver_name": call["driver_name"],
+                "load_number": call["load_number"],
+                "scenario_type": call["scenario_type"],
+                "status": CAMPAIGN_ROW_QUEUED,
+                "retell_call_id": None,
+                "error": None
+            }
+            for index, call in enumerate(calls)
+        ]
+        queued = []
+        for row, call in zip(rows, calls):
+            if call["driver_phone"] in from_numbers:
+                row.update(status=CAMPAIGN_ROW_FAILED, error=SAME_NUMBER_DETAIL)
+            else:
+                queued.append(row)
+        
+        if queued:
+            try:
+                records = await self.db_service.create_call_logs([
+                    {
+                        "driver_name": calls[row["index"]]["driver_name"],
+                        "driver_phone": calls[row["index"]]["driver_phone"],
+                        "load_number": calls[row["index"]]["load_number"],
+                        "scenario_type": calls[row["index"]]["scenario_type"],
+                        "call_status": CALL_STATUS_INITIATED,
+                        "campaign_id": campaign_id,
+                        "campaign_index": row["index"]
+                    }
+                    for row in queued
+                ])
+            except Exception:
+                raise CallLogCreationError()
+            for row, record in zip(queued, records):
+                row["call_id"] = record["id"]
+        
+        call_campaigns.create(campaign_id, rows)
+        if queued:
+            task = asyncio.create_task(
+                self._dial_campaign(campaign_id, calls, queued, agent_ids)
+            )
+            call_campaigns.track(campaign_id, task)
+        
+        service_logger.info(
+            f"Started campaign {campaign_id}: {len(queued)} of {len(calls)} calls queued"
+        )
+        return call_campaigns.get(campaign_id)
+    
+    # PUBLIC_INTERFACE
+    async def get_campaign(self, campaign_id: str) -> Dict[str, Any]:
+        """
+        Get a campaign's per-row progress.
+        
+        Campaigns no longer held in memory (older than the tracker's
+        history, or started before a restart) are rebuilt from their call
+        logs; those rows also carry the call's current call_status.
+        
+        Args:
+            campaign_id: Campaign ID
+        
+        Returns:
+            Campaign progress
+        
+        Raises:
+            CampaignNotFoundError: If no calls belong to the campaign
+        """
+        progress = call_campaigns.get(campaign_id)
+        if progress is not None:
+            return progress
+        
+        calls = await self.db_service.list_campaign_calls(campaign_id)
+        if not calls:
+            raise CampaignNotFoundError(campaign_id)
+        
+        rows = []
+        for call in calls:
+            if call["call_status"] == CALL_STATUS_FAILED:
+                status = CAMPAIGN_ROW_FAILED
+            elif call.get("retell_call_id"):
+                status = CAMPAIGN_ROW_INITIATED
+            else:
+                status = CAMPAIGN_ROW_QUEUED
+            rows.append({
+                "index": call["campaign_index"],
+                "call_id": call["id"],
+                "driver_name": call["driver_name"],
+                "load_number": call["load_number"],
+                "scenario_type": call["scenario_type"],
+                "status": status,
+                "retell_call_id": call.get("retell_call_id"),
+                "error": None,
+                "call_status": call["call_status"]
+            })
+        return campaign_progress(campaign_id, rows, calls[0].get("created_at"))
+    
+    async def _dial_campaign(
+        self,
+        campaign_id: str,
+        calls: List[Dict[str, str]],
+        rows: List[Dict[str, Any]],
+        agent_ids: Dict[str, str]
+    ) -> None:
+        """
+        Dial a campaign's queued rows with bounded concurrency.
+        
+        Each row waits for a free from-number, so a campaign larger than
+        the pool's capacity is paced by calls ending. A failed row is
+        recorded on the campaign and its call log marked failed; it does
+        not stop the other rows.
+        
+        Args:
+            campaign_id: Campaign ID
+            calls: Submitted rows
+            rows: Queued progress rows, each with index and call_id
+            agent_ids: Agent ID per scenario
+        """
+        semaphore = asyncio.Semaphore(
+            int(os.getenv("CAMPAIGN_DIAL_CONCURRENCY", CAMPAIGN_DIAL_CONCURRENCY))
         )
         
+        async def dial(row: Dict[str, Any]) -> None:
+            call = calls[row["index"]]
+            async with semaphore:
+                try:
+                    from_number = await self.from_numbers.acquire(None)
+                    call_campaigns.update_row(campaign_id, row["index"], status=CAMPAIGN_ROW_DIALING)
+                    retell_call_id = await self._dial(
+                        agent_id=agent_ids[call["scenario_type"]],
+                        from_number=from_number,
+                        call_id=row["call_id"],
+                        driver_name=call["driver_name"],
+                        driver_phone=call["driver_phone"],
+                        load_number=call["load_number"]
+                    )
+                except Exception as e:
+                    service_logger.error(f"Campaign {campaign_id} call {row['call_id']} failed: {e}")
+                    call_campaigns.update_row(
+                        campaign_id, row["index"], status=CAMPAIGN_ROW_FAILED, error=str(e)
+                    )
+                    await self._mark_failed(row["call_id"])
+                    return
+                call_campaigns.update_row(
+                    campaign_id, row["index"],
+                    status=CAMPAIGN_ROW_INITIATED,
+                    retell_call_id=retell_call_id
+                )
+        
+        await asyncio.gather(*(dial(row) for row in rows))
+        service_logger.info(f"Finished dialing campaign {campaign_id}")
+    
+    async def _dial(
+        self,
+        agent_id: str,
+        from_number: str,
+        call_id: str,
+        driver_name: str,
+        driver_phone: str,
+        load_number: str
+    ) -> str:
+        """
+        Place a phone call through Retell and record its Retell call ID.
+        
+        The from-number slot is released if Retell rejects the call, as a
+        failure of the number only when the rejection is about the number
+        itself; otherwise it is held until the call ends.
+        
+        Args:
+            agent_id: Agent to call with
+            from_number: From-number reserved with from_numbers.acquire
+            call_id: Call log ID
+            driver_name: Driver's name
+            driver_phone: Driver's phone number
+            load_number: Load number
+        
+        Returns:
+            Retell call ID
+        """
         try:
-            # Initiate call via Retell
             retell_call = await self.retell_client.create_phone_call(
                 agent_id=agent_id,
                 from_number=from_number,
@@ -149,27 +418,57 @@ class CallService:
                     "load_number": load_number
                 }
             )
-            
-            # Update call log with Retell call ID
-            self.db_service.update_call_log(
-                call_record["id"],
-                {"retell_call_id": retell_call["call_id"]}
-            )
-            
-            service_logger.info(
-                f"Initiated phone call to {driver_name}: {retell_call['call_id']}"
-            )
-            
-            return {
-                "call_id": call_record["id"],
-                "retell_call_id": retell_call["call_id"],
-                "status": CALL_STATUS_INITIATED
-            }
         except Exception as e:
-            service_logger.error(f"Error initiating phone call: {e}")
+            self.from_numbers.release(from_number, failed=self._is_from_number_rejection(e, from_number))
             raise
+        self.from_numbers.attach(from_number, retell_call["call_id"])
+        
+        # Update call log with Retell call ID
+        await self.db_service.update_call_log(
+            call_id,
+            {"retell_call_id": retell_call["call_id"]}
+        )
+        
+        service_logger.info(
+            f"Initiated phone call to {driver_name}: {retell_call['call_id']}"
+        )
+        return retell_call["call_id"]
+    
+    def _is_from_number_rejection(self, error: Exception, from_number: str) -> bool:
+        """
+        Decide whether a failed dial counts against the from-number.
+        
+        Args:
+            error: Error raised by create_phone_call
+            from_number: From-number the call was placed with
+        
+        Returns:
+            True if Retell rejected the call because of the from-number or
+            its carrier; False for local errors (timeouts, connection
+            errors) and for rejections of the request, such as an invalid
+            to_number
+        """
+        if getattr(error, "status_code", None) is None:
+            return False
+        message = str(error)
+        if from_number in message:
+            return True
+        message = message.lower()
+        return any(marker in message for marker in FROM_NUMBER_REJECTION_MARKERS)
+    
+    async def _mark_failed(self, call_id: str) -> None:
+        """
+        Mark a call log as failed, logging rather than raising on error.
+        
+        Args:
+            call_id: Call log ID
+        """
+        try:
+            await self.db_service.update_call_log(call_id, {"call_status": CALL_STATUS_FAILED})
+        except Exception as e:
+            service_logger.error(f"Could not mark call {call_id} failed: {e}")
     
-    def _get_agent_id(self, scenario_type: str) -> str:
+    async def _get_agent_id(self, scenario_type: str) -> str:
         """
         Get agent ID for scenario type.
         
@@ -180,14 +479,19 @@ class CallService:
             Agent ID
             
         Raises:
+            AgentNotReadyError: If the agent is still being provisioned
             AgentConfigurationError: If agent not found
         """
-        agent_id = self.db_service.get_agent_id(scenario_type)
+        # Calls arriving right after startup wait for provisioning to finish
+        provisioned = await readiness.wait(scenario_type, AGENT_READY_WAIT_SECONDS)
+        agent_id = await self.db_service.get_agent_id(scenario_type)
         if not agent_id:
+            if not provisioned:
+                raise AgentNotReadyError(scenario_type)
             raise AgentConfigurationError(scenario_type)
         return agent_id
     
-    def _create_call_log(
+    async def _create_call_log(
         self,
         driver_name: str,
         driver_phone: str,
@@ -210,7 +514,7 @@ class CallService:
             CallLogCreationError: If creation fails
         """
         try:
-            return self.db_service.create_call_log({
+            return await self.db_service.create_call_log({
                 "driver_name": driver_name,
                 "driver_phone": driver_phone,
                 "load_number": load_number,
@@ -2,11 +2,13 @@
 Service layer for agent configuration operations.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from services.database_service import db_service
 from retell_client import retell_client
-from constants import END_CALL_TOOL, VALID_SCENARIOS
+from constants import VALID_SCENARIOS
+from retell_sync import sync_retell_agent
 from exceptions import ConfigurationNotFoundError
+from readiness import readiness
 from logger import service_logger
 
 
@@ -33,7 +35,8 @@ class ConfigurationService:
             retell_settings: Retell voice settings
             
         Returns:
-            Updated configuration with agent IDs
+            Updated configuration with agent IDs, and under retell_sync the
+            sync report (None if the sync failed)
         """
         # Save configuration to database
         config_data = {
@@ -42,20 +45,21 @@ class ConfigurationService:
             "retell_settings": retell_settings
         }
         
-        config_record = self.db_service.save_configuration(scenario_type, config_data)
+        config_record = await self.db_service.save_configuration(scenario_type, config_data)
         
         # Sync with Retell
-        await self._sync_retell_agent(
+        report = await self._sync_retell_agent(
             config_record['id'],
             scenario_type,
             system_prompt
         )
         
         # Return updated configuration
-        return self.db_service.get_agent_configuration(scenario_type)
+        config = await self.db_service.get_agent_configuration(scenario_type)
+        return {**config, "retell_sync": report}
     
     # PUBLIC_INTERFACE
-    def get_configuration(self, scenario_type: str) -> Dict[str, Any]:
+    async def get_configuration(self, scenario_type: str) -> Dict[str, Any]:
         """
         Get configuration for a specific scenario.
         
@@ -71,30 +75,33 @@ class ConfigurationService:
         if scenario_type not in VALID_SCENARIOS:
             raise ValueError(f"Invalid scenario type: {scenario_type}")
         
-        config = self.db_service.get_agent_configuration(scenario_type)
+        config = await self.db_service.get_agent_configuration(scenario_type)
         if not config:
             raise ConfigurationNotFoundError(scenario_type)
         
         return config
     
     # PUBLIC_INTERFACE
-    def list_configurations(self) -> List[Dict[str, Any]]:
+    async def list_configurations(self) -> List[Dict[str, Any]]:
         """
         Get all configurations.
         
         Returns:
             List of configuration dictionaries
         """
-        return self.db_service.list_configurations()
+        return await self.db_service.list_configurations()
     
     async def _sync_retell_agent(
         self,
         config_id: str,
         scenario_type: str,
         system_prompt: str
-    ) -> bool:
+    ) -> Optional[Dict[str, Any]]:
         """
-        Create or update Retell LLM and agent, store IDs in database.
+        Create or update Retell LLM and agent, store IDs and hashes in database.
+        
+        A successful sync marks the scenario ready, so a scenario whose
+        provisioning failed at startup recovers without a restart.
         
         Args:
             config_id: Configuration record ID
@@ -102,54 +109,24 @@ class ConfigurationService:
             system_prompt: System prompt
             
         Returns:
-            True if successful
+            Sync report from sync_retell_agent, or None if the sync failed
         """
         try:
-            config = self.db_service.get_agent_configuration(scenario_type)
-            llm_id = config.get("llm_id") if config else None
-            agent_id = config.get("agent_id") if config else None
-            
-            # Create or update LLM
-            if not llm_id:
-                service_logger.info(f"Creating new {scenario_type} LLM with end_call tool")
-                llm_id = await self.retell_client.create_llm(
-                    general_prompt=system_prompt,
-                    general_tools=[END_CALL_TOOL]
-                )
-                service_logger.info(f"Created {scenario_type} LLM: {llm_id}")
-                
-                # Update database with LLM ID
-                self.db_service.save_configuration(
-                    scenario_type,
-                    {"llm_id": llm_id}
-                )
-            else:
-                service_logger.info(f"Updating existing {scenario_type} LLM")
-                await self.retell_client.update_llm(
-                    llm_id=llm_id,
-                    general_prompt=system_prompt,
-                    general_tools=[END_CALL_TOOL]
-                )
-                service_logger.info(f"Updated {scenario_type} LLM")
-            
-            # Create agent if it doesn't exist
-            if not agent_id:
-                service_logger.info(f"Creating new {scenario_type} agent")
-                agent_name = f"Dispatch {scenario_type.title()} Agent"
-                agent_result = await self.retell_client.create_agent(agent_name, llm_id)
-                agent_id = agent_result['agent_id']
-                service_logger.info(f"Created {scenario_type} agent: {agent_id}")
-                
-                # Update database with agent ID
-                self.db_service.save_configuration(
-                    scenario_type,
-                    {"agent_id": agent_id}
-                )
+            config = await self.db_service.get_agent_configuration(scenario_type)
             
-            return True
+            # Only the parts that changed since the last sync are pushed
+            result = await sync_retell_agent(
+                scenario_type,
+                system_prompt,
+                config or {},
+                self.retell_client,
+                self.db_service
+            )
+            readiness.finish(scenario_type, result["agent_id"])
+            return result
         except Exception as e:
             service_logger.error(f"Error syncing Retell: {e}", exc_info=True)
-            return False
+            return None
 
 
 # Singleton instance
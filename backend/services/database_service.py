@@ -1,41 +1,162 @@
 """
 Database service layer for Supabase operations.
+
+All methods are coroutines backed by the async PostgREST client, so
+queries never block the event loop.
 """
 
 from typing import Dict, Any, Optional, List
 from database import supabase
-from constants import TABLE_AGENT_CONFIGURATIONS, TABLE_CALL_LOGS
-from exceptions import CallNotFoundError, ConfigurationNotFoundError
+from cache import TTLCache
+from constants import (
+    TABLE_AGENT_CONFIGURATIONS,
+    TABLE_CALL_LOGS,
+    CONFIG_CACHE_TTL_SECONDS,
+    CALL_LOGS_PAGE_SIZE,
+    CALL_LOG_FIELDS,
+    CALL_LOG_SUMMARY_FIELDS,
+    FIELDS_SUMMARY,
+    FIELDS_ALL
+)
+from exceptions import (
+    CallNotFoundError,
+    ConfigurationNotFoundError,
+    InvalidCursorError,
+    InvalidFieldsError
+)
 from logger import service_logger
+import base64
+import json
+import os
+
+
+def _select_columns(fields: str, required: List[str]) -> str:
+    """
+    Resolve a fields projection into a PostgREST select string.
+    
+    Args:
+        fields: "summary", "all", or a comma-separated list of columns
+        required: Columns always included in the projection
+        
+    Returns:
+        Select string for the query
+        
+    Raises:
+        InvalidFieldsError: If unknown columns are requested
+    """
+    if fields == FIELDS_ALL:
+        return "*"
+    
+    if fields == FIELDS_SUMMARY:
+        columns = list(CALL_LOG_SUMMARY_FIELDS)
+    else:
+        columns = [column.strip() for column in fields.split(",") if column.strip()]
+        if not columns or any(column not in CALL_LOG_FIELDS for column in columns):
+            raise InvalidFieldsError(fields)
+    
+    for column in required:
+        if column not in columns:
+            columns.append(column)
+    
+    return ",".join(columns)
+
+
+def _encode_cursor(row: Dict[str, Any]) -> str:
+    """
+    Encode the keyset position of a call log row as an opaque cursor.
+    
+    Args:
+        row: Call log row with created_at and id
+        
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps({"created_at": row["created_at"], "id": row["id"]})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Dict[str, str]:
+    """
+    Decode a cursor produced by _encode_cursor.
+    
+    Args:
+        cursor: Cursor string
+        
+    Returns:
+        Dictionary with created_at and id
+        
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        position = {"created_at": payload["created_at"], "id": payload["id"]}
+    except Exception:
+        raise InvalidCursorError(cursor)
+    
+    # Values are embedded in a quoted PostgREST filter
+    for value in position.values():
+        if not isinstance(value, str) or '"' in value or "\\" in value:
+            raise InvalidCursorError(cursor)
+    
+    return position
 
 
 class DatabaseService:
     """Service class for database operations."""
     
+    def __init__(self):
+        # Agent configurations are tiny and rarely change, so reads go
+        # through an in-process cache that every write invalidates.
+        self.config_cache = TTLCache(
+            float(os.getenv("CONFIG_CACHE_TTL_SECONDS", CONFIG_CACHE_TTL_SECONDS))
+        )
+    
     # PUBLIC_INTERFACE
-    def get_agent_configuration(self, scenario_type: str) -> Optional[Dict[str, Any]]:
+    async def get_agent_configuration(self, scenario_type: str) -> Optional[Dict[str, Any]]:
         """
         Get agent configuration for a scenario type.
         
+        Served from the configuration cache when possible; only found
+        configurations are cached.
+        
         Args:
             scenario_type: Type of scenario (checkin, emergency)
             
         Returns:
             Configuration dictionary or None if not found
         """
+        cached = self.config_cache.get(scenario_type)
+        if cached is not None:
+            return dict(cached)
+        
         try:
-            result = supabase.table(TABLE_AGENT_CONFIGURATIONS)\
+            result = await supabase.table(TABLE_AGENT_CONFIGURATIONS)\
                 .select("*")\
                 .eq("scenario_type", scenario_type)\
                 .execute()
             
-            return result.data[0] if result.data else None
+            if not result.data:
+                return None
+            
+            self.config_cache.set(scenario_type, result.data[0])
+            return dict(result.data[0])
         except Exception as e:
             service_logger.error(f"Error fetching agent configuration: {e}")
             raise
     
     # PUBLIC_INTERFACE
-    def get_agent_id(self, scenario_type: str) -> Optional[str]:
+    def invalidate_configuration_cache(self, scenario_type: Optional[str] = None) -> None:
+        """
+        Drop cached configuration for one scenario, or all scenarios.
+        
+        Args:
+            scenario_type: Scenario to invalidate (default: all)
+        """
+        self.config_cache.invalidate(scenario_type)
+    
+    # PUBLIC_INTERFACE
+    async def get_agent_id(self, scenario_type: str) -> Optional[str]:
         """
         Get agent ID for a scenario type.
         
@@ -45,11 +166,11 @@ class DatabaseService:
         Returns:
             Agent ID or None if not found
         """
-        config = self.get_agent_configuration(scenario_type)
+        config = await self.get_agent_configuration(scenario_type)
         return config.get("agent_id") if config else None
     
     # PUBLIC_INTERFACE
-    def create_call_log(self, call_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def create_call_log(self, call_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a new call log entry.
         
@@ -63,7 +184,7 @@ class DatabaseService:
             Exception: If creation fails
         """
         try:
-            result = supabase.table(TABLE_CALL_LOGS).insert(call_data).execute()
+            result = await supabase.table(TABLE_CALL_LOGS).insert(call_data).execute()
             
             if not result.data:
                 raise Exception("No data returned from insert")
@@ -75,7 +196,33 @@ class DatabaseService:
             raise
     
     # PUBLIC_INTERFACE
-    def update_call_log(
+    async def create_call_logs(self, calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create several call log entries in one insert.
+        
+        Args:
+            calls: Call log data, one dictionary per call with the same keys
+        
+        Returns:
+            Created call log records, in input order
+        
+        Raises:
+            Exception: If creation fails
+        """
+        try:
+            result = await supabase.table(TABLE_CALL_LOGS).insert(calls).execute()
+            
+            if len(result.data) != len(calls):
+                raise Exception(f"Inserted {len(result.data)} of {len(calls)} call logs")
+            
+            service_logger.info(f"Created {len(result.data)} call logs")
+            return result.data
+        except Exception as e:
+            service_logger.error(f"Error creating call logs: {e}")
+            raise
+    
+    # PUBLIC_INTERFACE
+    async def update_call_log(
         self, 
         call_id: str, 
         update_data: Dict[str, Any],
@@ -93,7 +240,7 @@ class DatabaseService:
             True if update successful
         """
         try:
-            result = supabase.table(TABLE_CALL_LOGS)\
+            result = await supabase.table(TABLE_CALL_LOGS)\
                 .update(update_data)\
                 .eq(id_field, call_id)\
                 .execute()
@@ -105,22 +252,26 @@ class DatabaseService:
             raise
     
     # PUBLIC_INTERFACE
-    def get_call_log(self, call_id: str) -> Dict[str, Any]:
+    async def get_call_log(self, call_id: str, fields: str = FIELDS_ALL) -> Dict[str, Any]:
         """
         Get call log by ID.
         
         Args:
             call_id: Call ID
+            fields: Projection: "all", "summary", or comma-separated columns
             
         Returns:
             Call log dictionary
             
         Raises:
             CallNotFoundError: If call not found
+            InvalidFieldsError: If unknown columns are requested
         """
+        columns = _select_columns(fields, required=["id"])
+        
         try:
-            result = supabase.table(TABLE_CALL_LOGS)\
-                .select("*")\
+            result = await supabase.table(TABLE_CALL_LOGS)\
+                .select(columns)\
                 .eq("id", call_id)\
                 .execute()
             
@@ -135,7 +286,7 @@ class DatabaseService:
             raise
     
     # PUBLIC_INTERFACE
-    def get_call_by_retell_id(self, retell_call_id: str) -> Optional[Dict[str, Any]]:
+    async def get_call_by_retell_id(self, retell_call_id: str) -> Optional[Dict[str, Any]]:
         """
         Get call log by Retell call ID.
         
@@ -146,7 +297,7 @@ class DatabaseService:
             Call log dictionary or None
         """
         try:
-            result = supabase.table(TABLE_CALL_LOGS)\
+            result = await supabase.table(TABLE_CALL_LOGS)\
                 .select("*")\
                 .eq("retell_call_id", retell_call_id)\
                 .execute()
@@ -157,31 +308,131 @@ class DatabaseService:
             raise
     
     # PUBLIC_INTERFACE
-    def list_call_logs(self, order_by: str = "created_at", ascending: bool = False) -> List[Dict[str, Any]]:
+    async def list_call_logs(
+        self,
+        limit: int = CALL_LOGS_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        ascending: bool = False,
+        fields: str = FIELDS_SUMMARY
+    ) -> Dict[str, Any]:
         """
-        List all call logs with optional ordering.
+        List call logs one page at a time using keyset pagination.
+        
+        Rows are ordered by (created_at, id) and each page starts strictly
+        after the cursor row, so deep pages cost the same index range scan
+        as the first one.
         
         Args:
-            order_by: Field to order by (default: created_at)
+            limit: Maximum number of call logs to return
+            cursor: Opaque cursor from a previous page's next_cursor
             ascending: Sort order direction (default: False for descending)
+            fields: Projection: "summary" (default), "all", or
+                comma-separated columns; id and created_at are always included
             
         Returns:
-            List of call log dictionaries
+            Dictionary with "items" (list of call logs) and "next_cursor"
+            (None on the last page)
+            
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded
+            InvalidFieldsError: If unknown columns are requested
         """
+        after = _decode_cursor(cursor) if cursor else None
+        columns = _select_columns(fields, required=["id", "created_at"])
+        
         try:
-            query = supabase.table(TABLE_CALL_LOGS).select("*")
+            query = supabase.table(TABLE_CALL_LOGS).select(columns)
             
-            # Apply ordering
-            query = query.order(order_by, desc=not ascending)
+            if after:
+                op = "gt" if ascending else "lt"
+                # PostgREST has no row comparison, so spell out
+                # (created_at, id) > / < (cursor.created_at, cursor.id)
+                query.params = query.params.add(
+                    "or",
+                    f'(created_at.{op}."{after["created_at"]}",'
+                    f'and(created_at.eq."{after["created_at"]}",id.{op}."{after["id"]}"))'
+                )
             
-            result = query.execute()
-            return result.data
+            # Single order parameter covering both keyset columns
+            direction = "" if ascending else ".desc"
+            query = query.order(f"created_at{direction},id", desc=not ascending)\
+                .limit(limit + 1)
+            
+            result = await query.execute()
         except Exception as e:
             service_logger.error(f"Error listing call logs: {e}")
             raise
+        
+        rows = result.data
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = _encode_cursor(rows[-1])
+        
+        return {"items": rows, "next_cursor": next_cursor}
+    
+    # PUBLIC_INTERFACE
+    async def list_campaign_calls(self, campaign_id: str) -> List[Dict[str, Any]]:
+        """
+        List the call logs of a batch call campaign, in submission order.
+        
+        Args:
+            campaign_id: Campaign ID
+        
+        Returns:
+            List of call log summaries
+        """
+        try:
+            result = await supabase.table(TABLE_CALL_LOGS)\
+                .select("id,retell_call_id,driver_name,load_number,scenario_type,call_status,campaign_index,created_at")\
+                .eq("campaign_id", campaign_id)\
+                .order("campaign_index")\
+                .execute()
+            
+            return result.data
+        except Exception as e:
+            service_logger.error(f"Error listing campaign calls: {e}")
+            raise
+    
+    # PUBLIC_INTERFACE
+    async def list_calls_for_extraction(
+        self,
+        scenario_type: str,
+        limit: int,
+        include_extracted: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        List calls with a transcript, oldest first, for offline extraction.
+        
+        Calls count as extracted only once a full extraction has been
+        stored; calls holding just the partial data written during the
+        call (their final extraction failed) are returned too.
+        
+        Args:
+            scenario_type: Scenario to select
+            limit: Maximum number of calls to return
+            include_extracted: Also return calls that are already extracted
+                (for reprocessing after a prompt change)
+        
+        Returns:
+            List of call logs with id and raw_transcript
+        """
+        try:
+            query = supabase.table(TABLE_CALL_LOGS)\
+                .select("id,raw_transcript")\
+                .eq("scenario_type", scenario_type)\
+                .not_.is_("raw_transcript", "null")
+            if not include_extracted:
+                query = query.eq("extraction_complete", False)
+            
+            result = await query.order("created_at").limit(limit).execute()
+            return result.data
+        except Exception as e:
+            service_logger.error(f"Error listing calls for extraction: {e}")
+            raise
     
     # PUBLIC_INTERFACE
-    def save_configuration(
+    async def save_configuration(
         self, 
         scenario_type: str, 
         config_data: Dict[str, Any]
@@ -197,15 +448,15 @@ class DatabaseService:
             Created/updated configuration
         """
         try:
-            existing = self.get_agent_configuration(scenario_type)
+            existing = await self.get_agent_configuration(scenario_type)
             
             if existing:
-                result = supabase.table(TABLE_AGENT_CONFIGURATIONS)\
+                result = await supabase.table(TABLE_AGENT_CONFIGURATIONS)\
                     .update(config_data)\
                     .eq("scenario_type", scenario_type)\
                     .execute()
             else:
-                result = supabase.table(TABLE_AGENT_CONFIGURATIONS)\
+                result = await supabase.table(TABLE_AGENT_CONFIGURATIONS)\
                     .insert(config_data)\
                     .execute()
             
@@ -217,9 +468,11 @@ class DatabaseService:
         except Exception as e:
             service_logger.error(f"Error saving configuration: {e}")
             raise
+        finally:
+            self.invalidate_configuration_cache(scenario_type)
     
     # PUBLIC_INTERFACE
-    def list_configurations(self) -> List[Dict[str, Any]]:
+    async def list_configurations(self) -> List[Dict[str, Any]]:
         """
         List all agent configurations.
         
@@ -227,7 +480,7 @@ class DatabaseService:
             List of configuration dictionaries
         """
         try:
-            result = supabase.table(TABLE_AGENT_CONFIGURATIONS)\
+            result = await supabase.table(TABLE_AGENT_CONFIGURATIONS)\
                 .select("*")\
                 .order("scenario_type")\
                 .execute()
@@ -0,0 +1,243 @@
+"""
+Worker pool that processes durable transcript extraction jobs.
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from job_queue import SQLiteJobQueue
+from constants import (
+    EXTRACTION_WORKER_CONCURRENCY,
+    EXTRACTION_DRAIN_TIMEOUT_SECONDS,
+    EXTRACTION_QUEUE_PATH,
+    EXTRACTION_MAX_ATTEMPTS,
+    EXTRACTION_VISIBILITY_TIMEOUT_SECONDS,
+    EXTRACTION_RETRY_BASE_SECONDS,
+    EXTRACTION_RETRY_MAX_SECONDS,
+    EXTRACTION_POLL_INTERVAL_SECONDS
+)
+from logger import service_logger
+
+# Handlers receive the job payload and whether this is the last attempt
+JobHandler = Callable[[Dict[str, Any], bool], Awaitable[Any]]
+
+
+class ExtractionWorkerPool:
+    """Runs jobs from a durable queue on a fixed number of asyncio workers."""
+    
+    def __init__(
+        self,
+        job_queue: SQLiteJobQueue,
+        concurrency: int = EXTRACTION_WORKER_CONCURRENCY,
+        poll_interval: float = EXTRACTION_POLL_INTERVAL_SECONDS
+    ):
+        """
+        Initialize the pool. Workers start on start() or the first submit.
+        
+        Args:
+            job_queue: Durable queue holding the jobs
+            concurrency: Number of jobs processed at the same time
+            poll_interval: Seconds an idle worker waits before polling again
+        """
+        self.job_queue = job_queue
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self._handlers: Dict[str, JobHandler] = {}
+        self._workers: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+        self.in_flight = 0
+        self.submitted = 0
+        self.completed = 0
+        self.retried = 0
+        self.dead_lettered = 0
+        self.total_wait_seconds = 0.0
+    
+    # PUBLIC_INTERFACE
+    def register_handler(self, job_type: str, handler: JobHandler) -> None:
+        """
+        Register the coroutine that processes a job type.
+        
+        Args:
+            job_type: Job type name
+            handler: Coroutine function taking (payload, final_attempt)
+        """
+        self._handlers[job_type] = handler
+    
+    # PUBLIC_INTERFACE
+    def start(self) -> None:
+        """Start worker tasks on the running event loop if not running."""
+        if self._workers:
+            return
+        
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._workers = [
+            asyncio.create_task(self._worker(index))
+            for index in range(self.concurrency)
+        ]
+        service_logger.info(f"Started {self.concurrency} extraction workers")
+    
+    # PUBLIC_INTERFACE
+    async def submit(self, job_type: str, payload: Dict[str, Any]) -> int:
+        """
+        Persist a job and wake an idle worker.
+        
+        Args:
+            job_type: Registered job type
+            payload: JSON-serializable job arguments
+        
+        Returns:
+            Job ID
+        """
+        self.start()
+        job_id = await asyncio.to_thread(self.job_queue.enqueue, job_type, payload)
+        self.submitted += 1
+        self._wakeup.set()
+        return job_id
+    
+    # PUBLIC_INTERFACE
+    async def stop(self, timeout: float = EXTRACTION_DRAIN_TIMEOUT_SECONDS) -> None:
+        """
+        Stop claiming jobs and let in-flight jobs finish.
+        
+        Queued jobs stay in the database for the next start. Jobs still
+        running after the timeout are cancelled and become claimable again
+        once their visibility timeout expires.
+        
+        Args:
+            timeout: Seconds to wait for in-flight jobs
+        """
+        if not self._workers:
+            return
+        
+        self._stopping = True
+        self._wakeup.set()
+        done, pending = await asyncio.wait(self._workers, timeout=timeout)
+        if pending:
+            service_logger.warning(
+                f"{len(pending)} extraction workers still busy after {timeout}s; cancelling"
+            )
+            for worker in pending:
+                worker.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        
+        self._workers = []
+        service_logger.info("Extraction workers stopped")
+    
+    # PUBLIC_INTERFACE
+    async def stats(self) -> Dict[str, Any]:
+        """
+        Get pool and queue counters.
+        
+        Returns:
+            Dictionary with queue depth by status, in-flight jobs and totals
+        """
+        counts = await asyncio.to_thread(self.job_queue.counts)
+        started = self.completed + self.retried + self.dead_lettered + self.in_flight
+        return {
+            "concurrency": self.concurrency,
+            "queue_depth": counts["pending"],
+            "running": counts["running"],
+            "dead_letter": counts["dead"],
+            "in_flight": self.in_flight,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "retried": self.retried,
+            "dead_lettered": self.dead_lettered,
+            "avg_wait_seconds": self.total_wait_seconds / started if started else 0.0
+        }
+    
+    async def _worker(self, index: int) -> None:
+        """
+        Claim and process jobs until the pool stops.
+        
+        Args:
+            index: Worker number, used in log messages
+        """
+        while not self._stopping:
+            try:
+                job = await asyncio.to_thread(self.job_queue.claim)
+            except Exception as e:
+                service_logger.error(f"Extraction worker {index} failed to claim job: {e}")
+                job = None
+            
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            
+            await self._run_job(index, job)
+    
+    async def _run_job(self, index: int, job: Dict[str, Any]) -> None:
+        """
+        Run one claimed job and record the outcome in the queue.
+        
+        Args:
+            index: Worker number, used in log messages
+            job: Claimed job dictionary
+        """
+        self.total_wait_seconds += max(0.0, time.time() - job["created_at"])
+        self.in_flight += 1
+        lease = asyncio.create_task(self._keep_leased(job["id"]))
+        try:
+            handler = self._handlers.get(job["job_type"])
+            if handler is None:
+                raise ValueError(f"No handler registered for job type {job['job_type']}")
+            
+            final_attempt = job["attempts"] >= job["max_attempts"]
+            await handler(job["payload"], final_attempt)
+            await asyncio.to_thread(self.job_queue.complete, job["id"])
+            self.completed += 1
+        except Exception as e:
+            retrying = await asyncio.to_thread(self.job_queue.fail, job["id"], str(e))
+            if retrying:
+                self.retried += 1
+                service_logger.warning(
+                    f"Extraction worker {index} job {job['id']} failed "
+                    f"(attempt {job['attempts']}/{job['max_attempts']}), retrying: {e}"
+                )
+            else:
+                self.dead_lettered += 1
+                service_logger.error(
+                    f"Extraction worker {index} job {job['id']} dead-lettered: {e}",
+                    exc_info=True
+                )
+        finally:
+            lease.cancel()
+            self.in_flight -= 1
+    
+    async def _keep_leased(self, job_id: int) -> None:
+        """
+        Renew a job's visibility timeout until cancelled.
+        
+        A slow extraction (rate-limit waits, re-asks, hedges) can outlast
+        the timeout; renewing keeps another worker from claiming it again.
+        
+        Args:
+            job_id: Claimed job ID
+        """
+        interval = self.job_queue.visibility_timeout / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(self.job_queue.extend, job_id)
+            except Exception as e:
+                service_logger.warning(f"Could not renew lease of job {job_id}: {e}")
+
+
+# Singleton instance
+extraction_pool = ExtractionWorkerPool(
+    SQLiteJobQueue(
+        path=os.getenv("EXTRACTION_QUEUE_PATH", EXTRACTION_QUEUE_PATH),
+        max_attempts=int(os.getenv("EXTRACTION_MAX_ATTEMPTS", EXTRACTION_MAX_ATTEMPTS)),
+        visibility_timeout=EXTRACTION_VISIBILITY_TIMEOUT_SECONDS,
+        retry_base_seconds=EXTRACTION_RETRY_BASE_SECONDS,
+        retry_max_seconds=EXTRACTION_RETRY_MAX_SECONDS
+    ),
+    concurrency=int(os.getenv("EXTRACTION_WORKER_CONCURRENCY", EXTRACTION_WORKER_CONCURRENCY))
+)
@@ -2,17 +2,28 @@
 Service layer for webhook processing operations.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from services.database_service import db_service
-from openai_client import openai_extractor
+from services.extraction_worker import extraction_pool
+from openai_client import FieldCallback
+from extractors import scenario_extractor
+from call_events import call_events
+from cache import TTLCache
+from transcripts import transcript_hash, parse_turns
 from constants import (
     CALL_STATUS_IN_PROGRESS,
     CALL_STATUS_COMPLETED,
     SCENARIO_CHECKIN,
-    SCENARIO_EMERGENCY
+    SCENARIO_EMERGENCY,
+    JOB_PROCESS_TRANSCRIPT,
+    EXTRACTION_DEDUP_TTL_SECONDS,
+    EXTRACTION_DEDUP_MAX_CALLS,
+    LIVE_EXTRACTION_DEBOUNCE_SECONDS
 )
 from logger import service_logger
+import asyncio
 import json
+import os
 
 
 class WebhookService:
@@ -20,7 +31,37 @@ class WebhookService:
     
     def __init__(self):
         self.db_service = db_service
-        self.extractor = openai_extractor
+        self.extractor = scenario_extractor
+        self.extraction_pool = extraction_pool
+        self.call_events = call_events
+        # Single-flight state: call_ended and call_analyzed usually carry
+        # the same transcript, which only needs to be extracted once.
+        self._queued = TTLCache(EXTRACTION_DEDUP_TTL_SECONDS, max_size=EXTRACTION_DEDUP_MAX_CALLS)
+        self._in_flight: Dict[str, Tuple[str, asyncio.Task]] = {}
+        self._extracted = TTLCache(EXTRACTION_DEDUP_TTL_SECONDS, max_size=EXTRACTION_DEDUP_MAX_CALLS)
+        self.dedup_stats = {"started": 0, "joined": 0, "skipped": 0}
+        # Live extraction state: a debounce timer per call, a lock so live
+        # runs and the end-of-call step never overlap, the turns and result
+        # of the last live run, and calls that already ended. All but the
+        # self-removing timers expire, in case call_ended never arrives.
+        self.live_debounce_seconds = float(
+            os.getenv("LIVE_EXTRACTION_DEBOUNCE_SECONDS", LIVE_EXTRACTION_DEBOUNCE_SECONDS)
+        )
+        self._live_timers: Dict[str, asyncio.Task] = {}
+        self._live_locks = TTLCache(EXTRACTION_DEDUP_TTL_SECONDS, max_size=EXTRACTION_DEDUP_MAX_CALLS)
+        self._live_latest = TTLCache(EXTRACTION_DEDUP_TTL_SECONDS, max_size=EXTRACTION_DEDUP_MAX_CALLS)
+        self._live_results = TTLCache(EXTRACTION_DEDUP_TTL_SECONDS, max_size=EXTRACTION_DEDUP_MAX_CALLS)
+        self._ended = TTLCache(EXTRACTION_DEDUP_TTL_SECONDS, max_size=EXTRACTION_DEDUP_MAX_CALLS)
+        self.live_stats = {
+            "updates": 0,
+            "ignored": 0,
+            "debounced": 0,
+            "unchanged": 0,
+            "extractions": 0,
+            "failed": 0,
+            "reconciled": 0,
+            "reextracted": 0
+        }
     
     # PUBLIC_INTERFACE
     async def handle_call_started(self, call_id: str) -> None:
@@ -31,7 +72,7 @@ class WebhookService:
             call_id: Retell call ID
         """
         try:
-            self.db_service.update_call_log(
+            await self.db_service.update_call_log(
                 call_id,
                 {"call_status": CALL_STATUS_IN_PROGRESS},
                 id_field="retell_call_id"
@@ -42,7 +83,7 @@ class WebhookService:
             raise
     
     # PUBLIC_INTERFACE
-    async def handle_call_ended(self, call_id: str, transcript: str = None) -> None:
+    async def handle_call_ended(self, call_id: str, transcript: Optional[str] = None) -> None:
         """
         Handle call_ended webhook event.
         
@@ -50,13 +91,14 @@ class WebhookService:
             call_id: Retell call ID
             transcript: Call transcript if available
         """
+        self._end_live(call_id)
         try:
             if transcript:
                 service_logger.info(f"Call ended with transcript: {call_id}")
-                await self.process_transcript(call_id, transcript)
+                await self.enqueue_transcript(call_id, transcript)
             else:
                 service_logger.info(f"Call ended without transcript: {call_id}")
-                self.db_service.update_call_log(
+                await self.db_service.update_call_log(
                     call_id,
                     {"call_status": CALL_STATUS_COMPLETED},
                     id_field="retell_call_id"
@@ -66,7 +108,7 @@ class WebhookService:
             raise
     
     # PUBLIC_INTERFACE
-    async def handle_call_analyzed(self, call_id: str, transcript: str = None) -> None:
+    async def handle_call_analyzed(self, call_id: str, transcript: Optional[str] = None) -> None:
         """
         Handle call_analyzed webhook event.
         
@@ -74,10 +116,11 @@ class WebhookService:
             call_id: Retell call ID
             transcript: Call transcript if available
         """
+        self._end_live(call_id)
         try:
             if transcript:
                 service_logger.info(f"Call analyzed with transcript: {call_id}")
-                await self.process_transcript(call_id, transcript)
+                await self.enqueue_transcript(call_id, transcript)
             else:
                 service_logger.warning(f"Call analyzed without transcript: {call_id}")
         except Exception as e:
@@ -85,51 +128,374 @@ class WebhookService:
             raise
     
     # PUBLIC_INTERFACE
-    async def process_transcript(self, call_id: str, transcript: str) -> None:
+    async def handle_transcript_updated(self, call_id: str, transcript: Optional[str] = None) -> None:
+        """
+        Handle transcript_updated webhook event.
+        
+        Live extraction runs once updates pause for the debounce interval,
+        so a burst of turn updates costs one extraction. Updates arriving
+        after the call ended or was analyzed are ignored.
+        
+        Args:
+            call_id: Retell call ID
+            transcript: Transcript so far
+        """
+        if not transcript or self.live_debounce_seconds < 0:
+            return
+        if self._ended.get(call_id):
+            self.live_stats["ignored"] += 1
+            service_logger.info(f"Ignoring transcript update for ended call {call_id}")
+            return
+        
+        self.live_stats["updates"] += 1
+        self._live_latest.set(call_id, transcript)
+        timer = self._live_timers.pop(call_id, None)
+        if timer is not None:
+            timer.cancel()
+            self.live_stats["debounced"] += 1
+        self._live_timers[call_id] = asyncio.ensure_future(self._debounced_live_extraction(call_id))
+    
+    # PUBLIC_INTERFACE
+    async def enqueue_transcript(self, call_id: str, transcript: str) -> None:
+        """
+        Persist the raw transcript and queue structured data extraction.
+        
+        The call stays in progress until the background extraction stores
+        structured data and marks it completed. A transcript identical to
+        one already queued, being extracted or extracted is dropped.
+        
+        Args:
+            call_id: Retell call ID
+            transcript: Call transcript text
+        """
+        digest = transcript_hash(transcript)
+        if self._is_duplicate(call_id, digest):
+            self.dedup_stats["skipped"] += 1
+            service_logger.info(f"Transcript already extracted or queued for call {call_id}")
+            return
+        
+        # Claim the digest before the first await so a concurrent duplicate is dropped
+        self._queued.set(call_id, digest)
+        try:
+            await self.db_service.update_call_log(
+                call_id,
+                {"raw_transcript": transcript},
+                id_field="retell_call_id"
+            )
+            await self.extraction_pool.submit(
+                JOB_PROCESS_TRANSCRIPT,
+                {"call_id": call_id, "transcript": transcript}
+            )
+        except Exception:
+            self._unqueue(call_id, digest)
+            raise
+        service_logger.info(f"Queued transcript extraction for call {call_id}")
+    
+    # PUBLIC_INTERFACE
+    async def run_extraction_job(self, payload: Dict[str, Any], final_attempt: bool) -> None:
+        """
+        Process a queued transcript extraction job.
+        
+        Args:
+            payload: Job payload with call_id and transcript
+            final_attempt: Whether the job queue will not retry a failure
+        """
+        try:
+            await self.process_transcript(
+                payload["call_id"],
+                payload["transcript"],
+                final_attempt=final_attempt
+            )
+        finally:
+            self._unqueue(payload["call_id"], transcript_hash(payload["transcript"]))
+    
+    # PUBLIC_INTERFACE
+    async def process_transcript(
+        self,
+        call_id: str,
+        transcript: str,
+        final_attempt: bool = True
+    ) -> None:
         """
         Process and store transcript with structured data extraction.
         
+        Extraction is single-flight per call: a transcript identical to one
+        already extracted is skipped, one identical to the in-flight
+        extraction joins it, and a changed transcript waits for the
+        in-flight extraction so writes land in order.
+        
         Args:
             call_id: Retell call ID
             transcript: Call transcript text
+            final_attempt: If False, extraction errors are raised so the job
+                queue retries; if True, the transcript is stored without
+                structured data and the call is marked completed
+        """
+        digest = transcript_hash(transcript)
+        
+        while True:
+            if self._extracted.get(call_id) == digest:
+                self.dedup_stats["skipped"] += 1
+                service_logger.info(f"Skipping unchanged transcript for call {call_id}")
+                return
+            
+            in_flight = self._in_flight.get(call_id)
+            if not in_flight:
+                break
+            
+            if in_flight[0] == digest:
+                self.dedup_stats["joined"] += 1
+                service_logger.info(f"Joining in-flight extraction for call {call_id}")
+                await asyncio.shield(in_flight[1])
+                return
+            
+            # Different transcript: let the older extraction finish first
+            await asyncio.gather(asyncio.shield(in_flight[1]), return_exceptions=True)
+        
+        self.dedup_stats["started"] += 1
+        task = asyncio.ensure_future(self._extract_and_store(call_id, transcript, final_attempt))
+        self._in_flight[call_id] = (digest, task)
+        try:
+            if await asyncio.shield(task):
+                self._extracted.set(call_id, digest)
+        finally:
+            if self._in_flight.get(call_id, (None, None))[1] is task:
+                del self._in_flight[call_id]
+    
+    def _is_duplicate(self, call_id: str, digest: str) -> bool:
+        """
+        Check whether a transcript is already queued, extracted or being
+        extracted.
+        
+        Args:
+            call_id: Retell call ID
+            digest: Transcript hash
+            
+        Returns:
+            True if no new extraction is needed
+        """
+        if digest in (self._queued.get(call_id), self._extracted.get(call_id)):
+            return True
+        in_flight = self._in_flight.get(call_id)
+        return bool(in_flight and in_flight[0] == digest)
+    
+    def _unqueue(self, call_id: str, digest: str) -> None:
+        """
+        Forget a queued transcript once its job has run or failed to queue.
+        
+        Args:
+            call_id: Retell call ID
+            digest: Transcript hash
+        """
+        if self._queued.get(call_id) == digest:
+            self._queued.invalidate(call_id)
+    
+    async def _debounced_live_extraction(self, call_id: str) -> None:
+        """
+        Wait out the debounce interval, then extract the latest transcript.
+        
+        Args:
+            call_id: Retell call ID
+        """
+        await asyncio.sleep(self.live_debounce_seconds)
+        # Past the timer: later updates schedule a new run instead of cancelling this one
+        if self._live_timers.get(call_id) is asyncio.current_task():
+            del self._live_timers[call_id]
+        
+        async with self._live_lock(call_id):
+            transcript = self._live_latest.get(call_id)
+            if transcript is None:
+                # The call ended while this run waited for the lock
+                return
+            try:
+                await self._live_extract(call_id, transcript)
+            except Exception as e:
+                self.live_stats["failed"] += 1
+                service_logger.warning(f"Live extraction failed for call {call_id}: {e}")
+        
+        if self._ended.get(call_id):
+            # _end_live left the lock to this run; nothing can take it now
+            self._live_locks.invalidate(call_id)
+    
+    async def _live_extract(self, call_id: str, transcript: str) -> None:
+        """
+        Extract a partial transcript and publish the fields that changed.
+        
+        Skipped when no turn changed since the previous live run.
+        
+        Args:
+            call_id: Retell call ID
+            transcript: Transcript so far
+        """
+        turns = parse_turns(transcript)
+        previous = self._live_results.get(call_id)
+        if previous is not None and previous[0] == turns:
+            self.live_stats["unchanged"] += 1
+            return
+        
+        call_info = await self.db_service.get_call_by_retell_id(call_id)
+        if not call_info:
+            return
+        
+        self.live_stats["extractions"] += 1
+        structured_data = await self._extract_data(call_info["scenario_type"], transcript)
+        if not structured_data:
+            return
+        
+        self._live_results.set(call_id, (turns, structured_data))
+        await self.db_service.update_call_log(
+            call_id,
+            {"structured_data": structured_data},
+            id_field="retell_call_id"
+        )
+        
+        earlier = previous[1] if previous is not None else {}
+        for name, value in structured_data.items():
+            if name not in earlier or earlier[name] != value:
+                self.call_events.publish(call_info["id"], {"type": "field", "field": name, "value": value})
+    
+    def _live_lock(self, call_id: str) -> asyncio.Lock:
+        """
+        Get the lock serializing live and end-of-call extraction for a call.
+        
+        Args:
+            call_id: Retell call ID
+        
+        Returns:
+            Per-call lock
+        """
+        lock = self._live_locks.get(call_id)
+        if lock is None:
+            lock = asyncio.Lock()
+        # Storing it again keeps the lock of a long call from expiring
+        self._live_locks.set(call_id, lock)
+        return lock
+    
+    def _end_live(self, call_id: str) -> None:
+        """
+        Stop live extraction for a call that ended.
+        
+        Cancels a pending timer and drops the call's live state. A lock held
+        by a running live extraction is dropped when that run finishes.
+        
+        Args:
+            call_id: Retell call ID
+        """
+        self._ended.set(call_id, True)
+        timer = self._live_timers.pop(call_id, None)
+        if timer is not None:
+            timer.cancel()
+        self._live_latest.invalidate(call_id)
+        lock = self._live_locks.get(call_id)
+        if lock is not None and not lock.locked():
+            self._live_locks.invalidate(call_id)
+    
+    async def _take_live_result(self, call_id: str, transcript: str) -> Optional[Dict[str, Any]]:
+        """
+        Stop live extraction for an ended call and reuse its result if current.
+        
+        Cancels a pending timer and waits for a running live extraction.
+        
+        Args:
+            call_id: Retell call ID
+            transcript: Final transcript
+        
+        Returns:
+            Live structured data if it was extracted from the same turns,
+            otherwise None
+        """
+        lock = self._live_locks.get(call_id)
+        self._end_live(call_id)
+        if lock is not None:
+            async with lock:
+                pass
+            self._live_locks.invalidate(call_id)
+        
+        live = self._live_results.get(call_id)
+        if live is None:
+            return None
+        self._live_results.invalidate(call_id)
+        
+        turns: List[Tuple[str, str]] = live[0]
+        if turns == parse_turns(transcript):
+            self.live_stats["reconciled"] += 1
+            return live[1]
+        self.live_stats["reextracted"] += 1
+        return None
+    
+    async def _extract_and_store(
+        self,
+        call_id: str,
+        transcript: str,
+        final_attempt: bool = True
+    ) -> bool:
+        """
+        Extract structured data and store it with the transcript.
+        
+        Args:
+            call_id: Retell call ID
+            transcript: Call transcript text
+            final_attempt: Whether to fall back instead of raising on error
+            
+        Returns:
+            True if structured data was extracted and stored
         """
         try:
             # Get call info
-            call_info = self.db_service.get_call_by_retell_id(call_id)
+            call_info = await self.db_service.get_call_by_retell_id(call_id)
             
             if not call_info:
                 service_logger.error(f"Call {call_id} not found in database")
-                return
+                return False
             
             scenario_type = call_info["scenario_type"]
             service_logger.info(f"Extracting structured data for {scenario_type} scenario")
             
-            # Extract structured data based on scenario
-            structured_data = await self._extract_data(scenario_type, transcript)
+            # Emergency fields are stored and pushed to dispatchers as they stream in
+            on_field = None
+            if scenario_type == SCENARIO_EMERGENCY:
+                on_field = self._field_publisher(call_id, call_info["id"])
+            
+            # Reuse the live result when the call ended with no new turns
+            structured_data = await self._take_live_result(call_id, transcript)
+            if structured_data is None:
+                structured_data = await self._extract_data(scenario_type, transcript, on_field)
             
             if structured_data:
                 service_logger.debug(f"Extracted data: {json.dumps(structured_data, indent=2)}")
             
             # Update database
-            self.db_service.update_call_log(
+            await self.db_service.update_call_log(
                 call_id,
                 {
                     "raw_transcript": transcript,
                     "structured_data": structured_data,
+                    "extraction_complete": structured_data is not None,
                     "call_status": CALL_STATUS_COMPLETED
                 },
                 id_field="retell_call_id"
             )
             
+            self.call_events.publish(call_info["id"], {
+                "type": "completed",
+                "call_status": CALL_STATUS_COMPLETED,
+                "structured_data": structured_data
+            })
+            
             service_logger.info(f"Stored transcript and structured data for call {call_id}")
+            return structured_data is not None
         except Exception as e:
             service_logger.error(f"Error processing transcript: {e}")
+            if not final_attempt:
+                raise
+            
             # Still save the transcript even if extraction fails
             try:
-                self.db_service.update_call_log(
+                await self.db_service.update_call_log(
                     call_id,
                     {
                         "raw_transcript": transcript,
+                        "extraction_complete": False,
                         "call_status": CALL_STATUS_COMPLETED
                     },
                     id_field="retell_call_id"
@@ -137,22 +503,58 @@ class WebhookService:
                 service_logger.info("Stored transcript only (extraction failed)")
             except Exception as save_error:
                 service_logger.error(f"Failed to save transcript: {save_error}")
+            return False
     
-    async def _extract_data(self, scenario_type: str, transcript: str) -> Dict[str, Any]:
+    def _field_publisher(self, call_id: str, log_id: str) -> FieldCallback:
+        """
+        Build a callback that stores and publishes each field as it arrives.
+        
+        Args:
+            call_id: Retell call ID
+            log_id: Call log ID that event subscribers listen on
+        
+        Returns:
+            Coroutine function taking (field, value)
+        """
+        partial: Dict[str, Any] = {}
+        
+        async def on_field(name: str, value: Any) -> None:
+            partial[name] = value
+            self.call_events.publish(log_id, {"type": "field", "field": name, "value": value})
+            try:
+                await self.db_service.update_call_log(
+                    call_id,
+                    {"structured_data": dict(partial)},
+                    id_field="retell_call_id"
+                )
+            except Exception as e:
+                # The complete result is written once extraction finishes
+                service_logger.warning(f"Failed to store partial data for call {call_id}: {e}")
+        
+        return on_field
+    
+    async def _extract_data(
+        self,
+        scenario_type: str,
+        transcript: str,
+        on_field: Optional[FieldCallback] = None
+    ) -> Dict[str, Any]:
         """
         Extract structured data based on scenario type.
         
         Args:
             scenario_type: Type of scenario
             transcript: Call transcript
-            
+            on_field: Optional callback for fields as they stream in
+                (emergency scenario only)
+        
         Returns:
             Extracted structured data dictionary
         """
         if scenario_type == SCENARIO_CHECKIN:
             return await self.extractor.extract_checkin_data(transcript)
         elif scenario_type == SCENARIO_EMERGENCY:
-            return await self.extractor.extract_emergency_data(transcript)
+            return await self.extractor.extract_emergency_data(transcript, on_field=on_field)
         else:
             service_logger.warning(f"Unknown scenario type: {scenario_type}")
             return None
@@ -160,3 +562,4 @@ class WebhookService:
 
 # Singleton instance
 webhook_service = WebhookService()
+extraction_pool.register_handler(JOB_PROCESS_TRANSCRIPT, webhook_service.run_extraction_job)
@@ -3,16 +3,19 @@ Application startup and initialization logic.
 """
 
 import asyncio
+from typing import Optional
 from services.database_service import db_service
 from retell_client import retell_client
 from default_prompts import CHECKIN_PROMPT, EMERGENCY_PROMPT, DEFAULT_RETELL_SETTINGS
-from constants import END_CALL_TOOL, SCENARIO_CHECKIN, SCENARIO_EMERGENCY
+from constants import SCENARIO_CHECKIN, SCENARIO_EMERGENCY
+from retell_sync import sync_retell_agent
+from readiness import readiness, PROVISIONING
 from logger import app_logger
 
 
 async def ensure_agent_exists(scenario_type: str, system_prompt: str) -> str:
     """
-    Check if agent exists, create if not.
+    Check if agent exists, create if not, and sync changed settings.
     
     Args:
         scenario_type: Type of scenario (checkin, emergency)
@@ -20,29 +23,15 @@ async def ensure_agent_exists(scenario_type: str, system_prompt: str) -> str:
         
     Returns:
         Agent ID
+    
+    Raises:
+        Exception: If the configuration or the Retell agent cannot be set up
     """
     try:
         # Check if configuration exists
-        config = db_service.get_agent_configuration(scenario_type)
+        config = await db_service.get_agent_configuration(scenario_type)
         
-        if config:
-            # Check if agent_id exists
-            if config.get("agent_id") and config.get("llm_id"):
-                app_logger.info(f"{scenario_type.title()} agent already exists: {config['agent_id']}")
-                
-                # Update the LLM to ensure it has the end_call tool
-                app_logger.info(f"Ensuring {scenario_type} LLM has end_call tool")
-                await retell_client.update_llm(
-                    llm_id=config["llm_id"],
-                    general_tools=[END_CALL_TOOL]
-                )
-                app_logger.info(f"Updated {scenario_type} LLM with end_call tool")
-                
-                return config["agent_id"]
-            else:
-                app_logger.warning(f"{scenario_type.title()} config exists but no agent_id, creating")
-                config_id = config["id"]
-        else:
+        if not config:
             app_logger.info(f"Creating {scenario_type} configuration")
             # Create configuration
             config_data = {
@@ -50,55 +39,94 @@ async def ensure_agent_exists(scenario_type: str, system_prompt: str) -> str:
                 "system_prompt": system_prompt,
                 "retell_settings": DEFAULT_RETELL_SETTINGS
             }
-            config = db_service.save_configuration(scenario_type, config_data)
-            config_id = config["id"]
+            config = await db_service.save_configuration(scenario_type, config_data)
             app_logger.info(f"Created {scenario_type} configuration")
         
-        # Create LLM with end_call tool
-        app_logger.info(f"Creating {scenario_type} LLM with end_call tool")
-        llm_id = await retell_client.create_llm(
-            general_prompt=system_prompt,
-            general_tools=[END_CALL_TOOL]
+        # Create whatever is missing and push only what changed; an
+        # unchanged configuration makes no Retell API calls
+        result = await sync_retell_agent(
+            scenario_type,
+            config.get("system_prompt") or system_prompt,
+            config,
+            retell_client,
+            db_service
         )
-        app_logger.info(f"Created LLM: {llm_id}")
-        
-        # Update config with LLM ID
-        db_service.save_configuration(scenario_type, {"llm_id": llm_id})
-        
-        # Create agent
-        app_logger.info(f"Creating {scenario_type} agent")
-        agent_name = f"Dispatch {scenario_type.title()} Agent"
-        agent_result = await retell_client.create_agent(agent_name, llm_id)
-        agent_id = agent_result['agent_id']
-        app_logger.info(f"Created agent: {agent_id}")
         
-        # Update config with agent ID
-        db_service.save_configuration(scenario_type, {"agent_id": agent_id})
-        
-        app_logger.info(f"{scenario_type.title()} agent fully configured\n")
-        return agent_id
+        app_logger.info(f"{scenario_type.title()} agent ready: {result['agent_id']}")
+        return result["agent_id"]
     except Exception as e:
         app_logger.error(f"Error ensuring {scenario_type} agent: {e}", exc_info=True)
+        raise
+
+
+# Default prompt per scenario, used when a configuration is first created
+DEFAULT_PROMPTS = {
+    SCENARIO_CHECKIN: CHECKIN_PROMPT,
+    SCENARIO_EMERGENCY: EMERGENCY_PROMPT
+}
+
+_initialization_task: Optional[asyncio.Task] = None
+
+
+async def _provision(scenario_type: str, system_prompt: str) -> Optional[str]:
+    """
+    Provision one scenario's agent and record the outcome on the readiness gate.
+    
+    Args:
+        scenario_type: Type of scenario
+        system_prompt: Default system prompt for the agent
+    
+    Returns:
+        Agent ID, or None if provisioning failed
+    """
+    try:
+        agent_id = await ensure_agent_exists(scenario_type, system_prompt)
+    except Exception as e:
+        readiness.finish(scenario_type, None, error=str(e))
         return None
+    readiness.finish(scenario_type, agent_id)
+    return agent_id
 
 
 async def initialize_agents():
-    """Initialize both check-in and emergency agents on startup."""
+    """Initialize all scenario agents concurrently on startup."""
     app_logger.info("=" * 60)
     app_logger.info("INITIALIZING LOGISTICS VOICE AGENTS")
     app_logger.info("=" * 60)
     
-    # Ensure check-in agent exists
-    await ensure_agent_exists(SCENARIO_CHECKIN, CHECKIN_PROMPT)
+    for scenario_type in DEFAULT_PROMPTS:
+        if readiness.status()["scenarios"][scenario_type]["status"] != PROVISIONING:
+            readiness.start(scenario_type)
     
-    # Ensure emergency agent exists
-    await ensure_agent_exists(SCENARIO_EMERGENCY, EMERGENCY_PROMPT)
+    # Scenarios are independent, so their Retell and Supabase round trips overlap
+    await asyncio.gather(*(
+        _provision(scenario_type, system_prompt)
+        for scenario_type, system_prompt in DEFAULT_PROMPTS.items()
+    ))
     
     app_logger.info("=" * 60)
     app_logger.info("AGENT INITIALIZATION COMPLETE")
     app_logger.info("=" * 60)
 
 
+# PUBLIC_INTERFACE
+def start_agent_initialization() -> asyncio.Task:
+    """
+    Start agent initialization in the background.
+    
+    Every scenario is marked as provisioning before this returns, so
+    requests arriving right after startup wait on the readiness gate.
+    
+    Returns:
+        The initialization task
+    """
+    global _initialization_task
+    for scenario_type in DEFAULT_PROMPTS:
+        readiness.start(scenario_type)
+    _initialization_task = asyncio.create_task(initialize_agents())
+    return _initialization_task
+
+
 def run_startup():
     """Synchronous wrapper for startup."""
     asyncio.run(initialize_agents())
@@ -0,0 +1,143 @@
+"""
+Incremental parser for a streamed JSON object.
+
+Model output arrives in arbitrary text chunks. The parser reports each
+top-level key/value pair as soon as its value is complete, so fields can
+be acted on before the object is closed.
+"""
+
+import json
+from typing import Any, Dict, List, Tuple
+
+_START = "start"
+_KEY = "key"
+_COLON = "colon"
+_VALUE = "value"
+_SEPARATOR = "separator"
+_DONE = "done"
+
+_NUMBER_CHARS = set("0123456789+-.eE")
+
+# Returned by _decode when the value is not fully received yet
+_INCOMPLETE = object()
+
+
+class IncrementalObjectParser:
+    """Parses one JSON object from chunks, emitting completed fields."""
+    
+    def __init__(self):
+        """Initialize an empty parser."""
+        self._buffer = ""
+        self._position = 0
+        self._state = _START
+        self._key = None
+        self._decoder = json.JSONDecoder()
+        self.result: Dict[str, Any] = {}
+    
+    @property
+    def done(self) -> bool:
+        """Whether the closing brace has been read."""
+        return self._state == _DONE
+    
+    # PUBLIC_INTERFACE
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Add a chunk of text and collect the fields it completes.
+        
+        Args:
+            chunk: Next piece of the streamed JSON text
+        
+        Returns:
+            List of (key, value) pairs completed by this chunk, in order
+        
+        Raises:
+            ValueError: If the text is not a JSON object
+        """
+        self._buffer += chunk
+        completed: List[Tuple[str, Any]] = []
+        
+        while self._state != _DONE:
+            self._skip_whitespace()
+            if self._position >= len(self._buffer):
+                break
+            char = self._buffer[self._position]
+            
+            if self._state == _START:
+                self._expect(char, "{")
+                self._state = _KEY
+            elif self._state == _KEY:
+                if char == "}":
+                    self._position += 1
+                    self._state = _DONE
+                    continue
+                key = self._decode()
+                if key is _INCOMPLETE:
+                    break
+                if not isinstance(key, str):
+                    raise ValueError(f"Expected object key at offset {self._position}")
+                self._key = key
+                self._state = _COLON
+            elif self._state == _COLON:
+                self._expect(char, ":")
+                self._state = _VALUE
+            elif self._state == _VALUE:
+                value = self._decode()
+                if value is _INCOMPLETE:
+                    break
+                self.result[self._key] = value
+                completed.append((self._key, value))
+                self._state = _SEPARATOR
+            elif self._state == _SEPARATOR:
+                if char == ",":
+                    self._position += 1
+                    self._state = _KEY
+                elif char == "}":
+                    self._position += 1
+                    self._state = _DONE
+                else:
+                    raise ValueError(f"Expected ',' or '}}' at offset {self._position}")
+        
+        # Drop consumed text so long streams do not re-scan it
+        self._buffer = self._buffer[self._position:]
+        self._position = 0
+        return completed
+    
+    def _skip_whitespace(self) -> None:
+        """Advance past whitespace."""
+        while self._position < len(self._buffer) and self._buffer[self._position].isspace():
+            self._position += 1
+    
+    def _expect(self, char: str, expected: str) -> None:
+        """
+        Consume an expected structural character.
+        
+        Args:
+            char: Character at the current position
+            expected: Character required by the grammar
+        
+        Raises:
+            ValueError: If the character does not match
+        """
+        if char != expected:
+            raise ValueError(f"Expected '{expected}' at offset {self._position}, got '{char}'")
+        self._position += 1
+    
+    def _decode(self) -> Any:
+        """
+        Decode the JSON value at the current position if it is complete.
+        
+        Returns:
+            The value, or _INCOMPLETE if more text is needed
+        """
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._position)
+        except json.JSONDecodeError:
+            return _INCOMPLETE
+        
+        # A number at the end of the buffer may still be growing ("12" -> "123")
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            if end == len(self._buffer) or self._buffer[end] in _NUMBER_CHARS:
+                return _INCOMPLETE
+        
+        self._position = end
+        return value
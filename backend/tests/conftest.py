@@ -7,14 +7,19 @@ All imports of third-party services (Supabase, Retell, OpenAI) are mocked
 at the module level before application code is imported.
 """
 
+import os
 import sys
 from unittest.mock import MagicMock, AsyncMock, Mock
 import pytest
 
 
-# Mock Supabase before any imports
+# Keep the durable extraction queue out of the working tree during tests
+os.environ.setdefault("EXTRACTION_QUEUE_PATH", ":memory:")
+
+
+# Mock Supabase (async PostgREST) before any imports
 class MockSupabaseClient:
-    """Mock Supabase client."""
+    """Mock async PostgREST client used for Supabase."""
     
     def __init__(self, *args, **kwargs):
         self.table_mock = MagicMock()
@@ -28,8 +33,12 @@ class MockSupabaseClient:
         mock.update.return_value = mock
         mock.eq.return_value = mock
         mock.order.return_value = mock
-        mock.execute.return_value = MagicMock(data=[])
+        mock.execute = AsyncMock(return_value=MagicMock(data=[]))
         return mock
+    
+    async def aclose(self):
+        """Mock closing pooled connections."""
+        return None
 
 
 # Mock Retell SDK classes
@@ -138,20 +147,41 @@ class MockSupabaseModule:
         return MockSupabaseClient()
 
 
+class MockPostgrestModule:
+    """Mock postgrest module."""
+    AsyncPostgrestClient = MockSupabaseClient
+
+
 class MockRetellModule:
     """Mock retell module."""
     AsyncRetell = MockAsyncRetell
     Retell = MockAsyncRetell  # Alias in case both are used
 
 
+class MockAPIConnectionError(Exception):
+    """Mock OpenAI connection error."""
+
+
+class MockAPIStatusError(Exception):
+    """Mock OpenAI HTTP status error."""
+    
+    def __init__(self, message="", status_code=500, headers=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.response = MagicMock(headers=headers or {})
+
+
 class MockOpenAIModule:
     """Mock openai module."""
     AsyncOpenAI = MockAsyncOpenAI
+    APIConnectionError = MockAPIConnectionError
+    APIStatusError = MockAPIStatusError
     OpenAI = MockAsyncOpenAI  # Also provide sync version
 
 
 # Install mocks into sys.modules before any application imports
 sys.modules['supabase'] = MockSupabaseModule()
+sys.modules['postgrest'] = MockPostgrestModule()
 sys.modules['retell'] = MockRetellModule()
 sys.modules['openai'] = MockOpenAIModule()
 
@@ -11,7 +11,9 @@ from constants import SCENARIO_CHECKIN, CALL_STATUS_INITIATED
 from exceptions import (
     AgentConfigurationError,
     ConfigurationNotFoundError,
-    CallNotFoundError
+    CallNotFoundError,
+    InvalidCursorError,
+    InvalidFieldsError
 )
 
 
@@ -32,7 +34,7 @@ class TestCallRoutes:
     @pytest.fixture
     def mock_db_service(self):
         """Mock database service."""
-        with patch('routers.calls.db_service') as mock:
+        with patch('routers.calls.db_service', new_callable=AsyncMock) as mock:
             yield mock
     
     def test_initiate_web_call_success(self, client, mock_call_service):
@@ -125,20 +127,23 @@ class TestCallRoutes:
     def test_list_calls_success(self, client, mock_db_service):
         """Test GET /api/calls endpoint."""
         # Setup
-        mock_db_service.list_call_logs.return_value = [
-            {
-                "id": "call-1",
-                "driver_name": "John Doe",
-                "call_status": "completed",
-                "scenario_type": SCENARIO_CHECKIN
-            },
-            {
-                "id": "call-2",
-                "driver_name": "Jane Smith",
-                "call_status": "initiated",
-                "scenario_type": SCENARIO_CHECKIN
-            }
-        ]
+        mock_db_service.list_call_logs.return_value = {
+            "items": [
+                {
+                    "id": "call-1",
+                    "driver_name": "John Doe",
+                    "call_status": "completed",
+                    "scenario_type": SCENARIO_CHECKIN
+                },
+                {
+                    "id": "call-2",
+                    "driver_name": "Jane Smith",
+                    "call_status": "initiated",
+                    "scenario_type": SCENARIO_CHECKIN
+                }
+            ],
+            "next_cursor": "cursor-abc"
+        }
         
         # Execute
         response = client.get("/api/calls")
@@ -146,24 +151,46 @@ class TestCallRoutes:
         # Assert
         assert response.status_code == 200
         data = response.json()
-        assert len(data) == 2
-        assert data[0]["driver_name"] == "John Doe"
+        assert len(data["items"]) == 2
+        assert data["items"][0]["driver_name"] == "John Doe"
+        assert data["next_cursor"] == "cursor-abc"
     
-    def test_list_calls_with_ordering(self, client, mock_db_service):
-        """Test GET /api/calls with ordering parameters."""
+    def test_list_calls_with_pagination(self, client, mock_db_service):
+        """Test GET /api/calls with paging and ordering parameters."""
         # Setup
-        mock_db_service.list_call_logs.return_value = []
+        mock_db_service.list_call_logs.return_value = {"items": [], "next_cursor": None}
         
         # Execute
-        response = client.get("/api/calls?order_by=created_at&ascending=true")
+        response = client.get("/api/calls?limit=10&cursor=abc&ascending=true")
         
         # Assert
         assert response.status_code == 200
         mock_db_service.list_call_logs.assert_called_once_with(
-            order_by="created_at",
-            ascending=True
+            limit=10,
+            cursor="abc",
+            ascending=True,
+            fields="summary"
         )
     
+    def test_list_calls_limit_too_large(self, client, mock_db_service):
+        """Test GET /api/calls rejects oversized pages."""
+        # Execute
+        response = client.get("/api/calls?limit=100000")
+        
+        # Assert
+        assert response.status_code == 422
+    
+    def test_list_calls_invalid_cursor(self, client, mock_db_service):
+        """Test GET /api/calls with an undecodable cursor."""
+        # Setup
+        mock_db_service.list_call_logs.side_effect = InvalidCursorError("bad")
+        
+        # Execute
+        response = client.get("/api/calls?cursor=bad")
+        
+        # Assert
+        assert response.status_code == 400
+    
     def test_get_call_success(self, client, mock_db_service):
         """Test GET /api/calls/{call_id} endpoint."""
         # Setup
@@ -187,6 +214,32 @@ class TestCallRoutes:
         assert data["driver_name"] == "John Doe"
         assert data["raw_transcript"] == "Test transcript"
     
+    def test_get_call_with_fields(self, client, mock_db_service):
+        """Test GET /api/calls/{call_id} forwards the fields projection."""
+        # Setup
+        mock_db_service.get_call_log.return_value = {
+            "id": "call-123",
+            "call_status": "completed"
+        }
+        
+        # Execute
+        response = client.get("/api/calls/call-123?fields=call_status")
+        
+        # Assert
+        assert response.status_code == 200
+        mock_db_service.get_call_log.assert_called_once_with("call-123", fields="call_status")
+    
+    def test_get_call_invalid_fields(self, client, mock_db_service):
+        """Test GET /api/calls/{call_id} with unknown columns."""
+        # Setup
+        mock_db_service.get_call_log.side_effect = InvalidFieldsError("password")
+        
+        # Execute
+        response = client.get("/api/calls/call-123?fields=password")
+        
+        # Assert
+        assert response.status_code == 400
+    
     def test_get_call_not_found(self, client, mock_db_service):
         """Test GET /api/calls/{call_id} when call doesn't exist."""
         # Setup
@@ -198,6 +251,39 @@ class TestCallRoutes:
         # Assert
         assert response.status_code == 404
 
+    
+    def test_call_events_completed_call(self, client, mock_db_service):
+        """Test GET /api/calls/{call_id}/events ends at once for a completed call."""
+        # Setup
+        mock_db_service.get_call_log.return_value = {
+            "id": "call-123",
+            "call_status": "completed",
+            "structured_data": {"emergency_type": "Accident"}
+        }
+        
+        # Execute
+        response = client.get("/api/calls/call-123/events")
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.text == (
+            'data: {"type": "completed", "call_status": "completed", '
+            '"structured_data": {"emergency_type": "Accident"}}\n\n'
+        )
+    
+    def test_call_events_not_found(self, client, mock_db_service):
+        """Test GET /api/calls/{call_id}/events when call doesn't exist."""
+        # Setup
+        mock_db_service.get_call_log.side_effect = CallNotFoundError("call-999")
+        
+        # Execute
+        response = client.get("/api/calls/call-999/events")
+        
+        # Assert
+        assert response.status_code == 404
+        from call_events import call_events
+        assert call_events.stats()["subscribers"] == 0
 
 class TestConfigurationRoutes:
     """Test configuration-related API routes."""
@@ -210,7 +296,7 @@ class TestConfigurationRoutes:
     @pytest.fixture
     def mock_config_service(self):
         """Mock configuration service."""
-        with patch('routers.configurations.config_service') as mock:
+        with patch('routers.configurations.config_service', new_callable=AsyncMock) as mock:
             yield mock
     
     def test_create_configuration_success(self, client, mock_config_service):
@@ -223,7 +309,8 @@ class TestConfigurationRoutes:
             "retell_settings": {"voice_id": "11labs-Adrian"},
             "llm_id": "llm-123",
             "agent_id": "agent-123",
-            "created_at": "2024-01-01T00:00:00Z"
+            "created_at": "2024-01-01T00:00:00Z",
+            "retell_sync": {"llm": "updated", "agent": "unchanged", "changed": ["general_prompt"]}
         })
         
         # Execute
@@ -243,6 +330,7 @@ class TestConfigurationRoutes:
         assert data["scenario_type"] == SCENARIO_CHECKIN
         assert data["llm_id"] == "llm-123"
         assert data["agent_id"] == "agent-123"
+        assert data["retell_sync"]["changed"] == ["general_prompt"]
     
     def test_create_configuration_invalid_scenario(self, client):
         """Test configuration with invalid scenario type."""
@@ -385,6 +473,26 @@ class TestWebhookRoutes:
         assert response.status_code == 200
         mock_webhook_service.handle_call_analyzed.assert_called_once()
     
+    def test_handle_transcript_updated_webhook(self, client, mock_webhook_service):
+        """Test POST /api/webhooks/retell with transcript_updated event."""
+        # Setup
+        mock_webhook_service.handle_transcript_updated = AsyncMock()
+        
+        # Execute
+        response = client.post("/api/webhooks/retell", json={
+            "event": "transcript_updated",
+            "call": {
+                "call_id": "retell-call-789",
+                "transcript": "Driver: On I-10"
+            }
+        })
+        
+        # Assert
+        assert response.status_code == 200
+        mock_webhook_service.handle_transcript_updated.assert_called_once_with(
+            "retell-call-789", "Driver: On I-10"
+        )
+    
     def test_handle_unknown_webhook_event(self, client, mock_webhook_service):
         """Test webhook with unknown event type."""
         # Execute
@@ -402,3 +510,23 @@ class TestWebhookRoutes:
         mock_webhook_service.handle_call_started.assert_not_called()
         mock_webhook_service.handle_call_ended.assert_not_called()
         mock_webhook_service.handle_call_analyzed.assert_not_called()
+
+
+class TestMetricsRoutes:
+    """Test runtime metrics API routes."""
+    
+    @pytest.fixture
+    def client(self):
+        """Test client."""
+        return TestClient(app)
+    
+    def test_get_metrics_includes_config_cache(self, client):
+        """Test GET /api/metrics exposes configuration cache counters."""
+        # Execute
+        response = client.get("/api/metrics")
+        
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert "hits" in data["config_cache"]
+        assert "misses" in data["config_cache"]
@@ -0,0 +1,119 @@
+"""
+Tests for offline check-in extraction through the (fake) Batch API.
+"""
+
+import httpx
+import json
+import pytest
+from unittest.mock import AsyncMock
+from batch_api import BatchAPIClient
+import fake_batch_api
+from constants import SCENARIO_CHECKIN
+
+
+CALLS = [
+    {
+        "id": "call-1",
+        "raw_transcript": (
+            "Agent: Where are you now?\n"
+            "User: I'm driving on I-10 near Indio, ETA 8 AM tomorrow.\n"
+            "Agent: Please remember to send the POD.\n"
+            "User: Will do."
+        )
+    },
+    {
+        "id": "call-2",
+        "raw_transcript": (
+            "Agent: What's your status?\n"
+            "User: I arrived and I'm in door 42, getting unloaded.\n"
+            "Agent: Send the POD when you're done.\n"
+            "User: Sure."
+        )
+    }
+]
+
+
+class TestBatchExtraction:
+    """Test the submit, poll and apply cycle against the local fake."""
+    
+    @pytest.fixture
+    def client(self):
+        """Get a Batch API client talking to the fake endpoint in-process."""
+        return BatchAPIClient(
+            api_key="test",
+            base_url=fake_batch_api.FAKE_BATCH_BASE_URL,
+            transport=httpx.ASGITransport(app=fake_batch_api.app)
+        )
+    
+    @pytest.fixture
+    def service(self, client):
+        """Get a batch extraction service with a mocked database."""
+        from services.batch_extraction_service import BatchExtractionService
+        service = BatchExtractionService(client=client)
+        service.db_service = AsyncMock()
+        service.db_service.list_calls_for_extraction.return_value = CALLS
+        service.db_service.update_call_log.return_value = True
+        return service
+    
+    def test_requests_written_as_jsonl(self, service):
+        """Test each call becomes a chat completion request keyed by call ID."""
+        # Execute
+        lines = [json.loads(line) for line in service.build_requests(CALLS).splitlines()]
+        
+        # Assert
+        assert [line["custom_id"] for line in lines] == ["call-1", "call-2"]
+        assert lines[0]["url"] == "/v1/chat/completions"
+        assert lines[0]["body"]["response_format"]["json_schema"]["strict"] is True
+        assert "I-10 near Indio" in lines[0]["body"]["messages"][1]["content"]
+    
+    async def test_run_applies_results(self, service):
+        """Test a completed batch writes validated structured data per call."""
+        # Execute
+        summary = await service.run(poll_interval=0)
+        
+        # Assert
+        assert summary["status"] == "completed"
+        assert summary["applied"] == 2
+        updates = {
+            call.args[0]: call.args[1]["structured_data"]
+            for call in service.db_service.update_call_log.call_args_list
+        }
+        assert updates["call-1"]["driver_status"] == "Driving"
+        assert updates["call-1"]["current_location"] == "I-10 near Indio"
+        assert updates["call-2"]["unloading_status"] == "In Door 42"
+        assert all(
+            call.args[1]["extraction_complete"] is True
+            for call in service.db_service.update_call_log.call_args_list
+        )
+        service.db_service.list_calls_for_extraction.assert_called_once_with(
+            SCENARIO_CHECKIN, 1000, include_extracted=False
+        )
+    
+    async def test_invalid_result_left_pending(self, service):
+        """Test a result failing validation is not written."""
+        # Setup
+        output = json.dumps({
+            "custom_id": "call-1",
+            "response": {"status_code": 200, "body": {"choices": [{"message": {"content": '{"eta": 5}'}}]}},
+            "error": None
+        })
+        service.client = AsyncMock()
+        service.client.get_file_content.return_value = output
+        
+        # Execute
+        counts = await service.apply_results({"id": "batch_1", "status": "completed", "output_file_id": "file-1"})
+        
+        # Assert
+        assert counts == {"applied": 0, "invalid": 1, "failed": 0}
+        service.db_service.update_call_log.assert_not_called()
+    
+    async def test_nothing_pending(self, service):
+        """Test no batch is created when every call is extracted."""
+        # Setup
+        service.db_service.list_calls_for_extraction.return_value = []
+        
+        # Execute
+        summary = await service.run(poll_interval=0)
+        
+        # Assert
+        assert summary["batch_id"] is None
@@ -0,0 +1,279 @@
+"""
+Tests for batch call campaigns.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi.testclient import TestClient
+from campaigns import CampaignTracker
+from number_pool import FromNumberPool
+from constants import (
+    SCENARIO_CHECKIN,
+    SCENARIO_EMERGENCY,
+    CALL_STATUS_FAILED,
+    CALL_STATUS_INITIATED,
+    CAMPAIGN_ROW_QUEUED,
+    CAMPAIGN_ROW_INITIATED,
+    CAMPAIGN_ROW_FAILED
+)
+from exceptions import AgentConfigurationError, CallLogCreationError, CampaignNotFoundError
+
+
+def campaign_calls(count, scenario_type=SCENARIO_CHECKIN, start=0):
+    """Build campaign rows with distinct phones and loads."""
+    return [
+        {
+            "driver_name": f"Driver {index}",
+            "driver_phone": f"+1415555{index:04d}",
+            "load_number": f"LOAD-{index}",
+            "scenario_type": scenario_type
+        }
+        for index in range(start, start + count)
+    ]
+
+
+@patch.dict('os.environ', {'RETELL_FROM_NUMBER': '+14155559999', 'CAMPAIGN_DIAL_CONCURRENCY': '3'})
+class TestCallCampaigns:
+    """Test campaigns insert once, dial with bounded concurrency and report progress."""
+    
+    @pytest.fixture
+    def tracker(self):
+        """Fresh campaign tracker."""
+        tracker = CampaignTracker()
+        with patch('services.call_service.call_campaigns', tracker):
+            yield tracker
+    
+    @pytest.fixture
+    def call_service(self, tracker):
+        """Call service whose dependencies record calls."""
+        from services.call_service import CallService
+        service = CallService()
+        service.db_service = AsyncMock()
+        service.db_service.get_agent_id.side_effect = lambda scenario: f"agent-{scenario}"
+        service.db_service.create_call_logs.side_effect = lambda calls: [
+            {"id": f"call-{index}", **call} for index, call in enumerate(calls)
+        ]
+        service.from_numbers = FromNumberPool(max_concurrent=100)
+        service.retell_client = MagicMock()
+        service.retell_client.create_phone_call = AsyncMock(
+            side_effect=lambda **kwargs: {"call_id": f"retell-{kwargs['to_number']}"}
+        )
+        return service
+    
+    async def test_bulk_insert_and_dial_all(self, call_service, tracker):
+        """Test all call logs are written in one insert and every row is dialed."""
+        # Setup
+        calls = campaign_calls(4) + campaign_calls(2, SCENARIO_EMERGENCY, start=4)
+        
+        # Execute
+        started = await call_service.start_campaign(calls)
+        await tracker.wait(started["campaign_id"])
+        progress = tracker.get(started["campaign_id"])
+        
+        # Assert
+        assert started["total"] == 6
+        assert started["counts"][CAMPAIGN_ROW_QUEUED] == 6
+        call_service.db_service.create_call_logs.assert_awaited_once()
+        inserted = call_service.db_service.create_call_logs.call_args[0][0]
+        assert {row["campaign_id"] for row in inserted} == {started["campaign_id"]}
+        assert [row["campaign_index"] for row in inserted] == list(range(6))
+        assert all(row["call_status"] == CALL_STATUS_INITIATED for row in inserted)
+        assert call_service.db_service.get_agent_id.await_count == 2
+        assert progress["done"] is True
+        assert progress["counts"][CAMPAIGN_ROW_INITIATED] == 6
+        assert progress["rows"][5]["retell_call_id"] == f"retell-{calls[5]['driver_phone']}"
+        agents = {
+            call.kwargs["to_number"]: call.kwargs["agent_id"]
+            for call in call_service.retell_client.create_phone_call.call_args_list
+        }
+        assert agents[calls[0]["driver_phone"]] == f"agent-{SCENARIO_CHECKIN}"
+        assert agents[calls[5]["driver_phone"]] == f"agent-{SCENARIO_EMERGENCY}"
+    
+    async def test_dial_concurrency_bounded(self, call_service, tracker):
+        """Test no more calls are in flight than CAMPAIGN_DIAL_CONCURRENCY."""
+        # Setup
+        in_flight = 0
+        peak = 0
+        
+        async def create_phone_call(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"call_id": f"retell-{kwargs['to_number']}"}
+        
+        call_service.retell_client.create_phone_call = AsyncMock(side_effect=create_phone_call)
+        
+        # Execute
+        started = await call_service.start_campaign(campaign_calls(12))
+        await tracker.wait(started["campaign_id"])
+        
+        # Assert
+        assert peak == 3
+        assert tracker.get(started["campaign_id"])["counts"][CAMPAIGN_ROW_INITIATED] == 12
+    
+    async def test_failed_row_does_not_stop_campaign(self, call_service, tracker):
+        """Test a Retell error fails only its row and marks its call log failed."""
+        # Setup
+        calls = campaign_calls(3)
+        
+        async def create_phone_call(**kwargs):
+            if kwargs["to_number"] == calls[1]["driver_phone"]:
+                raise Exception("Retell rejected the number")
+            return {"call_id": f"retell-{kwargs['to_number']}"}
+        
+        call_service.retell_client.create_phone_call = AsyncMock(side_effect=create_phone_call)
+        
+        # Execute
+        started = await call_service.start_campaign(calls)
+        await tracker.wait(started["campaign_id"])
+        progress = tracker.get(started["campaign_id"])
+        
+        # Assert
+        assert [row["status"] for row in progress["rows"]] == [
+            CAMPAIGN_ROW_INITIATED, CAMPAIGN_ROW_FAILED, CAMPAIGN_ROW_INITIATED
+        ]
+        assert progress["rows"][1]["error"] == "Retell rejected the number"
+        call_service.db_service.update_call_log.assert_any_await(
+            "call-1", {"call_status": CALL_STATUS_FAILED}
+        )
+    
+    async def test_from_number_row_rejected_without_call_log(self, call_service, tracker):
+        """Test a row calling the from_number fails up front and is not inserted."""
+        # Setup
+        calls = campaign_calls(2)
+        calls[0]["driver_phone"] = "+14155559999"
+        
+        # Execute
+        started = await call_service.start_campaign(calls)
+        await tracker.wait(started["campaign_id"])
+        
+        # Assert
+        assert started["rows"][0]["status"] == CAMPAIGN_ROW_FAILED
+        assert started["rows"][0]["call_id"] is None
+        inserted = call_service.db_service.create_call_logs.call_args[0][0]
+        assert [row["campaign_index"] for row in inserted] == [1]
+        assert started["rows"][1]["call_id"] == "call-0"
+    
+    async def test_missing_agent_rejects_campaign(self, call_service):
+        """Test nothing is written when a scenario has no agent."""
+        # Setup
+        call_service.db_service.get_agent_id.side_effect = None
+        call_service.db_service.get_agent_id.return_value = None
+        
+        # Execute & Assert
+        with pytest.raises(AgentConfigurationError):
+            await call_service.start_campaign(campaign_calls(2))
+        call_service.db_service.create_call_logs.assert_not_awaited()
+    
+    async def test_insert_failure(self, call_service):
+        """Test a failed bulk insert raises CallLogCreationError."""
+        # Setup
+        call_service.db_service.create_call_logs.side_effect = Exception("Database error")
+        
+        # Execute & Assert
+        with pytest.raises(CallLogCreationError):
+            await call_service.start_campaign(campaign_calls(2))
+    
+    async def test_progress_rebuilt_from_call_logs(self, call_service):
+        """Test an untracked campaign is reported from its call logs."""
+        # Setup
+        call_service.db_service.list_campaign_calls.return_value = [
+            {"id": "c1", "retell_call_id": "r1", "driver_name": "A", "load_number": "L1",
+             "scenario_type": SCENARIO_CHECKIN, "call_status": "completed", "campaign_index": 0,
+             "created_at": "t"},
+            {"id": "c2", "retell_call_id": None, "driver_name": "B", "load_number": "L2",
+             "scenario_type": SCENARIO_CHECKIN, "call_status": CALL_STATUS_FAILED, "campaign_index": 2,
+             "created_at": "t"}
+        ]
+        
+        # Execute
+        progress = await call_service.get_campaign("campaign-1")
+        
+        # Assert
+        assert [row["status"] for row in progress["rows"]] == [CAMPAIGN_ROW_INITIATED, CAMPAIGN_ROW_FAILED]
+        assert progress["rows"][0]["call_status"] == "completed"
+        assert [row["index"] for row in progress["rows"]] == [0, 2]
+        assert progress["done"] is True
+    
+    async def test_unknown_campaign(self, call_service):
+        """Test an unknown campaign raises CampaignNotFoundError."""
+        # Setup
+        call_service.db_service.list_campaign_calls.return_value = []
+        
+        # Execute & Assert
+        with pytest.raises(CampaignNotFoundError):
+            await call_service.get_campaign("missing")
+
+
+class TestCampaignTracker:
+    """Test the bounded campaign history."""
+    
+    async def test_history_keeps_dialing_campaigns(self):
+        """Test the oldest finished campaign is dropped, not one still dialing."""
+        # Setup
+        tracker = CampaignTracker(history_size=2)
+        row = {"status": CAMPAIGN_ROW_QUEUED}
+        release = asyncio.Event()
+        
+        # Execute
+        tracker.create("dialing", [dict(row)])
+        tracker.track("dialing", asyncio.ensure_future(release.wait()))
+        tracker.create("finished", [dict(row)])
+        tracker.create("newest", [dict(row)])
+        release.set()
+        await tracker.wait("dialing")
+        
+        # Assert
+        assert tracker.get("dialing") is not None
+        assert tracker.get("finished") is None
+        assert tracker.get("newest") is not None
+
+
+class TestCampaignRoutes:
+    """Test the campaign endpoints."""
+    
+    @pytest.fixture
+    def client(self):
+        """Test client."""
+        from main import app
+        return TestClient(app)
+    
+    def test_start_campaign(self, client):
+        """Test POST /api/calls/batch returns 202 with the campaign."""
+        # Setup
+        progress = {"campaign_id": "campaign-1", "total": 2, "rows": []}
+        
+        # Execute
+        with patch('routers.calls.call_service') as mock:
+            mock.start_campaign = AsyncMock(return_value=progress)
+            response = client.post("/api/calls/batch", json={"calls": campaign_calls(2)})
+        
+        # Assert
+        assert response.status_code == 202
+        assert response.json()["campaign_id"] == "campaign-1"
+        assert len(mock.start_campaign.call_args[0][0]) == 2
+    
+    def test_start_campaign_invalid_row(self, client):
+        """Test one invalid row rejects the whole request."""
+        # Setup
+        calls = campaign_calls(2)
+        calls[1]["driver_phone"] = "invalid-phone"
+        
+        # Execute
+        response = client.post("/api/calls/batch", json={"calls": calls})
+        
+        # Assert
+        assert response.status_code == 422
+    
+    def test_get_campaign_not_found(self, client):
+        """Test GET /api/calls/batch/{id} returns 404 for an unknown campaign."""
+        # Execute
+        with patch('routers.calls.call_service') as mock:
+            mock.get_campaign = AsyncMock(side_effect=CampaignNotFoundError("missing"))
+            response = client.get("/api/calls/batch/missing")
+        
+        # Assert
+        assert response.status_code == 404
@@ -36,7 +36,7 @@ class TestConfigurationService:
     async def test_save_configuration_new(self, config_service, sample_config):
         """Test creating a new configuration."""
         # Setup
-        config_service.db_service = MagicMock()
+        config_service.db_service = AsyncMock()
         config_service.db_service.save_configuration.return_value = sample_config.copy()
         config_service.db_service.get_agent_configuration.side_effect = [
             {**sample_config, "llm_id": None, "agent_id": None},  # First call (before sync)
@@ -63,12 +63,13 @@ class TestConfigurationService:
     async def test_save_configuration_update_existing(self, config_service, sample_config):
         """Test updating an existing configuration."""
         # Setup
-        config_service.db_service = MagicMock()
+        config_service.db_service = AsyncMock()
         config_service.db_service.save_configuration.return_value = sample_config
         config_service.db_service.get_agent_configuration.return_value = sample_config
         
         config_service.retell_client = MagicMock()
         config_service.retell_client.update_llm = AsyncMock()
+        config_service.retell_client.update_agent = AsyncMock()
         
         # Execute
         result = await config_service.save_configuration(
@@ -80,46 +81,48 @@ class TestConfigurationService:
         # Assert
         assert result["scenario_type"] == SCENARIO_CHECKIN
         config_service.retell_client.update_llm.assert_called_once()
+        assert result["retell_sync"]["llm"] == "updated"
+        assert "general_prompt" in result["retell_sync"]["changed"]
     
-    def test_get_configuration_success(self, config_service, sample_config):
+    async def test_get_configuration_success(self, config_service, sample_config):
         """Test retrieving a configuration."""
         # Setup
-        config_service.db_service = MagicMock()
+        config_service.db_service = AsyncMock()
         config_service.db_service.get_agent_configuration.return_value = sample_config
         
         # Execute
-        result = config_service.get_configuration(SCENARIO_CHECKIN)
+        result = await config_service.get_configuration(SCENARIO_CHECKIN)
         
         # Assert
         assert result == sample_config
         config_service.db_service.get_agent_configuration.assert_called_once_with(SCENARIO_CHECKIN)
     
-    def test_get_configuration_not_found(self, config_service):
+    async def test_get_configuration_not_found(self, config_service):
         """Test retrieving a non-existent configuration."""
         # Setup
-        config_service.db_service = MagicMock()
+        config_service.db_service = AsyncMock()
         config_service.db_service.get_agent_configuration.return_value = None
         
         # Execute & Assert
         with pytest.raises(ConfigurationNotFoundError):
-            config_service.get_configuration(SCENARIO_CHECKIN)
+            await config_service.get_configuration(SCENARIO_CHECKIN)
     
-    def test_get_configuration_invalid_scenario(self, config_service):
+    async def test_get_configuration_invalid_scenario(self, config_service):
         """Test with invalid scenario type."""
         # Execute & Assert
         with pytest.raises(ValueError, match="Invalid scenario type"):
-            config_service.get_configuration("invalid_scenario")
+            await config_service.get_configuration("invalid_scenario")
     
-    def test_list_configurations(self, config_service, sample_config):
+    async def test_list_configurations(self, config_service, sample_config):
         """Test listing all configurations."""
         # Setup
         emergency_config = {**sample_config, "scenario_type": SCENARIO_EMERGENCY}
         
-        config_service.db_service = MagicMock()
+        config_service.db_service = AsyncMock()
         config_service.db_service.list_configurations.return_value = [sample_config, emergency_config]
         
         # Execute
-        result = config_service.list_configurations()
+        result = await config_service.list_configurations()
         
         # Assert
         assert len(result) == 2
@@ -135,7 +138,7 @@ class TestConfigurationService:
             "agent_id": None
         }
         
-        config_service.db_service = MagicMock()
+        config_service.db_service = AsyncMock()
         config_service.db_service.get_agent_configuration.return_value = config_without_ids
         config_service.db_service.save_configuration.return_value = None
         
@@ -151,7 +154,31 @@ class TestConfigurationService:
         )
         
         # Assert
-        assert result is True
+        assert result["llm_id"] == "new-llm-id"
+        assert result["agent_id"] == "new-agent-id"
+        assert result["llm"] == result["agent"] == "created"
         config_service.retell_client.create_llm.assert_called_once()
         config_service.retell_client.create_agent.assert_called_once()
         assert config_service.db_service.save_configuration.call_count == 2  # Once for LLM, once for agent
+    
+    async def test_sync_marks_failed_scenario_ready(self, config_service):
+        """Test a successful sync recovers a scenario whose startup provisioning failed."""
+        # Setup
+        from readiness import ReadinessGate
+        gate = ReadinessGate()
+        gate.start(SCENARIO_CHECKIN)
+        gate.finish(SCENARIO_CHECKIN, None, error="Retell unavailable")
+        config_service.db_service = AsyncMock()
+        config_service.db_service.get_agent_configuration.return_value = {"llm_id": None, "agent_id": None}
+        config_service.retell_client = MagicMock()
+        config_service.retell_client.create_llm = AsyncMock(return_value="new-llm-id")
+        config_service.retell_client.create_agent = AsyncMock(return_value={"agent_id": "new-agent-id"})
+        
+        # Execute
+        with patch("services.configuration_service.readiness", gate):
+            await config_service._sync_retell_agent("test-id", SCENARIO_CHECKIN, "Test prompt")
+        
+        # Assert
+        state = gate.status()["scenarios"][SCENARIO_CHECKIN]
+        assert state["status"] == "ready"
+        assert state["agent_id"] == "new-agent-id"
@@ -0,0 +1,275 @@
+"""
+Tests for database service - async Supabase access layer.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from constants import SCENARIO_CHECKIN
+from exceptions import CallNotFoundError, InvalidCursorError, InvalidFieldsError
+
+
+def make_query(data):
+    """Build a fluent PostgREST query mock whose execute() is awaitable."""
+    query = MagicMock()
+    query.select.return_value = query
+    query.insert.return_value = query
+    query.update.return_value = query
+    query.eq.return_value = query
+    query.order.return_value = query
+    query.limit.return_value = query
+    query.execute = AsyncMock(return_value=MagicMock(data=data))
+    return query
+
+
+class TestDatabaseService:
+    """Test async database operations."""
+    
+    @pytest.fixture
+    def db_service(self):
+        """Get a fresh database service."""
+        from services.database_service import DatabaseService
+        return DatabaseService()
+    
+    @pytest.fixture
+    def mock_supabase(self):
+        """Patch the async Supabase client used by the service."""
+        with patch('services.database_service.supabase') as mock:
+            yield mock
+    
+    async def test_get_agent_configuration_awaits_query(self, db_service, mock_supabase):
+        """Test configuration lookup awaits the PostgREST query."""
+        # Setup
+        query = make_query([{"scenario_type": SCENARIO_CHECKIN, "agent_id": "agent-1"}])
+        mock_supabase.table.return_value = query
+        
+        # Execute
+        result = await db_service.get_agent_configuration(SCENARIO_CHECKIN)
+        
+        # Assert
+        assert result["agent_id"] == "agent-1"
+        query.execute.assert_awaited_once()
+    
+    async def test_get_call_log_not_found(self, db_service, mock_supabase):
+        """Test missing call raises CallNotFoundError."""
+        # Setup
+        mock_supabase.table.return_value = make_query([])
+        
+        # Execute & Assert
+        with pytest.raises(CallNotFoundError):
+            await db_service.get_call_log("call-999")
+    
+    async def test_save_configuration_inserts_when_missing(self, db_service, mock_supabase):
+        """Test save inserts a new row when no configuration exists."""
+        # Setup
+        lookup = make_query([])
+        insert = make_query([{"id": "config-1", "scenario_type": SCENARIO_CHECKIN}])
+        mock_supabase.table.side_effect = [lookup, insert]
+        
+        # Execute
+        result = await db_service.save_configuration(
+            SCENARIO_CHECKIN,
+            {"scenario_type": SCENARIO_CHECKIN}
+        )
+        
+        # Assert
+        assert result["id"] == "config-1"
+        insert.insert.assert_called_once()
+        insert.execute.assert_awaited_once()
+    
+    async def test_calls_for_extraction_include_partial_data(self, db_service, mock_supabase):
+        """Test offline extraction selects calls not fully extracted, not just those without data."""
+        # Setup
+        query = make_query([{"id": "call-1", "raw_transcript": "Driver: On I-10"}])
+        query.not_.is_.return_value = query
+        mock_supabase.table.return_value = query
+        
+        # Execute
+        calls = await db_service.list_calls_for_extraction(SCENARIO_CHECKIN, 10)
+        
+        # Assert
+        assert [call["id"] for call in calls] == ["call-1"]
+        query.eq.assert_any_call("extraction_complete", False)
+        query.is_.assert_not_called()
+
+
+class TestConfigurationCache:
+    """Test read-through caching of agent configurations."""
+    
+    @pytest.fixture
+    def db_service(self):
+        """Get a fresh database service."""
+        from services.database_service import DatabaseService
+        return DatabaseService()
+    
+    @pytest.fixture
+    def mock_supabase(self):
+        """Patch the async Supabase client used by the service."""
+        with patch('services.database_service.supabase') as mock:
+            yield mock
+    
+    async def test_repeat_lookup_served_from_cache(self, db_service, mock_supabase):
+        """Test agent lookups after the first one hit no database."""
+        # Setup
+        query = make_query([{"scenario_type": SCENARIO_CHECKIN, "agent_id": "agent-1"}])
+        mock_supabase.table.return_value = query
+        
+        # Execute
+        first = await db_service.get_agent_id(SCENARIO_CHECKIN)
+        second = await db_service.get_agent_id(SCENARIO_CHECKIN)
+        
+        # Assert
+        assert first == second == "agent-1"
+        query.execute.assert_awaited_once()
+        stats = db_service.config_cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+    
+    async def test_missing_configuration_not_cached(self, db_service, mock_supabase):
+        """Test a missing configuration is looked up again next time."""
+        # Setup
+        query = make_query([])
+        mock_supabase.table.return_value = query
+        
+        # Execute
+        await db_service.get_agent_configuration(SCENARIO_CHECKIN)
+        await db_service.get_agent_configuration(SCENARIO_CHECKIN)
+        
+        # Assert
+        assert query.execute.await_count == 2
+    
+    async def test_save_configuration_invalidates_cache(self, db_service, mock_supabase):
+        """Test writes drop the cached configuration."""
+        # Setup
+        db_service.config_cache.set(SCENARIO_CHECKIN, {"agent_id": "stale"})
+        update = make_query([{"scenario_type": SCENARIO_CHECKIN, "agent_id": "fresh"}])
+        mock_supabase.table.return_value = update
+        
+        # Execute
+        await db_service.save_configuration(SCENARIO_CHECKIN, {"agent_id": "fresh"})
+        
+        # Assert
+        assert db_service.config_cache.get(SCENARIO_CHECKIN) is None
+    
+    async def test_expired_entry_is_reloaded(self, db_service, mock_supabase):
+        """Test entries past their TTL are fetched again."""
+        # Setup
+        db_service.config_cache.ttl_seconds = 0
+        query = make_query([{"scenario_type": SCENARIO_CHECKIN, "agent_id": "agent-1"}])
+        mock_supabase.table.return_value = query
+        
+        # Execute
+        await db_service.get_agent_configuration(SCENARIO_CHECKIN)
+        await db_service.get_agent_configuration(SCENARIO_CHECKIN)
+        
+        # Assert
+        assert query.execute.await_count == 2
+
+
+class TestCallLogPagination:
+    """Test keyset pagination of call logs."""
+    
+    @pytest.fixture
+    def db_service(self):
+        """Get a fresh database service."""
+        from services.database_service import DatabaseService
+        return DatabaseService()
+    
+    @pytest.fixture
+    def mock_supabase(self):
+        """Patch the async Supabase client used by the service."""
+        with patch('services.database_service.supabase') as mock:
+            yield mock
+    
+    @staticmethod
+    def make_rows(count):
+        """Build call log rows newest first."""
+        return [
+            {"id": f"call-{i}", "created_at": f"2024-01-01T00:00:{59 - i:02d}+00:00"}
+            for i in range(count)
+        ]
+    
+    async def test_first_page_returns_next_cursor(self, db_service, mock_supabase):
+        """Test a full page fetches one extra row and returns a cursor."""
+        # Setup
+        query = make_query(self.make_rows(3))
+        mock_supabase.table.return_value = query
+        
+        # Execute
+        page = await db_service.list_call_logs(limit=2)
+        
+        # Assert
+        assert [row["id"] for row in page["items"]] == ["call-0", "call-1"]
+        assert page["next_cursor"] is not None
+        query.limit.assert_called_once_with(3)
+        query.order.assert_called_once_with("created_at.desc,id", desc=True)
+    
+    async def test_last_page_has_no_cursor(self, db_service, mock_supabase):
+        """Test a short page ends pagination."""
+        # Setup
+        mock_supabase.table.return_value = make_query(self.make_rows(1))
+        
+        # Execute
+        page = await db_service.list_call_logs(limit=2)
+        
+        # Assert
+        assert len(page["items"]) == 1
+        assert page["next_cursor"] is None
+    
+    async def test_cursor_filters_after_previous_page(self, db_service, mock_supabase):
+        """Test the cursor becomes a keyset filter on created_at and id."""
+        # Setup
+        from services.database_service import _encode_cursor
+        last_row = {"id": "call-1", "created_at": "2024-01-01T00:00:58+00:00"}
+        query = make_query([])
+        params = MagicMock()
+        query.params = params
+        mock_supabase.table.return_value = query
+        
+        # Execute
+        await db_service.list_call_logs(limit=2, cursor=_encode_cursor(last_row))
+        
+        # Assert
+        key, value = params.add.call_args[0]
+        assert key == "or"
+        assert 'created_at.lt."2024-01-01T00:00:58+00:00"' in value
+        assert 'id.lt."call-1"' in value
+    
+    async def test_invalid_cursor_rejected(self, db_service, mock_supabase):
+        """Test malformed cursors raise InvalidCursorError."""
+        # Execute & Assert
+        with pytest.raises(InvalidCursorError):
+            await db_service.list_call_logs(cursor="not-a-cursor")
+
+    
+    async def test_list_defaults_to_summary_projection(self, db_service, mock_supabase):
+        """Test list reads skip transcript and structured data by default."""
+        # Setup
+        query = make_query([])
+        mock_supabase.table.return_value = query
+        
+        # Execute
+        await db_service.list_call_logs()
+        
+        # Assert
+        columns = query.select.call_args[0][0].split(",")
+        assert "raw_transcript" not in columns
+        assert "structured_data" not in columns
+        assert "driver_name" in columns
+    
+    async def test_custom_projection_keeps_keyset_columns(self, db_service, mock_supabase):
+        """Test custom projections always include id and created_at."""
+        # Setup
+        query = make_query([])
+        mock_supabase.table.return_value = query
+        
+        # Execute
+        await db_service.list_call_logs(fields="call_status")
+        
+        # Assert
+        query.select.assert_called_once_with("call_status,id,created_at")
+    
+    async def test_unknown_field_rejected(self, db_service, mock_supabase):
+        """Test projections naming unknown columns raise InvalidFieldsError."""
+        # Execute & Assert
+        with pytest.raises(InvalidFieldsError):
+            await db_service.get_call_log("call-1", fields="id,secret")
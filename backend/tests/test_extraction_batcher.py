@@ -0,0 +1,163 @@
+"""
+Tests for micro-batched check-in extraction.
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from extraction_batcher import MicroBatcher
+
+
+CHECKIN_RESULT = {
+    "call_outcome": "In-Transit Update",
+    "driver_status": "Driving",
+    "current_location": "I-10 near Indio, CA",
+    "eta": "Tomorrow, 8:00 AM",
+    "delay_reason": "None",
+    "unloading_status": "N/A",
+    "pod_reminder_acknowledged": False
+}
+
+
+class TestMicroBatcher:
+    """Test items are grouped by size and age."""
+    
+    async def test_full_batch_flushed_at_once(self):
+        """Test reaching max_items sends one batch without waiting."""
+        # Setup
+        handler = AsyncMock(side_effect=lambda group, items: [item * 2 for item in items])
+        batcher = MicroBatcher(handler, max_items=3, max_wait_seconds=10)
+        
+        # Execute
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit("g", item) for item in [1, 2, 3])),
+            timeout=1
+        )
+        
+        # Assert
+        assert results == [2, 4, 6]
+        handler.assert_called_once_with("g", [1, 2, 3])
+        assert batcher.stats()["full_flushes"] == 1
+    
+    async def test_partial_batch_flushed_after_wait(self):
+        """Test a lone item is sent once the wait window passes."""
+        # Setup
+        handler = AsyncMock(side_effect=lambda group, items: items)
+        batcher = MicroBatcher(handler, max_items=8, max_wait_seconds=0.01)
+        
+        # Execute
+        result = await asyncio.wait_for(batcher.submit("g", "only"), timeout=1)
+        
+        # Assert
+        assert result == "only"
+        assert batcher.stats()["batches"] == 1
+    
+    async def test_groups_not_mixed(self):
+        """Test items of different groups go in different batches."""
+        # Setup
+        handler = AsyncMock(side_effect=lambda group, items: items)
+        batcher = MicroBatcher(handler, max_items=8, max_wait_seconds=0.01)
+        
+        # Execute
+        await asyncio.gather(batcher.submit("a", 1), batcher.submit("b", 2), batcher.submit("a", 3))
+        
+        # Assert
+        calls = sorted(call.args for call in handler.call_args_list)
+        assert calls == [("a", [1, 3]), ("b", [2])]
+    
+    async def test_handler_error_reaches_every_caller(self):
+        """Test a failed batch fails each submitted item."""
+        # Setup
+        handler = AsyncMock(side_effect=RuntimeError("upstream down"))
+        batcher = MicroBatcher(handler, max_items=2, max_wait_seconds=10)
+        
+        # Execute
+        results = await asyncio.gather(
+            batcher.submit("g", 1), batcher.submit("g", 2), return_exceptions=True
+        )
+        
+        # Assert
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert batcher.stats()["failed_batches"] == 1
+
+
+class TestBatchedCheckinExtraction:
+    """Test concurrent check-in extractions share one request."""
+    
+    @pytest.fixture
+    def extractor(self):
+        """Get an extractor with no fast path and a mocked completions client."""
+        from openai_client import OpenAIExtractor
+        extractor = OpenAIExtractor()
+        extractor.fast_path_threshold = 2.0
+        extractor.batcher.max_wait_seconds = 0.01
+        extractor.client = MagicMock()
+        extractor.client.chat.completions.create = AsyncMock()
+        return extractor
+    
+    async def test_concurrent_checkins_batched(self, extractor):
+        """Test results are fanned back to the caller of each transcript."""
+        # Setup
+        def respond(**kwargs):
+            prompt = kwargs["messages"][1]["content"]
+            results = [
+                {"transcript_id": key, **CHECKIN_RESULT, "current_location": location}
+                for key, location in [("t1", "I-10"), ("t2", "I-40")]
+                if f"Transcript {key}:" in prompt
+            ]
+            return MagicMock(choices=[MagicMock(message=MagicMock(content=json.dumps({"results": results})))])
+        
+        extractor.client.chat.completions.create.side_effect = respond
+        
+        # Execute
+        first, second = await asyncio.gather(
+            extractor.extract_checkin_data("Driver: I'm on I-10"),
+            extractor.extract_checkin_data("Driver: I'm on I-40")
+        )
+        
+        # Assert
+        extractor.client.chat.completions.create.assert_called_once()
+        request = extractor.client.chat.completions.create.call_args.kwargs
+        assert request["response_format"]["json_schema"]["name"] == "checkin_batch_extraction"
+        assert first["current_location"] == "I-10"
+        assert second["current_location"] == "I-40"
+    
+    async def test_item_missing_from_batch_reasked(self, extractor):
+        """Test a transcript left out of the batch response is asked alone."""
+        # Setup
+        batch = {"results": [{"transcript_id": "t1", **CHECKIN_RESULT}]}
+        extractor.client.chat.completions.create.side_effect = [
+            MagicMock(choices=[MagicMock(message=MagicMock(content=json.dumps(batch)))]),
+            MagicMock(choices=[MagicMock(message=MagicMock(content=json.dumps(CHECKIN_RESULT)))])
+        ]
+        
+        # Execute
+        results = await asyncio.gather(
+            extractor.extract_checkin_data("Driver: I'm on I-10"),
+            extractor.extract_checkin_data("Driver: I'm on I-40")
+        )
+        
+        # Assert
+        assert results == [CHECKIN_RESULT, CHECKIN_RESULT]
+        assert extractor.client.chat.completions.create.call_count == 2
+    
+    @pytest.mark.parametrize("fast_model, batch_max_tokens", [(None, 500), ("gpt-4o-mini", 3)])
+    async def test_strong_model_and_long_transcripts_not_batched(self, extractor, fast_model, batch_max_tokens):
+        """Test check-ins routed to the strong model or over the token limit are sent alone."""
+        # Setup
+        extractor.fast_model = fast_model
+        extractor.batch_max_tokens = batch_max_tokens
+        extractor.client.chat.completions.create.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(content=json.dumps(CHECKIN_RESULT)))]
+        )
+        
+        # Execute
+        await asyncio.gather(
+            extractor.extract_checkin_data("Driver: I'm on I-10"),
+            extractor.extract_checkin_data("Driver: I'm on I-40")
+        )
+        
+        # Assert
+        assert extractor.client.chat.completions.create.call_count == 2
+        assert extractor.batcher.stats()["batches"] == 0
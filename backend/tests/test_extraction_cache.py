@@ -0,0 +1,158 @@
+"""
+Tests for the content-addressed extraction result cache.
+"""
+
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from constants import SCENARIO_CHECKIN, SCENARIO_EMERGENCY
+from extraction_cache import ExtractionCache, extraction_cache_key
+
+
+# Valid for both schemas apart from call_outcome, which is overridden per scenario
+CHECKIN_RESULT = {
+    "call_outcome": "In-Transit Update",
+    "driver_status": "Driving",
+    "current_location": "I-10 near Indio, CA",
+    "eta": "Tomorrow, 8:00 AM",
+    "delay_reason": "None",
+    "unloading_status": "N/A",
+    "pod_reminder_acknowledged": False
+}
+EMERGENCY_RESULT = {
+    "call_outcome": "Emergency Escalation",
+    "emergency_type": "Breakdown",
+    "safety_status": "Driver is safe",
+    "injury_status": "No injuries reported",
+    "emergency_location": "I-15 North, Mile Marker 123",
+    "load_secure": True,
+    "escalation_status": "Connected to Human Dispatcher"
+}
+
+
+def make_completion(content):
+    """Build a chat completion response with the given message content."""
+    return MagicMock(choices=[MagicMock(message=MagicMock(content=content))])
+
+
+class TestExtractionCache:
+    """Test the memory and disk tiers."""
+    
+    async def test_memory_hit_returns_copy(self):
+        """Test cached results are returned as independent copies."""
+        # Setup
+        cache = ExtractionCache(max_size=10)
+        await cache.set("key", {"driver_status": "Driving"})
+        
+        # Execute
+        first = await cache.get("key")
+        first["driver_status"] = "Changed"
+        second = await cache.get("key")
+        
+        # Assert
+        assert second == {"driver_status": "Driving"}
+        assert cache.stats()["memory_hits"] == 2
+    
+    async def test_least_recently_used_entry_evicted(self):
+        """Test the memory tier evicts the least recently used key."""
+        # Setup
+        cache = ExtractionCache(max_size=2)
+        await cache.set("a", {"value": 1})
+        await cache.set("b", {"value": 2})
+        await cache.get("a")
+        
+        # Execute
+        await cache.set("c", {"value": 3})
+        
+        # Assert
+        assert await cache.get("b") is None
+        assert await cache.get("a") == {"value": 1}
+        assert cache.stats()["evictions"] == 1
+    
+    async def test_disk_tier_survives_restart(self, tmp_path):
+        """Test results written to disk are served by a new cache instance."""
+        # Setup
+        path = str(tmp_path / "cache.db")
+        cache = ExtractionCache(max_size=10, disk_path=path)
+        await cache.set("key", {"emergency_type": "Accident"})
+        cache.close()
+        
+        # Execute
+        reopened = ExtractionCache(max_size=10, disk_path=path)
+        result = await reopened.get("key")
+        
+        # Assert
+        assert result == {"emergency_type": "Accident"}
+        assert reopened.stats()["disk_hits"] == 1
+        reopened.close()
+    
+    def test_key_depends_on_every_input(self):
+        """Test changing any key component changes the key."""
+        # Setup
+        base = extraction_cache_key(SCENARIO_CHECKIN, "v1", "gpt-4o", "abc")
+        
+        # Execute
+        variants = [
+            extraction_cache_key(SCENARIO_EMERGENCY, "v1", "gpt-4o", "abc"),
+            extraction_cache_key(SCENARIO_CHECKIN, "v2", "gpt-4o", "abc"),
+            extraction_cache_key(SCENARIO_CHECKIN, "v1", "gpt-4o-mini", "abc"),
+            extraction_cache_key(SCENARIO_CHECKIN, "v1", "gpt-4o", "abd")
+        ]
+        
+        # Assert
+        assert base not in variants
+        assert len(set(variants)) == len(variants)
+
+
+class TestExtractorCaching:
+    """Test the OpenAI extractor consults the cache."""
+    
+    @pytest.fixture
+    def extractor(self):
+        """Get an extractor with a mocked completions client and empty cache."""
+        from openai_client import OpenAIExtractor
+        extractor = OpenAIExtractor()
+        extractor.client = MagicMock()
+        
+        async def respond(**kwargs):
+            prompt = kwargs["messages"][-1]["content"]
+            result = EMERGENCY_RESULT if "emergency_type" in prompt else CHECKIN_RESULT
+            return make_completion(json.dumps(result))
+        
+        extractor.client.chat.completions.create = AsyncMock(side_effect=respond)
+        return extractor
+    
+    async def test_repeat_transcript_skips_api(self, extractor):
+        """Test an identical transcript is answered from the cache."""
+        # Execute
+        first = await extractor.extract_checkin_data("Agent: Hi\nDriver: Hello there")
+        second = await extractor.extract_checkin_data("Agent: Hi\nDriver: Hello there")
+        
+        # Assert
+        assert first == second
+        assert first["driver_status"] == "Driving"
+        extractor.client.chat.completions.create.assert_awaited_once()
+    
+    async def test_scenarios_cached_separately(self, extractor):
+        """Test the same transcript is extracted once per scenario."""
+        # Execute
+        await extractor.extract_checkin_data("Driver: flat tire")
+        await extractor.extract_emergency_data("Driver: flat tire")
+        
+        # Assert
+        assert extractor.client.chat.completions.create.await_count == 2
+    
+    async def test_failed_extraction_not_cached(self, extractor):
+        """Test API errors propagate and leave nothing in the cache."""
+        # Setup
+        extractor.client.chat.completions.create.side_effect = Exception("API Error")
+        
+        # Execute & Assert
+        with pytest.raises(Exception):
+            await extractor.extract_checkin_data("Driver: hello")
+        assert extractor.cache.stats()["size"] == 0
+    
+    def test_prompt_version_differs_per_scenario(self, extractor):
+        """Test each scenario prompt has its own version."""
+        # Assert
+        assert extractor.prompt_version(SCENARIO_CHECKIN) != extractor.prompt_version(SCENARIO_EMERGENCY)
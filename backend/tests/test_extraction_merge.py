@@ -0,0 +1,150 @@
+"""
+Tests for chunked extraction and the field-level merge of chunk results.
+"""
+
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from constants import SCENARIO_CHECKIN, SCENARIO_EMERGENCY
+from extraction_merge import merge_chunk_results
+
+
+EMERGENCY_BASE = {
+    "call_outcome": "Emergency Escalation",
+    "emergency_type": "Accident",
+    "safety_status": "Driver is safe",
+    "injury_status": "No injuries reported",
+    "emergency_location": "I-15 North, Mile Marker 123",
+    "load_secure": True,
+    "escalation_status": "Connected to Human Dispatcher"
+}
+
+
+class TestMergeChunkResults:
+    """Test deterministic per-field merge rules."""
+    
+    def test_latest_location_wins(self):
+        """Test the last chunk's location replaces earlier ones."""
+        # Setup
+        results = [
+            {**EMERGENCY_BASE, "emergency_location": "I-15 North, Mile Marker 120"},
+            {**EMERGENCY_BASE, "emergency_location": "I-15 North, Mile Marker 123"}
+        ]
+        
+        # Execute
+        merged = merge_chunk_results(SCENARIO_EMERGENCY, results)
+        
+        # Assert
+        assert merged["emergency_location"] == "I-15 North, Mile Marker 123"
+    
+    def test_placeholder_does_not_override(self):
+        """Test a later chunk that does not discuss a field keeps the earlier value."""
+        # Setup
+        results = [
+            {**EMERGENCY_BASE, "emergency_location": "I-15 North, Mile Marker 120"},
+            {**EMERGENCY_BASE, "emergency_location": "Unknown"}
+        ]
+        
+        # Execute
+        merged = merge_chunk_results(SCENARIO_EMERGENCY, results)
+        
+        # Assert
+        assert merged["emergency_location"] == "I-15 North, Mile Marker 120"
+    
+    def test_any_injury_mention_wins(self):
+        """Test an injury in any chunk beats later "no injuries" values."""
+        # Setup
+        results = [
+            {**EMERGENCY_BASE, "injury_status": "Driver has a cut on his arm"},
+            {**EMERGENCY_BASE, "injury_status": "No injuries reported"}
+        ]
+        
+        # Execute
+        merged = merge_chunk_results(SCENARIO_EMERGENCY, results)
+        
+        # Assert
+        assert merged["injury_status"] == "Driver has a cut on his arm"
+    
+    def test_unsecured_load_wins(self):
+        """Test one chunk reporting an unsecured load decides load_secure."""
+        # Setup
+        results = [{**EMERGENCY_BASE, "load_secure": False}, EMERGENCY_BASE]
+        
+        # Execute
+        merged = merge_chunk_results(SCENARIO_EMERGENCY, results)
+        
+        # Assert
+        assert merged["load_secure"] is False
+    
+    def test_checkin_outcome_follows_driver_status(self):
+        """Test call_outcome comes from the chunk whose driver_status won."""
+        # Setup
+        results = [
+            {"call_outcome": "Arrival Confirmation", "driver_status": "Arrived", "pod_reminder_acknowledged": True},
+            {"call_outcome": "In-Transit Update", "driver_status": "Unknown", "pod_reminder_acknowledged": False}
+        ]
+        
+        # Execute
+        merged = merge_chunk_results(SCENARIO_CHECKIN, results)
+        
+        # Assert
+        assert merged == {
+            "call_outcome": "Arrival Confirmation",
+            "driver_status": "Arrived",
+            "pod_reminder_acknowledged": True
+        }
+
+
+class TestChunkedExtraction:
+    """Test long transcripts are extracted per chunk and merged."""
+    
+    @pytest.fixture
+    def extractor(self):
+        """Get an extractor with small chunks and a mocked completions client."""
+        from openai_client import OpenAIExtractor
+        extractor = OpenAIExtractor()
+        extractor.chunk_threshold_tokens = 60
+        extractor.chunk_tokens = 40
+        extractor.client = MagicMock()
+        extractor.client.chat.completions.create = AsyncMock()
+        return extractor
+    
+    async def test_long_emergency_transcript_chunked(self, extractor):
+        """Test each chunk gets its own request and the results are merged."""
+        # Setup
+        transcript = "\n".join(
+            f"{'Agent' if index % 2 else 'Driver'}: update {index} from mile marker {100 + index}"
+            for index in range(12)
+        )
+        
+        def respond(**kwargs):
+            chunk = kwargs["messages"][1]["content"]
+            markers = [line.rsplit(" ", 1)[-1] for line in chunk.splitlines() if "mile marker" in line]
+            result = {**EMERGENCY_BASE, "emergency_location": f"Mile Marker {markers[-1]}"}
+            return MagicMock(choices=[MagicMock(message=MagicMock(content=json.dumps(result)))])
+        
+        extractor.client.chat.completions.create.side_effect = respond
+        
+        # Execute
+        result = await extractor.extract_emergency_data(transcript)
+        
+        # Assert
+        calls = extractor.client.chat.completions.create.call_count
+        assert calls > 1
+        assert extractor.chunking_stats()["chunks"] == calls
+        assert result["emergency_location"] == "Mile Marker 111"
+    
+    async def test_short_transcript_not_chunked(self, extractor):
+        """Test transcripts within the threshold use a single request."""
+        # Setup
+        extractor.client.chat.completions.create.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(content=json.dumps(EMERGENCY_BASE)))]
+        )
+        
+        # Execute
+        result = await extractor.extract_emergency_data("Driver: I hit a guardrail")
+        
+        # Assert
+        assert result == EMERGENCY_BASE
+        extractor.client.chat.completions.create.assert_called_once()
+        assert extractor.chunking_stats()["transcripts"] == 0
@@ -0,0 +1,384 @@
+"""
+Tests for typed extraction results and field-level re-asks.
+"""
+
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from models import CheckinExtraction, EmergencyExtraction, strict_json_schema
+
+
+CHECKIN_RESULT = {
+    "call_outcome": "In-Transit Update",
+    "driver_status": "Driving",
+    "current_location": "I-10 near Indio, CA",
+    "eta": "Tomorrow, 8:00 AM",
+    "delay_reason": "None",
+    "unloading_status": "N/A",
+    "pod_reminder_acknowledged": False
+}
+
+
+EMERGENCY_RESULT = {
+    "call_outcome": "Emergency Escalation",
+    "emergency_type": "Accident",
+    "safety_status": "Driver confirmed everyone is safe",
+    "injury_status": "No injuries reported",
+    "emergency_location": "I-15 North, Mile Marker 123",
+    "load_secure": True,
+    "escalation_status": "Connected to Human Dispatcher"
+}
+
+
+def make_completion(result):
+    """Build a chat completion response carrying a JSON result."""
+    return MagicMock(choices=[MagicMock(message=MagicMock(content=json.dumps(result)))])
+
+
+def make_stream(text, chunk_size=7, usage=None):
+    """Build a streamed chat completion delivering text in small chunks."""
+    async def stream():
+        for start in range(0, len(text), chunk_size):
+            delta = MagicMock(content=text[start:start + chunk_size])
+            yield MagicMock(choices=[MagicMock(delta=delta)], usage=None)
+        if usage is not None:
+            yield MagicMock(choices=[], usage=usage)
+    return stream()
+
+
+class TestExtractionModels:
+    """Test result models and their JSON schema."""
+    
+    def test_enum_case_normalized(self):
+        """Test enum values differing only in case are accepted and fixed."""
+        # Execute
+        result = CheckinExtraction(**{**CHECKIN_RESULT, "driver_status": "driving"})
+        
+        # Assert
+        assert result.driver_status == "Driving"
+    
+    def test_strict_schema_requires_every_field(self):
+        """Test the schema meets OpenAI strict mode requirements."""
+        # Execute
+        schema = strict_json_schema(EmergencyExtraction)
+        
+        # Assert
+        assert schema["additionalProperties"] is False
+        assert schema["required"] == list(EmergencyExtraction.model_fields)
+        assert schema["properties"]["call_outcome"] == {
+            "type": "string",
+            "enum": ["Emergency Escalation"]
+        }
+
+
+class TestFieldReask:
+    """Test the extractor re-asks only fields that fail validation."""
+    
+    @pytest.fixture
+    def extractor(self):
+        """Get an extractor with a mocked completions client and no fast path."""
+        from openai_client import OpenAIExtractor
+        extractor = OpenAIExtractor()
+        extractor.fast_path_threshold = 2.0
+        extractor.client = MagicMock()
+        extractor.client.chat.completions.create = AsyncMock()
+        return extractor
+    
+    async def test_invalid_field_reasked_alone(self, extractor):
+        """Test an out-of-schema enum triggers a re-ask for that field only."""
+        # Setup
+        extractor.client.chat.completions.create.side_effect = [
+            make_completion({**CHECKIN_RESULT, "driver_status": "Speeding"}),
+            make_completion({"driver_status": "Driving"})
+        ]
+        
+        # Execute
+        result = await extractor.extract_checkin_data("Driver: hello")
+        
+        # Assert
+        assert result == CHECKIN_RESULT
+        reask = extractor.client.chat.completions.create.call_args_list[1].kwargs
+        assert reask["response_format"]["json_schema"]["schema"]["required"] == ["driver_status"]
+        assert extractor.validation_stats["reasked_fields"] == 1
+    
+    async def test_missing_field_reasked(self, extractor):
+        """Test fields missing from the response are requested again."""
+        # Setup
+        partial = {key: value for key, value in CHECKIN_RESULT.items() if key != "eta"}
+        extractor.client.chat.completions.create.side_effect = [
+            make_completion(partial),
+            make_completion({"eta": "Tomorrow, 8:00 AM"})
+        ]
+        
+        # Execute
+        result = await extractor.extract_checkin_data("Driver: hello")
+        
+        # Assert
+        assert result["eta"] == "Tomorrow, 8:00 AM"
+    
+    async def test_persistently_invalid_field_raises(self, extractor):
+        """Test extraction fails after the re-ask attempts are used up."""
+        # Setup
+        from openai_client import ExtractionValidationError
+        extractor.client.chat.completions.create.side_effect = [
+            make_completion({**CHECKIN_RESULT, "pod_reminder_acknowledged": "maybe"}),
+            make_completion({"pod_reminder_acknowledged": "maybe"}),
+            make_completion({"pod_reminder_acknowledged": "maybe"})
+        ]
+        
+        # Execute & Assert
+        with pytest.raises(ExtractionValidationError):
+            await extractor.extract_checkin_data("Driver: hello")
+        assert extractor.client.chat.completions.create.await_count == extractor.reask_attempts + 1
+        assert extractor.cache.stats()["size"] == 0
+
+
+class TestModelRouting:
+    """Test fast-model-first routing and escalation."""
+    
+    @pytest.fixture
+    def extractor(self):
+        """Get an extractor with a mocked completions client and no fast path."""
+        from openai_client import OpenAIExtractor
+        extractor = OpenAIExtractor()
+        extractor.fast_path_threshold = 2.0
+        extractor.fast_model = "gpt-4o-mini"
+        extractor.client = MagicMock()
+        extractor.client.chat.completions.create = AsyncMock(
+            return_value=make_completion(CHECKIN_RESULT)
+        )
+        return extractor
+    
+    def used_models(self, extractor):
+        """List the models requested, in order."""
+        return [call.kwargs["model"] for call in extractor.client.chat.completions.create.call_args_list]
+    
+    async def test_short_checkin_uses_fast_model(self, extractor):
+        """Test short check-ins are served by the fast model alone."""
+        # Execute
+        await extractor.extract_checkin_data("Driver: hello")
+        
+        # Assert
+        assert self.used_models(extractor) == ["gpt-4o-mini"]
+        assert extractor.routing_stats()["fast_first"] == 1
+    
+    async def test_emergency_uses_strong_model(self, extractor):
+        """Test emergencies skip the fast model."""
+        # Setup
+        extractor.client.chat.completions.create.return_value = make_completion({
+            "call_outcome": "Emergency Escalation",
+            "emergency_type": "Accident",
+            "safety_status": "Safe",
+            "injury_status": "None",
+            "emergency_location": "I-15",
+            "load_secure": True,
+            "escalation_status": "Connected to Human Dispatcher"
+        })
+        
+        # Execute
+        await extractor.extract_emergency_data("Driver: I crashed")
+        
+        # Assert
+        assert self.used_models(extractor) == ["gpt-4o"]
+    
+    async def test_long_transcript_uses_strong_model(self, extractor):
+        """Test transcripts over the routing threshold skip the fast model."""
+        # Setup
+        extractor.long_transcript_tokens = 5
+        
+        # Execute
+        await extractor.extract_checkin_data("Driver: this check-in goes on for quite a while")
+        
+        # Assert
+        assert self.used_models(extractor) == ["gpt-4o"]
+    
+    async def test_invalid_fast_result_escalates(self, extractor):
+        """Test fields failing validation are re-asked on the strong model."""
+        # Setup
+        extractor.client.chat.completions.create.side_effect = [
+            make_completion({**CHECKIN_RESULT, "driver_status": "Parked"}),
+            make_completion({"driver_status": "Arrived"})
+        ]
+        
+        # Execute
+        result = await extractor.extract_checkin_data("Driver: hello")
+        
+        # Assert
+        assert result["driver_status"] == "Arrived"
+        assert self.used_models(extractor) == ["gpt-4o-mini", "gpt-4o"]
+        stats = extractor.routing_stats()
+        assert stats["escalated"] == 1
+        assert stats["escalation_rate"] == 1.0
+    
+    @pytest.mark.parametrize("transcript, fast_answer, reasked", [
+        # Key field contradicts the rule-based guess
+        ("Driver: I'm driving on I-10 near Indio", {"driver_status": "Delayed"}, ["driver_status"]),
+        # Placeholder for a field the rules found
+        ("Driver: I'm driving on I-10 near Indio", {"current_location": "N/A"}, ["current_location"]),
+        # Outcome contradicts the status
+        ("Driver: hello", {"driver_status": "Arrived"}, ["call_outcome", "driver_status"])
+    ])
+    async def test_doubtful_fast_result_escalates(self, extractor, transcript, fast_answer, reasked):
+        """Test valid but doubtful fast-model fields are re-asked on the strong model."""
+        # Setup
+        extractor.client.chat.completions.create.side_effect = [
+            make_completion({**CHECKIN_RESULT, **fast_answer}),
+            make_completion({field: CHECKIN_RESULT[field] for field in reasked})
+        ]
+        
+        # Execute
+        result = await extractor.extract_checkin_data(transcript)
+        
+        # Assert
+        assert result == CHECKIN_RESULT
+        assert self.used_models(extractor) == ["gpt-4o-mini", "gpt-4o"]
+        second_schema = extractor.client.chat.completions.create.call_args.kwargs["response_format"]
+        assert sorted(second_schema["json_schema"]["schema"]["properties"]) == sorted(reasked)
+        assert extractor.routing_stats()["disputed"] == 1
+        assert extractor.validation_stats["invalid_responses"] == 0
+    
+    async def test_cost_recorded_per_tier(self, extractor):
+        """Test reported token usage is priced per model."""
+        # Setup
+        completion = make_completion(CHECKIN_RESULT)
+        completion.usage = MagicMock(prompt_tokens=1_000_000, completion_tokens=0, total_tokens=1_000_000)
+        extractor.client.chat.completions.create.return_value = completion
+        
+        # Execute
+        await extractor.extract_checkin_data("Driver: hello")
+        
+        # Assert
+        tier = extractor.routing_stats()["tiers"]["gpt-4o-mini"]
+        assert tier["requests"] == 1
+        assert tier["cost_usd"] == pytest.approx(0.15)
+
+
+class TestStreamingExtraction:
+    """Test emergency fields are handed over while the response streams."""
+    
+    @pytest.fixture
+    def extractor(self):
+        """Get an extractor with a mocked completions client."""
+        from openai_client import OpenAIExtractor
+        extractor = OpenAIExtractor()
+        extractor.client = MagicMock()
+        extractor.client.chat.completions.create = AsyncMock()
+        return extractor
+    
+    async def test_fields_published_before_stream_ends(self, extractor):
+        """Test each field is published once, while later chunks are still pending."""
+        # Setup
+        text = json.dumps(EMERGENCY_RESULT)
+        received = []
+        
+        async def stream():
+            async for chunk in make_stream(text):
+                # Record how many fields were out when each chunk arrived
+                received.append(len(published))
+                yield chunk
+        
+        published = []
+        
+        async def on_field(name, value):
+            published.append((name, value))
+        
+        extractor.client.chat.completions.create.return_value = stream()
+        
+        # Execute
+        result = await extractor.extract_emergency_data("Driver: I hit a guardrail", on_field=on_field)
+        
+        # Assert
+        assert result == EMERGENCY_RESULT
+        assert published == list(EMERGENCY_RESULT.items())
+        assert 0 < received[len(received) // 2] < len(EMERGENCY_RESULT)
+        assert extractor.client.chat.completions.create.call_args.kwargs["stream"] is True
+        assert extractor.streaming_stats()["early_fields"] == len(EMERGENCY_RESULT)
+    
+    async def test_invalid_streamed_field_published_after_reask(self, extractor):
+        """Test a field failing validation is only published once re-asked."""
+        # Setup
+        text = json.dumps({**EMERGENCY_RESULT, "emergency_type": "Fire"})
+        extractor.client.chat.completions.create.side_effect = [
+            make_stream(text),
+            make_completion({"emergency_type": "Other"})
+        ]
+        published = []
+        
+        async def on_field(name, value):
+            published.append(name)
+        
+        # Execute
+        result = await extractor.extract_emergency_data("Driver: there is smoke", on_field=on_field)
+        
+        # Assert
+        assert result["emergency_type"] == "Other"
+        assert published[-1] == "emergency_type"
+        assert sorted(published) == sorted(EMERGENCY_RESULT)
+    
+    async def test_interrupted_stream_reasks_missing_fields(self, extractor):
+        """Test fields completed before a stream error are kept and the rest re-asked."""
+        # Setup
+        names = list(EMERGENCY_RESULT)
+        text = json.dumps(EMERGENCY_RESULT)
+        cut = text.index(f'"{names[2]}"')
+        
+        async def broken_stream():
+            async for chunk in make_stream(text[:cut]):
+                yield chunk
+            raise ConnectionError("connection reset")
+        
+        extractor.client.chat.completions.create.side_effect = [
+            broken_stream(),
+            make_completion({name: EMERGENCY_RESULT[name] for name in names[2:]})
+        ]
+        published = []
+        
+        async def on_field(name, value):
+            published.append(name)
+        
+        # Execute
+        result = await extractor.extract_emergency_data("Driver: I hit a guardrail", on_field=on_field)
+        
+        # Assert
+        assert result == EMERGENCY_RESULT
+        assert published[:2] == names[:2]
+        assert sorted(published) == sorted(names)
+        assert extractor.streaming_stats()["interrupted"] == 1
+    
+    async def test_stream_usage_recorded(self, extractor):
+        """Test the usage reported in the last chunk is priced and charged."""
+        # Setup
+        usage = MagicMock(prompt_tokens=1_000_000, completion_tokens=0, total_tokens=1_000_000)
+        extractor.client.chat.completions.create.return_value = make_stream(
+            json.dumps(EMERGENCY_RESULT), usage=usage
+        )
+        on_field = AsyncMock()
+        
+        # Execute
+        await extractor.extract_emergency_data("Driver: I hit a guardrail", on_field=on_field)
+        
+        # Assert
+        kwargs = extractor.client.chat.completions.create.call_args.kwargs
+        assert kwargs["stream_options"] == {"include_usage": True}
+        tier = extractor.routing_stats()["tiers"]["gpt-4o"]
+        assert tier["prompt_tokens"] == 1_000_000
+        assert tier["cost_usd"] == pytest.approx(2.5)
+        assert extractor.rate_governor.tokens.available <= 0
+    
+    async def test_cached_fields_published(self, extractor):
+        """Test a cache hit still hands every field to on_field."""
+        # Setup
+        extractor.client.chat.completions.create.return_value = make_completion(EMERGENCY_RESULT)
+        await extractor.extract_emergency_data("Driver: I hit a guardrail")
+        published = []
+        
+        async def on_field(name, value):
+            published.append((name, value))
+        
+        # Execute
+        result = await extractor.extract_emergency_data("Driver: I hit a guardrail", on_field=on_field)
+        
+        # Assert
+        assert result == EMERGENCY_RESULT
+        assert published == list(EMERGENCY_RESULT.items())
+        extractor.client.chat.completions.create.assert_awaited_once()
@@ -0,0 +1,144 @@
+"""
+Tests for the background extraction worker pool.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+from job_queue import SQLiteJobQueue
+from services.extraction_worker import ExtractionWorkerPool
+
+
+def make_queue(max_attempts=3):
+    """Build an in-memory job queue with no retry delay."""
+    return SQLiteJobQueue(
+        path=":memory:",
+        max_attempts=max_attempts,
+        visibility_timeout=60,
+        retry_base_seconds=0,
+        retry_max_seconds=0
+    )
+
+
+async def wait_until(predicate, timeout=2.0):
+    """Poll until predicate() is true or the timeout expires."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+class TestExtractionWorkerPool:
+    """Test background job processing from the durable queue."""
+    
+    async def test_submitted_jobs_run_and_leave_the_queue(self):
+        """Test queued jobs are processed and removed once complete."""
+        # Setup
+        pool = ExtractionWorkerPool(make_queue(), concurrency=2, poll_interval=0.01)
+        handler = AsyncMock()
+        pool.register_handler("extract", handler)
+        
+        # Execute
+        for index in range(5):
+            await pool.submit("extract", {"call_id": f"call-{index}"})
+        await wait_until(lambda: pool.completed == 5)
+        await pool.stop(timeout=1)
+        
+        # Assert
+        assert handler.await_count == 5
+        stats = await pool.stats()
+        assert stats["queue_depth"] == 0
+        assert stats["running"] == 0
+    
+    async def test_concurrency_is_bounded(self):
+        """Test no more than `concurrency` jobs run at the same time."""
+        # Setup
+        pool = ExtractionWorkerPool(make_queue(), concurrency=2, poll_interval=0.01)
+        running = 0
+        peak = 0
+        
+        async def handler(payload, final_attempt):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+        
+        pool.register_handler("extract", handler)
+        
+        # Execute
+        for index in range(6):
+            await pool.submit("extract", {"index": index})
+        await wait_until(lambda: pool.completed == 6)
+        await pool.stop(timeout=1)
+        
+        # Assert
+        assert peak == 2
+    
+    async def test_failed_job_retried_then_dead_lettered(self):
+        """Test failures retry up to max_attempts, flagging the final one."""
+        # Setup
+        queue = make_queue(max_attempts=3)
+        pool = ExtractionWorkerPool(queue, concurrency=1, poll_interval=0.01)
+        handler = AsyncMock(side_effect=Exception("OpenAI API error"))
+        pool.register_handler("extract", handler)
+        
+        # Execute
+        await pool.submit("extract", {"call_id": "call-1"})
+        await wait_until(lambda: pool.dead_lettered == 1)
+        await pool.stop(timeout=1)
+        
+        # Assert
+        assert handler.await_count == 3
+        assert [call.args[1] for call in handler.await_args_list] == [False, False, True]
+        assert (await pool.stats())["dead_letter"] == 1
+        assert queue.dead_letters()[0]["last_error"] == "OpenAI API error"
+    
+    async def test_queued_jobs_survive_restart(self, tmp_path):
+        """Test jobs left in the queue file are processed by a new pool."""
+        # Setup
+        path = str(tmp_path / "jobs.db")
+        first = SQLiteJobQueue(path, 3, 60, 0, 0)
+        first.enqueue("extract", {"call_id": "call-1"})
+        first.close()
+        
+        pool = ExtractionWorkerPool(SQLiteJobQueue(path, 3, 60, 0, 0), concurrency=1, poll_interval=0.01)
+        handler = AsyncMock()
+        pool.register_handler("extract", handler)
+        
+        # Execute
+        pool.start()
+        await wait_until(lambda: pool.completed == 1)
+        await pool.stop(timeout=1)
+        
+        # Assert
+        handler.assert_awaited_once_with({"call_id": "call-1"}, False)
+    
+    async def test_lease_renewed_while_job_runs(self):
+        """Test a job outlasting the visibility timeout is not claimed twice."""
+        # Setup
+        queue = make_queue()
+        queue.visibility_timeout = 0.06
+        pool = ExtractionWorkerPool(queue, concurrency=1, poll_interval=0.01)
+        release = asyncio.Event()
+        runs = 0
+        
+        async def handler(payload, final_attempt):
+            nonlocal runs
+            runs += 1
+            await release.wait()
+        
+        pool.register_handler("extract", handler)
+        
+        # Execute
+        await pool.submit("extract", {"call_id": "call-1"})
+        await wait_until(lambda: pool.in_flight == 1)
+        await asyncio.sleep(0.2)
+        stolen = queue.claim()
+        release.set()
+        await wait_until(lambda: pool.completed == 1)
+        await pool.stop(timeout=1)
+        
+        # Assert
+        assert stolen is None
+        assert runs == 1
@@ -0,0 +1,118 @@
+"""
+Tests for the shared, instrumented HTTP transport.
+"""
+
+import asyncio
+import httpx
+import pytest
+from http_transport import SharedHTTPClients
+
+
+@pytest.fixture
+async def server():
+    """Run a minimal keep-alive HTTP/1.1 server and count its connections."""
+    accepted = []
+    
+    async def handle(reader, writer):
+        accepted.append(writer)
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n") if not reader.at_eof() else b""
+            if not head:
+                break
+            await asyncio.sleep(0.01)
+            body = b"" if head.startswith(b"HEAD") else b"ok"
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: keep-alive\r\n\r\n" + body)
+            await writer.drain()
+    
+    async def safe_handle(reader, writer):
+        try:
+            await handle(reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+    
+    tcp = await asyncio.start_server(safe_handle, "127.0.0.1", 0)
+    port = tcp.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", accepted
+    tcp.close()
+
+
+class TestSharedHTTPClients:
+    """Test pooled clients are shared, pre-warmed and instrumented."""
+    
+    def test_one_client_per_host(self):
+        """Test every caller for a host gets the same pooled client."""
+        # Setup
+        clients = SharedHTTPClients()
+        
+        # Execute
+        first = clients.client("openai")
+        second = clients.client("openai")
+        
+        # Assert
+        assert first is second
+        assert clients.client("retell") is not first
+    
+    async def test_warm_up_opens_reusable_connections(self, server, monkeypatch):
+        """Test pre-warmed connections are kept alive and reused by real requests."""
+        # Setup
+        url, accepted = server
+        monkeypatch.setenv("HTTP_PREWARM_CONNECTIONS", "2")
+        clients = SharedHTTPClients()
+        client = clients.client("upstream", warm_url=url, base_url=url)
+        
+        # Execute
+        warmed = await clients.warm_up()
+        pool_after_warm_up = clients.stats()["hosts"]["upstream"]
+        await asyncio.gather(client.get("/a"), client.get("/b"))
+        stats = clients.stats()["hosts"]["upstream"]
+        await clients.close()
+        
+        # Assert
+        assert warmed["upstream"] is not None
+        assert pool_after_warm_up["connections"] == 2
+        assert pool_after_warm_up["idle_connections"] == 2
+        assert len(accepted) == 2
+        assert stats["requests"] == 4
+        assert stats["peak_in_flight"] == 2
+        assert stats["first_request_seconds"] is not None
+    
+    async def test_warm_up_failure_not_raised(self):
+        """Test an unreachable host is reported, not raised."""
+        # Setup
+        def refuse(request):
+            raise httpx.ConnectError("connection refused", request=request)
+        
+        clients = SharedHTTPClients()
+        clients.client("retell", warm_url="https://retell.invalid", transport=httpx.MockTransport(refuse))
+        
+        # Execute
+        warmed = await clients.warm_up()
+        
+        # Assert
+        assert warmed == {"retell": None}
+        assert clients.stats()["hosts"]["retell"]["errors"] >= 1
+    
+    async def test_utilization_reported_for_active_requests(self):
+        """Test in-flight requests are visible in the metrics."""
+        # Setup
+        release = asyncio.Event()
+        
+        async def slow(request):
+            await release.wait()
+            return httpx.Response(200)
+        
+        clients = SharedHTTPClients()
+        client = clients.client("supabase", transport=httpx.MockTransport(slow))
+        
+        # Execute
+        request = asyncio.ensure_future(client.get("https://db.example/rest/v1/call_logs"))
+        await asyncio.sleep(0.01)
+        during = clients.stats()["hosts"]["supabase"]["in_flight"]
+        release.set()
+        await request
+        
+        # Assert
+        assert during == 1
+        assert clients.stats()["hosts"]["supabase"]["in_flight"] == 0
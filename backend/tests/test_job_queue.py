@@ -0,0 +1,137 @@
+"""
+Tests for the durable SQLite job queue.
+"""
+
+import pytest
+from job_queue import SQLiteJobQueue
+
+
+class TestSQLiteJobQueue:
+    """Test claiming, retry and dead-letter behaviour."""
+    
+    @pytest.fixture
+    def queue(self):
+        """In-memory queue with a short visibility timeout."""
+        queue = SQLiteJobQueue(
+            path=":memory:",
+            max_attempts=2,
+            visibility_timeout=60,
+            retry_base_seconds=10,
+            retry_max_seconds=40
+        )
+        yield queue
+        queue.close()
+    
+    def test_claimed_job_hidden_from_other_workers(self, queue):
+        """Test a claimed job is not handed out twice."""
+        # Setup
+        queue.enqueue("extract", {"call_id": "call-1"})
+        
+        # Execute
+        first = queue.claim()
+        second = queue.claim()
+        
+        # Assert
+        assert first["payload"] == {"call_id": "call-1"}
+        assert first["attempts"] == 1
+        assert second is None
+    
+    def test_expired_claim_becomes_visible_again(self, queue):
+        """Test a job whose worker died is claimable after the timeout."""
+        # Setup
+        queue.visibility_timeout = 0
+        queue.enqueue("extract", {"call_id": "call-1"})
+        queue.claim()
+        
+        # Execute
+        reclaimed = queue.claim()
+        
+        # Assert
+        assert reclaimed is not None
+        assert reclaimed["attempts"] == 2
+    
+    def test_expired_final_attempt_dead_lettered(self, queue):
+        """Test a job whose worker hung on its last attempt is not claimed again."""
+        # Setup
+        queue.visibility_timeout = 0
+        queue.enqueue("extract", {"call_id": "call-1"})
+        queue.claim()
+        queue.claim()
+        
+        # Execute
+        reclaimed = queue.claim()
+        
+        # Assert
+        assert reclaimed is None
+        assert queue.counts()["dead"] == 1
+        assert queue.dead_letters()[0]["last_error"] == "Visibility timeout expired on the final attempt"
+    
+    def test_extend_renews_lease(self, queue):
+        """Test extending a running job keeps it hidden."""
+        # Setup
+        job_id = queue.enqueue("extract", {"call_id": "call-1"})
+        queue.visibility_timeout = 0
+        queue.claim()
+        
+        # Execute
+        queue.visibility_timeout = 60
+        renewed = queue.extend(job_id)
+        
+        # Assert
+        assert renewed is True
+        assert queue.claim() is None
+    
+    def test_failed_job_scheduled_with_backoff(self, queue):
+        """Test a failure delays the next attempt."""
+        # Setup
+        job_id = queue.enqueue("extract", {"call_id": "call-1"})
+        queue.claim()
+        
+        # Execute
+        retrying = queue.fail(job_id, "timeout")
+        
+        # Assert
+        assert retrying is True
+        assert queue.claim() is None
+        assert queue.counts()["pending"] == 1
+    
+    def test_retry_delay_grows_exponentially_and_is_capped(self, queue):
+        """Test backoff doubles per attempt up to the maximum."""
+        # Execute
+        delays = [queue.retry_delay(attempt) for attempt in (1, 2, 3, 10)]
+        
+        # Assert
+        assert 5 <= delays[0] <= 10
+        assert 10 <= delays[1] <= 20
+        assert 20 <= delays[2] <= 40
+        assert delays[3] <= 40
+    
+    def test_final_failure_dead_letters_and_requeue(self, queue):
+        """Test jobs out of attempts are dead-lettered and can be requeued."""
+        # Setup
+        queue.retry_base_seconds = 0
+        job_id = queue.enqueue("extract", {"call_id": "call-1"})
+        queue.claim()
+        queue.fail(job_id, "error 1")
+        queue.claim()
+        
+        # Execute
+        retrying = queue.fail(job_id, "error 2")
+        
+        # Assert
+        assert retrying is False
+        assert queue.counts()["dead"] == 1
+        assert queue.requeue_dead() == 1
+        assert queue.claim()["attempts"] == 1
+    
+    def test_complete_removes_job(self, queue):
+        """Test completed jobs leave the queue."""
+        # Setup
+        job_id = queue.enqueue("extract", {"call_id": "call-1"})
+        queue.claim()
+        
+        # Execute
+        queue.complete(job_id)
+        
+        # Assert
+        assert queue.counts() == {"pending": 0, "running": 0, "dead": 0}
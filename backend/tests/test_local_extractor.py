@@ -0,0 +1,122 @@
+"""
+Tests for the CPU-only extraction backend and per-scenario backend selection.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from local_extractor import LocalCheckinExtractor
+from extractors import ScenarioExtractor
+from constants import CHECKIN_FIELDS
+
+
+class TestLocalCheckinExtractor:
+    """Test the local backend fills the whole check-in schema."""
+    
+    def test_clear_transcript(self):
+        """Test stated facts are extracted."""
+        # Setup
+        transcript = (
+            "Agent: Where are you?\n"
+            "Driver: I'm running late, stuck in heavy traffic on I-40 outside Flagstaff.\n"
+            "Agent: ETA?\n"
+            "Driver: Probably 3 PM today.\n"
+            "Agent: Don't forget the POD.\n"
+            "Driver: Got it."
+        )
+        
+        # Execute
+        result = LocalCheckinExtractor().extract(transcript)
+        
+        # Assert
+        assert result == {
+            "call_outcome": "In-Transit Update",
+            "driver_status": "Delayed",
+            "current_location": "I-40 outside Flagstaff",
+            "eta": "Today, 3:00 PM",
+            "delay_reason": "Heavy Traffic",
+            "unloading_status": "N/A",
+            "pod_reminder_acknowledged": True
+        }
+    
+    def test_conflicting_status_uses_latest_turn(self):
+        """Test the most recent driver turn decides a conflicting status."""
+        # Setup
+        extractor = LocalCheckinExtractor()
+        transcript = (
+            "Driver: I was driving all night.\n"
+            "Driver: Just got here, I'm in door 7 getting unloaded."
+        )
+        
+        # Execute
+        result = extractor.extract(transcript)
+        
+        # Assert
+        assert result["driver_status"] == "Unloading"
+        assert result["call_outcome"] == "Arrival Confirmation"
+        assert extractor.counts["status_from_last_turn"] == 1
+    
+    async def test_unclear_transcript_gets_defaults(self):
+        """Test a transcript with no usable facts still returns a valid result."""
+        # Execute
+        result = await LocalCheckinExtractor().extract_checkin_data("Driver: Hello?")
+        
+        # Assert
+        assert list(result) == CHECKIN_FIELDS
+        assert result["driver_status"] == "Driving"
+        assert result["current_location"] == "Unknown"
+
+
+class TestScenarioExtractor:
+    """Test each scenario is routed to its configured backend."""
+    
+    async def test_scenarios_routed_separately(self):
+        """Test check-ins can go to one backend and emergencies to another."""
+        # Setup
+        local = LocalCheckinExtractor()
+        remote = MagicMock()
+        remote.extract_checkin_data = AsyncMock()
+        router = ScenarioExtractor(
+            backends={"openai": remote, "local": local},
+            selection={"checkin": "local", "emergency": "openai"}
+        )
+        
+        # Execute
+        result = await router.extract_checkin_data("Driver: I'm driving on I-10 near Indio")
+        
+        # Assert
+        assert result["current_location"] == "I-10 near Indio"
+        assert local.counts["calls"] == 1
+        remote.extract_checkin_data.assert_not_called()
+    
+    async def test_emergency_forwarded_with_callback(self):
+        """Test emergency extraction keeps the streaming callback."""
+        # Setup
+        remote = MagicMock()
+        remote.extract_emergency_data = AsyncMock(return_value={"load_secure": True})
+        router = ScenarioExtractor(
+            backends={"openai": remote},
+            selection={"checkin": "openai", "emergency": "openai"}
+        )
+        on_field = AsyncMock()
+        
+        # Execute
+        result = await router.extract_emergency_data("Driver: crash", on_field=on_field)
+        
+        # Assert
+        assert result == {"load_secure": True}
+        remote.extract_emergency_data.assert_called_once_with("Driver: crash", on_field=on_field)
+    
+    def test_local_backend_rejected_for_emergency(self):
+        """Test a backend without the scenario's schema fails at startup."""
+        # Execute / Assert
+        with pytest.raises(ValueError, match="does not support the emergency scenario"):
+            ScenarioExtractor(
+                backends={"openai": MagicMock(), "local": LocalCheckinExtractor()},
+                selection={"checkin": "openai", "emergency": "local"}
+            )
+    
+    def test_unknown_backend_rejected(self):
+        """Test a misspelled backend name fails at startup."""
+        # Execute / Assert
+        with pytest.raises(ValueError, match="Unknown extraction backend"):
+            ScenarioExtractor(backends={}, selection={"checkin": "onnx", "emergency": "openai"})
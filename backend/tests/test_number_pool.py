@@ -0,0 +1,227 @@
+"""
+Tests for the outbound from-number pool.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from number_pool import FromNumberPool
+from constants import (
+    SCENARIO_CHECKIN,
+    FROM_NUMBER_SELECTION_ROUND_ROBIN
+)
+from exceptions import FromNumberUnavailableError, InvalidPhoneNumberError
+
+NUMBERS = "+14155550001,+14155550002,+14155550003"
+
+
+@patch.dict('os.environ', {'RETELL_FROM_NUMBERS': NUMBERS})
+class TestFromNumberPool:
+    """Test selection, per-number limits and cool-down."""
+    
+    async def test_least_loaded_spreads_calls(self):
+        """Test concurrent calls go to the number with the fewest active calls."""
+        # Setup
+        pool = FromNumberPool(max_concurrent=2)
+        
+        # Execute
+        picked = [await pool.acquire(0) for _ in range(6)]
+        
+        # Assert
+        assert sorted(picked) == sorted(NUMBERS.split(",") * 2)
+        assert all(number["active_calls"] == 2 for number in pool.stats()["numbers"].values())
+    
+    async def test_round_robin_rotates(self):
+        """Test round-robin hands out numbers in order, skipping full ones."""
+        # Setup
+        pool = FromNumberPool(max_concurrent=1, selection=FROM_NUMBER_SELECTION_ROUND_ROBIN)
+        first = await pool.acquire(0)
+        second = await pool.acquire(0)
+        pool.release(first)
+        
+        # Execute
+        third = await pool.acquire(0)
+        fourth = await pool.acquire(0)
+        
+        # Assert
+        assert (first, second, third, fourth) == (
+            "+14155550001", "+14155550002", "+14155550003", "+14155550001"
+        )
+    
+    async def test_unknown_selection(self):
+        """Test an unknown selection strategy is rejected."""
+        # Execute & Assert
+        with pytest.raises(ValueError):
+            FromNumberPool(selection="random")
+    
+    async def test_full_pool_times_out(self):
+        """Test acquire raises once every number is at its limit for the whole wait."""
+        # Setup
+        pool = FromNumberPool(max_concurrent=1)
+        for _ in range(3):
+            await pool.acquire(0)
+        
+        # Execute & Assert
+        with pytest.raises(FromNumberUnavailableError):
+            await pool.acquire(0.05)
+    
+    async def test_waiter_resumes_when_call_ends(self):
+        """Test a waiting caller gets the number freed by a call_ended webhook."""
+        # Setup
+        pool = FromNumberPool(max_concurrent=1)
+        for index in range(3):
+            pool.attach(await pool.acquire(0), f"retell-{index}")
+        waiter = asyncio.ensure_future(pool.acquire(5))
+        await asyncio.sleep(0)
+        
+        # Execute
+        assert pool.stats()["waiting"] == 1
+        assert pool.call_ended("retell-1") is True
+        
+        # Assert
+        assert await asyncio.wait_for(waiter, 1) == "+14155550002"
+        assert pool.call_ended("unknown-call") is False
+    
+    async def test_cooldown_after_consecutive_failures(self):
+        """Test a number failing repeatedly is skipped until its cool-down ends."""
+        # Setup
+        pool = FromNumberPool(max_concurrent=5, failure_threshold=2, cooldown_seconds=0.1)
+        
+        # Execute
+        with patch.dict('os.environ', {'RETELL_FROM_NUMBERS': '+14155550001'}):
+            for _ in range(2):
+                pool.release(await pool.acquire(0), failed=True)
+        cooling = [number for number, state in pool.stats()["numbers"].items() if state["cooling_down"]]
+        during = [await pool.acquire(0) for _ in range(4)]
+        await asyncio.sleep(0.15)
+        after = await pool.acquire(0)
+        
+        # Assert
+        assert cooling == ["+14155550001"]
+        assert "+14155550001" not in during
+        assert pool.stats()["numbers"]["+14155550001"]["cooldowns"] == 1
+        assert after == "+14155550001"
+    
+    async def test_success_resets_failures(self):
+        """Test only consecutive failures start a cool-down."""
+        # Setup
+        pool = FromNumberPool(max_concurrent=5, failure_threshold=2)
+        
+        # Execute
+        with patch.dict('os.environ', {'RETELL_FROM_NUMBERS': '+14155550001'}):
+            pool.release(await pool.acquire(0), failed=True)
+            pool.attach(await pool.acquire(0), "retell-1")
+            pool.release(await pool.acquire(0), failed=True)
+            pool.call_ended("retell-1", "dial_failed")
+            stats = pool.stats()["numbers"]["+14155550001"]
+        
+        # Assert
+        assert stats["failures"] == 3
+        assert stats["cooldowns"] == 1
+    
+    async def test_stale_calls_expire(self):
+        """Test a call whose end event never arrives stops holding its slot."""
+        # Setup
+        pool = FromNumberPool(max_concurrent=1, call_timeout_seconds=0.01)
+        with patch.dict('os.environ', {'RETELL_FROM_NUMBERS': '+14155550001'}):
+            pool.attach(await pool.acquire(0), "retell-lost")
+            await asyncio.sleep(0.02)
+            
+            # Execute
+            number = await pool.acquire(0)
+        
+        # Assert
+        assert number == "+14155550001"
+    
+    async def test_waiter_wakes_when_stale_call_expires(self):
+        """Test an unbounded wait resumes once a lost call's slot expires."""
+        # Setup
+        pool = FromNumberPool(max_concurrent=1, call_timeout_seconds=0.05)
+        with patch.dict('os.environ', {'RETELL_FROM_NUMBERS': '+14155550001'}):
+            pool.attach(await pool.acquire(0), "retell-lost")
+            
+            # Execute
+            number = await asyncio.wait_for(pool.acquire(None), 1)
+        
+        # Assert
+        assert number == "+14155550001"
+
+
+@patch.dict('os.environ', {'RETELL_FROM_NUMBERS': NUMBERS})
+class TestCallServiceFromNumbers:
+    """Test phone calls are placed from the pool."""
+    
+    @pytest.fixture
+    def call_service(self):
+        """Call service with its own pool and mocked dependencies."""
+        from services.call_service import CallService
+        service = CallService()
+        service.from_numbers = FromNumberPool(max_concurrent=1)
+        service.db_service = AsyncMock()
+        service.db_service.get_agent_id.return_value = "agent-123"
+        service.db_service.create_call_log.return_value = {"id": "call-uuid-123"}
+        service.retell_client = MagicMock()
+        service.retell_client.create_phone_call = AsyncMock(return_value={"call_id": "retell-789"})
+        return service
+    
+    async def initiate(self, call_service, driver_phone="+14155551234"):
+        """Initiate a check-in phone call."""
+        return await call_service.initiate_phone_call(
+            driver_name="John Doe",
+            driver_phone=driver_phone,
+            load_number="LOAD-456",
+            scenario_type=SCENARIO_CHECKIN
+        )
+    
+    async def test_call_holds_number_until_ended(self, call_service):
+        """Test a placed call keeps its number busy until call_ended."""
+        # Execute
+        await self.initiate(call_service)
+        
+        # Assert
+        from_number = call_service.retell_client.create_phone_call.call_args.kwargs["from_number"]
+        assert from_number in NUMBERS.split(",")
+        assert call_service.from_numbers.stats()["numbers"][from_number]["active_calls"] == 1
+        call_service.from_numbers.call_ended("retell-789")
+        assert call_service.from_numbers.stats()["numbers"][from_number]["active_calls"] == 0
+    
+    @pytest.mark.parametrize("status_code, message, failures", [
+        (400, "from_number is flagged as spam by the carrier", 1),
+        (403, "Call from +14155550001 rejected", 1),
+        (422, "to_number is not a valid phone number", 0),
+        (None, "Request timed out", 0)
+    ])
+    async def test_retell_error_frees_number(self, call_service, status_code, message, failures):
+        """Test a rejected call releases its slot, counting only number rejections as failures."""
+        # Setup
+        error = Exception(message)
+        error.status_code = status_code
+        call_service.retell_client.create_phone_call.side_effect = error
+        
+        # Execute
+        with patch.dict('os.environ', {'RETELL_FROM_NUMBERS': '+14155550001'}):
+            with pytest.raises(Exception):
+                await self.initiate(call_service)
+            numbers = call_service.from_numbers.stats()["numbers"].values()
+        
+        # Assert
+        assert sum(number["active_calls"] for number in numbers) == 0
+        assert sum(number["failures"] for number in numbers) == failures
+    
+    async def test_all_numbers_busy(self, call_service):
+        """Test a call fails with 503 when every number stays busy."""
+        # Setup
+        for _ in range(3):
+            await call_service.from_numbers.acquire(0)
+        
+        # Execute & Assert
+        with patch.dict('os.environ', {'FROM_NUMBER_ACQUIRE_WAIT_SECONDS': '0'}):
+            with pytest.raises(FromNumberUnavailableError):
+                await self.initiate(call_service)
+        call_service.db_service.create_call_log.assert_not_awaited()
+    
+    async def test_driver_phone_in_pool(self, call_service):
+        """Test calling any of the pool's numbers is rejected."""
+        # Execute & Assert
+        with pytest.raises(InvalidPhoneNumberError):
+            await self.initiate(call_service, driver_phone="+14155550002")
@@ -0,0 +1,152 @@
+"""
+Tests for the OpenAI rate governor.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from openai import APIConnectionError, APIStatusError
+from rate_limiter import RateGovernor, TokenBucket
+
+
+class FakeClock:
+    """Monotonic clock that only moves when something sleeps."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def monotonic(self):
+        return self.now
+    
+    async def sleep(self, delay):
+        self.now += delay
+
+
+def make_governor(**overrides):
+    """Build a governor with generous limits unless overridden."""
+    settings = {
+        "requests_per_minute": 6000,
+        "tokens_per_minute": 600000,
+        "max_retries": 3,
+        "retry_base_seconds": 1.0,
+        "retry_max_seconds": 30.0
+    }
+    settings.update(overrides)
+    return RateGovernor(**settings)
+
+
+class TestTokenBucket:
+    """Test bucket refill arithmetic."""
+    
+    def test_empty_bucket_reports_wait(self):
+        """Test the wait is the time needed to refill the shortfall."""
+        # Setup
+        bucket = TokenBucket(per_minute=600)
+        bucket.consume(600)
+        
+        # Execute
+        wait = bucket.time_until(10, bucket._updated)
+        
+        # Assert
+        assert wait == pytest.approx(1.0, rel=0.05)
+    
+    def test_oversized_request_capped_at_capacity(self):
+        """Test a request above capacity waits for a full bucket, not forever."""
+        # Setup
+        bucket = TokenBucket(per_minute=60)
+        
+        # Execute
+        wait = bucket.time_until(1000, bucket._updated)
+        
+        # Assert
+        assert wait == 0.0
+
+
+class TestRateGovernor:
+    """Test limiting and retry behavior."""
+    
+    async def test_waits_for_token_budget(self):
+        """Test a request larger than the remaining tokens sleeps first."""
+        # Setup
+        governor = make_governor(tokens_per_minute=6000)
+        governor.tokens.consume(6000)
+        
+        # Execute
+        with patch("rate_limiter.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            sleep.side_effect = lambda delay: governor.tokens.consume(-6000)
+            await governor.acquire(100)
+        
+        # Assert
+        sleep.assert_awaited_once()
+        assert sleep.call_args[0][0] == pytest.approx(1.0, rel=0.05)
+        assert governor.stats()["wait"]["count"] == 1
+    
+    async def test_429_retried_after_retry_after(self):
+        """Test throttled requests back off for at least Retry-After."""
+        # Setup
+        clock = FakeClock()
+        request = AsyncMock(side_effect=[
+            APIStatusError("slow down", status_code=429, headers={"retry-after": "2"}),
+            "ok"
+        ])
+        
+        # Execute
+        with patch("rate_limiter.time", clock), patch("rate_limiter.asyncio.sleep", clock.sleep):
+            governor = make_governor()
+            result = await governor.call(request, 100)
+        
+        # Assert
+        assert result == "ok"
+        assert 1002.0 <= clock.now <= 1003.0
+        stats = governor.stats()
+        assert stats["throttled"] == 1
+        assert stats["retried"] == 1
+        assert stats["sent"] == 2
+    
+    async def test_connection_error_retried(self):
+        """Test transient connection failures are retried."""
+        # Setup
+        governor = make_governor()
+        request = AsyncMock(side_effect=[APIConnectionError("reset"), "ok"])
+        
+        # Execute
+        with patch("rate_limiter.asyncio.sleep", new_callable=AsyncMock):
+            result = await governor.call(request, 100)
+        
+        # Assert
+        assert result == "ok"
+    
+    async def test_client_error_not_retried(self):
+        """Test a 400 is raised immediately."""
+        # Setup
+        governor = make_governor()
+        request = AsyncMock(side_effect=APIStatusError("bad request", status_code=400))
+        
+        # Execute & Assert
+        with pytest.raises(APIStatusError):
+            await governor.call(request, 100)
+        request.assert_awaited_once()
+        assert governor.stats()["failed"] == 1
+    
+    async def test_retries_exhausted(self):
+        """Test the error surfaces after max_retries retries."""
+        # Setup
+        governor = make_governor(max_retries=2)
+        request = AsyncMock(side_effect=APIStatusError("down", status_code=503))
+        
+        # Execute & Assert
+        with patch("rate_limiter.asyncio.sleep", new_callable=AsyncMock):
+            with pytest.raises(APIStatusError):
+                await governor.call(request, 100)
+        assert request.await_count == 3
+    
+    async def test_reported_usage_corrects_estimate(self):
+        """Test the token bucket is charged actual usage, not the estimate."""
+        # Setup
+        governor = make_governor(tokens_per_minute=10000)
+        request = AsyncMock(return_value=MagicMock(usage=MagicMock(total_tokens=400)))
+        
+        # Execute
+        await governor.call(request, 1000)
+        
+        # Assert
+        assert governor.tokens.available == pytest.approx(9600, abs=5)
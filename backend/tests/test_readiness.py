@@ -0,0 +1,192 @@
+"""
+Tests for concurrent agent provisioning and the readiness gate.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+from fastapi.testclient import TestClient
+from readiness import ReadinessGate
+from constants import SCENARIO_CHECKIN, SCENARIO_EMERGENCY
+from exceptions import AgentConfigurationError, AgentNotReadyError
+
+
+class TestReadinessGate:
+    """Test callers wait for provisioning and state is reported."""
+    
+    async def test_wait_released_when_ready(self):
+        """Test a waiting caller resumes as soon as the agent is ready."""
+        # Setup
+        gate = ReadinessGate()
+        gate.start(SCENARIO_CHECKIN)
+        
+        # Execute
+        waiter = asyncio.ensure_future(gate.wait(SCENARIO_CHECKIN, timeout=5))
+        await asyncio.sleep(0)
+        gate.finish(SCENARIO_CHECKIN, "agent-1")
+        
+        # Assert
+        assert await waiter is True
+        state = gate.status()["scenarios"][SCENARIO_CHECKIN]
+        assert state["status"] == "ready"
+        assert state["agent_id"] == "agent-1"
+        assert state["duration_seconds"] >= 0
+    
+    async def test_wait_times_out_while_provisioning(self):
+        """Test the wait is bounded."""
+        # Setup
+        gate = ReadinessGate()
+        gate.start(SCENARIO_CHECKIN)
+        
+        # Execute / Assert
+        assert await gate.wait(SCENARIO_CHECKIN, timeout=0.01) is False
+    
+    async def test_never_started_does_not_wait(self):
+        """Test scenarios that are not being provisioned pass straight through."""
+        # Execute / Assert
+        assert await ReadinessGate().wait(SCENARIO_CHECKIN, timeout=10) is True
+    
+    def test_status_not_ready_until_all_scenarios(self):
+        """Test overall readiness needs every scenario, and failures are reported."""
+        # Setup
+        gate = ReadinessGate()
+        gate.start(SCENARIO_CHECKIN)
+        gate.start(SCENARIO_EMERGENCY)
+        gate.finish(SCENARIO_CHECKIN, "agent-1")
+        gate.finish(SCENARIO_EMERGENCY, None)
+        
+        # Execute
+        status = gate.status()
+        
+        # Assert
+        assert status["ready"] is False
+        assert status["scenarios"][SCENARIO_EMERGENCY]["status"] == "failed"
+        assert status["scenarios"][SCENARIO_EMERGENCY]["error"]
+
+
+class TestAgentInitialization:
+    """Test scenarios are provisioned concurrently."""
+    
+    async def test_scenarios_provisioned_concurrently(self):
+        """Test both agents are provisioned at the same time."""
+        # Setup
+        import startup
+        gate = ReadinessGate()
+        in_flight = []
+        peak = []
+        
+        async def ensure(scenario_type, system_prompt):
+            in_flight.append(scenario_type)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(scenario_type)
+            return f"agent-{scenario_type}"
+        
+        # Execute
+        with patch.object(startup, "readiness", gate), patch.object(startup, "ensure_agent_exists", ensure):
+            await startup.initialize_agents()
+        
+        # Assert
+        assert max(peak) == 2
+        assert gate.status()["ready"] is True
+    
+    async def test_provisioning_error_reported(self):
+        """Test the readiness gate reports why provisioning failed."""
+        # Setup
+        import startup
+        gate = ReadinessGate()
+        ensure = AsyncMock(side_effect=RuntimeError("Retell API key rejected"))
+        
+        # Execute
+        with patch.object(startup, "readiness", gate), patch.object(startup, "ensure_agent_exists", ensure):
+            await startup.initialize_agents()
+        
+        # Assert
+        state = gate.status()["scenarios"][SCENARIO_CHECKIN]
+        assert state["status"] == "failed"
+        assert state["error"] == "Retell API key rejected"
+
+
+class TestCallInitiationGate:
+    """Test call initiation waits on the gate."""
+    
+    @pytest.fixture
+    def call_service(self):
+        """Get call service with a mocked database."""
+        from services.call_service import CallService
+        service = CallService()
+        service.db_service = AsyncMock()
+        return service
+    
+    async def test_waits_for_provisioning(self, call_service):
+        """Test a call during provisioning gets the agent once it is created."""
+        # Setup
+        gate = ReadinessGate()
+        gate.start(SCENARIO_CHECKIN)
+        agent_ids = {}
+        call_service.db_service.get_agent_id.side_effect = lambda scenario: agent_ids.get(scenario)
+        
+        async def provision():
+            await asyncio.sleep(0.01)
+            agent_ids[SCENARIO_CHECKIN] = "agent-1"
+            gate.finish(SCENARIO_CHECKIN, "agent-1")
+        
+        # Execute
+        with patch("services.call_service.readiness", gate):
+            asyncio.ensure_future(provision())
+            agent_id = await call_service._get_agent_id(SCENARIO_CHECKIN)
+        
+        # Assert
+        assert agent_id == "agent-1"
+    
+    async def test_not_ready_after_wait(self, call_service):
+        """Test a call is refused with 503 if provisioning outlasts the wait."""
+        # Setup
+        gate = ReadinessGate()
+        gate.start(SCENARIO_CHECKIN)
+        call_service.db_service.get_agent_id.return_value = None
+        
+        # Execute / Assert
+        with patch("services.call_service.readiness", gate), \
+                patch("services.call_service.AGENT_READY_WAIT_SECONDS", 0.01):
+            with pytest.raises(AgentNotReadyError) as error:
+                await call_service._get_agent_id(SCENARIO_CHECKIN)
+        assert error.value.status_code == 503
+    
+    async def test_failed_provisioning_reports_configuration_error(self, call_service):
+        """Test a failed provisioning still surfaces as a configuration error."""
+        # Setup
+        gate = ReadinessGate()
+        gate.start(SCENARIO_CHECKIN)
+        gate.finish(SCENARIO_CHECKIN, None)
+        call_service.db_service.get_agent_id.return_value = None
+        
+        # Execute / Assert
+        with patch("services.call_service.readiness", gate):
+            with pytest.raises(AgentConfigurationError):
+                await call_service._get_agent_id(SCENARIO_CHECKIN)
+
+
+class TestReadyRoute:
+    """Test the /ready endpoint."""
+    
+    def test_ready_reports_state(self):
+        """Test /ready returns 503 with per-scenario state until all are ready."""
+        # Setup
+        from main import app
+        gate = ReadinessGate()
+        gate.start(SCENARIO_CHECKIN)
+        
+        # Execute
+        with patch("main.readiness", gate):
+            pending = TestClient(app).get("/ready")
+            gate.finish(SCENARIO_CHECKIN, "agent-1")
+            gate.start(SCENARIO_EMERGENCY)
+            gate.finish(SCENARIO_EMERGENCY, "agent-2")
+            ready = TestClient(app).get("/ready")
+        
+        # Assert
+        assert pending.status_code == 503
+        assert pending.json()["scenarios"][SCENARIO_CHECKIN]["status"] == "provisioning"
+        assert ready.status_code == 200
+        assert ready.json()["scenarios"][SCENARIO_EMERGENCY]["agent_id"] == "agent-2"
@@ -0,0 +1,223 @@
+"""
+Tests for hedged emergency extraction requests.
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from request_hedging import RequestHedger
+
+
+EMERGENCY_RESULT = {
+    "call_outcome": "Emergency Escalation",
+    "emergency_type": "Accident",
+    "safety_status": "Driver confirmed everyone is safe",
+    "injury_status": "No injuries reported",
+    "emergency_location": "I-15 North, Mile Marker 123",
+    "load_secure": True,
+    "escalation_status": "Connected to Human Dispatcher"
+}
+
+
+def warmed_hedger(max_rate: float = 1.0, trigger: float = 0.01) -> RequestHedger:
+    """Get a hedger whose p90 trigger is already known."""
+    hedger = RequestHedger(percentile=90, max_rate=max_rate, min_samples=5)
+    for _ in range(50):
+        hedger.request_latency.record(trigger)
+    return hedger
+
+
+def slow_then_fast(delays):
+    """Get a request factory whose successive copies take the given delays."""
+    calls = []
+    
+    async def request():
+        index = len(calls)
+        calls.append(index)
+        await asyncio.sleep(delays[index])
+        return f"copy-{index}"
+    
+    return request, calls
+
+
+class TestRequestHedger:
+    """Test hedges are sent after the trigger and capped by the budget."""
+    
+    async def test_fast_request_not_hedged(self):
+        """Test a request finishing before the trigger is sent once."""
+        # Setup
+        hedger = warmed_hedger(trigger=0.05)
+        request, calls = slow_then_fast([0, 0])
+        
+        # Execute
+        result = await hedger.run(request)
+        
+        # Assert
+        assert result == "copy-0"
+        assert calls == [0]
+        assert hedger.counts["hedged"] == 0
+    
+    async def test_hedge_wins_and_primary_cancelled(self):
+        """Test a slow request is resent and the faster copy is used."""
+        # Setup
+        hedger = warmed_hedger()
+        cancelled = asyncio.Event()
+        
+        async def request():
+            if not hedger.counts["hedged"]:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return "hedge"
+        
+        # Execute
+        result = await hedger.run(request)
+        await asyncio.sleep(0)
+        
+        # Assert
+        assert result == "hedge"
+        assert cancelled.is_set()
+        assert hedger.stats()["hedge_wins"] == 1
+        assert hedger.stats()["hedge_win_rate"] == 1.0
+    
+    async def test_cancelled_copy_latency_recorded(self):
+        """Test the losing copy's elapsed time still feeds the trigger."""
+        # Setup
+        hedger = warmed_hedger(trigger=0.02)
+        request, calls = slow_then_fast([10, 0.02])
+        samples = hedger.request_latency.count
+        
+        # Execute
+        await hedger.run(request)
+        await asyncio.sleep(0)
+        
+        # Assert
+        assert hedger.counts["hedge_wins"] == 1
+        assert hedger.request_latency.count == samples + 2
+        assert hedger.request_latency.percentile(100) >= 0.04
+    
+    async def test_primary_can_still_win(self):
+        """Test the original is kept when it finishes before the hedge."""
+        # Setup
+        hedger = warmed_hedger()
+        request, calls = slow_then_fast([0.03, 1])
+        
+        # Execute
+        result = await hedger.run(request)
+        
+        # Assert
+        assert result == "copy-0"
+        assert calls == [0, 1]
+        assert hedger.counts["primary_wins"] == 1
+    
+    async def test_failed_copy_falls_back_to_other(self):
+        """Test an error from one copy waits for the other copy."""
+        # Setup
+        hedger = warmed_hedger()
+        attempts = []
+        
+        async def request():
+            attempts.append(1)
+            if len(attempts) == 1:
+                await asyncio.sleep(0.03)
+                raise RuntimeError("upstream reset")
+            await asyncio.sleep(0.05)
+            return "hedge"
+        
+        # Execute
+        result = await hedger.run(request)
+        
+        # Assert
+        assert result == "hedge"
+    
+    async def test_hedge_rate_capped(self):
+        """Test the budget only allows max_rate of requests to be hedged."""
+        # Setup
+        hedger = warmed_hedger(max_rate=0.5)
+        
+        async def request():
+            await asyncio.sleep(0.03)
+            return "done"
+        
+        # Execute
+        for _ in range(4):
+            await hedger.run(request)
+        
+        # Assert
+        assert hedger.counts["hedged"] == 2
+        assert hedger.counts["skipped_budget"] == 2
+        assert hedger.stats()["hedge_rate"] == 0.5
+    
+    async def test_not_hedged_while_warming_up(self):
+        """Test no hedge is sent before enough latency samples exist."""
+        # Setup
+        hedger = RequestHedger(percentile=90, max_rate=1.0, min_samples=5)
+        request, calls = slow_then_fast([0.02])
+        
+        # Execute
+        await hedger.run(request)
+        
+        # Assert
+        assert hedger.trigger_seconds() is None
+        assert calls == [0]
+
+
+class TestHedgedEmergencyExtraction:
+    """Test the extractor hedges emergency requests only."""
+    
+    @pytest.fixture
+    def extractor(self):
+        """Get an extractor with a warmed-up emergency hedger."""
+        from openai_client import OpenAIExtractor
+        extractor = OpenAIExtractor()
+        extractor.emergency_hedger = warmed_hedger()
+        extractor.client = MagicMock()
+        return extractor
+    
+    async def test_slow_emergency_request_hedged(self, extractor):
+        """Test a stalled emergency request is answered by its hedge."""
+        # Setup
+        response = MagicMock(choices=[MagicMock(message=MagicMock(content=json.dumps(EMERGENCY_RESULT)))])
+        calls = []
+        
+        async def create(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                await asyncio.sleep(10)
+            return response
+        
+        extractor.client.chat.completions.create = create
+        
+        # Execute
+        result = await extractor.extract_emergency_data("Driver: I had an accident on I-15")
+        
+        # Assert
+        assert result == EMERGENCY_RESULT
+        assert len(calls) == 2
+        assert calls[0] == calls[1]
+        assert extractor.hedging_stats()["hedge_wins"] == 1
+    
+    async def test_checkin_not_hedged(self, extractor):
+        """Test check-in extractions bypass the hedger."""
+        # Setup
+        extractor.fast_path_threshold = 2.0
+        extractor.client.chat.completions.create = AsyncMock(return_value=MagicMock(
+            choices=[MagicMock(message=MagicMock(content=json.dumps({
+                "call_outcome": "In-Transit Update",
+                "driver_status": "Driving",
+                "current_location": "I-10",
+                "eta": "N/A",
+                "delay_reason": "None",
+                "unloading_status": "N/A",
+                "pod_reminder_acknowledged": False
+            })))]
+        ))
+        
+        # Execute
+        await extractor.extract_checkin_data("Driver: I'm on I-10")
+        
+        # Assert
+        assert extractor.hedging_stats()["requests"] == 0
@@ -0,0 +1,116 @@
+"""
+Tests for hash-diffed Retell provisioning.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from retell_sync import agent_spec, content_hash, llm_spec, sync_retell_agent
+from constants import SCENARIO_CHECKIN
+
+
+def synced_config(prompt: str = "Prompt v1") -> dict:
+    """Get a configuration whose hashes match what is provisioned."""
+    hashes = {name: content_hash(value) for name, value in llm_spec(prompt).items()}
+    hashes["agent"] = content_hash(agent_spec(SCENARIO_CHECKIN, "llm-1"))
+    return {
+        "system_prompt": prompt,
+        "llm_id": "llm-1",
+        "agent_id": "agent-1",
+        "retell_hashes": hashes
+    }
+
+
+class TestRetellSync:
+    """Test Retell is only called for parts that changed."""
+    
+    @pytest.fixture
+    def retell(self):
+        """Get a mocked Retell client."""
+        retell = MagicMock()
+        retell.create_llm = AsyncMock(return_value="llm-1")
+        retell.update_llm = AsyncMock()
+        retell.create_agent = AsyncMock(return_value={"agent_id": "agent-1"})
+        retell.update_agent = AsyncMock()
+        return retell
+    
+    def test_content_hash_ignores_key_order(self):
+        """Test equal settings hash the same regardless of key order."""
+        # Execute / Assert
+        assert content_hash({"a": 1, "b": [1, 2]}) == content_hash({"b": [1, 2], "a": 1})
+        assert content_hash({"a": 1}) != content_hash({"a": 2})
+    
+    async def test_steady_state_makes_no_calls(self, retell):
+        """Test an unchanged configuration makes no Retell or database writes."""
+        # Setup
+        db = AsyncMock()
+        
+        # Execute
+        report = await sync_retell_agent(SCENARIO_CHECKIN, "Prompt v1", synced_config(), retell, db)
+        
+        # Assert
+        assert report["llm"] == report["agent"] == "unchanged"
+        assert report["changed"] == []
+        retell.update_llm.assert_not_called()
+        retell.update_agent.assert_not_called()
+        retell.create_llm.assert_not_called()
+        db.save_configuration.assert_not_called()
+    
+    async def test_prompt_change_pushes_prompt_only(self, retell):
+        """Test only the changed prompt is sent and its hash stored."""
+        # Setup
+        db = AsyncMock()
+        
+        # Execute
+        report = await sync_retell_agent(SCENARIO_CHECKIN, "Prompt v2", synced_config(), retell, db)
+        
+        # Assert
+        assert report["llm"] == "updated"
+        assert report["changed"] == ["general_prompt"]
+        retell.update_llm.assert_called_once_with(llm_id="llm-1", general_prompt="Prompt v2")
+        retell.update_agent.assert_not_called()
+        saved = db.save_configuration.call_args.args[1]["retell_hashes"]
+        assert saved["general_prompt"] == content_hash("Prompt v2")
+    
+    async def test_legacy_config_synced_once(self, retell):
+        """Test a configuration without hashes is pushed once and then skipped."""
+        # Setup
+        config = {"system_prompt": "Prompt v1", "llm_id": "llm-1", "agent_id": "agent-1"}
+        db = AsyncMock()
+        
+        # Execute
+        first = await sync_retell_agent(SCENARIO_CHECKIN, "Prompt v1", config, retell, db)
+        config["retell_hashes"] = db.save_configuration.call_args.args[1]["retell_hashes"]
+        second = await sync_retell_agent(SCENARIO_CHECKIN, "Prompt v1", config, retell, db)
+        
+        # Assert
+        assert first["changed"] == ["general_prompt", "general_tools", "model", "agent"]
+        assert second["changed"] == []
+        retell.update_llm.assert_called_once()
+        retell.update_agent.assert_called_once()
+    
+    async def test_missing_resources_created(self, retell):
+        """Test a new configuration creates the LLM and agent and stores IDs."""
+        # Setup
+        db = AsyncMock()
+        
+        # Execute
+        report = await sync_retell_agent(SCENARIO_CHECKIN, "Prompt v1", {}, retell, db)
+        
+        # Assert
+        assert report["llm"] == report["agent"] == "created"
+        assert report["agent_id"] == "agent-1"
+        db.save_configuration.assert_any_call(SCENARIO_CHECKIN, {"llm_id": "llm-1"})
+        final = db.save_configuration.call_args.args[1]
+        assert final["agent_id"] == "agent-1"
+        assert final["retell_hashes"] == synced_config()["retell_hashes"]
+    
+    async def test_failed_update_keeps_old_hashes(self, retell):
+        """Test hashes are not stored when Retell rejects the update."""
+        # Setup
+        db = AsyncMock()
+        retell.update_llm.side_effect = Exception("Retell unavailable")
+        
+        # Execute / Assert
+        with pytest.raises(Exception, match="Retell unavailable"):
+            await sync_retell_agent(SCENARIO_CHECKIN, "Prompt v2", synced_config(), retell, db)
+        db.save_configuration.assert_not_called()
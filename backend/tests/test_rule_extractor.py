@@ -0,0 +1,151 @@
+"""
+Tests for the rule-based check-in fast path.
+"""
+
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from constants import CHECKIN_FIELDS
+from rule_extractor import RuleBasedCheckinExtractor
+
+
+IN_TRANSIT_CALL = (
+    "Agent: Hi John, this is dispatch about load 7891. What's your status?\n"
+    "User: I'm driving, on I-10 near Indio right now.\n"
+    "Agent: What's your ETA?\n"
+    "User: Should be there tomorrow around 8 AM.\n"
+    "Agent: Please remember to send the POD after delivery.\n"
+    "User: Will do."
+)
+
+MODEL_RESULT = {
+    "call_outcome": "In-Transit Update",
+    "driver_status": "Delayed",
+    "current_location": "I-40 near Flagstaff, AZ",
+    "eta": "Today, 5:00 PM",
+    "delay_reason": "Weather",
+    "unloading_status": "N/A",
+    "pod_reminder_acknowledged": False
+}
+
+
+def make_completion(content):
+    """Build a chat completion response with the given message content."""
+    return MagicMock(choices=[MagicMock(message=MagicMock(content=content))])
+
+
+class TestRuleBasedCheckinExtractor:
+    """Test field rules and confidence scores."""
+    
+    @pytest.fixture
+    def extractor(self):
+        """Get a rule-based extractor."""
+        return RuleBasedCheckinExtractor()
+    
+    def test_in_transit_call_fully_resolved(self, extractor):
+        """Test a plainly stated in-transit update fills every field."""
+        # Execute
+        guesses = extractor.extract(IN_TRANSIT_CALL)
+        
+        # Assert
+        values = {field: guess.value for field, guess in guesses.items()}
+        assert values == {
+            "call_outcome": "In-Transit Update",
+            "driver_status": "Driving",
+            "current_location": "I-10 near Indio",
+            "eta": "Tomorrow, 8:00 AM",
+            "delay_reason": "None",
+            "unloading_status": "N/A",
+            "pod_reminder_acknowledged": True
+        }
+        assert min(guess.confidence for guess in guesses.values()) >= 0.8
+    
+    def test_arrival_with_door(self, extractor):
+        """Test arrival calls pick up the dock door and skip the ETA."""
+        # Execute
+        guesses = extractor.extract("Agent: Status?\nUser: I just got here, I'm in door 42.")
+        
+        # Assert
+        assert guesses["driver_status"].value == "Unloading"
+        assert guesses["call_outcome"].value == "Arrival Confirmation"
+        assert guesses["unloading_status"].value == "In Door 42"
+        assert guesses["eta"].value == "N/A"
+    
+    def test_conflicting_status_unresolved(self, extractor):
+        """Test arrival and in-transit cues together leave the call to the LLM."""
+        # Execute
+        guesses = extractor.extract("User: I arrived at the shipper and I'm driving to the receiver now.")
+        
+        # Assert
+        assert guesses["driver_status"].confidence == 0
+        assert guesses["call_outcome"].confidence == 0
+    
+    def test_negated_delay_ignored(self, extractor):
+        """Test "not delayed" does not classify the driver as delayed."""
+        # Execute
+        guesses = extractor.extract("User: I'm not delayed, still rolling on I-40.")
+        
+        # Assert
+        assert guesses["driver_status"].value == "Driving"
+    
+    def test_highway_without_place_is_low_confidence(self, extractor):
+        """Test a bare highway number is below the default threshold."""
+        # Execute
+        guesses = extractor.extract("User: I'm driving on I-40.")
+        
+        # Assert
+        assert guesses["current_location"].value == "I-40"
+        assert guesses["current_location"].confidence < 0.8
+
+
+class TestFastPathRouting:
+    """Test the OpenAI extractor only asks the model for unresolved fields."""
+    
+    @pytest.fixture
+    def extractor(self):
+        """Get an extractor with a mocked completions client."""
+        from openai_client import OpenAIExtractor
+        extractor = OpenAIExtractor()
+        extractor.client = MagicMock()
+        extractor.client.chat.completions.create = AsyncMock(
+            return_value=make_completion(json.dumps(MODEL_RESULT))
+        )
+        return extractor
+    
+    async def test_fully_resolved_call_skips_model(self, extractor):
+        """Test a fully resolved call never reaches the API."""
+        # Execute
+        result = await extractor.extract_checkin_data(IN_TRANSIT_CALL)
+        
+        # Assert
+        assert list(result) == CHECKIN_FIELDS
+        extractor.client.chat.completions.create.assert_not_awaited()
+        stats = extractor.fast_path_stats()
+        assert stats["resolved_locally"] == 1
+        assert stats["local_share"] == 1.0
+    
+    async def test_low_confidence_fields_sent_to_model(self, extractor):
+        """Test only unresolved fields appear in the prompt and are merged back."""
+        # Execute
+        result = await extractor.extract_checkin_data(
+            "User: I'm driving on I-40, should arrive at 3 PM today."
+        )
+        
+        # Assert
+        prompt = extractor.client.chat.completions.create.call_args.kwargs["messages"][1]["content"]
+        assert '"current_location"' in prompt
+        assert '"driver_status"' not in prompt
+        assert result["current_location"] == "I-40 near Flagstaff, AZ"
+        assert result["driver_status"] == "Driving"
+        assert result["eta"] == "Today, 3:00 PM"
+        assert extractor.fast_path_stats()["partial_llm"] == 1
+    
+    async def test_ambiguous_call_sent_whole(self, extractor):
+        """Test calls without a clear driver status use the full prompt."""
+        # Execute
+        await extractor.extract_checkin_data("User: Hello? Can you hear me?")
+        
+        # Assert
+        prompt = extractor.client.chat.completions.create.call_args.kwargs["messages"][1]["content"]
+        assert '"driver_status"' in prompt
+        assert extractor.fast_path_stats()["full_llm"] == 1
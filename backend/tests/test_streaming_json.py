@@ -0,0 +1,105 @@
+"""
+Tests for incremental JSON parsing and live call events.
+"""
+
+import json
+import pytest
+from streaming_json import IncrementalObjectParser
+from call_events import CallEventBroker
+
+
+class TestIncrementalObjectParser:
+    """Test fields are reported as soon as their values complete."""
+    
+    def test_fields_completed_char_by_char(self):
+        """Test a character-at-a-time stream yields every field once, in order."""
+        # Setup
+        payload = {"emergency_type": "Accident", "load_secure": True, "note": None, "miles": 12.5}
+        parser = IncrementalObjectParser()
+        
+        # Execute
+        completed = []
+        for char in json.dumps(payload):
+            completed.extend(parser.feed(char))
+        
+        # Assert
+        assert completed == list(payload.items())
+        assert parser.result == payload
+        assert parser.done
+    
+    def test_field_reported_before_object_closes(self):
+        """Test a string value is available before the rest of the object arrives."""
+        # Setup
+        parser = IncrementalObjectParser()
+        
+        # Execute
+        first = parser.feed('{"emergency_type": "Acc')
+        second = parser.feed('ident", "safety_st')
+        
+        # Assert
+        assert first == []
+        assert second == [("emergency_type", "Accident")]
+        assert not parser.done
+    
+    def test_number_waits_for_delimiter(self):
+        """Test a number at the end of a chunk is not reported until it ends."""
+        # Setup
+        parser = IncrementalObjectParser()
+        
+        # Execute
+        first = parser.feed('{"miles": 12')
+        second = parser.feed('3}')
+        
+        # Assert
+        assert first == []
+        assert second == [("miles", 123)]
+    
+    def test_non_object_rejected(self):
+        """Test text that is not a JSON object raises ValueError."""
+        # Execute & Assert
+        with pytest.raises(ValueError):
+            IncrementalObjectParser().feed('["Accident"]')
+
+
+class TestCallEventBroker:
+    """Test per-call event fan-out."""
+    
+    def test_publish_reaches_only_that_call(self):
+        """Test subscribers receive events for their own call only."""
+        # Setup
+        broker = CallEventBroker()
+        queue = broker.subscribe("call-1")
+        other = broker.subscribe("call-2")
+        
+        # Execute
+        broker.publish("call-1", {"type": "field"})
+        
+        # Assert
+        assert queue.get_nowait() == {"type": "field"}
+        assert other.empty()
+    
+    def test_full_queue_drops_oldest(self):
+        """Test a slow subscriber loses its oldest event instead of blocking."""
+        # Setup
+        broker = CallEventBroker(queue_size=2)
+        queue = broker.subscribe("call-1")
+        
+        # Execute
+        for index in range(3):
+            broker.publish("call-1", {"index": index})
+        
+        # Assert
+        assert [queue.get_nowait()["index"] for _ in range(2)] == [1, 2]
+        assert broker.stats()["dropped"] == 1
+    
+    def test_unsubscribe_removes_call(self):
+        """Test the last unsubscribe forgets the call."""
+        # Setup
+        broker = CallEventBroker()
+        queue = broker.subscribe("call-1")
+        
+        # Execute
+        broker.unsubscribe("call-1", queue)
+        
+        # Assert
+        assert broker.stats()["calls"] == 0
@@ -0,0 +1,126 @@
+"""
+Tests for transcript compaction and chunking before extraction.
+"""
+
+from transcripts import chunk_transcript, compact_transcript, count_tokens
+
+
+class TestCompactTranscript:
+    """Test filler removal, repeat collapsing and the token budget."""
+    
+    def test_speakers_normalized_and_continuations_joined(self):
+        """Test Retell labels map to Agent / Driver and wrapped lines rejoin."""
+        # Setup
+        transcript = "agent: Where are you?\nUser: On I-10 near\nIndio, mile marker 142."
+        
+        # Execute
+        result = compact_transcript(transcript, 1000)
+        
+        # Assert
+        assert result == "Agent: Where are you?\nDriver: On I-10 near Indio, mile marker 142."
+    
+    def test_filler_and_backchannel_turns_dropped(self):
+        """Test hesitation words and backchannel-only turns are removed."""
+        # Setup
+        transcript = (
+            "Agent: I'm calling about load 7891.\n"
+            "User: mm-hmm\n"
+            "User: Um, uh, I'm running late.\n"
+            "Agent: Okay."
+        )
+        
+        # Execute
+        result = compact_transcript(transcript, 1000)
+        
+        # Assert
+        assert result == "Agent: I'm calling about load 7891.\nDriver: I'm running late."
+    
+    def test_backchannel_answering_question_kept(self):
+        """Test a bare "yeah" that answers a question is kept."""
+        # Setup
+        transcript = "Agent: Is the load secure?\nUser: Yeah."
+        
+        # Execute
+        result = compact_transcript(transcript, 1000)
+        
+        # Assert
+        assert result.endswith("Driver: Yeah.")
+    
+    def test_repeated_utterances_collapsed(self):
+        """Test repeated greetings from the same speaker are kept once."""
+        # Setup
+        transcript = "Agent: Hello, this is dispatch.\nUser: Hi.\nAgent: Hello, this is dispatch!"
+        
+        # Execute
+        result = compact_transcript(transcript, 1000)
+        
+        # Assert
+        assert result.count("this is dispatch") == 1
+    
+    def test_budget_keeps_opening_and_latest_turns(self):
+        """Test long transcripts are cut to the budget around an omission marker."""
+        # Setup
+        turns = ["Agent: This is dispatch calling about load 7891."]
+        for i in range(100):
+            turns.append(f"Agent: Update number {i}, what changed?")
+            turns.append(f"User: Status report {i}, still moving along.")
+        transcript = "\n".join(turns)
+        
+        # Execute
+        result = compact_transcript(transcript, 200)
+        
+        # Assert
+        assert count_tokens(result) <= 200
+        assert result.startswith("Agent: This is dispatch calling about load 7891.")
+        assert "turns omitted" in result
+        assert result.endswith("Driver: Status report 99, still moving along.")
+
+
+class TestChunkTranscript:
+    """Test splitting long transcripts on turn boundaries."""
+    
+    @staticmethod
+    def make_transcript(turns):
+        """Build a compacted transcript of numbered turns."""
+        return "\n".join(
+            f"{'Agent' if index % 2 else 'Driver'}: turn {index} about the load on the road"
+            for index in range(turns)
+        )
+    
+    def test_short_transcript_single_chunk(self):
+        """Test a transcript within the chunk size is returned whole."""
+        # Setup
+        transcript = self.make_transcript(3)
+        
+        # Execute
+        chunks = chunk_transcript(transcript, 1000)
+        
+        # Assert
+        assert chunks == [transcript]
+    
+    def test_chunks_fit_budget_and_overlap_one_turn(self):
+        """Test chunks stay within budget and repeat the previous chunk's last turn."""
+        # Setup
+        transcript = self.make_transcript(20)
+        
+        # Execute
+        chunks = chunk_transcript(transcript, 40)
+        
+        # Assert
+        assert len(chunks) > 1
+        for previous, chunk in zip(chunks, chunks[1:]):
+            assert chunk.splitlines()[0] == previous.splitlines()[-1]
+        assert all(count_tokens(chunk) <= 40 for chunk in chunks)
+        assert chunks[-1].splitlines()[-1] == transcript.splitlines()[-1]
+    
+    def test_appending_turns_keeps_earlier_chunks(self):
+        """Test a growing transcript only changes its last chunk."""
+        # Setup
+        transcript = self.make_transcript(20)
+        
+        # Execute
+        before = chunk_transcript(transcript, 40)
+        after = chunk_transcript(transcript + "\nDriver: one more turn", 40)
+        
+        # Assert
+        assert after[:len(before) - 1] == before[:-1]
@@ -2,13 +2,15 @@
 Tests for webhook service - processes Retell webhook events.
 """
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from constants import (
     CALL_STATUS_IN_PROGRESS,
     CALL_STATUS_COMPLETED,
     SCENARIO_CHECKIN,
-    SCENARIO_EMERGENCY
+    SCENARIO_EMERGENCY,
+    JOB_PROCESS_TRANSCRIPT
 )
 
 
@@ -54,7 +56,7 @@ class TestWebhookService:
         """Test call_started event updates status to in_progress."""
         # Setup
         call_id = "retell-call-789"
-        webhook_service.db_service = MagicMock()
+        webhook_service.db_service = AsyncMock()
         
         # Execute
         await webhook_service.handle_call_started(call_id)
@@ -67,24 +69,44 @@ class TestWebhookService:
         )
     
     async def test_handle_call_ended_with_transcript(self, webhook_service, sample_call_info, sample_transcript):
-        """Test call_ended event with transcript processes it."""
+        """Test call_ended event with transcript queues extraction."""
         # Setup
         call_id = "retell-call-789"
-        webhook_service.db_service = MagicMock()
-        webhook_service.db_service.get_call_by_retell_id.return_value = sample_call_info
-        webhook_service.process_transcript = AsyncMock()
+        webhook_service.db_service = AsyncMock()
+        webhook_service.extraction_pool = AsyncMock()
         
         # Execute
         await webhook_service.handle_call_ended(call_id, sample_transcript)
         
         # Assert
-        webhook_service.process_transcript.assert_called_once_with(call_id, sample_transcript)
+        webhook_service.extraction_pool.submit.assert_called_once_with(
+            JOB_PROCESS_TRANSCRIPT,
+            {"call_id": call_id, "transcript": sample_transcript}
+        )
+    
+    async def test_enqueue_transcript_persists_before_queueing(self, webhook_service, sample_transcript):
+        """Test the raw transcript is stored before extraction is queued."""
+        # Setup
+        call_id = "retell-call-789"
+        webhook_service.db_service = AsyncMock()
+        webhook_service.extraction_pool = AsyncMock()
+        
+        # Execute
+        await webhook_service.enqueue_transcript(call_id, sample_transcript)
+        
+        # Assert - status is left for the background job to complete
+        webhook_service.db_service.update_call_log.assert_called_once_with(
+            call_id,
+            {"raw_transcript": sample_transcript},
+            id_field="retell_call_id"
+        )
+        webhook_service.extraction_pool.submit.assert_called_once()
     
     async def test_handle_call_ended_without_transcript(self, webhook_service):
         """Test call_ended event without transcript just updates status."""
         # Setup
         call_id = "retell-call-789"
-        webhook_service.db_service = MagicMock()
+        webhook_service.db_service = AsyncMock()
         
         # Execute
         await webhook_service.handle_call_ended(call_id)
@@ -97,18 +119,20 @@ class TestWebhookService:
         )
     
     async def test_handle_call_analyzed_with_transcript(self, webhook_service, sample_call_info, sample_transcript):
-        """Test call_analyzed event with transcript processes it."""
+        """Test call_analyzed event with transcript queues extraction."""
         # Setup
         call_id = "retell-call-789"
-        webhook_service.db_service = MagicMock()
-        webhook_service.db_service.get_call_by_retell_id.return_value = sample_call_info
-        webhook_service.process_transcript = AsyncMock()
+        webhook_service.db_service = AsyncMock()
+        webhook_service.extraction_pool = AsyncMock()
         
         # Execute
         await webhook_service.handle_call_analyzed(call_id, sample_transcript)
         
         # Assert
-        webhook_service.process_transcript.assert_called_once_with(call_id, sample_transcript)
+        webhook_service.extraction_pool.submit.assert_called_once_with(
+            JOB_PROCESS_TRANSCRIPT,
+            {"call_id": call_id, "transcript": sample_transcript}
+        )
     
     async def test_process_transcript_checkin_scenario(
         self,
@@ -118,7 +142,7 @@ class TestWebhookService:
     ):
         """Test transcript processing for checkin scenario."""
         # Setup
-        webhook_service.db_service = MagicMock()
+        webhook_service.db_service = AsyncMock()
         webhook_service.db_service.get_call_by_retell_id.return_value = sample_call_info
         
         extracted_data = {
@@ -142,6 +166,7 @@ class TestWebhookService:
         update_args = webhook_service.db_service.update_call_log.call_args[0]
         assert update_args[1]["raw_transcript"] == sample_transcript
         assert update_args[1]["structured_data"] == extracted_data
+        assert update_args[1]["extraction_complete"] is True
         assert update_args[1]["call_status"] == CALL_STATUS_COMPLETED
     
     async def test_process_transcript_emergency_scenario(
@@ -154,7 +179,7 @@ class TestWebhookService:
         emergency_call = {**sample_call_info, "scenario_type": SCENARIO_EMERGENCY}
         emergency_transcript = "Driver reports engine overheating on Highway 101 near mile marker 50"
         
-        webhook_service.db_service = MagicMock()
+        webhook_service.db_service = AsyncMock()
         webhook_service.db_service.get_call_by_retell_id.return_value = emergency_call
         
         extracted_data = {
@@ -171,13 +196,46 @@ class TestWebhookService:
         await webhook_service.process_transcript("retell-call-789", emergency_transcript)
         
         # Assert
-        webhook_service.extractor.extract_emergency_data.assert_called_once_with(emergency_transcript)
+        webhook_service.extractor.extract_emergency_data.assert_called_once()
+        call = webhook_service.extractor.extract_emergency_data.call_args
+        assert call.args == (emergency_transcript,)
+        assert callable(call.kwargs["on_field"])
         webhook_service.db_service.update_call_log.assert_called_once()
     
+    async def test_emergency_fields_published_as_they_stream(self, webhook_service, sample_call_info):
+        """Test streamed emergency fields are stored and pushed before completion."""
+        # Setup
+        from call_events import CallEventBroker
+        emergency_call = {**sample_call_info, "scenario_type": SCENARIO_EMERGENCY}
+        webhook_service.db_service = AsyncMock()
+        webhook_service.db_service.get_call_by_retell_id.return_value = emergency_call
+        webhook_service.call_events = CallEventBroker()
+        queue = webhook_service.call_events.subscribe(emergency_call["id"])
+        
+        async def extract(transcript, on_field=None):
+            await on_field("emergency_type", "Accident")
+            await on_field("load_secure", True)
+            return {"emergency_type": "Accident", "load_secure": True}
+        
+        webhook_service.extractor = MagicMock()
+        webhook_service.extractor.extract_emergency_data = extract
+        
+        # Execute
+        await webhook_service.process_transcript("retell-call-789", "Driver: I hit a guardrail")
+        
+        # Assert
+        updates = [c.args[1] for c in webhook_service.db_service.update_call_log.call_args_list]
+        assert updates[0] == {"structured_data": {"emergency_type": "Accident"}}
+        assert updates[1] == {"structured_data": {"emergency_type": "Accident", "load_secure": True}}
+        assert updates[2]["call_status"] == CALL_STATUS_COMPLETED
+        events = [queue.get_nowait() for _ in range(queue.qsize())]
+        assert [event["type"] for event in events] == ["field", "field", "completed"]
+        assert events[0] == {"type": "field", "field": "emergency_type", "value": "Accident"}
+    
     async def test_process_transcript_call_not_found(self, webhook_service, sample_transcript):
         """Test transcript processing when call not found in database."""
         # Setup
-        webhook_service.db_service = MagicMock()
+        webhook_service.db_service = AsyncMock()
         webhook_service.db_service.get_call_by_retell_id.return_value = None
         
         # Execute (should not raise exception, just log)
@@ -194,7 +252,7 @@ class TestWebhookService:
     ):
         """Test transcript still saved when extraction fails."""
         # Setup
-        webhook_service.db_service = MagicMock()
+        webhook_service.db_service = AsyncMock()
         webhook_service.db_service.get_call_by_retell_id.return_value = sample_call_info
         
         webhook_service.extractor = MagicMock()
@@ -209,8 +267,31 @@ class TestWebhookService:
         # Call should save transcript only (in the fallback path)
         fallback_update = webhook_service.db_service.update_call_log.call_args[0]
         assert fallback_update[1]["raw_transcript"] == sample_transcript
+        assert fallback_update[1]["extraction_complete"] is False
         assert fallback_update[1]["call_status"] == CALL_STATUS_COMPLETED
     
+    async def test_extraction_error_raised_for_retry(
+        self,
+        webhook_service,
+        sample_call_info,
+        sample_transcript
+    ):
+        """Test non-final attempts raise so the job queue retries."""
+        # Setup
+        webhook_service.db_service = AsyncMock()
+        webhook_service.db_service.get_call_by_retell_id.return_value = sample_call_info
+        
+        webhook_service.extractor = MagicMock()
+        webhook_service.extractor.extract_checkin_data = AsyncMock(side_effect=Exception("OpenAI API error"))
+        
+        # Execute & Assert
+        with pytest.raises(Exception, match="OpenAI API error"):
+            await webhook_service.run_extraction_job(
+                {"call_id": "retell-call-789", "transcript": sample_transcript},
+                final_attempt=False
+            )
+        webhook_service.db_service.update_call_log.assert_not_called()
+    
     async def test_extract_data_unknown_scenario(self, webhook_service):
         """Test data extraction with unknown scenario type."""
         # Execute
@@ -218,3 +299,268 @@ class TestWebhookService:
         
         # Assert
         assert result is None
+
+
+class TestExtractionSingleFlight:
+    """Test per-call deduplication of transcript extraction."""
+    
+    @pytest.fixture
+    def webhook_service(self):
+        """Get webhook service with mocked dependencies."""
+        from services.webhook_service import WebhookService
+        service = WebhookService()
+        service.db_service = AsyncMock()
+        service.db_service.get_call_by_retell_id.return_value = {
+            "id": "call-uuid-123",
+            "retell_call_id": "retell-call-789",
+            "scenario_type": SCENARIO_CHECKIN
+        }
+        service.extractor = MagicMock()
+        return service
+    
+    async def test_concurrent_identical_transcripts_extract_once(self, webhook_service):
+        """Test call_ended and call_analyzed share one in-flight extraction."""
+        # Setup
+        release = asyncio.Event()
+        
+        async def slow_extract(transcript):
+            await release.wait()
+            return {"driver_status": "Driving"}
+        
+        webhook_service.extractor.extract_checkin_data = AsyncMock(side_effect=slow_extract)
+        
+        # Execute
+        first = asyncio.create_task(webhook_service.process_transcript("retell-call-789", "same"))
+        second = asyncio.create_task(webhook_service.process_transcript("retell-call-789", "same"))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(first, second)
+        
+        # Assert
+        webhook_service.extractor.extract_checkin_data.assert_called_once()
+        webhook_service.db_service.update_call_log.assert_called_once()
+        assert webhook_service.dedup_stats["joined"] == 1
+    
+    async def test_unchanged_transcript_skipped_after_extraction(self, webhook_service):
+        """Test a repeat transcript is neither persisted nor queued again."""
+        # Setup
+        webhook_service.extractor.extract_checkin_data = AsyncMock(return_value={"eta": "N/A"})
+        webhook_service.extraction_pool = AsyncMock()
+        await webhook_service.process_transcript("retell-call-789", "same")
+        webhook_service.db_service.update_call_log.reset_mock()
+        
+        # Execute
+        await webhook_service.enqueue_transcript("retell-call-789", "same")
+        
+        # Assert
+        webhook_service.db_service.update_call_log.assert_not_called()
+        webhook_service.extraction_pool.submit.assert_not_called()
+        assert webhook_service.dedup_stats["skipped"] == 1
+    
+    async def test_duplicate_dropped_while_job_queued(self, webhook_service):
+        """Test call_analyzed repeating a still-queued transcript neither writes nor enqueues."""
+        # Setup
+        webhook_service.extractor.extract_checkin_data = AsyncMock(return_value={"eta": "N/A"})
+        webhook_service.extraction_pool = AsyncMock()
+        
+        # Execute
+        await webhook_service.handle_call_ended("retell-call-789", "same")
+        await webhook_service.handle_call_analyzed("retell-call-789", "same")
+        job_payload = webhook_service.extraction_pool.submit.call_args.args[1]
+        await webhook_service.run_extraction_job(job_payload, final_attempt=True)
+        
+        # Assert
+        webhook_service.extraction_pool.submit.assert_called_once()
+        assert webhook_service.dedup_stats["skipped"] == 1
+        webhook_service.extractor.extract_checkin_data.assert_called_once()
+        assert webhook_service._queued.get("retell-call-789") is None
+    
+    async def test_failed_enqueue_not_treated_as_queued(self, webhook_service):
+        """Test a transcript whose job could not be queued is accepted on redelivery."""
+        # Setup
+        webhook_service.extraction_pool = AsyncMock()
+        webhook_service.extraction_pool.submit.side_effect = [Exception("Queue full"), None]
+        
+        # Execute
+        with pytest.raises(Exception):
+            await webhook_service.enqueue_transcript("retell-call-789", "same")
+        await webhook_service.enqueue_transcript("retell-call-789", "same")
+        
+        # Assert
+        assert webhook_service.extraction_pool.submit.call_count == 2
+    
+    async def test_changed_transcript_extracted_again(self, webhook_service):
+        """Test a different transcript for the same call is extracted."""
+        # Setup
+        webhook_service.extractor.extract_checkin_data = AsyncMock(return_value={"eta": "N/A"})
+        
+        # Execute
+        await webhook_service.process_transcript("retell-call-789", "partial")
+        await webhook_service.process_transcript("retell-call-789", "partial and more")
+        
+        # Assert
+        assert webhook_service.extractor.extract_checkin_data.call_count == 2
+    
+    async def test_failed_extraction_is_retried(self, webhook_service):
+        """Test a redelivered transcript is extracted again after a failure."""
+        # Setup
+        webhook_service.extractor.extract_checkin_data = AsyncMock(
+            side_effect=[Exception("OpenAI API error"), {"eta": "N/A"}]
+        )
+        
+        # Execute
+        await webhook_service.process_transcript("retell-call-789", "same")
+        await webhook_service.process_transcript("retell-call-789", "same")
+        
+        # Assert
+        assert webhook_service.extractor.extract_checkin_data.call_count == 2
+
+
+class TestLiveExtraction:
+    """Test incremental extraction from transcript_updated events."""
+    
+    @pytest.fixture
+    def webhook_service(self):
+        """Get webhook service with mocked dependencies and a short debounce."""
+        from services.webhook_service import WebhookService
+        service = WebhookService()
+        service.live_debounce_seconds = 0.01
+        service.db_service = AsyncMock()
+        service.db_service.get_call_by_retell_id.return_value = {
+            "id": "call-uuid-123",
+            "retell_call_id": "retell-call-789",
+            "scenario_type": SCENARIO_CHECKIN
+        }
+        service.extractor = MagicMock()
+        service.extractor.extract_checkin_data = AsyncMock(return_value={"driver_status": "Driving"})
+        return service
+    
+    async def test_burst_of_updates_extracted_once(self, webhook_service):
+        """Test updates arriving within the debounce interval cost one extraction."""
+        # Setup
+        transcript = "Agent: Where are you?\nDriver: On I-10"
+        
+        # Execute
+        await webhook_service.handle_transcript_updated("retell-call-789", "Agent: Where are you?")
+        await webhook_service.handle_transcript_updated("retell-call-789", "Agent: Where are you?\nDriver: On")
+        await webhook_service.handle_transcript_updated("retell-call-789", transcript)
+        await asyncio.sleep(0.05)
+        
+        # Assert
+        webhook_service.extractor.extract_checkin_data.assert_called_once_with(transcript)
+        assert webhook_service.live_stats["debounced"] == 2
+        webhook_service.db_service.update_call_log.assert_called_once_with(
+            "retell-call-789",
+            {"structured_data": {"driver_status": "Driving"}},
+            id_field="retell_call_id"
+        )
+    
+    async def test_unchanged_turns_not_extracted_again(self, webhook_service):
+        """Test an update that only changes whitespace is skipped."""
+        # Execute
+        await webhook_service.handle_transcript_updated("retell-call-789", "Driver: On I-10")
+        await asyncio.sleep(0.05)
+        await webhook_service.handle_transcript_updated("retell-call-789", "Driver:  On I-10\n")
+        await asyncio.sleep(0.05)
+        
+        # Assert
+        webhook_service.extractor.extract_checkin_data.assert_called_once()
+        assert webhook_service.live_stats["unchanged"] == 1
+    
+    async def test_call_end_reuses_live_result(self, webhook_service):
+        """Test the end-of-call step stores the live result without extracting."""
+        # Setup
+        await webhook_service.handle_transcript_updated("retell-call-789", "Driver: On I-10")
+        await asyncio.sleep(0.05)
+        
+        # Execute
+        await webhook_service.process_transcript("retell-call-789", "Driver: On I-10")
+        
+        # Assert
+        webhook_service.extractor.extract_checkin_data.assert_called_once()
+        final_update = webhook_service.db_service.update_call_log.call_args.args[1]
+        assert final_update["structured_data"] == {"driver_status": "Driving"}
+        assert final_update["call_status"] == CALL_STATUS_COMPLETED
+        assert webhook_service.live_stats["reconciled"] == 1
+    
+    async def test_call_end_with_new_turns_extracts(self, webhook_service):
+        """Test turns spoken after the last live run are extracted at call end."""
+        # Setup
+        await webhook_service.handle_transcript_updated("retell-call-789", "Driver: On I-10")
+        await asyncio.sleep(0.05)
+        
+        # Execute
+        await webhook_service.process_transcript("retell-call-789", "Driver: On I-10\nDriver: Running late")
+        
+        # Assert
+        assert webhook_service.extractor.extract_checkin_data.call_count == 2
+        assert webhook_service.live_stats["reextracted"] == 1
+    
+    async def test_call_end_cancels_pending_update(self, webhook_service):
+        """Test a debounced update still pending at call end is dropped."""
+        # Setup
+        webhook_service.live_debounce_seconds = 10
+        await webhook_service.handle_transcript_updated("retell-call-789", "Driver: On I-10")
+        
+        # Execute
+        await webhook_service.process_transcript("retell-call-789", "Driver: On I-10")
+        await asyncio.sleep(0)
+        
+        # Assert
+        webhook_service.extractor.extract_checkin_data.assert_called_once()
+        assert webhook_service._live_timers == {}
+    
+    async def test_update_after_call_ended_ignored(self, webhook_service):
+        """Test a transcript_updated arriving after call_ended schedules nothing."""
+        # Setup
+        await webhook_service.handle_transcript_updated("retell-call-789", "Driver: On I-10")
+        await webhook_service.handle_call_ended("retell-call-789")
+        
+        # Execute
+        await webhook_service.handle_transcript_updated("retell-call-789", "Driver: On I-10\nAgent: Bye")
+        await asyncio.sleep(0.05)
+        
+        # Assert
+        webhook_service.extractor.extract_checkin_data.assert_not_called()
+        assert webhook_service.live_stats["ignored"] == 1
+        assert webhook_service._live_timers == {}
+        assert webhook_service._live_latest.get("retell-call-789") is None
+        assert webhook_service._live_locks.get("retell-call-789") is None
+    
+    async def test_call_end_during_live_run_drops_lock(self, webhook_service):
+        """Test a live run still extracting when the call ends releases its lock state."""
+        # Setup
+        release = asyncio.Event()
+        
+        async def extract(transcript):
+            await release.wait()
+            return {"driver_status": "Driving"}
+        
+        webhook_service.extractor.extract_checkin_data = AsyncMock(side_effect=extract)
+        await webhook_service.handle_transcript_updated("retell-call-789", "Driver: On I-10")
+        await asyncio.sleep(0.05)
+        
+        # Execute
+        await webhook_service.handle_call_analyzed("retell-call-789")
+        locked = webhook_service._live_locks.get("retell-call-789") is not None
+        release.set()
+        await asyncio.sleep(0.01)
+        
+        # Assert
+        assert locked is True
+        assert webhook_service._live_locks.get("retell-call-789") is None
+    
+    async def test_live_state_bounded_without_call_end(self, webhook_service):
+        """Test calls that never send call_ended do not grow the live state unbounded."""
+        # Setup
+        webhook_service._live_latest.max_size = 2
+        webhook_service._live_locks.max_size = 2
+        
+        # Execute
+        for index in range(3):
+            await webhook_service.handle_transcript_updated(f"retell-call-{index}", "Driver: On I-10")
+        await asyncio.sleep(0.05)
+        
+        # Assert
+        assert webhook_service._live_latest.stats()["size"] == 2
+        assert webhook_service._live_locks.stats()["size"] == 2
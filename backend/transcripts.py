@@ -0,0 +1,339 @@
+"""
+Transcript utilities shared by webhook processing and extraction.
+"""
+
+import hashlib
+import re
+from typing import List, Optional, Set, Tuple
+from constants import (
+    TRANSCRIPT_DISFLUENCIES,
+    TRANSCRIPT_BACKCHANNELS,
+    TRANSCRIPT_TOKENIZER_ENCODING
+)
+from logger import service_logger
+
+# Retell labels the caller "User"; extraction prompts talk about the driver
+SPEAKER_ALIASES = {
+    "agent": "Agent",
+    "assistant": "Agent",
+    "bot": "Agent",
+    "user": "Driver",
+    "driver": "Driver",
+    "caller": "Driver"
+}
+
+_TURN_PATTERN = re.compile(
+    r"^(" + "|".join(SPEAKER_ALIASES) + r")\s*:\s*(.*)$",
+    re.IGNORECASE
+)
+_WORD_PATTERN = re.compile(r"[a-z0-9']+(?:-[a-z0-9']+)*")
+_LEADING_WORD_PATTERN = re.compile(r"^\s*([A-Za-z]+(?:-[A-Za-z]+)*)[\s,.!?;:-]*")
+_TOKEN_ESTIMATE_PATTERN = re.compile(r"\w{1,4}|[^\w\s]")
+_OMITTED_MARKER = "[... {count} turns omitted ...]"
+
+
+def transcript_hash(transcript: str) -> str:
+    """
+    Hash a transcript for change detection and cache keys.
+    
+    Args:
+        transcript: Call transcript text
+        
+    Returns:
+        Hex SHA-256 digest
+    """
+    return hashlib.sha256(transcript.encode("utf-8")).hexdigest()
+
+
+def _load_encoding():
+    """
+    Load the local BPE tokenizer used by the OpenAI models.
+    
+    Returns:
+        tiktoken encoding, or None if tiktoken or its encoding data is unavailable
+    """
+    try:
+        import tiktoken
+        return tiktoken.get_encoding(TRANSCRIPT_TOKENIZER_ENCODING)
+    except Exception as e:
+        service_logger.warning(f"tiktoken unavailable, estimating transcript tokens: {e}")
+        return None
+
+
+_encoding = None
+_encoding_loaded = False
+
+
+# PUBLIC_INTERFACE
+def count_tokens(text: str) -> int:
+    """
+    Count model input tokens in a piece of text.
+    
+    Uses tiktoken when installed. Otherwise words are split into four
+    character pieces, which slightly over-counts English BPE tokens.
+    
+    Args:
+        text: Text to measure
+        
+    Returns:
+        Token count
+    """
+    global _encoding, _encoding_loaded
+    if not _encoding_loaded:
+        _encoding = _load_encoding()
+        _encoding_loaded = True
+    
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    return len(_TOKEN_ESTIMATE_PATTERN.findall(text))
+
+
+def _normalize_speaker(speaker: str) -> str:
+    """
+    Map Retell and ad-hoc speaker labels onto Agent / Driver.
+    
+    Args:
+        speaker: Raw speaker label matched by _TURN_PATTERN
+        
+    Returns:
+        Canonical speaker label
+    """
+    return SPEAKER_ALIASES[speaker.strip().lower()]
+
+
+def _words(text: str) -> List[str]:
+    """
+    Split an utterance into lowercase words for filler and repeat checks.
+    
+    Args:
+        text: Utterance text
+        
+    Returns:
+        List of words without punctuation
+    """
+    return _WORD_PATTERN.findall(text.lower())
+
+
+# PUBLIC_INTERFACE
+def parse_turns(transcript: str) -> List[Tuple[str, str]]:
+    """
+    Split a transcript into (speaker, text) turns.
+    
+    Lines without a speaker prefix continue the previous turn.
+    
+    Args:
+        transcript: Raw transcript in "Speaker: text" lines
+        
+    Returns:
+        List of (speaker, text) tuples
+    """
+    turns: List[Tuple[str, str]] = []
+    for line in transcript.splitlines():
+        line = " ".join(line.split())
+        if not line:
+            continue
+        
+        match = _TURN_PATTERN.match(line)
+        if match:
+            turns.append((_normalize_speaker(match.group(1)), match.group(2)))
+        elif turns:
+            speaker, text = turns[-1]
+            turns[-1] = (speaker, f"{text} {line}")
+        else:
+            turns.append(("Unknown", line))
+    return turns
+
+
+def _strip_disfluencies(text: str) -> str:
+    """
+    Remove leading hesitation words ("um, uh, so I'm at...").
+    
+    Args:
+        text: Utterance text
+        
+    Returns:
+        Utterance without leading disfluencies
+    """
+    while True:
+        match = _LEADING_WORD_PATTERN.match(text)
+        if not match or match.group(1).lower() not in TRANSCRIPT_DISFLUENCIES:
+            return text
+        text = text[match.end():]
+
+
+def _clean_turns(turns: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """
+    Drop filler and repeated turns, then merge consecutive same-speaker turns.
+    
+    Backchannels ("yeah", "mm-hmm") and repeats are kept when they answer a
+    question, since there they carry the answer.
+    
+    Args:
+        turns: Parsed (speaker, text) turns
+        
+    Returns:
+        Cleaned turns
+    """
+    seen: Set[Tuple[str, str]] = set()
+    cleaned: List[Tuple[str, str]] = []
+    
+    for speaker, text in turns:
+        text = _strip_disfluencies(text)
+        words = _words(text)
+        if not words or all(word in TRANSCRIPT_DISFLUENCIES for word in words):
+            continue
+        
+        answers_question = bool(
+            cleaned and cleaned[-1][0] != speaker and cleaned[-1][1].rstrip().endswith("?")
+        )
+        if not answers_question:
+            if all(word in TRANSCRIPT_BACKCHANNELS for word in words):
+                continue
+            if (speaker, " ".join(words)) in seen:
+                continue
+        seen.add((speaker, " ".join(words)))
+        
+        if cleaned and cleaned[-1][0] == speaker:
+            cleaned[-1] = (speaker, f"{cleaned[-1][1]} {text}")
+        else:
+            cleaned.append((speaker, text))
+    
+    return cleaned
+
+
+def _truncate_to_budget(line: str, max_tokens: int) -> str:
+    """
+    Cut a line to fit a token budget, keeping its start.
+    
+    Args:
+        line: Rendered transcript line
+        max_tokens: Token budget for the line
+        
+    Returns:
+        Truncated line
+    """
+    words = line.split(" ")
+    low, high = 0, len(words)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if count_tokens(" ".join(words[:middle])) <= max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+    return " ".join(words[:low])
+
+
+def _fit_budget(lines: List[str], max_tokens: int) -> List[str]:
+    """
+    Keep the opening and the most recent lines that fit the token budget.
+    
+    The opening gets up to a quarter of the budget; the rest is filled from
+    the end of the call, where outcomes are usually confirmed.
+    
+    Args:
+        lines: Rendered transcript lines
+        max_tokens: Token budget for the whole transcript
+        
+    Returns:
+        Lines within the budget, with a marker where turns were omitted
+    """
+    costs = [count_tokens(line) + 1 for line in lines]
+    if sum(costs) <= max_tokens:
+        return lines
+    
+    marker_cost = count_tokens(_OMITTED_MARKER.format(count=len(lines))) + 1
+    budget = max_tokens - marker_cost
+    
+    head_end = 0
+    head_cost = 0
+    while head_end < len(lines) and head_cost + costs[head_end] <= budget // 4:
+        head_cost += costs[head_end]
+        head_end += 1
+    
+    tail_start = len(lines)
+    tail_cost = head_cost
+    while tail_start > head_end and tail_cost + costs[tail_start - 1] <= budget:
+        tail_start -= 1
+        tail_cost += costs[tail_start]
+    
+    if tail_start == len(lines) and head_end < len(lines):
+        # Not even the last turn fits whole; keep as much of it as possible
+        tail = [_truncate_to_budget(lines[-1], budget - head_cost)]
+        tail_start = len(lines) - 1
+    else:
+        tail = lines[tail_start:]
+    
+    omitted = tail_start - head_end
+    marker = [_OMITTED_MARKER.format(count=omitted)] if omitted else []
+    return lines[:head_end] + marker + tail
+
+
+# PUBLIC_INTERFACE
+def compact_transcript(transcript: str, max_tokens: Optional[int]) -> str:
+    """
+    Shrink a transcript before it is pasted into an extraction prompt.
+    
+    Speaker labels are normalized to Agent / Driver, hesitation words and
+    backchannel-only turns are dropped, repeated utterances collapse to their
+    first occurrence, and the result is cut to a token budget.
+    
+    Args:
+        transcript: Raw call transcript
+        max_tokens: Maximum tokens of transcript to keep, or None to keep
+            every cleaned turn
+        
+    Returns:
+        Compacted transcript, one "Speaker: text" line per turn
+    """
+    turns = _clean_turns(parse_turns(transcript))
+    lines = [f"{speaker}: {text}" for speaker, text in turns]
+    if max_tokens is None:
+        return "\n".join(lines)
+    return "\n".join(_fit_budget(lines, max_tokens))
+
+
+# PUBLIC_INTERFACE
+def chunk_transcript(transcript: str, chunk_tokens: int, overlap_turns: int = 1) -> List[str]:
+    """
+    Split a compacted transcript into chunks on turn boundaries.
+    
+    Chunks are packed greedily from the start, so appending turns to a
+    transcript leaves its earlier chunks unchanged. Each chunk repeats the
+    last turns of the previous one, so an answer keeps its question.
+    
+    Args:
+        transcript: Compacted transcript, one "Speaker: text" line per turn
+        chunk_tokens: Token budget per chunk; longer turns are truncated
+        overlap_turns: Turns carried over from the previous chunk
+    
+    Returns:
+        Chunks of "Speaker: text" lines, at least one
+    """
+    lines = [line for line in transcript.splitlines() if line.strip()]
+    chunks: List[List[str]] = []
+    current: List[str] = []
+    cost = 0
+    fresh = 0
+    
+    for line in lines:
+        line_cost = count_tokens(line) + 1
+        if line_cost > chunk_tokens:
+            line = _truncate_to_budget(line, chunk_tokens - 1)
+            line_cost = count_tokens(line) + 1
+        
+        if fresh and cost + line_cost > chunk_tokens:
+            chunks.append(current)
+            current = current[-overlap_turns:] if overlap_turns else []
+            cost = sum(count_tokens(kept) + 1 for kept in current)
+            # Drop carried-over turns that would leave no room for this one
+            while current and cost + line_cost > chunk_tokens:
+                cost -= count_tokens(current.pop(0)) + 1
+            fresh = 0
+        
+        current.append(line)
+        cost += line_cost
+        fresh += 1
+    
+    if fresh or not chunks:
+        chunks.append(current)
+    return ["\n".join(chunk) for chunk in chunks]
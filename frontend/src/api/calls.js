@@ -1,4 +1,4 @@
-import apiClient from '../client';
+import apiClient, { API_BASE_URL } from '../client';
 
 export const callsAPI = {
   // Initiate a web call (browser-based)
@@ -13,17 +13,34 @@ export const callsAPI = {
     return response.data;
   },
 
-  // Get call details by ID
-  getCall: async (callId) => {
-    const response = await apiClient.get(`/api/calls/${callId}`);
+  // Get call details by ID; fields can be 'all', 'summary' or a column list
+  getCall: async (callId, fields = 'all') => {
+    const response = await apiClient.get(`/api/calls/${callId}`, {
+      params: { fields }
+    });
     return response.data;
   },
 
-  // List all calls with optional ordering
-  listCalls: async (orderBy = 'created_at', ascending = false) => {
-    const response = await apiClient.get('/api/calls', {
-      params: { order_by: orderBy, ascending }
-    });
+  // List one page of calls; pass the previous page's next_cursor to continue
+  listCalls: async ({ ascending = false, cursor = null, limit = 50 } = {}) => {
+    const params = { ascending, limit };
+    if (cursor) {
+      params.cursor = cursor;
+    }
+    const response = await apiClient.get('/api/calls', { params });
     return response.data;
   },
+
+  // Stream live updates for a call; returns a function that closes the stream
+  subscribe: (callId, onEvent) => {
+    const source = new EventSource(`${API_BASE_URL}/api/calls/${callId}/events`);
+    source.onmessage = (message) => {
+      const event = JSON.parse(message.data);
+      onEvent(event);
+      if (event.type === 'completed') {
+        source.close();
+      }
+    };
+    return () => source.close();
+  },
 };
@@ -1,6 +1,7 @@
 import { useState, useEffect, useCallback } from 'react';
 import { useParams, Link } from 'react-router-dom';
 import { useCalls } from '../hooks/useCalls';
+import { callsAPI } from '../api/calls';
 import { formatDate, formatFieldName, formatBoolean, getStatusConfig } from '../utils/formatters';
 import { CALL_STATUS, CALL_STATUS_CONFIG, POLLING_INTERVALS } from '../constants';
 
@@ -22,22 +23,45 @@ export default function CallResults() {
     loadCall();
   }, [loadCall]);
 
-  // Poll for updates if call is in progress
-  useEffect(() => {
-    if (!call) return;
-
-    const shouldPoll = 
-      call.call_status === CALL_STATUS.INITIATED || 
-      call.call_status === CALL_STATUS.IN_PROGRESS;
-
-    if (!shouldPoll) return;
+  const callStatus = call?.call_status;
+  const isActive =
+    callStatus === CALL_STATUS.INITIATED ||
+    callStatus === CALL_STATUS.IN_PROGRESS;
 
-    const interval = setInterval(() => {
-      loadCall();
+  // Show extracted fields as soon as the server publishes them
+  useEffect(() => {
+    if (!isActive) return;
+
+    return callsAPI.subscribe(id, (event) => {
+      if (event.type === 'field') {
+        setCall((current) => ({
+          ...current,
+          structured_data: { ...current.structured_data, [event.field]: event.value }
+        }));
+      } else if (event.type === 'completed') {
+        loadCall();
+      }
+    });
+  }, [id, isActive, loadCall]);
+
+  // Poll for updates if call is in progress (fallback if the event stream drops)
+  useEffect(() => {
+    if (!isActive) return;
+
+    // Poll the lightweight summary; fetch the full record once status changes
+    const interval = setInterval(async () => {
+      try {
+        const summary = await callsAPI.getCall(id, 'summary');
+        if (summary.call_status !== callStatus) {
+          loadCall();
+        }
+      } catch (err) {
+        console.error('Failed to poll call status:', err);
+      }
     }, POLLING_INTERVALS.CALL_STATUS);
 
     return () => clearInterval(interval);
-  }, [call, loadCall]);
+  }, [id, isActive, callStatus, loadCall]);
 
   if (isLoading && !call) {
     return (
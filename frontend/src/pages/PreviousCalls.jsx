@@ -9,7 +9,9 @@ export default function PreviousCalls() {
   const [filteredCalls, setFilteredCalls] = useState([]);
   const [searchQuery, setSearchQuery] = useState('');
   const [sortOrder, setSortOrder] = useState('desc'); // 'asc' or 'desc'
+  const [nextCursor, setNextCursor] = useState(null);
   const [isLoading, setIsLoading] = useState(true);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
   const [error, setError] = useState(null);
 
   const loadCalls = useCallback(async () => {
@@ -18,9 +20,9 @@ export default function PreviousCalls() {
     
     try {
       const ascending = sortOrder === 'asc';
-      const data = await callsAPI.listCalls('created_at', ascending);
-      setCalls(data);
-      setFilteredCalls(data);
+      const page = await callsAPI.listCalls({ ascending });
+      setCalls(page.items);
+      setNextCursor(page.next_cursor);
     } catch (err) {
       console.error('Failed to load calls:', err);
       setError('Failed to load previous calls. Please try again.');
@@ -29,6 +31,22 @@ export default function PreviousCalls() {
     }
   }, [sortOrder]);
 
+  const loadMoreCalls = async () => {
+    setIsLoadingMore(true);
+    
+    try {
+      const ascending = sortOrder === 'asc';
+      const page = await callsAPI.listCalls({ ascending, cursor: nextCursor });
+      setCalls(prev => [...prev, ...page.items]);
+      setNextCursor(page.next_cursor);
+    } catch (err) {
+      console.error('Failed to load more calls:', err);
+      setError('Failed to load previous calls. Please try again.');
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
   useEffect(() => {
     loadCalls();
   }, [loadCalls]);
@@ -109,7 +127,7 @@ export default function PreviousCalls() {
           {/* Sort and Results */}
           <div className="flex flex-col sm:flex-row sm:items-center sm:justify-between gap-3">
             <div className="text-xs sm:text-sm text-neutral-600">
-              Showing {filteredCalls.length} of {calls.length} call{calls.length !== 1 ? 's' : ''}
+              Showing {filteredCalls.length} of {calls.length}{nextCursor ? '+' : ''} call{calls.length !== 1 ? 's' : ''}
             </div>
             
             <button
@@ -249,6 +267,18 @@ export default function PreviousCalls() {
           </div>
         </>
       )}
+
+      {nextCursor && (
+        <div className="flex justify-center">
+          <button
+            onClick={loadMoreCalls}
+            disabled={isLoadingMore}
+            className="btn-secondary w-full sm:w-auto sm:min-w-[160px] justify-center"
+          >
+            {isLoadingMore ? 'Loading...' : 'Load More'}
+          </button>
+        </div>
+      )}
     </div>
   );
 }